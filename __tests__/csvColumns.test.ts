@@ -0,0 +1,81 @@
+import { detectCsvColumns, parseCsvAmount, readCsvRow } from '../csvColumns';
+
+describe('parseCsvAmount', () => {
+  it.each([
+    ['1,234.56', 1234.56],
+    ['1.234,56', 1234.56],
+    ['1 234,56', 1234.56],
+    ['1,234', 1234],
+    ['12,5', 12.5],
+    ['1.234.567', 1234567],
+    ['0.125', 0.125],
+    ['-45.00', 45],
+    ['(45.00)', 45],
+    ['£1,000.00 CR', 1000],
+    ["1'234.50", 1234.5],
+  ])('reads %s as %d', (raw, expected) => {
+    expect(parseCsvAmount(raw)).toBe(expected);
+  });
+
+  it('is NaN without digits', () => {
+    expect(parseCsvAmount('')).toBeNaN();
+    expect(parseCsvAmount('n/a')).toBeNaN();
+  });
+});
+
+describe('detectCsvColumns', () => {
+  const rows = [
+    { 'Transaction Date': '01/03/2024', Description: 'TESCO STORES', 'Debit Amount': '12.50', 'Credit Amount': '', Balance: '987.50' },
+    { 'Transaction Date': '02/03/2024', Description: 'SALARY', 'Debit Amount': '', 'Credit Amount': '2,000.00', Balance: '2,987.50' },
+    { 'Transaction Date': '03/03/2024', Description: 'OVERDRAFT INTEREST', 'Debit Amount': '4.10', 'Credit Amount': '', Balance: '2,983.40' },
+  ];
+
+  it('maps date, description and debit/credit, never the balance', () => {
+    expect(detectCsvColumns(Object.keys(rows[0]), rows)).toEqual({
+      date: 'Transaction Date',
+      description: 'Description',
+      amount: null,
+      debit: 'Debit Amount',
+      credit: 'Credit Amount',
+    });
+  });
+
+  it('reads headers in other languages and with accents', () => {
+    const fields = ['Datum', 'Omschrijving', 'Bedrag'];
+    const sample = [{ Datum: '05-03-2024', Omschrijving: 'Rente', Bedrag: '1.234,56' }];
+    expect(detectCsvColumns(fields, sample)).toEqual({
+      date: 'Datum', description: 'Omschrijving', amount: 'Bedrag', debit: null, credit: null,
+    });
+    const libelle = detectCsvColumns(['Date', 'Libellé', 'Montant'], [{ Date: '2024-03-05', 'Libellé': 'Intérêts', Montant: '3,20' }]);
+    expect(libelle?.description).toBe('Libellé');
+  });
+
+  it('skips a column whose name fits but whose values do not', () => {
+    const fields = ['Date', 'Amount reference', 'Amount', 'Details'];
+    const sample = [{ Date: '01/03/2024', 'Amount reference': 'REF-ABC', Amount: '10.00', Details: 'x' }];
+    expect(detectCsvColumns(fields, sample)?.amount).toBe('Amount');
+  });
+
+  it('gives up without a date or an amount column', () => {
+    expect(detectCsvColumns(['Description', 'Amount'], [{ Description: 'x', Amount: '1.00' }])).toBeNull();
+    expect(detectCsvColumns(['Date', 'Description'], [{ Date: '01/03/2024', Description: 'x' }])).toBeNull();
+  });
+});
+
+describe('readCsvRow', () => {
+  const columns = { date: 'Date', description: 'Details', amount: null, debit: 'Paid out', credit: 'Paid in' };
+
+  it('takes the first non-zero amount column and keeps the whole row as text', () => {
+    const row = { Date: '01/03/2024', Details: ' Interest ', 'Paid out': '0.00', 'Paid in': '£3.20' };
+    expect(readCsvRow(row, columns)).toEqual({
+      date: '01/03/2024',
+      description: 'Interest',
+      amount: 3.2,
+      text: '01/03/2024  Interest  0.00 £3.20',
+    });
+  });
+
+  it('leaves the amount NaN when every amount cell is empty', () => {
+    expect(readCsvRow({ Date: '01/03/2024', Details: 'x', 'Paid out': '', 'Paid in': '' }, columns).amount).toBeNaN();
+  });
+});
@@ -0,0 +1,73 @@
+import { createDedupeStage, dedupeTransactions, mergeStatements, transactionKey } from '../dedupe';
+import { legacyDedupe } from './legacy';
+
+interface Row {
+  date: string;
+  amount: number;
+  description: string;
+  n: number; // position in the input, to tell copies apart
+}
+
+const random = (seed: number) => () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+// Few distinct values, so copies are common; some amounts are not positive
+const rows = (count: number, seed: number): Row[] => {
+  const rand = random(seed);
+  const pick = <T>(values: T[]) => values[Math.floor(rand() * values.length)];
+  return Array.from({ length: count }, (_, n) => ({
+    date: pick(['01/02/2024', '02/02/2024', '2024-02-03']),
+    amount: pick([12.5, 12.5, 100, 0, -3, NaN, 7.99]),
+    description: pick(['Interest charged', 'TESCO 123', 'Salary', '']),
+    n,
+  }));
+};
+
+describe('dedupeTransactions', () => {
+  it('keeps the same rows as the old filter/findIndex pass', () => {
+    for (let seed = 1; seed <= 50; seed++) {
+      const input = rows(300, seed);
+      expect(dedupeTransactions(input)).toEqual(legacyDedupe(input));
+    }
+  });
+
+  it('keeps the first copy and drops amounts that are not positive', () => {
+    const input: Row[] = [
+      { date: 'd', amount: 5, description: 'a', n: 0 },
+      { date: 'd', amount: 5, description: 'a', n: 1 },
+      { date: 'd', amount: 0, description: 'b', n: 2 },
+      { date: 'd', amount: NaN, description: 'c', n: 3 },
+      { date: 'd', amount: 5, description: 'a ', n: 4 },
+    ];
+    expect(dedupeTransactions(input).map(t => t.n)).toEqual([0, 4]);
+  });
+
+  it('keeps a separator inside the description from colliding with another key', () => {
+    // Dates and amounts never hold \u0000; the free-text description comes last
+    const a = { date: '1', amount: 2, description: '3\u00004' };
+    const b = { date: '1', amount: 2, description: '3' };
+    const c = { date: '1', amount: 23, description: '4' };
+    expect(new Set([a, b, c].map(transactionKey)).size).toBe(3);
+  });
+});
+
+describe('createDedupeStage', () => {
+  it('remembers keys across batches and counts what it dropped', () => {
+    const input = rows(500, 99);
+    const stage = createDedupeStage<Row>();
+    const kept = [input.slice(0, 100), input.slice(100, 350), input.slice(350)].flatMap(batch => stage.add(batch));
+    expect(kept).toEqual(legacyDedupe(input));
+    expect(stage.size).toBe(kept.length);
+    expect(stage.dropped).toBe(input.length - kept.length);
+  });
+
+  it('merges statements in upload order, keeping an overlap from the first', () => {
+    const march = rows(200, 3);
+    const april = rows(200, 4);
+    expect(mergeStatements([march, april])).toEqual(legacyDedupe([...march, ...april]));
+  });
+});
@@ -0,0 +1,153 @@
+import { createLedger, ribaTotalsByCurrency, topRibaSources, updateLedger } from '../ledger';
+import type { Ledger } from '../ledger';
+import type { Currency, Transaction } from '../statement';
+
+// As the dashboard's riba toggle (index.tsx)
+const toggleRiba = (txn: Transaction): Transaction =>
+  ({ ...txn, isRiba: !txn.isRiba, category: !txn.isRiba ? 'riba' : 'uncategorized' });
+
+const random = (seed: number) => () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+const transactions = (count: number, seed: number): Transaction[] => {
+  const rand = random(seed);
+  const pick = <T>(values: readonly T[]) => values[Math.floor(rand() * values.length)];
+  return Array.from({ length: count }, (_, i) => {
+    const isRiba = rand() < 0.3;
+    return {
+      id: `t${i}`,
+      date: '01/03/2024',
+      description: pick(['HSBC interest', 'Barclays overdraft fee', 'TESCO STORES', 'Salary ACME', 'HSBC loan interest']),
+      amount: Math.round(rand() * 100000) / 100,
+      originalText: `line ${i}`,
+      isRiba,
+      currency: pick(['GBP', 'USD', 'EUR'] as const),
+      category: isRiba ? 'riba' : pick(['income', 'shopping', 'utilities', 'transfer', 'uncategorized'] as const),
+      confidence: pick(['high', 'medium', 'low'] as const),
+      page: 1,
+    };
+  });
+};
+
+// The certificate's per-currency totals and the dashboard's top sources, as
+// index.tsx computed them from the transaction objects
+const naiveTotalsByCurrency = (txns: Transaction[]) =>
+  txns.filter(t => t.isRiba).reduce((acc: Record<string, number>, t) => {
+    acc[t.currency] = (acc[t.currency] || 0) + t.amount;
+    return acc;
+  }, {});
+
+const naiveTopSources = (txns: Transaction[], limit: number) => {
+  const sourceMap = new Map<string, number>();
+  txns.filter(t => t.isRiba).forEach(t => {
+    const source = t.description.split(' ')[0] || 'Bank';
+    sourceMap.set(source, (sourceMap.get(source) || 0) + t.amount);
+  });
+  return Array.from(sourceMap.entries()).sort((a, b) => b[1] - a[1]).slice(0, limit);
+};
+
+// Totals recomputed from scratch, as the dashboard did before the ledger
+const expectedTotals = (txns: Transaction[]) => {
+  const riba = txns.filter(t => t.isRiba);
+  const byCurrency: Partial<Record<Currency, number>> = {};
+  for (const t of riba) byCurrency[t.currency] = (byCurrency[t.currency] || 0) + t.amount;
+  const byCategory: Record<string, number> = {};
+  for (const t of txns) byCategory[t.category] = (byCategory[t.category] || 0) + 1;
+  return {
+    volume: txns.reduce((n, t) => n + t.amount, 0),
+    ribaCount: riba.length,
+    ribaAmount: riba.reduce((n, t) => n + t.amount, 0),
+    byCurrency,
+    byCategory,
+    ribaIndexes: txns.flatMap((t, i) => (t.isRiba ? [i] : [])),
+  };
+};
+
+const expectConsistent = (ledger: Ledger) => {
+  const expected = expectedTotals(ledger.transactions);
+  expect(ledger.totals.volume).toBeCloseTo(expected.volume, 6);
+  expect(ledger.totals.riba.count).toBe(expected.ribaCount);
+  expect(ledger.totals.riba.amount).toBeCloseTo(expected.ribaAmount, 6);
+  expect(Object.keys(ledger.totals.ribaByCurrency).sort()).toEqual(Object.keys(expected.byCurrency).sort());
+  for (const [currency, tally] of Object.entries(ledger.totals.ribaByCurrency)) {
+    expect(tally!.amount).toBeCloseTo(expected.byCurrency[currency as Currency]!, 6);
+  }
+  expect(Object.fromEntries(Object.entries(ledger.totals.byCategory).map(([c, tally]) => [c, tally!.count])))
+    .toEqual(expected.byCategory);
+  expect(ledger.ribaIndexes).toEqual(expected.ribaIndexes);
+};
+
+describe('ledger', () => {
+  it('totals a result set as the dashboard used to', () => {
+    expectConsistent(createLedger(transactions(500, 1)));
+    expectConsistent(createLedger([]));
+  });
+
+  it('keeps its totals right through many toggles', () => {
+    const rand = random(2);
+    let ledger = createLedger(transactions(300, 2));
+    for (let i = 0; i < 1000; i++) {
+      ledger = updateLedger(ledger, `t${Math.floor(rand() * 300)}`, toggleRiba);
+    }
+    expectConsistent(ledger);
+  });
+
+  it('drops a currency once its last riba row is toggled off', () => {
+    const txns = transactions(50, 3).map(t => ({ ...t, isRiba: false, category: 'shopping' as const }));
+    txns[7] = { ...txns[7], currency: 'EUR' };
+    let ledger = updateLedger(createLedger(txns), 't7', toggleRiba);
+    expect(Object.keys(ledger.totals.ribaByCurrency)).toEqual(['EUR']);
+    ledger = updateLedger(ledger, 't7', toggleRiba);
+    expect(ledger.totals.ribaByCurrency).toEqual({});
+    expect(ledger.totals.riba).toEqual({ count: 0, amount: 0 });
+  });
+
+  it('never changes the ledger it was given', () => {
+    const before = createLedger(transactions(20, 4));
+    const snapshot = JSON.stringify({ ...before, indexById: [...before.indexById] });
+    const after = updateLedger(before, 't3', toggleRiba);
+    expect(JSON.stringify({ ...before, indexById: [...before.indexById] })).toBe(snapshot);
+    expect(after.transactions[3].isRiba).toBe(!before.transactions[3].isRiba);
+    expect(updateLedger(before, 'missing', toggleRiba)).toBe(before);
+  });
+
+  it('totals riba by currency as the certificate did', () => {
+    const rand = random(5);
+    let ledger = createLedger(transactions(400, 5));
+    expect(ribaTotalsByCurrency(ledger)).toEqual(naiveTotalsByCurrency(ledger.transactions));
+    for (let i = 0; i < 500; i++) {
+      ledger = updateLedger(ledger, `t${Math.floor(rand() * 400)}`, toggleRiba);
+    }
+    const totals = ribaTotalsByCurrency(ledger);
+    const expected = naiveTotalsByCurrency(ledger.transactions);
+    expect(Object.keys(totals)).toEqual(Object.keys(expected));
+    expect(totals).toEqual(expected);
+  });
+
+  it('ranks riba sources as the dashboard did', () => {
+    const rand = random(6);
+    let ledger = createLedger(transactions(400, 6));
+    for (let round = 0; round < 3; round++) {
+      for (const limit of [1, 3, 10]) {
+        const top = topRibaSources(ledger, limit);
+        const expected = naiveTopSources(ledger.transactions, limit);
+        expect(top.map(([source]) => source)).toEqual(expected.map(([source]) => source));
+        top.forEach(([, sum], i) => expect(sum).toBeCloseTo(expected[i][1], 6));
+      }
+      for (let i = 0; i < 200; i++) {
+        ledger = updateLedger(ledger, `t${Math.floor(rand() * 400)}`, toggleRiba);
+      }
+    }
+  });
+
+  it('names a source with no first word Bank', () => {
+    const [txn] = transactions(1, 7);
+    const ledger = createLedger([{ ...txn, description: ' interest', isRiba: true, category: 'riba' }]);
+    expect(topRibaSources(ledger, 3)).toEqual([['Bank', txn.amount]]);
+    expect(topRibaSources(createLedger([]), 3)).toEqual([]);
+  });
+});
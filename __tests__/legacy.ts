@@ -0,0 +1,102 @@
+// The straightforward implementations the optimized modules replaced, kept
+// as references: each optimization must give exactly the same results.
+
+import { detectCategory, dominantCurrency } from '../rules/compiled';
+import { DATE_RE } from '../statement';
+import type { Currency, Transaction } from '../statement';
+import type { PageTextItem } from '../pdfText';
+
+// pdfText.ts: Object.keys(rows).find() line bucketing
+export const legacyProcessPageText = (items: PageTextItem[]): string[] => {
+  const rows: Record<string, PageTextItem[]> = {};
+  const Y_TOLERANCE = 4; // pixels
+
+  items.forEach(item => {
+    const existingY = Object.keys(rows).find(y => Math.abs(parseFloat(y) - item.y) < Y_TOLERANCE);
+
+    if (existingY) {
+      rows[existingY].push(item);
+    } else {
+      rows[item.y.toString()] = [item];
+    }
+  });
+
+  const sortedY = Object.keys(rows).sort((a, b) => parseFloat(b) - parseFloat(a));
+  return sortedY.map(y => {
+    const rowItems = rows[y].sort((a, b) => a.x - b.x);
+    return rowItems.map(i => i.str).join(' ');
+  });
+};
+
+// dedupe.ts: the filter/findIndex() pass
+export const legacyDedupe = <T extends { date: string; amount: number; description: string }>(transactions: T[]): T[] =>
+  transactions.filter((t, index, self) =>
+    !isNaN(t.amount) &&
+    t.amount > 0 &&
+    index === self.findIndex((x) => (
+      x.description === t.description && x.amount === t.amount && x.date === t.date
+    ))
+  );
+
+const parseTransactionAmount = (line: string, dateMatch: string | null): number => {
+  let clean = line;
+  if (dateMatch) clean = clean.replace(dateMatch, '');
+  clean = clean.replace(/\b\d{5,}\b/g, '');
+  const decimalMatches = clean.match(/(\d{1,3}(?:,\d{3})*\.\d{2})\b|(\d{1,3}(?:\.\d{3})*,\d{2})\b/g);
+  if (!decimalMatches || decimalMatches.length === 0) return 0;
+  const raw = decimalMatches[0];
+  if (raw.match(/,\d{2}$/)) {
+    return parseFloat(raw.replace(/\./g, '').replace(',', '.'));
+  }
+  return parseFloat(raw.replace(/,/g, ''));
+};
+
+// statement.ts: every line of the upload at once, the currency voted over the
+// joined text, then one dedupe pass. `fallback` stands in for the timezone
+// guess when no line names a currency. Ids are left out.
+export const legacyParseStatement = (
+  lines: { text: string; page: number }[],
+  fallback: Currency,
+): Omit<Transaction, 'id'>[] => {
+  const fullText = lines.map(l => l.text).join(' ');
+  const dominant = (dominantCurrency(fullText) as Currency | null) ?? fallback;
+  const transactions: Omit<Transaction, 'id'>[] = [];
+
+  lines.forEach(({ text: line, page }) => {
+    if (line.length < 5) return;
+
+    const { category, isRiba, confidence, reason } = detectCategory(line);
+    const dateMatch = line.match(DATE_RE);
+    const dateStr = dateMatch ? dateMatch[0] : null;
+    const amount = parseTransactionAmount(line, dateStr);
+
+    if (amount > 0) {
+      let currency: Currency = dominant;
+      if (line.includes('SAR')) currency = 'SAR';
+      else if (line.includes('AED')) currency = 'AED';
+      else if (line.includes('INR') || line.includes('₹')) currency = 'INR';
+      else if (line.includes('MYR') || line.includes('RM')) currency = 'MYR';
+      else if (line.includes('IDR')) currency = 'IDR';
+      else if (line.includes('GBP') || line.includes('£')) currency = 'GBP';
+      else if (line.includes('EUR') || line.includes('€')) currency = 'EUR';
+      else if (line.includes('$') || line.includes('USD')) currency = 'USD';
+
+      if (isRiba || (dateMatch && line.length > 15)) {
+        transactions.push({
+          date: dateMatch ? dateMatch[0] : new Date().toISOString().split('T')[0],
+          description: line.substring(0, 80).trim() || 'Transaction',
+          amount,
+          originalText: line,
+          isRiba,
+          currency,
+          category,
+          confidence,
+          reason,
+          page,
+        });
+      }
+    }
+  });
+
+  return legacyDedupe(transactions);
+};
@@ -0,0 +1,67 @@
+import { readFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { processPageText, Y_TOLERANCE } from '../pdfText';
+import type { PageTextItem } from '../pdfText';
+import { legacyProcessPageText } from './legacy';
+
+// Deterministic PRNG, so a failure can be reproduced
+const random = (seed: number) => () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+describe('processPageText', () => {
+  it('groups items into rows top to bottom, left to right', () => {
+    const items: PageTextItem[] = [
+      { str: 'World', x: 60, y: 700.5 },
+      { str: 'Second', x: 10, y: 680 },
+      { str: 'Hello', x: 10, y: 702 },
+    ];
+    expect(processPageText(items)).toEqual(['Hello World', 'Second']);
+  });
+
+  it('keeps rows exactly Y_TOLERANCE apart separate', () => {
+    const items: PageTextItem[] = [
+      { str: 'a', x: 0, y: 100 },
+      { str: 'b', x: 0, y: 100 - Y_TOLERANCE },
+    ];
+    expect(processPageText(items)).toEqual(['a', 'b']);
+  });
+
+  it('breaks ties between two candidate rows in the old Object.keys order', () => {
+    // 103 and 97.5 are both within range of 100; an integer key was listed first
+    const items: PageTextItem[] = [
+      { str: 'frac', x: 0, y: 97.5 },
+      { str: 'int', x: 0, y: 103 },
+      { str: 'mid', x: 5, y: 100 },
+      { str: 'mid2', x: 5, y: 100.25 },
+    ];
+    expect(processPageText(items)).toEqual(legacyProcessPageText(items));
+    expect(processPageText(items)).toEqual(['int mid mid2', 'frac']);
+  });
+
+  it('matches the old bucketing on jittered random pages', () => {
+    const rand = random(7);
+    for (let page = 0; page < 200; page++) {
+      const items: PageTextItem[] = [];
+      const rows = 1 + Math.floor(rand() * 40);
+      for (let i = 0; i < rows * 6; i++) {
+        const row = Math.floor(rand() * rows);
+        // Mix integer and fractional baselines, and gaps close to the tolerance
+        const jitter = rand() < 0.3 ? Math.round(rand() * 6 - 3) : rand() * 6 - 3;
+        items.push({ str: `w${i}`, x: Math.floor(rand() * 500), y: 760 - row * (Y_TOLERANCE + rand() * 10) + jitter });
+      }
+      expect(processPageText(items)).toEqual(legacyProcessPageText(items));
+    }
+  });
+
+  it('matches the old bucketing on the dense statement fixture', () => {
+    const { pages }: { pages: PageTextItem[][] } =
+      JSON.parse(readFileSync(join(process.cwd(), 'bench/fixtures/dense-statement.json'), 'utf8'));
+    for (const items of pages) {
+      expect(processPageText(items)).toEqual(legacyProcessPageText(items));
+    }
+  });
+});
@@ -0,0 +1,131 @@
+import { REPORT_FORMATS, isoDate, matchesFilter } from '../reportFormats';
+import type { Transaction } from '../statement';
+
+const txn = (fields: Partial<Transaction> = {}): Transaction => ({
+  id: 't1',
+  date: '05/03/2024',
+  description: 'HSBC interest',
+  amount: 12.5,
+  originalText: '05/03/2024 HSBC interest 12.50',
+  isRiba: true,
+  currency: 'GBP',
+  category: 'riba',
+  confidence: 'high',
+  page: 1,
+  ...fields,
+});
+
+describe('isoDate', () => {
+  it.each([
+    ['05/03/2024', 'GBP', '2024-03-05'], // day first by default
+    ['05/03/2024', 'USD', '2024-05-03'], // month first in dollars
+    ['03/25/2024', 'GBP', '2024-03-25'], // no 25th month: month first
+    ['25/03/2024', 'USD', '2024-03-25'], // no 25th month: day first
+    ['5.3.24', 'EUR', '2024-03-05'],
+    ['05-03-2024', 'INR', '2024-03-05'],
+    ['2024-03-05', 'USD', '2024-03-05'],
+    ['2024-3-5T10:00', 'GBP', '2024-03-05'],
+    ['12 Mar 2024', 'GBP', '2024-03-12'],
+    ['12 March 24', 'USD', '2024-03-12'],
+    ['Mar 12, 2024', 'GBP', '2024-03-12'],
+    ['  Sept. 1 2024 ', 'USD', '2024-09-01'],
+  ] as const)('reads %s (%s) as %s', (date, currency, expected) => {
+    expect(isoDate(date, currency)).toBe(expected);
+  });
+
+  it.each([
+    ['13/13/2024', 'GBP'],
+    ['00/03/2024', 'GBP'],
+    ['2024-13-01', 'GBP'],
+    ['12 Foo 2024', 'GBP'],
+    ['yesterday', 'USD'],
+    ['', 'GBP'],
+  ] as const)('gives up on %s', (date, currency) => {
+    expect(isoDate(date, currency)).toBeNull();
+  });
+});
+
+describe('matchesFilter', () => {
+  const halal = txn({ isRiba: false, category: 'shopping' });
+
+  it('keeps everything without a filter', () => {
+    expect(matchesFilter(halal, null, { ribaOnly: false })).toBe(true);
+    expect(matchesFilter(halal, null, { ribaOnly: true })).toBe(false);
+  });
+
+  it('keeps the ends of the range', () => {
+    const filter = { ribaOnly: false, from: '2024-03-01', to: '2024-03-31' };
+    expect(matchesFilter(halal, '2024-03-01', filter)).toBe(true);
+    expect(matchesFilter(halal, '2024-03-31', filter)).toBe(true);
+    expect(matchesFilter(halal, '2024-02-29', filter)).toBe(false);
+    expect(matchesFilter(halal, '2024-04-01', filter)).toBe(false);
+    expect(matchesFilter(halal, '2024-01-01', { ribaOnly: false, to: '2024-03-31' })).toBe(true);
+  });
+
+  it('drops unreadable dates once a range is set', () => {
+    expect(matchesFilter(halal, null, { ribaOnly: false, from: '2024-03-01' })).toBe(false);
+  });
+});
+
+describe('REPORT_FORMATS', () => {
+  // Split a CSV line on the commas outside quotes, undoing "" escapes
+  const csvFields = (line: string) => {
+    const fields: string[] = [];
+    let field = '';
+    let quoted = false;
+    for (let i = 0; i < line.length; i++) {
+      const c = line[i];
+      if (quoted && c === '"' && line[i + 1] === '"') { field += '"'; i++; }
+      else if (c === '"') quoted = !quoted;
+      else if (c === ',' && !quoted) { fields.push(field); field = ''; }
+      else field += c;
+    }
+    return [...fields, field];
+  };
+
+  it('quotes CSV fields with commas and quotes', () => {
+    const row = REPORT_FORMATS.csv.row(txn({ date: '5 Mar, 2024', description: 'Loan "A", interest' }), null, '2024-04-01');
+    expect(row).toBe('"5 Mar, 2024","Loan ""A"", interest",12.5,GBP,riba,Riba,high\n');
+    expect(csvFields(row.trimEnd())).toEqual(['5 Mar, 2024', 'Loan "A", interest', '12.5', 'GBP', 'riba', 'Riba', 'high']);
+  });
+
+  it('leaves plain CSV dates unquoted', () => {
+    const row = REPORT_FORMATS.csv.row(txn(), null, '2024-04-01');
+    expect(row).toBe('05/03/2024,"HSBC interest",12.5,GBP,riba,Riba,high\n');
+    expect(csvFields(REPORT_FORMATS.csv.header('2024-04-01').trimEnd())).toHaveLength(csvFields(row.trimEnd()).length);
+  });
+
+  it('escapes &, < and > in OFX', () => {
+    const row = REPORT_FORMATS.ofx.row(
+      txn({ id: 'a&b<1>', description: 'M&S <card> interest' }),
+      '2024-03-05',
+      '2024-04-01',
+    );
+    expect(row).toContain('<FITID>a&amp;b&lt;1&gt;</FITID>');
+    expect(row).toContain('<NAME>M&amp;S &lt;card&gt; interest</NAME>');
+    expect(row).toContain('<DTPOSTED>20240305</DTPOSTED>');
+    expect(row).toContain('<TRNAMT>-12.50</TRNAMT>');
+    // Nothing left that an XML parser would read as markup
+    const text = row.replace(/<\/?[A-Z]+>/g, '');
+    expect(text).not.toMatch(/[<>]|&(?!amp;|lt;|gt;)/);
+  });
+
+  it('cuts OFX names before escaping them', () => {
+    const row = REPORT_FORMATS.ofx.row(txn({ description: `${'x'.repeat(31)}&&&` }), null, '2024-04-01');
+    expect(row).toContain(`<NAME>${'x'.repeat(31)}&amp;</NAME>`);
+    expect(row).toContain('<DTPOSTED>20240401</DTPOSTED>');
+  });
+
+  it('writes income as an OFX credit', () => {
+    const row = REPORT_FORMATS.ofx.row(txn({ isRiba: false, category: 'income', amount: 100 }), '2024-03-05', '2024-04-01');
+    expect(row).toContain('<TRNTYPE>CREDIT</TRNTYPE>');
+    expect(row).toContain('<TRNAMT>100.00</TRNAMT>');
+    expect(row).toContain('<MEMO>Halal: income</MEMO>');
+  });
+
+  it('keeps each JSON Lines row on one line', () => {
+    const row = REPORT_FORMATS.jsonl.row(txn({ description: 'line\nbreak "quoted"' }), null, '2024-04-01');
+    expect(row.split('\n')).toHaveLength(2);
+    expect(JSON.parse(row).description).toBe('line\nbreak "quoted"');
+  });
+});
@@ -0,0 +1,78 @@
+import { readFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { createStatementStream } from '../statement';
+import type { Transaction } from '../statement';
+import { legacyParseStatement } from './legacy';
+
+interface Statement {
+  name: string;
+  pages: { text: string }[][];
+}
+
+const { statements }: { statements: Statement[] } =
+  JSON.parse(readFileSync(join(process.cwd(), 'bench/fixtures/golden-corpus.json'), 'utf8'));
+
+const withoutIds = (transactions: Transaction[]) => transactions.map(({ id, ...txn }) => txn);
+
+// Lines of several statements uploaded together, in upload order (file, then page)
+const uploadLines = (files: Statement[]) =>
+  files.flatMap(s => s.pages.flatMap((page, p) => page.map(line => ({ text: line.text, page: p + 1 }))));
+
+// Feed every page of `files` to a stream, in the given order of [file, page] pairs
+const stream = (files: Statement[], order: [number, number][]) => {
+  const s = createStatementStream();
+  for (const [f, p] of order) s.addPage(f, p + 1, files[f].pages[p].map(line => line.text));
+  return s;
+};
+
+const inOrder = (files: Statement[]) =>
+  files.flatMap((s, f) => s.pages.map((_, p) => [f, p] as [number, number]));
+
+describe('createStatementStream', () => {
+  it('gives the same transactions as parsing each statement at once', () => {
+    for (const statement of statements) {
+      const snapshot = stream([statement], inOrder([statement])).snapshot();
+      expect(withoutIds(snapshot)).toEqual(legacyParseStatement(uploadLines([statement]), 'USD'));
+    }
+  });
+
+  it('gives the same result whatever order the pages arrive in', () => {
+    const files = statements.slice(0, 5);
+    const expected = legacyParseStatement(uploadLines(files), 'USD');
+    const order = inOrder(files);
+    const shuffled = [...order.slice(1).reverse(), order[0]];
+    expect(withoutIds(stream(files, shuffled).snapshot())).toEqual(expected);
+  });
+
+  it('moves transactions without a currency of their own to the final vote', () => {
+    const s = createStatementStream();
+    s.addPage(0, 1, ['Account currency EUR', '01/03/2024 Interest charged 12.50']);
+    const interest = (txns: Transaction[]) => txns.find(t => t.originalText.startsWith('01/03/2024'))!;
+    const early = s.snapshot();
+    expect(interest(early).currency).toBe('EUR');
+
+    s.addPage(1, 1, ['Statement currency GBP', '02/03/2024 Card payment £20.00 GBP', 'All amounts in £ GBP']);
+    const late = s.snapshot();
+    expect(interest(late).currency).toBe('GBP');
+    // Snapshots hand out new objects; the earlier one is left as it was
+    expect(interest(early).currency).toBe('EUR');
+    expect(interest(late).id).toBe(interest(early).id);
+  });
+
+  it('forgets a dropped file and its currency votes', () => {
+    const [a, b] = statements.filter(s => s.pages.length > 1);
+    const s = stream([a, b], inOrder([a, b]));
+    s.dropFile(1);
+    expect(withoutIds(s.snapshot())).toEqual(legacyParseStatement(uploadLines([a]), 'USD'));
+    expect(s.lineCount).toBe(uploadLines([a]).length);
+  });
+
+  it('restores an exported file as if it had just been classified', () => {
+    const files = statements.slice(0, 3);
+    const original = stream(files, inOrder(files));
+    const restored = createStatementStream();
+    files.forEach((_, f) => restored.restoreFile(f, original.exportFile(f)));
+    expect(withoutIds(restored.snapshot())).toEqual(withoutIds(original.snapshot()));
+    expect(restored.lineCount).toBe(original.lineCount);
+  });
+});
@@ -0,0 +1,67 @@
+// Regenerate dense-statement.json: pdf.js text items for a dense credit card statement.
+//
+// Real statements must never be committed, so the fixture is synthetic but
+// shaped like getTextContent() output from one: 80 rows per page, descriptions
+// split into kerning-sized runs of 1-4 characters (~1,200 items per page),
+// baselines jittered by up to ±1.2pt, small superscript runs, and items
+// emitted column by column as table PDFs do.
+// To benchmark a real statement locally, record it with
+// `npx tsx bench/record-pdf-items.ts statement.pdf > /tmp/items.json` instead.
+//
+// Usage:
+//   node bench/fixtures/generate-dense-statement.mjs
+
+import { writeFileSync } from 'node:fs';
+
+const PAGES = 2;
+const ROWS_PER_PAGE = 80;
+const ROW_HEIGHT = 9;
+
+let seed = 7;
+const rand = () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+const pick = (list) => list[Math.floor(rand() * list.length)];
+const round = (n) => Math.round(n * 100) / 100;
+
+const MERCHANTS = [
+  'AMAZON MKTPLACE PMTS AMZN.COM/BILL', 'TESCO STORES 2231 LONDON', 'UBER *TRIP HELP.UBER.COM', 'SHELL OIL 57442',
+  'NETFLIX.COM 866-579-7172', 'PURCHASE INTEREST CHARGE', 'LATE PAYMENT FEE', 'PAYMENT THANK YOU',
+  'STARBUCKS STORE 10292', 'APPLE.COM/BILL ITUNES', 'CASH ADVANCE FEE', 'WHOLE FOODS MKT 10231',
+];
+const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
+const page = () => {
+  const columns = [[], [], [], [], []];
+  for (let r = 0; r < ROWS_PER_PAGE; r++) {
+    const base = 760 - r * ROW_HEIGHT;
+    const y = () => round(base + (rand() * 2.4 - 1.2));
+    const month = pick(MONTHS);
+    const day = String(1 + Math.floor(rand() * 28)).padStart(2, '0');
+
+    columns[0].push({ str: month, x: 36, y: y() }, { str: day, x: round(52 + rand()), y: y() });
+    columns[1].push({ str: month, x: 84, y: y() }, { str: day, x: round(100 + rand()), y: y() });
+    let x = 140;
+    for (const word of pick(MERCHANTS).split(' ')) {
+      for (let c = 0; c < word.length;) {
+        const run = word.slice(c, c + 1 + Math.floor(rand() * 4));
+        columns[2].push({ str: run, x: round(x), y: y() });
+        x += run.length * 4.4;
+        c += run.length;
+      }
+      x += 2.2;
+    }
+    if (rand() < 0.15) columns[2].push({ str: '†', x: round(x), y: round(base + 2.5) });
+    columns[3].push({ str: String(Math.floor(rand() * 1e8)).padStart(8, '0'), x: 420, y: y() });
+    columns[4].push({ str: (rand() * 2000).toFixed(2), x: round(520 + rand() * 8), y: y() });
+  }
+  return columns.flat();
+};
+
+const pages = Array.from({ length: PAGES }, page);
+const out = new URL('./dense-statement.json', import.meta.url);
+writeFileSync(out, JSON.stringify({ pages }) + '\n');
+console.log(`✅ ${pages.reduce((n, p) => n + p.length, 0)} items on ${PAGES} page(s) -> ${out.pathname}`);
@@ -0,0 +1,169 @@
+// Regenerate golden-corpus.json: synthetic statements with a label per line.
+//
+// Each statement has one currency, number format (US 1,234.56, EU 1.234,56 or
+// Indian 1,23,456.78), date format and one or two description languages, and
+// the set covers all 8 supported currencies. Lines are transactions (some riba, some halal) mixed
+// with the header, balance and summary lines real statements carry. Labels say
+// what a careful reader would extract, not what the pipeline currently does:
+// `txn` is null for lines that are not transactions, otherwise the amount,
+// currency and whether it is riba. Descriptions carry a reference number so no
+// two lines are duplicates.
+// The corpus is committed so the benchmark's precision/recall is comparable
+// across changes; regenerate only when adding cases, then update the baseline
+// with `npm run bench:pipeline -- --update`.
+//
+// Usage:
+//   node bench/fixtures/generate-golden-corpus.mjs
+
+import { writeFileSync } from 'node:fs';
+
+const PAGES = 3;
+const ROWS_PER_PAGE = 30;
+
+let seed = 11;
+const rand = () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+const pick = (list) => list[Math.floor(rand() * list.length)];
+
+// [description, riba]; riba covers interest and late payment penalties
+const DESCRIPTIONS = {
+  en: [
+    ['CREDIT INTEREST', true], ['Overdraft Interest Charged', true], ['LATE FEE', true],
+    ['Finance charge on purchases', true], ['NSF FEE', true], ['Int. Pd', true],
+    ['POS PURCHASE TESCO STORES', false], ['SALARY ACME LTD', false], ['MONTHLY FEE', false],
+    ['Refund - Order', false], ['DIVIDEND VANGUARD', false], ['ATM WITHDRAWAL', false],
+    ['CARD PAYMENT STARBUCKS', false], ['DIRECT DEBIT BRITISH GAS', false], ['Netflix.com', false],
+    ['TRANSFER TO SAVINGS', false], ['Grocery Outlet', false], ['UBER *TRIP', false],
+  ],
+  fr: [
+    ['Intérêts débiteurs', true], ['Agios trimestriels', true], ['Frais de retard', true],
+    ['Carte CB Carrefour', false], ['Virement salaire', false], ['Prélèvement EDF', false],
+    ['Retrait DAB', false], ['Paiement Boulangerie', false],
+  ],
+  de: [
+    ['Sollzinsen', true], ['Überziehungszinsen', true], ['Mahngebühr', true],
+    ['Kartenzahlung REWE', false], ['Gehalt', false], ['Lastschrift Telekom', false],
+    ['Bargeldauszahlung', false], ['Dauerauftrag Miete', false],
+  ],
+  ar: [
+    ['فوائد مدينة', true], ['غرامة تأخير', true], ['Fawaid', true],
+    ['راتب شهري', false], ['مشتريات كارفور', false], ['سحب نقدي', false], ['فاتورة كهرباء', false],
+  ],
+  hi: [
+    ['ब्याज शुल्क', true], ['विलंब शुल्क', true],
+    ['वेतन', false], ['किराना स्टोर', false], ['बिजली बिल', false], ['UPI PAYMENT SWIGGY', false],
+  ],
+  ms: [
+    ['Faedah dikenakan', true], ['Caj lewat bayar', true],
+    ['Gaji bulanan', false], ['Pembelian Tesco', false], ['Bil TNB', false], ['Pengeluaran ATM', false],
+  ],
+  id: [
+    ['Bunga pinjaman', true], ['Denda keterlambatan', true],
+    ['Gaji', false], ['Belanja Indomaret', false], ['Tagihan PLN', false], ['Tarik tunai ATM', false],
+  ],
+};
+
+// Markers as they appear next to amounts; '' leaves the amount bare
+const MARKERS = {
+  GBP: ['£', 'GBP ', ''], USD: ['$', 'USD ', ''], EUR: ['€', 'EUR ', ''], INR: ['₹', 'Rs.', 'INR ', ''],
+  SAR: ['SAR ', 'ر.س ', ''], AED: ['AED ', ''], MYR: ['RM', 'MYR ', ''], IDR: ['Rp', 'IDR ', ''],
+};
+
+const MONTHS = {
+  en: ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+  fr: ['janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.', 'août', 'sept.', 'oct.', 'nov.', 'déc.'],
+};
+
+const pad = (n) => String(n).padStart(2, '0');
+const DATES = {
+  'DD/MM/YYYY': (d, m, y) => `${pad(d)}/${pad(m)}/${y}`,
+  'MM/DD/YYYY': (d, m, y) => `${pad(m)}/${pad(d)}/${y}`,
+  'DD.MM.YYYY': (d, m, y) => `${pad(d)}.${pad(m)}.${y}`,
+  'DD-MM-YYYY': (d, m, y) => `${pad(d)}-${pad(m)}-${y}`,
+  'DD-MM-YY': (d, m, y) => `${pad(d)}-${pad(m)}-${String(y).slice(2)}`,
+  'DD/MM/YY': (d, m, y) => `${pad(d)}/${pad(m)}/${String(y).slice(2)}`,
+  'D Mon YYYY': (d, m, y) => `${d} ${MONTHS.en[m - 1]} ${y}`,
+  'Mon D, YYYY': (d, m, y) => `${MONTHS.en[m - 1]} ${d}, ${y}`,
+  'D mois YYYY': (d, m, y) => `${d} ${MONTHS.fr[m - 1]} ${y}`,
+  'YYYY-MM-DD': (d, m, y) => `${y}-${pad(m)}-${pad(d)}`,
+};
+
+const formatAmount = (amount, numbers) => {
+  const [int, dec] = amount.toFixed(2).split('.');
+  const groups = numbers === 'in'
+    ? int.replace(/\B(?=(\d{2})*\d{3}$)/g, ',')
+    : int.replace(/\B(?=(\d{3})+(?!\d))/g, numbers === 'eu' ? '.' : ',');
+  return numbers === 'eu' ? `${groups},${dec}` : `${groups}.${dec}`;
+};
+
+const STATEMENTS = [
+  { currency: 'GBP', numbers: 'us', dates: 'DD/MM/YYYY', languages: ['en'] },
+  { currency: 'GBP', numbers: 'us', dates: 'D Mon YYYY', languages: ['en'] },
+  { currency: 'USD', numbers: 'us', dates: 'MM/DD/YYYY', languages: ['en'] },
+  { currency: 'USD', numbers: 'us', dates: 'Mon D, YYYY', languages: ['en'] },
+  { currency: 'EUR', numbers: 'eu', dates: 'DD.MM.YYYY', languages: ['de', 'en'] },
+  { currency: 'EUR', numbers: 'eu', dates: 'D mois YYYY', languages: ['fr'] },
+  { currency: 'EUR', numbers: 'eu', dates: 'YYYY-MM-DD', languages: ['de'] },
+  { currency: 'INR', numbers: 'in', dates: 'DD-MM-YYYY', languages: ['en', 'hi'] },
+  { currency: 'INR', numbers: 'us', dates: 'D Mon YYYY', languages: ['en'] },
+  { currency: 'SAR', numbers: 'us', dates: 'DD/MM/YYYY', languages: ['ar', 'en'] },
+  { currency: 'SAR', numbers: 'eu', dates: 'DD.MM.YYYY', languages: ['ar'] },
+  { currency: 'AED', numbers: 'us', dates: 'DD-MM-YY', languages: ['en', 'ar'] },
+  { currency: 'MYR', numbers: 'us', dates: 'DD/MM/YY', languages: ['ms', 'en'] },
+  { currency: 'MYR', numbers: 'us', dates: 'YYYY-MM-DD', languages: ['ms'] },
+  { currency: 'IDR', numbers: 'eu', dates: 'DD/MM/YYYY', languages: ['id'] },
+  { currency: 'IDR', numbers: 'eu', dates: 'D Mon YYYY', languages: ['id', 'en'] },
+];
+
+// IDR amounts run into the millions
+const SCALE = { IDR: 20000, INR: 80 };
+
+let ref = 100000;
+const statement = (spec) => {
+  const { currency, numbers, dates, languages } = spec;
+  const scale = SCALE[currency] || 1;
+  const date = () => DATES[dates](1 + Math.floor(rand() * 28), 1 + Math.floor(rand() * 12), 2024);
+  const money = (max) => rand() * max * scale;
+  const marked = (amount) => `${pick(MARKERS[currency])}${formatAmount(amount, numbers)}`;
+  let balance = money(8000);
+
+  const pages = [];
+  for (let p = 0; p < PAGES; p++) {
+    const lines = [
+      { text: `Page ${p + 1} of ${PAGES}`, txn: null },
+      { text: `Account number ${String(Math.floor(rand() * 1e8)).padStart(8, '0')} Currency: ${currency}`, txn: null },
+    ];
+    if (p === 0) {
+      lines.push({ text: `Statement date ${date()}`, txn: null });
+      lines.push({ text: `Opening balance ${marked(balance)}`, txn: null });
+    }
+    for (let r = 0; r < ROWS_PER_PAGE; r++) {
+      const [description, riba] = pick(DESCRIPTIONS[pick(languages)]);
+      const amount = Math.round((riba ? money(120) : money(2500)) * 100) / 100 || 0.01;
+      balance += rand() < 0.3 ? amount : -amount;
+      const text = `${date()} ${description} ${ref++} ${marked(amount)} ${formatAmount(Math.abs(balance), numbers)}`;
+      lines.push({ text, txn: { amount, currency, riba } });
+    }
+    if (p === PAGES - 1) {
+      lines.push({ text: `Interest rate ${formatAmount(rand() * 30, numbers)}% APR`, txn: null });
+      lines.push({ text: `Total interest charged this period ${marked(money(300))}`, txn: null });
+      lines.push({ text: `Closing balance ${date()} ${marked(Math.abs(balance))}`, txn: null });
+    }
+    pages.push(lines);
+  }
+  return {
+    name: `${currency} ${numbers.toUpperCase()} ${dates} ${languages.join('+')}`,
+    ...spec,
+    pages,
+  };
+};
+
+const statements = STATEMENTS.map(statement);
+const out = new URL('./golden-corpus.json', import.meta.url);
+writeFileSync(out, JSON.stringify({ statements }) + '\n');
+const lines = statements.reduce((n, s) => n + s.pages.reduce((m, p) => m + p.length, 0), 0);
+console.log(`✅ ${statements.length} statements, ${lines} labelled lines -> ${out.pathname}`);
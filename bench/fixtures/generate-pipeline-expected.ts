@@ -0,0 +1,30 @@
+// Regenerate pipeline-expected.json: what the app's pipeline extracts from the
+// first page of every golden-corpus statement.
+//
+// scripts/tests/test_ribascan.py compares the Python port (scripts/ribascan)
+// with this output field by field. Ids are random and left out; every
+// transaction on these pages has a printed date, so nothing depends on today's
+// date. Regenerate after a change to statement.ts, dedupe.ts or
+// rules/riba_rules.toml, and make the same change in ribascan.
+//
+// Usage:
+//   npx tsx bench/fixtures/generate-pipeline-expected.ts
+
+import { readFileSync, writeFileSync } from 'node:fs';
+import { createStatementStream } from '../../statement';
+
+const corpusUrl = new URL('./golden-corpus.json', import.meta.url);
+const out = new URL('./pipeline-expected.json', import.meta.url);
+const { statements }: { statements: { name: string; pages: { text: string }[][] }[] } =
+  JSON.parse(readFileSync(corpusUrl, 'utf8'));
+
+const expected = statements.map(({ name, pages }) => {
+  const lines = pages[0].map(line => line.text);
+  const stream = createStatementStream();
+  stream.addPage(0, 1, lines);
+  const transactions = stream.snapshot().map(({ id, ...txn }) => txn);
+  return { name, transactions };
+});
+
+writeFileSync(out, JSON.stringify({ statements: expected }) + '\n');
+console.log(`✅ ${expected.length} statements, ${expected.reduce((n, s) => n + s.transactions.length, 0)} transactions -> ${out.pathname}`);
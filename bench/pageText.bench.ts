@@ -0,0 +1,69 @@
+// Micro-benchmark for processPageText (pdfText.ts) against the previous
+// Object.keys(rows).find() bucketing, on recorded pdf.js text items.
+//
+// The fixture's pages are repeated to a 200-page statement. Both versions must
+// produce identical lines for every page before any timing is reported.
+//
+// Usage:
+//   npx tsx bench/pageText.bench.ts [items.json]    # default: bench/fixtures/dense-statement.json
+
+import { readFileSync } from 'node:fs';
+import { processPageText, PageTextItem, Y_TOLERANCE } from '../pdfText';
+
+const STATEMENT_PAGES = 200;
+const ROUNDS = 5;
+
+// --- Previous implementation ---
+
+const legacyProcessPageText = (items: PageTextItem[]) => {
+  const rows: Record<string, PageTextItem[]> = {};
+  items.forEach(item => {
+    const existingY = Object.keys(rows).find(y => Math.abs(parseFloat(y) - item.y) < Y_TOLERANCE);
+    if (existingY) {
+      rows[existingY].push(item);
+    } else {
+      rows[item.y.toString()] = [item];
+    }
+  });
+  const sortedY = Object.keys(rows).sort((a, b) => parseFloat(b) - parseFloat(a));
+  return sortedY.map(y => rows[y].sort((a, b) => a.x - b.x).map(i => i.str).join(' '));
+};
+
+// --- Run ---
+
+const path = process.argv[2] || new URL('./fixtures/dense-statement.json', import.meta.url);
+const dump = JSON.parse(readFileSync(path, 'utf8'));
+const recorded: PageTextItem[][] = Array.isArray(dump) ? dump : dump.pages;
+const pages = Array.from({ length: STATEMENT_PAGES }, (_, i) => recorded[i % recorded.length]);
+const itemCount = pages.reduce((n, p) => n + p.length, 0);
+
+for (const [i, page] of recorded.entries()) {
+  const before = legacyProcessPageText(page);
+  const after = processPageText(page);
+  if (JSON.stringify(before) !== JSON.stringify(after)) {
+    console.error(`❌ Page ${i + 1}: lines differ from the previous implementation`);
+    process.exit(1);
+  }
+}
+
+const time = (fn: (items: PageTextItem[]) => string[]) => {
+  let best = Infinity;
+  let lines = 0;
+  for (let r = 0; r < ROUNDS; r++) {
+    const start = performance.now();
+    lines = 0;
+    for (const page of pages) lines += fn(page).length;
+    best = Math.min(best, performance.now() - start);
+  }
+  return { ms: best, lines };
+};
+
+const before = time(legacyProcessPageText);
+const after = time(processPageText);
+
+console.log(`✅ ${STATEMENT_PAGES} pages, ${itemCount} items, ${after.lines} lines; output identical; best of ${ROUNDS} rounds\n`);
+console.log(`${'version'.padEnd(10)} ${'ms'.padStart(10)} ${'items/s'.padStart(14)}`);
+for (const [name, r] of [['before', before], ['after', after]] as const) {
+  console.log(`${name.padEnd(10)} ${r.ms.toFixed(1).padStart(10)} ${Math.round(itemCount / r.ms * 1000).toString().padStart(14)}`);
+}
+console.log(`\n${(before.ms / after.ms).toFixed(1)}x faster`);
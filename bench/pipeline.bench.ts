@@ -0,0 +1,217 @@
+// Speed and accuracy of the statement pipeline on the golden corpus.
+//
+// Each labelled statement (bench/fixtures/golden-corpus.json) is laid out as
+// pdf.js text items, grouped into lines by processPageText (pdfText.ts) and
+// classified by its own statement stream (statement.ts), one upload per
+// statement as processFiles does. Reported:
+//   speed     lines/s through the classifier, ms per page end to end, peak heap
+//   accuracy  precision/recall of transaction and riba detection against the
+//             labels, and how often the amount and currency were right
+// Accuracy is deterministic, so it is compared with
+// bench/fixtures/golden-baseline.json and any drop fails the run; speed
+// depends on the machine and is only reported.
+//
+// Usage:
+//   npx tsx bench/pipeline.bench.ts             # report; exit 1 if accuracy dropped
+//   npx tsx bench/pipeline.bench.ts --update    # accept the current accuracy as the baseline
+//   node --expose-gc --import tsx bench/pipeline.bench.ts   # steadier heap figures
+
+import { readFileSync, writeFileSync } from 'node:fs';
+import { processPageText, PageTextItem } from '../pdfText';
+import { createStatementStream, Transaction } from '../statement';
+
+const REPEAT = 10; // corpus passes per timed round
+const ROUNDS = 5;
+const ROW_HEIGHT = 12;
+
+interface Label {
+  amount: number;
+  currency: string;
+  riba: boolean;
+}
+
+interface Statement {
+  name: string;
+  pages: { text: string; txn: Label | null }[][];
+}
+
+interface Rate {
+  precision: number;
+  recall: number;
+}
+
+interface Accuracy {
+  transactions: Rate;
+  riba: Rate;
+  amount: number; // share of detected transactions with the labelled amount
+  currency: number; // same, for the currency
+}
+
+const corpusUrl = new URL('./fixtures/golden-corpus.json', import.meta.url);
+const baselineUrl = new URL('./fixtures/golden-baseline.json', import.meta.url);
+const { statements }: { statements: Statement[] } = JSON.parse(readFileSync(corpusUrl, 'utf8'));
+
+// --- Layout: one item per word, rows top to bottom with a little baseline jitter ---
+
+let seed = 3;
+const rand = () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+const layout = (lines: string[]): PageTextItem[] => {
+  const items: PageTextItem[] = [];
+  lines.forEach((line, row) => {
+    let x = 36;
+    for (const str of line.split(' ')) {
+      items.push({ str, x, y: 760 - row * ROW_HEIGHT + (rand() * 2 - 1) });
+      x += str.length * 5 + 3;
+    }
+  });
+  return items;
+};
+
+const pages = statements.map(s => s.pages.map(page => layout(page.map(line => line.text))));
+const pageCount = pages.reduce((n, s) => n + s.length, 0);
+const lineCount = statements.reduce((n, s) => n + s.pages.reduce((m, p) => m + p.length, 0), 0);
+
+// The layout must survive line grouping, or the labels would not line up
+statements.forEach((s, i) => s.pages.forEach((page, p) => {
+  const lines = processPageText(pages[i][p]);
+  if (JSON.stringify(lines) !== JSON.stringify(page.map(line => line.text))) {
+    console.error(`❌ ${s.name}, page ${p + 1}: processPageText did not reproduce the corpus lines`);
+    process.exit(1);
+  }
+}));
+
+// --- Pipeline ---
+
+const timing = { pageText: 0, classify: 0 };
+const run = (items: PageTextItem[][]): Transaction[] => {
+  const stream = createStatementStream();
+  items.forEach((page, p) => {
+    const start = performance.now();
+    const lines = processPageText(page);
+    const grouped = performance.now();
+    stream.addPage(0, p + 1, lines);
+    timing.pageText += grouped - start;
+    timing.classify += performance.now() - grouped;
+  });
+  const start = performance.now();
+  const transactions = stream.snapshot();
+  timing.classify += performance.now() - start;
+  return transactions;
+};
+
+// --- Accuracy ---
+
+const rate = (tp: number, fp: number, fn: number): Rate => ({
+  precision: tp + fp ? tp / (tp + fp) : 1,
+  recall: tp + fn ? tp / (tp + fn) : 1,
+});
+
+const score = (statement: Statement, found: Transaction[]) => {
+  const byText = new Map(found.map(t => [t.originalText, t]));
+  const n = { tp: 0, fp: 0, fn: 0, ribaTp: 0, ribaFp: 0, ribaFn: 0, amount: 0, currency: 0 };
+  for (const page of statement.pages) {
+    for (const { text, txn: label } of page) {
+      const t = byText.get(text);
+      if (t && label) n.tp++;
+      else if (t) n.fp++;
+      else if (label) n.fn++;
+      const riba = Boolean(t?.isRiba);
+      if (riba && label?.riba) n.ribaTp++;
+      else if (riba) n.ribaFp++;
+      else if (label?.riba) n.ribaFn++;
+      if (t && label) {
+        if (Math.abs(t.amount - label.amount) < 0.005) n.amount++;
+        if (t.currency === label.currency) n.currency++;
+      }
+    }
+  }
+  return n;
+};
+
+type Counts = ReturnType<typeof score>;
+
+const accuracy = (n: Counts): Accuracy => ({
+  transactions: rate(n.tp, n.fp, n.fn),
+  riba: rate(n.ribaTp, n.ribaFp, n.ribaFn),
+  amount: n.tp ? n.amount / n.tp : 1,
+  currency: n.tp ? n.currency / n.tp : 1,
+});
+
+const perStatement = statements.map((s, i) => ({ name: s.name, counts: score(s, run(pages[i])) }));
+const total = perStatement.reduce((sum, { counts }) => {
+  for (const key of Object.keys(sum) as (keyof Counts)[]) sum[key] += counts[key];
+  return sum;
+}, { tp: 0, fp: 0, fn: 0, ribaTp: 0, ribaFp: 0, ribaFn: 0, amount: 0, currency: 0 });
+const result = accuracy(total);
+
+// --- Speed ---
+
+const gc = (globalThis as { gc?: () => void }).gc;
+gc?.();
+const heapBefore = process.memoryUsage().heapUsed;
+let heapPeak = heapBefore;
+let best = { pageText: Infinity, classify: Infinity, total: Infinity };
+for (let r = 0; r < ROUNDS; r++) {
+  timing.pageText = timing.classify = 0;
+  for (let pass = 0; pass < REPEAT; pass++) {
+    for (const items of pages) {
+      run(items);
+      heapPeak = Math.max(heapPeak, process.memoryUsage().heapUsed);
+    }
+  }
+  const round = { ...timing, total: timing.pageText + timing.classify };
+  if (round.total < best.total) best = round;
+}
+
+// --- Report ---
+
+const pct = (x: number) => `${(x * 100).toFixed(1)}%`.padStart(7);
+const mb = (bytes: number) => `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+
+console.log(`✅ ${statements.length} statements, ${pageCount} pages, ${lineCount} labelled lines; ${REPEAT} passes per round, best of ${ROUNDS}\n`);
+console.log(`${'stage'.padEnd(12)} ${'ms/page'.padStart(10)} ${'lines/s'.padStart(12)}`);
+for (const stage of ['pageText', 'classify', 'total'] as const) {
+  const ms = best[stage];
+  console.log(`${stage.padEnd(12)} ${(ms / (pageCount * REPEAT)).toFixed(3).padStart(10)} ${Math.round(lineCount * REPEAT / ms * 1000).toString().padStart(12)}`);
+}
+console.log(`peak heap    ${mb(heapPeak)} (+${mb(heapPeak - heapBefore)} while running)${gc ? '' : '; run with --expose-gc for a steadier figure'}\n`);
+
+console.log(`${'statement'.padEnd(32)} ${'txn P'.padStart(7)} ${'txn R'.padStart(7)} ${'riba P'.padStart(7)} ${'riba R'.padStart(7)} ${'amount'.padStart(7)} ${'curr.'.padStart(7)}`);
+const row = (name: string, a: Accuracy) => console.log(
+  `${name.padEnd(32)} ${pct(a.transactions.precision)} ${pct(a.transactions.recall)} ${pct(a.riba.precision)} ${pct(a.riba.recall)} ${pct(a.amount)} ${pct(a.currency)}`
+);
+for (const { name, counts } of perStatement) row(name, accuracy(counts));
+row('all', result);
+
+// --- Baseline ---
+
+const metrics = (a: Accuracy): [string, number][] => [
+  ['transaction precision', a.transactions.precision], ['transaction recall', a.transactions.recall],
+  ['riba precision', a.riba.precision], ['riba recall', a.riba.recall],
+  ['amount accuracy', a.amount], ['currency accuracy', a.currency],
+];
+
+if (process.argv.includes('--update')) {
+  writeFileSync(baselineUrl, JSON.stringify(result, null, 2) + '\n');
+  console.log(`\n✅ Baseline updated: ${baselineUrl.pathname}`);
+} else {
+  const baseline: Accuracy = JSON.parse(readFileSync(baselineUrl, 'utf8'));
+  const now = metrics(result);
+  const drops = metrics(baseline).filter(([, before], i) => now[i][1] < before - 1e-9);
+  const gains = metrics(baseline).filter(([, before], i) => now[i][1] > before + 1e-9);
+  if (drops.length) {
+    for (const [name, before] of drops) {
+      console.error(`❌ ${name} dropped: ${pct(before).trim()} -> ${pct(now.find(([n]) => n === name)![1]).trim()}`);
+    }
+    process.exit(1);
+  }
+  console.log(gains.length
+    ? `\n✅ Accuracy improved on ${gains.map(([name]) => name).join(', ')}; run with --update to raise the baseline`
+    : '\n✅ Accuracy matches the baseline');
+}
@@ -0,0 +1,29 @@
+// Record a PDF's pdf.js text items as {"pages": [[{ str, x, y }, ...], ...]}
+//
+// The same format the page-text benchmark and scripts/scan_statements.py read.
+// Dumps of real statements contain personal data: keep them out of the repo.
+//
+// Usage:
+//   npx tsx bench/record-pdf-items.ts statement.pdf > /tmp/items.json
+
+import { readFileSync } from 'node:fs';
+import * as pdfjs from 'pdfjs-dist/legacy/build/pdf.mjs';
+
+const path = process.argv[2];
+if (!path) {
+  console.error('Usage: npx tsx bench/record-pdf-items.ts <statement.pdf>');
+  process.exit(1);
+}
+
+const pdf = await pdfjs.getDocument({ data: new Uint8Array(readFileSync(path)) }).promise;
+const pages: { str: string; x: number; y: number }[][] = [];
+for (let i = 1; i <= pdf.numPages; i++) {
+  const page = await pdf.getPage(i);
+  const textContent = await page.getTextContent();
+  // Same mapping as processWorker.ts
+  pages.push(textContent.items.map((item: any) => ({ str: item.str, x: item.transform[4], y: item.transform[5] })));
+}
+await pdf.destroy();
+
+process.stdout.write(JSON.stringify({ pages }) + '\n');
+console.error(`✅ ${pages.reduce((n, p) => n + p.length, 0)} items on ${pages.length} page(s)`);
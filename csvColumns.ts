@@ -0,0 +1,165 @@
+// csvColumns.ts
+// Column auto-mapping for CSV bank exports (used by processWorker.ts)
+//
+// The header row and the first chunk of rows are inspected once per file to
+// find the date, description, amount and debit/credit columns. Rows are then
+// read straight from those columns instead of guessing the amount from the
+// whole line; files whose columns can't be recognized stay on the line path.
+
+import { DATE_RE } from './statement';
+
+export interface CsvColumns {
+  date: string;
+  description: string | null;
+  amount: string | null;
+  debit: string | null;
+  credit: string | null;
+}
+
+// One CSV row read through its column mapping
+export interface CsvRow {
+  date: string;
+  description: string;
+  amount: number; // absolute value, NaN if the amount cells are empty or unreadable
+  text: string; // every cell, as the line path would see the row
+}
+
+type Role = keyof CsvColumns;
+
+// Header keywords per role, best first; headers are compared lowercased and without accents
+const HEADER_KEYWORDS: Record<Role, string[]> = {
+  date: [
+    'date', 'datum', 'fecha', 'tanggal', 'tarikh', 'tarih', 'buchungstag', 'posted',
+    'تاريخ', 'दिनांक', 'तारीख', 'তারিখ', 'дата', '日期', 'תאריך',
+  ],
+  debit: [
+    'debit', 'withdrawal', 'paid out', 'money out', 'debet', 'soll', 'borc', 'afschrijving',
+    'مدين', 'नामे', 'डेबिट', 'дебет', 'списание', '支出', 'חובה',
+  ],
+  credit: [
+    'credit', 'deposit', 'paid in', 'money in', 'kredit', 'haben', 'alacak', 'bijschrijving',
+    'دائن', 'जमा', 'क्रेडिट', 'кредит', 'зачисление', '收入', 'זכות',
+  ],
+  amount: [
+    'amount', 'montant', 'betrag', 'bedrag', 'importe', 'jumlah', 'amaun', 'tutar', 'iznos', 'shuma',
+    'المبلغ', 'مبلغ', 'राशि', 'টাকা', 'сумма', '金额', 'סכום', 'value',
+  ],
+  description: [
+    'description', 'details', 'narrative', 'memo', 'payee', 'merchant', 'particulars',
+    'libelle', 'omschrijving', 'verwendungszweck', 'beschreibung', 'keterangan', 'butiran',
+    'aciklama', 'acıklama', 'opis', 'pershkrim', 'البيان', 'الوصف', 'विवरण', 'বিবরণ',
+    'описание', 'назначение', '摘要', '描述', 'תיאור', 'reference', 'transaction', 'name',
+  ],
+};
+
+// Running balances look like amounts but never are one
+const BALANCE_KEYWORDS = ['balance', 'saldo', 'solde', 'baki', 'bakiye', 'الرصيد', 'शेष', 'остаток', '余额', 'יתרה'];
+
+// Debit and credit are read before amount so "Debit Amount" is not taken as the amount
+const ROLE_ORDER: Role[] = ['date', 'debit', 'credit', 'amount', 'description'];
+
+const SAMPLE_ROWS = 50;
+const ISO_DATE_RE = /^\d{4}[./-]\d{1,2}[./-]\d{1,2}/;
+// Currency codes, CR/DR markers and symbols around a number
+const CURRENCY_TEXT_RE = /[A-Za-z]{2,3}\.?|[$£€₹﷼]/g;
+
+const normalizeHeader = (header: string) =>
+  header.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').trim();
+
+const cell = (row: Record<string, unknown>, field: string | null) =>
+  field === null ? '' : String(row[field] ?? '').trim();
+
+const looksLikeDate = (value: string) => ISO_DATE_RE.test(value) || DATE_RE.test(value);
+
+const looksLikeAmount = (value: string) =>
+  /\d/.test(value) && !looksLikeDate(value) && /^[\d.,'\s()+-]*$/.test(value.replace(CURRENCY_TEXT_RE, ''));
+
+// Amount cell -> absolute value. Either separator may be the decimal one: with
+// both present the last one is, a lone comma is thousands only when followed by
+// exactly three digits, and a lone dot is always decimal (KWD/BHD use three).
+export const parseCsvAmount = (raw: string): number => {
+  let clean = raw.replace(/[^\d.,]/g, '');
+  if (!/\d/.test(clean)) return NaN;
+  const comma = clean.lastIndexOf(',');
+  const dot = clean.lastIndexOf('.');
+  if (comma !== -1 && dot !== -1) {
+    const decimal = comma > dot ? ',' : '.';
+    clean = clean.split(decimal === ',' ? '.' : ',').join('').replace(',', '.');
+  } else if (comma !== -1) {
+    const single = clean.indexOf(',') === comma;
+    clean = single && clean.length - comma - 1 !== 3 ? clean.replace(',', '.') : clean.split(',').join('');
+  } else if (dot !== -1 && clean.indexOf('.') !== dot) {
+    clean = clean.split('.').join(''); // 1.234.567
+  }
+  return Number(clean);
+};
+
+// Share of the non-empty sample cells in `field` accepted by `test` (0 if all are empty)
+const matchRate = (sample: Record<string, unknown>[], field: string, test: (value: string) => boolean) => {
+  let filled = 0;
+  let matched = 0;
+  for (const row of sample) {
+    const value = cell(row, field);
+    if (!value) continue;
+    filled++;
+    if (test(value)) matched++;
+  }
+  return filled ? matched / filled : 0;
+};
+
+const ROLE_TEST: Record<Role, ((value: string) => boolean) | null> = {
+  date: looksLikeDate,
+  debit: looksLikeAmount,
+  credit: looksLikeAmount,
+  amount: looksLikeAmount,
+  description: null,
+};
+
+// Map header fields to roles, or null if there is no date column or no amount
+// (or debit/credit) column whose sample values actually look like one
+export const detectCsvColumns = (fields: string[], rows: Record<string, unknown>[]): CsvColumns | null => {
+  const sample = rows.slice(0, SAMPLE_ROWS);
+  const headers = fields.map(normalizeHeader);
+  const used = new Set<number>();
+  const found: Partial<Record<Role, string>> = {};
+
+  for (const role of ROLE_ORDER) {
+    const test = ROLE_TEST[role];
+    for (const keyword of HEADER_KEYWORDS[role]) {
+      const index = headers.findIndex((header, i) =>
+        !used.has(i) && header.includes(keyword) &&
+        (role === 'date' || role === 'description' || !BALANCE_KEYWORDS.some(kw => header.includes(kw))) &&
+        (!test || matchRate(sample, fields[i], test) >= 0.5));
+      if (index === -1) continue;
+      used.add(index);
+      found[role] = fields[index];
+      break;
+    }
+  }
+
+  if (!found.date || !(found.amount || found.debit || found.credit)) return null;
+  return {
+    date: found.date,
+    description: found.description ?? null,
+    amount: found.amount ?? null,
+    debit: found.debit ?? null,
+    credit: found.credit ?? null,
+  };
+};
+
+// Read one parsed row; the amount comes from the amount column, else the
+// debit column, else the credit column (the first that holds a non-zero value)
+export const readCsvRow = (row: Record<string, unknown>, columns: CsvColumns): CsvRow => {
+  let amount = NaN;
+  for (const field of [columns.amount, columns.debit, columns.credit]) {
+    if (field === null) continue;
+    amount = parseCsvAmount(cell(row, field));
+    if (amount > 0) break;
+  }
+  return {
+    date: cell(row, columns.date),
+    description: cell(row, columns.description),
+    amount,
+    text: Object.values(row).join(' ').trim(),
+  };
+};
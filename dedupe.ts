@@ -0,0 +1,53 @@
+// dedupe.ts
+// Transaction deduplication (used by statement.ts)
+
+export interface DedupeFields {
+  date: string;
+  amount: number;
+  description: string;
+}
+
+// date and amount never contain \u0000, so with the free-text description last
+// two different transactions can never produce the same key
+export const transactionKey = (t: DedupeFields) => `${t.date}\u0000${t.amount}\u0000${t.description}`;
+
+// Incremental dedupe stage: the first transaction with a given
+// (description, amount, date) wins and later copies are dropped. Transactions
+// without a positive amount are dropped too. The key set persists across add()
+// calls, so statements with overlapping date ranges can be fed one after the
+// other and the overlap is only kept from the first one.
+export const createDedupeStage = <T extends DedupeFields>() => {
+  const seen = new Set<string>();
+  let dropped = 0;
+  return {
+    add(batch: T[]): T[] {
+      const kept: T[] = [];
+      for (const t of batch) {
+        if (!(t.amount > 0)) {
+          dropped++;
+          continue;
+        }
+        const key = transactionKey(t);
+        if (seen.has(key)) {
+          dropped++;
+          continue;
+        }
+        seen.add(key);
+        kept.push(t);
+      }
+      return kept;
+    },
+    get size() { return seen.size; },
+    get dropped() { return dropped; },
+  };
+};
+
+// Same result as the previous filter/findIndex() pass, in O(n)
+export const dedupeTransactions = <T extends DedupeFields>(transactions: T[]): T[] =>
+  createDedupeStage<T>().add(transactions);
+
+// Merge per-statement results (in upload order) into one list
+export const mergeStatements = <T extends DedupeFields>(statements: T[][]): T[] => {
+  const stage = createDedupeStage<T>();
+  return statements.flatMap(batch => stage.add(batch));
+};
@@ -0,0 +1,143 @@
+// diagnostics.ts
+// Per-stage timings and counters of recent scans, for the diagnostics panel in Settings
+//
+// Stages are timed with performance.measure, so they also show up as
+// "ribapurify:<stage>" in the browser's performance profile. Workers time
+// their own stages (processWorker.ts) and send the totals with their 'done'
+// message. A profile holds durations, counts and file sizes only, never file
+// names or statement text, so it can be exported and shared as it is.
+
+export type Stage = 'pdfLoad' | 'textContent' | 'lineGrouping' | 'csvParse' | 'ocr' | 'classify' | 'snapshot' | 'dedupe';
+
+// Display order, with what each stage covers
+export const STAGES: { stage: Stage; label: string }[] = [
+  { stage: 'pdfLoad', label: 'pdf.js load + parse' },
+  { stage: 'textContent', label: 'getPage + getTextContent' },
+  { stage: 'lineGrouping', label: 'Line bucketing' },
+  { stage: 'csvParse', label: 'CSV parsing' },
+  { stage: 'ocr', label: 'OCR (incl. queueing)' },
+  { stage: 'classify', label: 'detectCategory (pages)' },
+  { stage: 'snapshot', label: 'Partial results (vote + dedupe)' },
+  { stage: 'dedupe', label: 'Final currency vote + dedupe' },
+];
+
+export interface StageTiming {
+  calls: number;
+  ms: number;
+  maxMs: number;
+}
+
+export type StageTimings = Partial<Record<Stage, StageTiming>>;
+
+export interface ScanCounters {
+  pages: number;
+  lines: number;
+  transactions: number;
+  ocrWords: number;
+}
+
+export interface ScanProfile {
+  startedAt: string; // ISO time
+  durationMs: number;
+  files: { kind: 'pdf' | 'csv' | 'image' | 'cached'; bytes: number }[];
+  stages: StageTimings;
+  counters: ScanCounters;
+  peakHeapBytes: number | null; // Chromium's performance.memory only
+  environment: { userAgent: string; cores: number | null; deviceMemoryGb: number | null };
+}
+
+const MAX_PROFILES = 10; // kept for the session, newest first
+
+const profiles: ScanProfile[] = [];
+const listeners = new Set<() => void>();
+
+const addTiming = (timings: StageTimings, stage: Stage, ms: number) => {
+  const timing = timings[stage] ??= { calls: 0, ms: 0, maxMs: 0 };
+  timing.calls++;
+  timing.ms += ms;
+  timing.maxMs = Math.max(timing.maxMs, ms);
+};
+
+// Time one stage call that began at `start` (a performance.now() value)
+export const measureStage = (timings: StageTimings, stage: Stage, start: number) => {
+  const end = performance.now();
+  try {
+    performance.measure(`ribapurify:${stage}`, { start, end });
+  } catch {
+    // measure() without start/end options (older Safari): keep the totals only
+  }
+  addTiming(timings, stage, end - start);
+};
+
+// Add timings reported by a worker
+export const mergeTimings = (into: StageTimings, from: StageTimings) => {
+  for (const [stage, timing] of Object.entries(from) as [Stage, StageTiming][]) {
+    const total = into[stage] ??= { calls: 0, ms: 0, maxMs: 0 };
+    total.calls += timing.calls;
+    total.ms += timing.ms;
+    total.maxMs = Math.max(total.maxMs, timing.maxMs);
+  }
+};
+
+const heapUsed = (): number | null => (performance as any).memory?.usedJSHeapSize ?? null;
+
+// Collects one scan, finished or not; finish() stores the profile and returns it
+export const createScanProfiler = () => {
+  const start = performance.now();
+  const startedAt = new Date().toISOString();
+  const stages: StageTimings = {};
+  const counters: ScanCounters = { pages: 0, lines: 0, transactions: 0, ocrWords: 0 };
+  const files: ScanProfile['files'] = [];
+  let peakHeap = heapUsed();
+  let profile: ScanProfile | null = null;
+  for (const { stage } of STAGES) performance.clearMeasures?.(`ribapurify:${stage}`);
+
+  const sampleHeap = () => {
+    const used = heapUsed();
+    if (used !== null) peakHeap = Math.max(peakHeap ?? 0, used);
+  };
+
+  return {
+    stages,
+    counters,
+    sampleHeap,
+    file(kind: ScanProfile['files'][number]['kind'], bytes: number) {
+      files.push({ kind, bytes });
+    },
+    // Only the first call records a profile, so failure paths can call it freely
+    finish(transactions: number): ScanProfile {
+      if (profile) return profile;
+      sampleHeap();
+      counters.transactions = transactions;
+      const nav = navigator as Navigator & { deviceMemory?: number };
+      profile = {
+        startedAt,
+        durationMs: performance.now() - start,
+        files,
+        stages,
+        counters,
+        peakHeapBytes: peakHeap,
+        environment: {
+          userAgent: nav.userAgent,
+          cores: nav.hardwareConcurrency || null,
+          deviceMemoryGb: nav.deviceMemory ?? null,
+        },
+      };
+      profiles.unshift(profile);
+      profiles.length = Math.min(profiles.length, MAX_PROFILES);
+      listeners.forEach(listener => listener());
+      return profile;
+    },
+  };
+};
+
+export type ScanProfiler = ReturnType<typeof createScanProfiler>;
+
+export const getScanProfiles = (): readonly ScanProfile[] => profiles;
+
+export const onScanProfile = (listener: () => void) => {
+  listeners.add(listener);
+  return () => { listeners.delete(listener); };
+};
+
+export const exportScanProfiles = () => JSON.stringify({ app: 'ribapurify', profiles }, null, 2);
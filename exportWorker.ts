@@ -0,0 +1,135 @@
+// exportWorker.ts
+// Web Worker that writes report exports (reportFormats.ts), started by reportExport.ts
+//
+// Rows are pulled from the main thread a slice at a time, filtered and
+// formatted here, so neither thread builds the report as one string. Without
+// an output file each chunk is wrapped in a Blob of its own, which the browser
+// can keep outside the JS heap, and those become the parts of the download;
+// with one (File System Access) each chunk is posted back and written as soon
+// as it is made.
+// OFX takes more than one pass over the rows: the first finds each
+// currency's date range, then each currency's rows are read and written
+// under its own statement, so none are held back until the end.
+
+import { REPORT_FORMATS, isoDate, matchesFilter } from './reportFormats';
+import type { ExportFilter, ExportFormat } from './reportFormats';
+import type { Currency, Transaction } from './statement';
+
+export const EXPORT_SLICE = 1000; // rows per 'read'
+
+export type ExportRequest =
+  | { type: 'start'; format: ExportFormat; filter: ExportFilter; total: number; today: string; toFile: boolean }
+  | { type: 'rows'; from: number; rows: Transaction[] };
+
+export type ExportResponse =
+  | { type: 'read'; from: number; count: number }
+  | { type: 'chunk'; chunk: string }
+  | { type: 'progress'; fraction: number }
+  | { type: 'done'; blob: Blob | null; count: number }
+  | { type: 'error'; error: string };
+
+type Start = Extract<ExportRequest, { type: 'start' }>;
+
+interface DateRange {
+  from: string;
+  to: string;
+}
+
+const post = (response: ExportResponse) => self.postMessage(response);
+
+let reading: ((rows: Transaction[]) => void) | null = null;
+const read = (from: number) => new Promise<Transaction[]>(resolve => {
+  reading = resolve;
+  post({ type: 'read', from, count: EXPORT_SLICE });
+});
+
+// One pass over the rows that match the filter; `onSlice` gets the share of
+// the rows read so far
+const eachRow = async (
+  { filter, total }: Start,
+  onRow: (txn: Transaction, date: string | null) => void,
+  onSlice: (fraction: number) => void,
+) => {
+  for (let from = 0; from < total; from += EXPORT_SLICE) {
+    for (const txn of await read(from)) {
+      const date = isoDate(txn.date, txn.currency);
+      if (matchesFilter(txn, date, filter)) onRow(txn, date);
+    }
+    onSlice(Math.min(total, from + EXPORT_SLICE) / total);
+  }
+};
+
+const run = async (start: Start) => {
+  const { toFile, today } = start;
+  const format = REPORT_FORMATS[start.format];
+  const parts: Blob[] = [];
+  const write = (chunk: string) => {
+    if (chunk === '') return;
+    if (toFile) post({ type: 'chunk', chunk });
+    else parts.push(new Blob([chunk]));
+  };
+  const progress = (fraction: number) => post({ type: 'progress', fraction });
+  let count = 0;
+
+  write(format.header(today));
+  if (!format.statement) {
+    let text = '';
+    await eachRow(start, (txn, date) => {
+      count++;
+      text += format.row(txn, date, today);
+    }, fraction => {
+      write(text);
+      text = '';
+      progress(fraction);
+    });
+  } else {
+    // First pass (half the progress bar): the date range of every currency
+    const ranges = new Map<Currency, DateRange>();
+    await eachRow(start, (txn, date) => {
+      count++;
+      const posted = date || today;
+      const range = ranges.get(txn.currency);
+      if (!range) {
+        ranges.set(txn.currency, { from: posted, to: posted });
+        return;
+      }
+      if (posted < range.from) range.from = posted;
+      if (posted > range.to) range.to = posted;
+    }, fraction => progress(fraction / 2));
+
+    // Then a pass per currency, writing its rows inside its statement
+    const { statement } = format;
+    let done = 0;
+    for (const [currency, range] of ranges) {
+      write(statement.start(currency, range.from, range.to));
+      let text = '';
+      await eachRow(start, (txn, date) => {
+        if (txn.currency === currency) text += format.row(txn, date, today);
+      }, fraction => {
+        write(text);
+        text = '';
+        progress(0.5 + (done + fraction) / ranges.size / 2);
+      });
+      write(statement.end(currency, range.to));
+      done++;
+    }
+  }
+  write(format.footer());
+
+  post({ type: 'done', blob: toFile ? null : new Blob(parts, { type: format.mimeType }), count });
+};
+
+// Worker message handler
+self.onmessage = async (event: MessageEvent<ExportRequest>) => {
+  const request = event.data;
+  if (request.type === 'rows') {
+    reading?.(request.rows);
+    return;
+  }
+  try {
+    await run(request);
+  } catch (error: any) {
+    console.error('Export worker error:', error);
+    post({ type: 'error', error: error?.message || String(error) });
+  }
+};
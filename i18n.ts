@@ -0,0 +1,100 @@
+import { Language, LocaleStrings, RichParagraph } from './locales';
+
+// Locale strings and blog posts are compiled by scripts/build_locales.py into
+// content-hashed JSON under /i18n/assets/. Only the manifest is revalidated;
+// the hashed assets never change, so the browser (and sw.js) cache them forever.
+// A locale's blog index lists its posts without their text; each post's body
+// is a separate asset of pre-tokenized rich text, fetched when the post is opened.
+export const LOCALE_MANIFEST_URL = '/i18n/manifest.json';
+
+export interface BlogPost {
+  title: string;
+  excerpt: string;
+  category: string;
+  readTime: string;
+  date: string;
+  author: string;
+  role: string;
+  color: string;
+  body: string; // URL of the post's paragraphs, see loadBlogArticle()
+}
+
+interface LocaleManifest {
+  version: number;
+  locales: Partial<Record<Language, { strings: string; blog?: string }>>;
+}
+
+let manifestPromise: Promise<LocaleManifest> | null = null;
+
+const loadManifest = (): Promise<LocaleManifest> => {
+  if (!manifestPromise) {
+    manifestPromise = fetch(LOCALE_MANIFEST_URL, { cache: 'no-cache' })
+      .then(res => {
+        if (!res.ok) throw new Error(`Locale manifest request failed: ${res.status}`);
+        return res.json();
+      })
+      .catch(e => {
+        // Allow a retry on the next call instead of caching the failure
+        manifestPromise = null;
+        throw e;
+      });
+  }
+  return manifestPromise;
+};
+
+const fetchJSON = async <T,>(url: string): Promise<T> => {
+  const res = await fetch(url);
+  if (!res.ok) throw new Error(`${url} request failed: ${res.status}`);
+  return res.json();
+};
+
+const loaded: Partial<Record<Language, LocaleStrings>> = {};
+const pending: Partial<Record<Language, Promise<LocaleStrings>>> = {};
+const blogPending: Partial<Record<Language, Promise<BlogPost[]>>> = {};
+const articlePending = new Map<string, Promise<RichParagraph[]>>();
+
+// Already-downloaded strings for a locale, or undefined if not loaded yet
+export const getLoadedLocale = (lang: Language): LocaleStrings | undefined => loaded[lang];
+
+export const loadLocale = (lang: Language): Promise<LocaleStrings> => {
+  if (loaded[lang]) return Promise.resolve(loaded[lang]!);
+  if (!pending[lang]) {
+    pending[lang] = loadManifest()
+      .then(manifest => {
+        const entry = manifest.locales[lang] || manifest.locales.en!;
+        return fetchJSON<LocaleStrings>(entry.strings);
+      })
+      .then(strings => (loaded[lang] = strings))
+      .finally(() => { delete pending[lang]; });
+  }
+  return pending[lang]!;
+};
+
+// Blog posts for a locale, falling back to English when it has no translation
+export const loadBlogPosts = (lang: Language): Promise<BlogPost[]> => {
+  if (!blogPending[lang]) {
+    blogPending[lang] = loadManifest()
+      .then(manifest => {
+        const url = manifest.locales[lang]?.blog || manifest.locales.en!.blog!;
+        return fetchJSON<BlogPost[]>(url);
+      })
+      .catch(e => {
+        delete blogPending[lang];
+        throw e;
+      });
+  }
+  return blogPending[lang]!;
+};
+
+// Paragraphs of one blog post; also used to prefetch a post before it is opened
+export const loadBlogArticle = (post: BlogPost): Promise<RichParagraph[]> => {
+  let article = articlePending.get(post.body);
+  if (!article) {
+    article = fetchJSON<RichParagraph[]>(post.body).catch(e => {
+      articlePending.delete(post.body);
+      throw e;
+    });
+    articlePending.set(post.body, article);
+  }
+  return article;
+};
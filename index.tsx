@@ -22,12 +22,21 @@ import {
   ChevronLeft, List, Printer, Plus, UploadCloud,
   FileJson, FileSpreadsheet, Mail, AlertCircle
 } from 'lucide-react';
-import DOMPurify from 'dompurify'; /* PRIORITY 1 FIXED: XSS Protection */
 
 
 
 import { PurificationAnimation, CursorTrail } from './Animations';
-import { TRANSLATIONS, LANGUAGES, Language } from './translations';
+import { LANGUAGES, Language, K, LocaleStrings, RichParagraph } from './locales';
+import { BlogPost, loadLocale, getLoadedLocale, loadBlogPosts, loadBlogArticle } from './i18n';
+import { Currency, Transaction, createStatementStream } from './statement';
+import { Ledger, createLedger, ribaTotalsByCurrency, topRibaSources, updateLedger } from './ledger';
+import { downloadBlob, exportReport } from './reportExport';
+import type { ExportFormat } from './reportFormats';
+import { FileOutcome, PageHandler, RowsHandler, getWorkerPool, isPoolFile, terminateWorkerPool } from './workerPool';
+import { STAGES, ScanProfile, ScanProfiler, createScanProfiler, exportScanProfiles, getScanProfiles, measureStage, mergeTimings, onScanProfile } from './diagnostics';
+import { ocrLanguagesFor, onOcrProgress, prewarmOcr, recognizeImage, terminateOcr } from './ocr';
+import { fileDigest, getCachedResult, putCachedResult, recordExtraction, restoreCachedResult } from './resultCache';
+import { PurificationRecord, UserProfile, loadStore, loadTransactions, saveProfile, saveTransactions, syncHistory, updateTransaction } from './store';
 
 
 // --- Error Boundary Component ---
@@ -68,53 +77,39 @@ class ErrorBoundary extends React.Component<{ children: React.ReactNode }, { has
   }
 }
 
-// --- PDF.js Worker Setup ---
-const getPdfJs = async () => {
-  const pdfjs = await import('pdfjs-dist');
-  // @ts-ignore
-  const pdfWorker = (await import('pdfjs-dist/build/pdf.worker.min.mjs?url')).default;
-  pdfjs.GlobalWorkerOptions.workerSrc = pdfWorker;
-  return { getDocument: pdfjs.getDocument };
+// --- Image OCR ---
+// Recognition runs on the shared, pre-warmed Tesseract scheduler (ocr.ts)
+const recognizeStatementImage = async (file: File, language: Language, onPage: PageHandler, profiler: ScanProfiler): Promise<FileOutcome> => {
+  try {
+    const start = performance.now();
+    const text = await recognizeImage(file, language);
+    measureStage(profiler.stages, 'ocr', start);
+    profiler.counters.ocrWords += text.split(/\s+/).filter(Boolean).length;
+    const ocrText = text.toLowerCase();
+    
+    // Check if image contains financial text
+    const financialKeywords = ['balance', 'transaction', 'debit', 'credit', 'account', 'statement', 'payment', 'interest'];
+    const hasFinancialContent = financialKeywords.some(kw => ocrText.includes(kw)) || 
+                               /\d+[.,]\d{2}/.test(ocrText); // Has decimal numbers
+    
+    if (!hasFinancialContent && ocrText.length > 50) {
+      console.warn(`Skipping ${file.name}: No financial content`);
+      return { fileName: file.name, success: false, reason: 'No financial content in image' };
+    }
+    
+    onPage(1, text.split('\n').filter(l => l.trim().length > 5).map(l => l.trim()));
+    return { fileName: file.name, success: true };
+  } catch (ocrError) {
+    console.error('OCR error:', ocrError);
+    return { fileName: file.name, success: false, reason: 'OCR processing failed' };
+  }
 };
 
 // --- TYPES ---
 type ViewState = 'dashboard' | 'knowledge' | 'methodology' | 'manifesto' | 'purification' | 'settings' | 'donate' | 'contact';
 type ProcessingState = 'idle' | 'analyzing' | 'complete' | 'error';
-type Currency = 'USD' | 'GBP' | 'EUR' | 'INR' | 'SAR' | 'AED' | 'MYR' | 'IDR';
 // type Language imported from translations
-type FatwaSource = 'global' | 'ecfr' | 'amja' | 'local';
-
-interface Transaction {
-  id: string;
-  date: string;
-  description: string;
-  amount: number;
-  originalText: string;
-  isRiba: boolean;
-  currency: Currency;
-  category: 'income' | 'shopping' | 'utilities' | 'transfer' | 'riba' | 'uncategorized';
-  confidence: 'high' | 'medium' | 'low';
-  page: number; // Added page number
-  reason?: string;
-}
-
-interface UserProfile {
-  name: string;
-  email: string;
-  joinedDate: string;
-  fatwaSource: FatwaSource;
-}
-
-interface PurificationRecord {
-  id: string;
-  date: string;
-  amount: number;
-  currency: Currency;
-  statementName: string;
-  itemsCount: number;
-  status: 'pending' | 'disposed';
-  notes?: string;
-}
+// UserProfile and PurificationRecord are defined with their storage (store.ts)
 
 // --- CONSTANTS ---
 
@@ -149,135 +144,45 @@ const formatCurrency = (amount: number, currency: Currency) => {
   }
 };
 
-const detectDominantCurrency = (fullText: string): Currency => {
-    const counts: Record<string, number> = {
-        'GBP': (fullText.match(/£|GBP/g) || []).length,
-        'USD': (fullText.match(/\$|USD/g) || []).length,
-        'EUR': (fullText.match(/€|EUR/g) || []).length,
-        'INR': (fullText.match(/₹|INR|Rs\.?|Rupees/gi) || []).length,
-        'SAR': (fullText.match(/SAR|ر.س/g) || []).length,
-        'AED': (fullText.match(/AED/g) || []).length,
-        'MYR': (fullText.match(/MYR|RM/g) || []).length,
-        'IDR': (fullText.match(/IDR|Rp/g) || []).length,
-    };
-    
-    // Find key with max value
-    const bestMatch = Object.keys(counts).reduce((a, b) => counts[a] > counts[b] ? a : b);
-    
-    // If no currency symbols found, try to guess from timezone
-    if (counts[bestMatch] === 0) {
-       try {
-         const tz = Intl.DateTimeFormat().resolvedOptions().timeZone;
-         if (tz.includes('Calcutta') || tz.includes('Kolkata') || tz.includes('India')) return 'INR';
-         if (tz.includes('Riyadh') || tz.includes('Saudi')) return 'SAR';
-         if (tz.includes('Dubai') || tz.includes('Abu_Dhabi')) return 'AED';
-         if (tz.includes('Jakarta')) return 'IDR';
-         if (tz.includes('Kuala_Lumpur')) return 'MYR';
-         if (tz.includes('London')) return 'GBP';
-         if (tz.includes('Berlin') || tz.includes('Paris') || tz.includes('Madrid')) return 'EUR';
-       } catch (e) {}
-       return 'USD'; // Ultimate fallback
-    }
-
-    return (bestMatch as Currency);
-};
-
-
-// Robust Amount Parser Helper
-// Solves issue where page number "1" is detected instead of "189.00"
-// Strategy: Enforce 2 decimal places strict check, filter out account numbers/dates
-const parseTransactionAmount = (line: string, dateMatch: string | null): number => {
-  let clean = line;
-  if (dateMatch) clean = clean.replace(dateMatch, ''); // Remove date
-  
-  // Remove noise: account numbers (long sequences of digits), specific 'page' numbers if at end
-  // Remove sequences of digits > 4 that don't have separators, to avoid years like 2023 if missed by date regex or account nums
-  clean = clean.replace(/\b\d{5,}\b/g, ''); 
-
-  // Strict regex: requires decimal point or comma followed by 2 digits.
-  // Supports 1,234.56 (US/UK) or 1.234,56 (EU)
-  // This actively ignores single integers like "1" or "2"
-  const decimalMatches = clean.match(/(\d{1,3}(?:,\d{3})*\.\d{2})\b|(\d{1,3}(?:\.\d{3})*,\d{2})\b/g);
-
-  if (!decimalMatches || decimalMatches.length === 0) return 0;
-
-  // If multiple matches, we take the first one found that fits the format.
-  // Usually, checking the line context helps, but simply taking the first one is safer than last (balance).
-  
-  const raw = decimalMatches[0];
-  
-  // Normalize to float
-  // If it has ',' as decimal separator (at the end e.g. ,00)
-  if (raw.match(/,\d{2}$/)) {
-     return parseFloat(raw.replace(/\./g, '').replace(',', '.'));
-  }
-  // Else assume '.' is decimal
-  return parseFloat(raw.replace(/,/g, ''));
-};
-
-// --- LOGIC ---
+// --- HOOKS ---
 
-// Advanced Category Detection with Scoring
-const detectCategory = (text: string): { category: Transaction['category']; isRiba: boolean; confidence: Transaction['confidence']; reason?: string } => {
-  const lower = text.toLowerCase();
+const detectInitialLanguage = (): Language => {
+  const saved = localStorage.getItem('app_language');
+  if (saved) return saved as Language;
   
-  // High Confidence Riba (Explicit keywords)
-  if (/(?:credit|gross|net|paid)\s*interest|int\.?\s*pd|fawaid|overdraft\s*interest|finance\s*charge|nsf\s*fee|non-sufficient\s*funds/i.test(lower)) {
-    return { category: 'riba', isRiba: true, confidence: 'high', reason: "Explicit Interest/Finance Charge" };
+  // Smart Detect via TimeZone
+  try {
+    const tz = Intl.DateTimeFormat().resolvedOptions().timeZone;
+    if (tz.includes('Asia/Dubai') || tz.includes('Riyadh')) return 'ar';
+    if (tz.includes('Calcutta')) return 'en'; // India defaults to English
+    if (tz.includes('Karachi')) return 'en'; // Pakistan defaults to English
+    if (tz.includes('Jakarta')) return 'id';
+    if (tz.includes('Berlin')) return 'de';
+    if (tz.includes('Moscow')) return 'ru';
+    if (tz.includes('Paris')) return 'fr';
+  } catch (e) {
+    console.warn("Timezone detection failed", e);
   }
   
-  // Medium Confidence Riba (Fees, Penalties, Arrears)
-  if (/late\s*fee|penalty|arrears|deficiency|past\s*due/i.test(lower)) {
-    return { category: 'riba', isRiba: true, confidence: 'medium', reason: "Penalty/Late Fee" };
-  }
-
-  // General Interest Keyword check (Medium confidence if not caught above)
-  if (/interest/i.test(lower)) {
-    return { category: 'riba', isRiba: true, confidence: 'medium', reason: "Contains word 'interest'" };
-  }
-
-  // Utilities / Service Fees (Halal but Gray area sometimes)
-  if (/service\s*fee|maintenance\s*fee|annual\s*fee|monthly\s*fee/i.test(lower)) {
-    return { category: 'utilities', isRiba: false, confidence: 'low', reason: "Bank Service Fee" };
-  }
-
-  // Halal Indicators
-  if (/cashback|refund|return|deposit|transfer|salary|payroll/i.test(lower)) {
-    return { category: 'income', isRiba: false, confidence: 'high' };
-  }
-
-  // Shubhah Indicators
-  if (/dividend|profit|bonus|reward/i.test(lower)) {
-    return { category: 'uncategorized', isRiba: false, confidence: 'medium', reason: "Ambiguous Reward/Profit" }; 
-  }
-
-  return { category: 'shopping', isRiba: false, confidence: 'low' }; 
+  return 'en';
 };
 
-
-// --- HOOKS ---
-
 const useLanguage = () => {
-  const [language, setLanguage] = useState<Language>(() => {
-    const saved = localStorage.getItem('app_language');
-    if (saved) return saved as Language;
-    
-    // Smart Detect via TimeZone
-    try {
-      const tz = Intl.DateTimeFormat().resolvedOptions().timeZone;
-      if (tz.includes('Asia/Dubai') || tz.includes('Riyadh')) return 'ar';
-      if (tz.includes('Calcutta')) return 'en'; // India defaults to English
-      if (tz.includes('Karachi')) return 'en'; // Pakistan defaults to English
-      if (tz.includes('Jakarta')) return 'id';
-      if (tz.includes('Berlin')) return 'de';
-      if (tz.includes('Moscow')) return 'ru';
-      if (tz.includes('Paris')) return 'fr';
-    } catch (e) {
-      console.warn("Timezone detection failed", e);
-    }
-    
-    return 'en';
-  });
+  const [language, setLanguage] = useState<Language>(detectInitialLanguage);
+  // Only the active locale and the English fallback are ever downloaded (see i18n.ts)
+  const [dicts, setDicts] = useState<{ active?: LocaleStrings; en?: LocaleStrings }>(() => ({
+    active: getLoadedLocale(language),
+    en: getLoadedLocale('en'),
+  }));
+
+  useEffect(() => {
+    let cancelled = false;
+    // Keep showing the previous language until the new chunk arrives
+    Promise.all([loadLocale(language), loadLocale('en')])
+      .then(([active, en]) => { if (!cancelled) setDicts({ active, en }); })
+      .catch(e => console.error('Failed to load locale', language, e));
+    return () => { cancelled = true; };
+  }, [language]);
 
   useEffect(() => {
     localStorage.setItem('app_language', language);
@@ -356,17 +261,39 @@ const useLanguage = () => {
     }
   }, [language]);
 
-  const t = useCallback((key: keyof typeof TRANSLATIONS['en']) => {
-    const dict = TRANSLATIONS[language] || TRANSLATIONS['en'];
-    // @ts-ignore
-    return dict[key] || TRANSLATIONS['en'][key] || key;
-  }, [language]);
+  // One array index per lookup; K[key] is the key name for strings missing everywhere
+  const t = useCallback((key: K): string => {
+    const value = dicts.active?.[key] || dicts.en?.[key] || K[key];
+    return typeof value === 'string' ? value : value.map(run => typeof run === 'string' ? run : run[0]).join('');
+  }, [dicts]);
+
+  // The same lookup for rich text keys (RICH_KEYS in scripts/build_locales.py)
+  const rich = useCallback((key: K): RichParagraph => {
+    const value = dicts.active?.[key] || dicts.en?.[key] || K[key];
+    return typeof value === 'string' ? [value] : value;
+  }, [dicts]);
 
-  return { language, setLanguage, t };
+  return { language, setLanguage, t, rich };
 };
 
+// Pre-tokenized rich text: plain runs are text nodes and bold runs <strong>,
+// so no HTML is built or sanitized at runtime
+const RichText = ({ text, strongClassName }: { text: string | RichParagraph; strongClassName: string }) => (
+  <>
+    {typeof text === 'string' ? text : text.map((run, i) =>
+      typeof run === 'string' ? run : <strong key={i} className={strongClassName}>{run[0]}</strong>
+    )}
+  </>
+);
+
 // --- COMPONENTS ---
 
+const LANDING_FAQ = [
+  { i: 1, q: K.faq_1_q, ans: K.faq_1_ans },
+  { i: 2, q: K.faq_2_q, ans: K.faq_2_ans },
+  { i: 3, q: K.faq_3_q, ans: K.faq_3_ans },
+];
+
 // Tooltip Component
 const Tooltip = ({ text, children, position = 'top' }: { text: string, children: React.ReactNode, position?: 'top' | 'bottom' }) => {
   return (
@@ -431,32 +358,104 @@ const LanguageSwitcher = ({ current, onChange }: { current: Language, onChange:
   );
 };
 
-// New Helper for Export
-const exportCSV = (transactions: Transaction[]) => {
-  const headers = ['Date', 'Description', 'Amount', 'Currency', 'Category', 'Status', 'Confidence'];
-  const rows = transactions.map(t => [
-    t.date,
-    `"${t.description.replace(/"/g, '""')}"`, // Escape quotes
-    t.amount,
-    t.currency,
-    t.category,
-    t.isRiba ? 'Riba' : 'Halal',
-    t.confidence
-  ]);
-  
-  const csvContent = [
-    headers.join(','),
-    ...rows.map(r => r.join(','))
-  ].join('\n');
-  
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-  const url = URL.createObjectURL(blob);
-  const link = document.createElement('a');
-  link.setAttribute('href', url);
-  link.setAttribute('download', `Purification_Report_${new Date().toISOString().split('T')[0]}.csv`);
-  document.body.appendChild(link);
-  link.click();
-  document.body.removeChild(link);
+// Report export (reportExport.ts): CSV, JSON Lines or OFX, optionally only
+// riba rows or a date range, written by a worker
+const EXPORT_FORMATS: { format: ExportFormat; label: string }[] = [
+  { format: 'csv', label: 'CSV' },
+  { format: 'jsonl', label: 'JSON Lines' },
+  { format: 'ofx', label: 'OFX' },
+];
+
+const ExportPanel = ({ ledger, t, onClose }: { ledger: Ledger; t: (key: K) => string; onClose: () => void }) => {
+  const [format, setFormat] = useState<ExportFormat>('csv');
+  const [ribaOnly, setRibaOnly] = useState(false);
+  const [from, setFrom] = useState('');
+  const [to, setTo] = useState('');
+  const [progress, setProgress] = useState<number | null>(null);
+  const [message, setMessage] = useState('');
+  const controller = useRef<AbortController | null>(null);
+
+  // Closing the panel stops a running export
+  useEffect(() => () => controller.current?.abort(), []);
+
+  const start = async () => {
+    controller.current = new AbortController();
+    setProgress(0);
+    setMessage('');
+    try {
+      const count = await exportReport(ledger, {
+        format,
+        filter: { ribaOnly, from: from || undefined, to: to || undefined },
+        onProgress: setProgress,
+        signal: controller.current.signal,
+      });
+      if (count !== null) setMessage(`${count} ${t(K.export_done)}`);
+    } catch (error: any) {
+      if (error?.name !== 'AbortError') {
+        console.error('Export failed:', error);
+        setMessage(t(K.export_failed));
+      }
+    } finally {
+      controller.current = null;
+      setProgress(null);
+    }
+  };
+
+  const running = progress !== null;
+  return (
+    <div className="bg-white rounded-2xl p-5 shadow-sm border border-slate-200 mb-6">
+      <div className="flex flex-wrap items-end gap-4">
+        <div className="flex rounded-lg bg-slate-100 p-1">
+          {EXPORT_FORMATS.map(option => (
+            <button
+              key={option.format}
+              onClick={() => setFormat(option.format)}
+              disabled={running}
+              className={`px-3 py-1.5 rounded-md text-sm font-medium transition-colors ${
+                format === option.format ? 'bg-white text-slate-900 shadow-sm' : 'text-slate-500 hover:text-slate-700'
+              }`}
+            >
+              {option.label}
+            </button>
+          ))}
+        </div>
+        <label className="flex items-center gap-2 text-sm text-slate-700">
+          <input type="checkbox" checked={ribaOnly} disabled={running} onChange={e => setRibaOnly(e.target.checked)} />
+          {t(K.export_riba_only)}
+        </label>
+        <label className="flex flex-col text-xs text-slate-500">
+          {t(K.export_date_from)}
+          <input type="date" value={from} max={to || undefined} disabled={running} onChange={e => setFrom(e.target.value)} className="mt-1 px-2 py-1 border border-slate-200 rounded-md text-sm text-slate-700" />
+        </label>
+        <label className="flex flex-col text-xs text-slate-500">
+          {t(K.export_date_to)}
+          <input type="date" value={to} min={from || undefined} disabled={running} onChange={e => setTo(e.target.value)} className="mt-1 px-2 py-1 border border-slate-200 rounded-md text-sm text-slate-700" />
+        </label>
+        <div className="flex gap-2 ml-auto">
+          <button
+            onClick={start}
+            disabled={running}
+            className="flex items-center gap-2 px-4 py-2 bg-emerald-600 hover:bg-emerald-700 disabled:opacity-50 text-white rounded-lg font-medium transition-colors"
+          >
+            <Download size={16} />
+            {t(K.export_start)}
+          </button>
+          <button
+            onClick={() => running ? controller.current?.abort() : onClose()}
+            className="px-4 py-2 bg-slate-100 hover:bg-slate-200 text-slate-700 rounded-lg font-medium transition-colors"
+          >
+            {t(K.puri_cancel_btn)}
+          </button>
+        </div>
+      </div>
+      {running && (
+        <div className="mt-4 h-2 bg-slate-100 rounded-full overflow-hidden">
+          <div className="h-full bg-emerald-500 transition-all" style={{ width: `${Math.round(progress * 100)}%` }} />
+        </div>
+      )}
+      {message && <p className="mt-3 text-sm text-slate-600">{message}</p>}
+    </div>
+  );
 };
 
 // Toggle Component
@@ -475,6 +474,84 @@ const Toggle = ({ checked, onChange }: { checked: boolean; onChange: () => void
   </button>
 );
 
+// Windowed list: only the rows in view (plus VIRTUAL_OVERSCAN on each side)
+// are mounted, so a log of thousands of rows costs the same as a short one.
+// Rows must be exactly itemHeight pixels tall.
+const VIRTUAL_OVERSCAN = 6;
+const VirtualList = ({ count, itemHeight, height, renderItem, className = '' }: {
+  count: number;
+  itemHeight: number;
+  height: number;
+  renderItem: (index: number) => React.ReactNode;
+  className?: string;
+}) => {
+  const [scrollTop, setScrollTop] = useState(0);
+  const rafId = useRef(0);
+  useEffect(() => () => cancelAnimationFrame(rafId.current), []);
+
+  const onScroll = (e: React.UIEvent<HTMLDivElement>) => {
+    const top = e.currentTarget.scrollTop;
+    cancelAnimationFrame(rafId.current);
+    rafId.current = requestAnimationFrame(() => setScrollTop(top));
+  };
+
+  const first = Math.max(0, Math.floor(scrollTop / itemHeight) - VIRTUAL_OVERSCAN);
+  const last = Math.min(count, Math.ceil((scrollTop + height) / itemHeight) + VIRTUAL_OVERSCAN);
+  const rows: React.ReactNode[] = [];
+  for (let i = first; i < last; i++) rows.push(renderItem(i));
+
+  return (
+    <div className={`overflow-y-auto ${className}`} style={{ height: Math.min(height, count * itemHeight), contain: 'strict' }} onScroll={onScroll}>
+      <div style={{ height: count * itemHeight, position: 'relative' }}>
+        <div style={{ transform: `translateY(${first * itemHeight}px)` }}>{rows}</div>
+      </div>
+    </div>
+  );
+};
+
+// Desktop Transaction Row (memoized: a toggle re-renders only its own row)
+const TransactionRow = React.memo(({ tObj, onToggleStatus, t }: { tObj: Transaction; onToggleStatus: (id: string) => void; t: (key: K) => string }) => (
+  <tr className={`hover:bg-slate-50 transition-colors will-change-auto ${tObj.isRiba ? 'bg-red-50/30' : ''}`} style={{contain: 'layout style'}}>
+    <td className="p-4 text-sm text-slate-600 font-mono whitespace-nowrap">{tObj.date}</td>
+    <td className="p-4 text-sm text-slate-800 font-medium">
+      {tObj.description}
+      {tObj.reason && tObj.isRiba && (
+        <div className="text-xs text-red-500 mt-1 flex items-center gap-1">
+          <Info size={10} /> {tObj.reason}
+        </div>
+      )}
+    </td>
+    <td className="p-4 text-sm font-mono text-right font-bold text-slate-700">
+      {formatCurrency(tObj.amount, tObj.currency)}
+    </td>
+    <td className="p-4 text-center">
+      {tObj.isRiba ? (
+          <span 
+            onClick={() => onToggleStatus(tObj.id)}
+            className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-red-100 text-red-800 cursor-pointer hover:bg-red-200 transition-colors"
+          >
+            {t(K.action_riba)}
+          </span>
+      ) : (
+          <span 
+            onClick={() => onToggleStatus(tObj.id)}
+            className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-emerald-100 text-emerald-800 cursor-pointer hover:bg-emerald-200 transition-colors"
+          >
+            {t(K.action_halal)}
+          </span>
+      )}
+    </td>
+    <td className="p-4 text-center">
+        <span className={`text-xs font-bold ${
+          tObj.confidence === 'high' ? 'text-green-600' : 
+          tObj.confidence === 'medium' ? 'text-yellow-600' : 'text-slate-400'
+        }`}>
+          {tObj.confidence.toUpperCase()}
+        </span>
+    </td>
+  </tr>
+));
+
 // Mobile Transaction Card
 const MobileTransactionCard = React.memo(({ tObj, onToggleStatus, formatCurrency, t }: any) => (
   <div className={`p-4 rounded-2xl border mb-3 transition-all duration-200 ${
@@ -498,10 +575,12 @@ const MobileTransactionCard = React.memo(({ tObj, onToggleStatus, formatCurrency
 
 // 2. Dashboard
 // Verif Log Accordion (Mobile)
-const VerifLogAccordion = ({ transactions, isOpen, onToggle, formatCurrency, t }: any) => {
-  const ribaTransactions = transactions.filter((t: any) => t.isRiba);
+const VERIF_ACCORDION_ROW_HEIGHT = 60;
+const VERIF_ROW_HEIGHT = 56;
+const VerifLogAccordion = ({ ledger, isOpen, onToggle, formatCurrency, t }: any) => {
+  const { transactions, ribaIndexes } = ledger as Ledger;
   
-  if (ribaTransactions.length === 0) return null;
+  if (ribaIndexes.length === 0) return null;
 
   return (
     <div className="md:hidden mb-6 bg-white rounded-2xl border border-red-100 overflow-hidden shadow-sm">
@@ -511,28 +590,35 @@ const VerifLogAccordion = ({ transactions, isOpen, onToggle, formatCurrency, t }
       >
         <div className="flex items-center gap-2 font-bold">
           <List size={18} />
-          {t('verif_log')}
+          {t(K.verif_log)}
           <span className="bg-red-100 text-red-700 text-xs px-2 py-0.5 rounded-full">
-            {ribaTransactions.length}
+            {ribaIndexes.length}
           </span>
         </div>
         {isOpen ? <ChevronDown size={20} className="rotate-180 transition-transform" /> : <ChevronDown size={20} />}
       </button>
       
       {isOpen && (
-        <div className="max-h-[300px] overflow-y-auto divide-y divide-slate-100 bg-white">
-          {ribaTransactions.map((t: any, idx: number) => (
-            <div key={idx} className="p-3 flex justify-between items-start text-sm">
-              <div>
-                <p className="font-mono font-bold text-slate-700 text-xs">{t.date}</p>
-                <p className="text-slate-500 text-xs truncate max-w-[150px]">{t.description}</p>
+        <VirtualList
+          className="bg-white"
+          count={ribaIndexes.length}
+          itemHeight={VERIF_ACCORDION_ROW_HEIGHT}
+          height={300}
+          renderItem={i => {
+            const t = transactions[ribaIndexes[i]];
+            return (
+              <div key={t.id} className="p-3 flex justify-between items-start text-sm border-b border-slate-100 overflow-hidden" style={{ height: VERIF_ACCORDION_ROW_HEIGHT }}>
+                <div>
+                  <p className="font-mono font-bold text-slate-700 text-xs">{t.date}</p>
+                  <p className="text-slate-500 text-xs truncate max-w-[150px]">{t.description}</p>
+                </div>
+                <p className="font-mono font-bold text-red-600">
+                  {formatCurrency(t.amount, t.currency)}
+                </p>
               </div>
-              <p className="font-mono font-bold text-red-600">
-                {formatCurrency(t.amount, t.currency)}
-              </p>
-            </div>
-          ))}
-        </div>
+            );
+          }}
+        />
       )}
     </div>
   );
@@ -542,7 +628,9 @@ const Dashboard = ({
   userProfile, 
   onUpload, 
   processingState, 
+  processingProgress,
   transactions, 
+  ledger,
   history,
   onProcess, 
   onReset,
@@ -558,6 +646,7 @@ const Dashboard = ({
   const [isDragging, setIsDragging] = useState(false);
   const [openFaq, setOpenFaq] = useState<number | null>(null);
   const [showVerifLog, setShowVerifLog] = useState(false);
+  const [showExport, setShowExport] = useState(false);
   
   // Pagination State
   const [currentPage, setCurrentPage] = useState(1);
@@ -571,11 +660,10 @@ const Dashboard = ({
     }
   };
 
-  const totalRiba = transactions
-    .filter((txn: Transaction) => txn.isRiba)
-    .reduce((sum: number, txn: Transaction) => sum + txn.amount, 0);
-    
-  const totalVolume = transactions.reduce((sum: number, txn: Transaction) => sum + txn.amount, 0);
+  // Running totals and the riba rows come from the ledger (ledger.ts)
+  const { totals, ribaIndexes } = ledger as Ledger;
+  const totalRiba = totals.riba.amount;
+  const totalVolume = totals.volume;
   const purityScore = totalVolume > 0 ? Math.round(((totalVolume - totalRiba) / totalVolume) * 100) : 100;
 
   // Add global CSS performance optimizations
@@ -592,16 +680,7 @@ const Dashboard = ({
     return () => style.remove();
   }, []);
 
-  const topSources = useMemo(() => {
-    const sourceMap = new Map<string, number>();
-    transactions.filter((txn: Transaction) => txn.isRiba).forEach((txn: Transaction) => {
-      const source = txn.description.split(' ')[0] || 'Bank';
-      sourceMap.set(source, (sourceMap.get(source) || 0) + txn.amount);
-    });
-    return Array.from(sourceMap.entries())
-      .sort((a, b) => b[1] - a[1])
-      .slice(0, 3);
-  }, [transactions]);
+  const topSources = useMemo(() => topRibaSources(ledger, 3), [ledger]);
   
   // Pagination Logic
   const indexOfLastItem = currentPage * itemsPerPage;
@@ -614,14 +693,11 @@ const Dashboard = ({
     const printWindow = window.open('', '_blank');
     if (!printWindow) return;
 
-    const ribaItems = transactions.filter((t: Transaction) => t.isRiba);
+    const ribaItems: Transaction[] = ribaIndexes.map(i => transactions[i]);
     const certificateId = `RIBA-${Date.now()}`;
     
     // Calculate Totals by Currency
-    const totalsByCurrency = ribaItems.reduce((acc: Record<string, number>, item: Transaction) => {
-      acc[item.currency] = (acc[item.currency] || 0) + item.amount;
-      return acc;
-    }, {});
+    const totalsByCurrency: Record<string, number> = ribaTotalsByCurrency(ledger);
 
     const CURRENCY_DISPLAY: Record<string, { symbol: string; name: string; flag: string }> = {
       USD: { symbol: '$', name: 'US Dollar', flag: '🇺🇸' },
@@ -711,7 +787,7 @@ const Dashboard = ({
 
     const htmlContent = `
       <!DOCTYPE html>
-      <html dir="${t('dir') || 'ltr'}">
+      <html dir="${document.documentElement.dir || 'ltr'}">
       <head>
         <title>Purification Certificate - RibaPurify</title>
         <style>
@@ -1081,7 +1157,7 @@ const Dashboard = ({
             <div class="header">
               <img src="${window.location.origin}/favicon.svg" alt="RibaPurify Logo" class="logo-icon" onerror="this.style.display='none'" />
               <div class="brand-name">RibaPurify</div>
-              <h1>${t('puri_cert_header')}</h1>
+              <h1>${t(K.puri_cert_header)}</h1>
             </div>
 
             <div class="ayah-box">
@@ -1091,19 +1167,19 @@ const Dashboard = ({
             </div>
 
             <div class="summary-box">
-              <div class="summary-label">${t('puri_cert_total_riba')}</div>
+              <div class="summary-label">${t(K.puri_cert_total_riba)}</div>
               <div class="summary-amount">${currencyRows.split('currency-amount')[1]?.match(/>(.*?)</)?.[1] || (Object.values(totalsByCurrency).reduce((a: number, b: number) => a + b, 0) as number).toFixed(2)}</div>
-              <div class="summary-meta">${sortedItems.length} ${t('puri_transactions')} ${t('puri_identified_across')} ${Object.keys(totalsByCurrency).length} ${t('puri_currencies')}</div>
+              <div class="summary-meta">${sortedItems.length} ${t(K.puri_transactions)} ${t(K.puri_identified_across)} ${Object.keys(totalsByCurrency).length} ${t(K.puri_currencies)}</div>
             </div>
 
-            <div class="section-title">${t('puri_cert_logs')}</div>
+            <div class="section-title">${t(K.puri_cert_logs)}</div>
             <table class="log-table">
               <thead>
                 <tr>
                   <th class="log-header" style="width: 40px;">#</th>
-                  <th class="log-header">${t('puri_cert_date')}</th>
-                  <th class="log-header">${t('puri_cert_source')}</th>
-                  <th class="log-header text-right">${t('puri_cert_amount')}</th>
+                  <th class="log-header">${t(K.puri_cert_date)}</th>
+                  <th class="log-header">${t(K.puri_cert_source)}</th>
+                  <th class="log-header text-right">${t(K.puri_cert_amount)}</th>
                 </tr>
               </thead>
               <tbody>
@@ -1114,31 +1190,31 @@ const Dashboard = ({
             <div class="guidance-box">
               <div class="guidance-title">
                 <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"/><line x1="12" y1="16" x2="12" y2="12"/><line x1="12" y1="8" x2="12.01" y2="8"/></svg>
-                ${t('puri_cert_guidance_title')}
+                ${t(K.puri_cert_guidance_title)}
               </div>
               <div class="guidance-text" style="margin-bottom: 20px;">
-                ${t('puri_cert_guidance_text')}
+                ${t(K.puri_cert_guidance_text)}
               </div>
               <div class="guidance-steps" style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 20px; border-top: 1px dashed #fdba74; padding-top: 15px;">
                 <div class="step">
-                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">1. ${t('puri_step_1_title')}</div>
-                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t('puri_step_1_desc')}</div>
+                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">1. ${t(K.puri_step_1_title)}</div>
+                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t(K.puri_step_1_desc)}</div>
                 </div>
                 <div class="step">
-                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">2. ${t('puri_step_2_title')}</div>
-                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t('puri_step_2_desc')}</div>
+                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">2. ${t(K.puri_step_2_title)}</div>
+                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t(K.puri_step_2_desc)}</div>
                 </div>
                 <div class="step">
-                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">3. ${t('puri_step_3_title')}</div>
-                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t('puri_step_3_desc')}</div>
+                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">3. ${t(K.puri_step_3_title)}</div>
+                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t(K.puri_step_3_desc)}</div>
                 </div>
               </div>
             </div>
 
             <div class="disclaimer-box">
-              <div class="disclaimer-title">${t('puri_cert_disclaimer_label')}</div>
+              <div class="disclaimer-title">${t(K.puri_cert_disclaimer_label)}</div>
               <div class="disclaimer-text">
-                ${t('puri_cert_disclaimer')}
+                ${t(K.puri_cert_disclaimer)}
               </div>
             </div>
 
@@ -1146,11 +1222,11 @@ const Dashboard = ({
 
             <div class="footer">
               <div class="footer-text">
-                <strong>${t('puri_cert_confirmation')}</strong><br><br>
-                ${t('puri_cert_privacy')}<br>
-                <strong>${t('puri_cert_id')}:</strong> ${certificateId}
+                <strong>${t(K.puri_cert_confirmation)}</strong><br><br>
+                ${t(K.puri_cert_privacy)}<br>
+                <strong>${t(K.puri_cert_id)}:</strong> ${certificateId}
               </div>
-              <div class="timestamp">${t('puri_cert_generated')}: ${new Date().toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' })}</div>
+              <div class="timestamp">${t(K.puri_cert_generated)}: ${new Date().toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' })}</div>
               <div class="page-number">Page 1</div>
             </div>
           </div>
@@ -1166,13 +1242,10 @@ const Dashboard = ({
   // If we have transactions and processing is complete, show Results View
   if (processingState === 'complete' && transactions.length > 0) {
     const currency = transactions[0]?.currency || 'USD';
-    const ribaTransactions = transactions.filter((t: Transaction) => t.isRiba);
     
-    // Calculate totals by currency
-    const totalsByCurrency = ribaTransactions.reduce((acc: Record<string, number>, txn: Transaction) => {
-      acc[txn.currency] = (acc[txn.currency] || 0) + txn.amount;
-      return acc;
-    }, {});
+    // Totals by currency
+    const totalsByCurrency: Record<string, number> = {};
+    for (const [curr, tally] of Object.entries(totals.ribaByCurrency)) totalsByCurrency[curr] = tally!.amount;
     
     const currenciesDetected = Object.keys(totalsByCurrency);
     const isMultiCurrency = currenciesDetected.length > 1;
@@ -1186,17 +1259,26 @@ const Dashboard = ({
             className="flex items-center justify-center gap-2 px-4 py-2 bg-blue-600 hover:bg-blue-700 text-white rounded-lg font-medium transition-colors shadow-sm"
           >
             <Printer size={16} />
-            {t('export_certificate_pdf')}
+            {t(K.export_certificate_pdf)}
+          </button>
+          <button 
+            onClick={() => setShowExport(open => !open)}
+            className="flex items-center justify-center gap-2 px-4 py-2 bg-emerald-600 hover:bg-emerald-700 text-white rounded-lg font-medium transition-colors shadow-sm"
+          >
+            <FileSpreadsheet size={16} />
+            {t(K.export_report)}
           </button>
           <button 
             onClick={() => { setFiles([]); onReset(); }}
             className="flex items-center justify-center gap-2 px-4 py-2 bg-slate-100 hover:bg-slate-200 text-slate-700 rounded-lg font-medium transition-colors"
           >
             <RotateCcw size={16} />
-            {t('dash_reset_btn')}
+            {t(K.dash_reset_btn)}
           </button>
         </div>
 
+        {showExport && <ExportPanel ledger={ledger} t={t} onClose={() => setShowExport(false)} />}
+
         {/* Pro Metrics Row */}
         <div className="grid grid-cols-1 md:grid-cols-3 gap-4 md:gap-6 mb-8">
           {/* Total Riba Card - Multi-Currency Support */}
@@ -1204,7 +1286,7 @@ const Dashboard = ({
             <div className="absolute top-0 right-0 p-4 opacity-5">
               <AlertTriangle size={80} className="text-red-600" />
             </div>
-            <p className="text-slate-500 font-medium text-sm uppercase tracking-wide mb-1">{t('total_riba')}</p>
+            <p className="text-slate-500 font-medium text-sm uppercase tracking-wide mb-1">{t(K.total_riba)}</p>
             
             {isMultiCurrency ? (
               <div className="space-y-2">
@@ -1227,7 +1309,7 @@ const Dashboard = ({
                 <h2 className="text-3xl md:text-4xl font-mono font-bold text-red-600 tracking-tight">
                   {formatCurrency(totalRiba, currency)}
                 </h2>
-                <p className="text-xs text-slate-400 mt-2">Detected across {ribaTransactions.length} transactions</p>
+                <p className="text-xs text-slate-400 mt-2">Detected across {ribaIndexes.length} transactions</p>
               </>
             )}
           </div>
@@ -1237,7 +1319,7 @@ const Dashboard = ({
              <div className="absolute top-0 right-0 p-4 opacity-5">
                <Shield size={80} className="text-emerald-600" />
              </div>
-             <p className="text-slate-500 font-medium text-sm uppercase tracking-wide mb-1">{t('financial_purity_score')}</p>
+             <p className="text-slate-500 font-medium text-sm uppercase tracking-wide mb-1">{t(K.financial_purity_score)}</p>
              <div className="flex items-end gap-2">
                <h2 className="text-3xl md:text-4xl font-mono font-bold text-slate-800 tracking-tight">
                  {purityScore}%
@@ -1251,7 +1333,7 @@ const Dashboard = ({
 
           {/* Top Sources (Simplified) */}
           <div className="bg-white rounded-2xl p-6 shadow-sm border border-slate-100">
-             <h3 className="text-slate-500 font-medium text-sm uppercase tracking-wide mb-3">{t('riba_sources')}</h3>
+             <h3 className="text-slate-500 font-medium text-sm uppercase tracking-wide mb-3">{t(K.riba_sources)}</h3>
              <div className="space-y-2">
                {topSources.map(([name, amount], i) => (
                  <div key={i} className="flex justify-between items-center text-sm">
@@ -1261,14 +1343,14 @@ const Dashboard = ({
                    </span>
                  </div>
                ))}
-               {topSources.length === 0 && <p className="text-slate-400 italic text-sm">{t('dash_none_detected')}</p>}
+               {topSources.length === 0 && <p className="text-slate-400 italic text-sm">{t(K.dash_none_detected)}</p>}
              </div>
           </div>
         </div>
 
         {/* Verif Log Accordion (Mobile) */}
         <VerifLogAccordion 
-          transactions={transactions} 
+          ledger={ledger} 
           isOpen={showVerifLog} 
           onToggle={() => setShowVerifLog(!showVerifLog)} 
           formatCurrency={formatCurrency}
@@ -1325,50 +1407,12 @@ const Dashboard = ({
                       <th className="p-4 text-xs font-semibold text-slate-500 uppercase tracking-wider">Description</th>
                       <th className="p-4 text-xs font-semibold text-slate-500 uppercase tracking-wider text-right">Amount</th>
                       <th className="p-4 text-xs font-semibold text-slate-500 uppercase tracking-wider text-center">Status</th>
-                      <th className="p-4 text-xs font-semibold text-slate-500 uppercase tracking-wider text-center">{t('confidence')}</th>
+                      <th className="p-4 text-xs font-semibold text-slate-500 uppercase tracking-wider text-center">{t(K.confidence)}</th>
                     </tr>
                   </thead>
                   <tbody className="divide-y divide-slate-100">
                     {currentTransactions.map((tObj: Transaction) => (
-                      <tr key={tObj.id} className={`hover:bg-slate-50 transition-colors will-change-auto ${tObj.isRiba ? 'bg-red-50/30' : ''}`} style={{contain: 'layout style'}}>
-                        <td className="p-4 text-sm text-slate-600 font-mono whitespace-nowrap">{tObj.date}</td>
-                        <td className="p-4 text-sm text-slate-800 font-medium">
-                          {tObj.description}
-                          {tObj.reason && tObj.isRiba && (
-                            <div className="text-xs text-red-500 mt-1 flex items-center gap-1">
-                              <Info size={10} /> {tObj.reason}
-                            </div>
-                          )}
-                        </td>
-                        <td className="p-4 text-sm font-mono text-right font-bold text-slate-700">
-                          {formatCurrency(tObj.amount, tObj.currency)}
-                        </td>
-                        <td className="p-4 text-center">
-                          {tObj.isRiba ? (
-                              <span 
-                                onClick={() => onToggleStatus(tObj.id)}
-                                className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-red-100 text-red-800 cursor-pointer hover:bg-red-200 transition-colors"
-                              >
-                                {t('action_riba')}
-                              </span>
-                          ) : (
-                              <span 
-                                onClick={() => onToggleStatus(tObj.id)}
-                                className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-emerald-100 text-emerald-800 cursor-pointer hover:bg-emerald-200 transition-colors"
-                              >
-                                {t('action_halal')}
-                              </span>
-                          )}
-                        </td>
-                        <td className="p-4 text-center">
-                            <span className={`text-xs font-bold ${
-                              tObj.confidence === 'high' ? 'text-green-600' : 
-                              tObj.confidence === 'medium' ? 'text-yellow-600' : 'text-slate-400'
-                            }`}>
-                              {tObj.confidence.toUpperCase()}
-                            </span>
-                        </td>
-                      </tr>
+                      <TransactionRow key={tObj.id} tObj={tObj} onToggleStatus={onToggleStatus} t={t} />
                     ))}
                   </tbody>
                 </table>
@@ -1395,33 +1439,39 @@ const Dashboard = ({
               <div className="p-4 bg-slate-900 text-white flex items-center justify-between">
                  <h3 className="font-bold flex items-center gap-2">
                    <List size={18} />
-                   {t('verif_log')}
+                   {t(K.verif_log)}
                  </h3>
-                 <span className="text-xs bg-slate-700 px-2 py-1 rounded-full">{ribaTransactions.length}</span>
+                 <span className="text-xs bg-slate-700 px-2 py-1 rounded-full">{ribaIndexes.length}</span>
               </div>
-              <div className="max-h-[600px] overflow-y-auto divide-y divide-slate-100">
-                {ribaTransactions.length === 0 ? (
-                  <div className="p-8 text-center text-slate-400 text-sm italic">
-                    {t('dash_none_detected')}
-                  </div>
-                ) : (
-                  ribaTransactions.map((t: Transaction, idx: number) => (
-                    <div key={idx} className="p-3 hover:bg-red-50 transition-colors flex justify-between items-start group">
-                      <div>
-                        <p className="text-xs font-mono font-bold text-slate-700">{t.date}</p>
-                      </div>
-                      <div className="text-right">
-                         <p className="text-sm font-bold text-red-600 font-mono">
-                           {formatCurrency(t.amount, t.currency)}
-                         </p>
-                         <p className="text-[10px] text-slate-400 truncate max-w-[100px] ml-auto">
-                           {t.description.substring(0, 15)}...
-                         </p>
+              {ribaIndexes.length === 0 ? (
+                <div className="p-8 text-center text-slate-400 text-sm italic">
+                  {t(K.dash_none_detected)}
+                </div>
+              ) : (
+                <VirtualList
+                  count={ribaIndexes.length}
+                  itemHeight={VERIF_ROW_HEIGHT}
+                  height={600}
+                  renderItem={i => {
+                    const t: Transaction = transactions[ribaIndexes[i]];
+                    return (
+                      <div key={t.id} className="p-3 hover:bg-red-50 transition-colors flex justify-between items-start group border-b border-slate-100 overflow-hidden" style={{ height: VERIF_ROW_HEIGHT }}>
+                        <div>
+                          <p className="text-xs font-mono font-bold text-slate-700">{t.date}</p>
+                        </div>
+                        <div className="text-right">
+                           <p className="text-sm font-bold text-red-600 font-mono">
+                             {formatCurrency(t.amount, t.currency)}
+                           </p>
+                           <p className="text-[10px] text-slate-400 truncate max-w-[100px] ml-auto">
+                             {t.description.substring(0, 15)}...
+                           </p>
+                        </div>
                       </div>
-                    </div>
-                  ))
-                )}
-              </div>
+                    );
+                  }}
+                />
+              )}
             </div>
           </div>
         </div>
@@ -1429,20 +1479,20 @@ const Dashboard = ({
         {/* Donate Section */}
         <div id="donate-section" className="mt-12 bg-gradient-to-br from-orange-50 via-amber-50 to-yellow-50 rounded-3xl shadow-lg border border-orange-200 p-8 md:p-10">
           <div className="text-center mb-8">
-            <h2 className="text-3xl font-bold text-slate-900 mb-3">{t('donate_here')}</h2>
+            <h2 className="text-3xl font-bold text-slate-900 mb-3">{t(K.donate_here)}</h2>
             <p className="text-slate-600 max-w-2xl mx-auto leading-relaxed">
-              <strong>{t('donate_remove_immediately')}</strong> {t('donate_here_desc')}
+              <strong>{t(K.donate_remove_immediately)}</strong> {t(K.donate_here_desc)}
             </p>
           </div>
 
           <div className="grid md:grid-cols-2 gap-4 max-w-4xl mx-auto">
             {[
-              { name: 'Islamic Relief Worldwide', url: 'https://www.islamic-relief.org', region: t('donate_region_global'), color: 'blue' },
-              { name: 'Penny Appeal', url: 'https://www.pennyappeal.org', region: t('donate_region_uk_global'), color: 'green' },
-              { name: 'Human Appeal', url: 'https://humanappeal.org.uk', region: t('donate_region_uk_global'), color: 'purple' },
-              { name: 'Zakat Foundation', url: 'https://www.zakat.org', region: t('donate_region_usa_global'), color: 'emerald' },
-              { name: 'UNHCR', url: 'https://www.unhcr.org', region: t('donate_region_global'), color: 'cyan' },
-              { name: 'Local Masjid / Community', url: '#', region: t('donate_region_your_area'), color: 'amber' }
+              { name: 'Islamic Relief Worldwide', url: 'https://www.islamic-relief.org', region: t(K.donate_region_global), color: 'blue' },
+              { name: 'Penny Appeal', url: 'https://www.pennyappeal.org', region: t(K.donate_region_uk_global), color: 'green' },
+              { name: 'Human Appeal', url: 'https://humanappeal.org.uk', region: t(K.donate_region_uk_global), color: 'purple' },
+              { name: 'Zakat Foundation', url: 'https://www.zakat.org', region: t(K.donate_region_usa_global), color: 'emerald' },
+              { name: 'UNHCR', url: 'https://www.unhcr.org', region: t(K.donate_region_global), color: 'cyan' },
+              { name: 'Local Masjid / Community', url: '#', region: t(K.donate_region_your_area), color: 'amber' }
             ].map((org, i) => (
               <a
                 key={i}
@@ -1480,7 +1530,7 @@ const Dashboard = ({
       <div className="max-w-2xl mx-auto py-12 px-4 pb-24 md:pb-12">
         <h2 className="text-2xl font-bold text-slate-800 mb-6 flex items-center gap-3">
           <FileText className="text-blue-600" />
-          {t('dash_selected')} {files.length}
+          {t(K.dash_selected)} {files.length}
         </h2>
         <div className="grid gap-4 mb-8">
           {files.map((f, i) => (
@@ -1496,7 +1546,7 @@ const Dashboard = ({
           onClick={() => onProcess(files)}
           className="w-full py-4 bg-blue-600 hover:bg-blue-700 text-white rounded-xl font-bold text-lg shadow-lg shadow-blue-200 transition-all active:scale-95"
         >
-          {t('dash_process_btn')}
+          {t(K.dash_process_btn)}
         </button>
       </div>
     );
@@ -1507,8 +1557,21 @@ const Dashboard = ({
     return (
       <div className="flex flex-col items-center justify-center min-h-[60vh]">
         <RefreshCw size={48} className="text-blue-600 animate-spin mb-6" />
-        <h2 className="text-2xl font-bold text-slate-800">{t('status_processing')}</h2>
-        <p className="text-slate-500 mt-2">{t('dash_processing_sub')}</p>
+        <h2 className="text-2xl font-bold text-slate-800">{t(K.status_processing)}</h2>
+        <p className="text-slate-500 mt-2">{t(K.dash_processing_sub)}</p>
+        {processingProgress && (processingProgress.total > 1 || processingProgress.ocr !== undefined) && (
+          <p className="text-slate-400 text-sm mt-1 tabular-nums">
+            {processingProgress.total > 1 && `${processingProgress.done} / ${processingProgress.total}`}
+            {processingProgress.total > 1 && processingProgress.ocr !== undefined && ' · '}
+            {processingProgress.ocr !== undefined && `OCR ${Math.round(processingProgress.ocr * 100)}%`}
+          </p>
+        )}
+        {/* Partial results, refreshed as pages are classified */}
+        {transactions.length > 0 && (
+          <p className="text-slate-600 text-sm mt-4 tabular-nums">
+            {t(K.puri_transactions)}: {transactions.length} · {t(K.total_riba)}: {formatCurrency(totals.riba.amount, transactions[0].currency)}
+          </p>
+        )}
       </div>
     );
   }
@@ -1518,7 +1581,7 @@ const Dashboard = ({
      return (
       <div className="flex flex-col items-center justify-center min-h-[60vh] px-4 text-center">
         <AlertTriangle size={64} className="text-red-500 mb-6" />
-        <h2 className="text-2xl font-bold text-slate-800 mb-2">{t('status_error')}</h2>
+        <h2 className="text-2xl font-bold text-slate-800 mb-2">{t(K.status_error)}</h2>
         <p className="text-slate-500 max-w-md mb-8">Make sure you are uploading a standard bank statement PDF or a clear image.</p>
         <button 
           onClick={() => { setFiles([]); onReset(); }}
@@ -1534,10 +1597,10 @@ const Dashboard = ({
   return (
     <div className="max-w-4xl mx-auto text-center py-20 px-4 pb-24 md:pb-20">
       <h1 className="text-5xl md:text-7xl font-bold tracking-tight text-slate-900 mb-6 font-sans">
-        {t('hero_title')}
+        {t(K.hero_title)}
       </h1>
       <p className="text-xl text-slate-600 mb-12 max-w-2xl mx-auto leading-relaxed">
-        {t('hero_desc')}
+        {t(K.hero_desc)}
       </p>
       
       {/* Mobile: Compact Summary or Scan Prompt */}
@@ -1565,7 +1628,7 @@ const Dashboard = ({
         onClick={onUploadClick}
         role="button"
         tabIndex={0}
-        aria-label={t('upload_btn') || 'Upload bank statement'}
+        aria-label={t(K.upload_btn) || 'Upload bank statement'}
         onKeyDown={(e) => { if (e.key === 'Enter' || e.key === ' ') { e.preventDefault(); onUploadClick(); } }} /* PRIORITY 2 FIXED: Keyboard nav + ARIA */
       >
         <div className="flex flex-col items-center justify-center space-y-6">
@@ -1574,37 +1637,37 @@ const Dashboard = ({
           </div>
           <div className="space-y-2">
             <h3 className="text-2xl font-bold text-slate-800">
-              {isDragging ? t('drop_text') : t('upload_btn')}
+              {isDragging ? t(K.drop_text) : t(K.upload_btn)}
             </h3>
-            <p className="text-slate-500">{t('hero_subtitle')}</p>
+            <p className="text-slate-500">{t(K.hero_subtitle)}</p>
           </div>
         </div>
       </div>
       
       {/* Methodology Teaser */}
       <div className="text-center mt-8 mb-12">
-         <p className="text-slate-600 mb-2">{t('meth_landing_teaser')}</p>
+         <p className="text-slate-600 mb-2">{t(K.meth_landing_teaser)}</p>
          <button onClick={() => navigateToView('methodology')} className="text-blue-600 font-bold hover:underline flex items-center justify-center gap-1 mx-auto">
-           {t('nav_meth')} <ArrowRight size={16} />
+           {t(K.nav_meth)} <ArrowRight size={16} />
          </button>
       </div>
 
       {/* FAQ Section on Landing */}
       <div className="mt-24 max-w-3xl mx-auto">
-        <h3 className="text-3xl font-bold text-slate-900 mb-10 text-center">{t('faq_title')}</h3>
+        <h3 className="text-3xl font-bold text-slate-900 mb-10 text-center">{t(K.faq_title)}</h3>
         <div className="space-y-4">
-          {[1, 2, 3].map(i => (
+          {LANDING_FAQ.map(({ i, q, ans }) => (
             <div key={i} className="bg-white rounded-2xl shadow-sm border border-slate-100 overflow-hidden transition-all duration-200">
               <button
                 onClick={() => setOpenFaq(openFaq === i ? null : i)}
                 className="w-full flex items-center justify-between p-6 text-left hover:bg-slate-50 transition-colors"
               >
-                <span className="font-semibold text-slate-800 text-lg">{t(`faq_${i}_q`)}</span>
+                <span className="font-semibold text-slate-800 text-lg">{t(q)}</span>
                 {openFaq === i ? <ChevronDown className="text-slate-400" /> : <ChevronRight className="text-slate-400" />}
               </button>
               {openFaq === i && (
                 <div className="px-6 pb-6 text-slate-600 leading-relaxed border-t border-slate-50 pt-4">
-                  {t(`faq_${i}_ans`)}
+                  {t(ans)}
                 </div>
               )}
             </div>
@@ -1618,13 +1681,13 @@ const Dashboard = ({
             >
               <span className="font-semibold text-slate-900 text-lg flex items-center gap-3">
                 <Heart className="text-pink-500 fill-pink-500" size={24} />
-                {t('faq_future_q')}
+                {t(K.faq_future_q)}
               </span>
                {openFaq === 4 ? <ChevronDown className="text-pink-400" /> : <ChevronRight className="text-pink-400" />}
             </button>
             {openFaq === 4 && (
               <div className="px-6 pb-6 text-slate-700 leading-relaxed italic border-t border-pink-100 pt-4 bg-pink-50/10">
-                "{t('faq_future_ans')}"
+                "{t(K.faq_future_ans)}"
               </div>
             )}
           </div>
@@ -1635,31 +1698,28 @@ const Dashboard = ({
 };
 
 // 3. Methodology View
-const MethodologyView = ({ t, userProfile }: any) => {
+const MethodologyView = ({ t, rich, userProfile }: any) => {
   // Ensure userProfile is safe to use
   const profile = userProfile || { fatwaSource: 'global' };
 
   const getFatwaNote = () => {
     switch (profile.fatwaSource) {
       case 'ecfr':
-        return t('meth_note_ecfr');
+        return t(K.meth_note_ecfr);
       case 'amja':
-        return t('meth_note_amja');
+        return t(K.meth_note_amja);
       default:
-        return t('meth_note_global');
+        return t(K.meth_note_global);
     }
   };
 
   return (
     <div className="max-w-5xl mx-auto py-12 px-4 pb-24 md:pb-12">
       <div className="text-center mb-16">
-        <h1 className="text-4xl font-bold text-slate-900 mb-4">{t('meth_title')}</h1>
-        <div 
-          className="text-xl text-slate-600 max-w-2xl mx-auto"
-          dangerouslySetInnerHTML={{ 
-            __html: DOMPurify.sanitize(t('meth_intro').replace(/\*\*(.*?)\*\*/g, '<strong class="font-bold text-slate-900">$1</strong>')) /* PRIORITY 1 FIXED */
-          }}
-        />
+        <h1 className="text-4xl font-bold text-slate-900 mb-4">{t(K.meth_title)}</h1>
+        <div className="text-xl text-slate-600 max-w-2xl mx-auto">
+          <RichText text={rich(K.meth_intro)} strongClassName="font-bold text-slate-900" />
+        </div>
       </div>
 
       {/* Process Steps */}
@@ -1668,38 +1728,38 @@ const MethodologyView = ({ t, userProfile }: any) => {
           <div className="h-12 w-12 bg-blue-100 rounded-xl flex items-center justify-center text-blue-600 mb-6">
             <FileText size={24} />
           </div>
-          <h3 className="text-xl font-bold text-slate-800 mb-3">{t('meth_step_1')}</h3>
-          <p className="text-slate-600 leading-relaxed">{t('meth_step_1_desc')}</p>
+          <h3 className="text-xl font-bold text-slate-800 mb-3">{t(K.meth_step_1)}</h3>
+          <p className="text-slate-600 leading-relaxed">{t(K.meth_step_1_desc)}</p>
         </div>
         <div className="bg-white p-6 md:p-8 rounded-2xl shadow-sm border border-slate-100 hover-card">
           <div className="h-12 w-12 bg-purple-100 rounded-xl flex items-center justify-center text-purple-600 mb-6">
             <Filter size={24} />
           </div>
-          <h3 className="text-xl font-bold text-slate-800 mb-3">{t('meth_step_2')}</h3>
-          <p className="text-slate-600 leading-relaxed">{t('meth_step_2_desc')}</p>
+          <h3 className="text-xl font-bold text-slate-800 mb-3">{t(K.meth_step_2)}</h3>
+          <p className="text-slate-600 leading-relaxed">{t(K.meth_step_2_desc)}</p>
         </div>
       </div>
 
       {/* Spectrum of Riba */}
       <div className="bg-slate-50 rounded-3xl p-6 md:p-12 border border-slate-200 mb-16">
-         <h3 className="text-2xl font-bold text-slate-900 mb-8 text-center">{t('meth_spectrum_title')}</h3>
+         <h3 className="text-2xl font-bold text-slate-900 mb-8 text-center">{t(K.meth_spectrum_title)}</h3>
          <div className="grid md:grid-cols-3 gap-6">
            <div className="bg-red-50 border border-red-100 p-6 rounded-xl">
-             <h4 className="font-bold text-red-700 mb-2 flex items-center gap-2"><XCircle size={18}/> {t('meth_haram_title')}</h4>
+             <h4 className="font-bold text-red-700 mb-2 flex items-center gap-2"><XCircle size={18}/> {t(K.meth_haram_title)}</h4>
              <ul className="text-sm text-red-900/80 space-y-2 list-disc list-inside methodology-list">
-               {t('meth_haram_items').split(',').map((item:string, i:number) => <li key={i}>{item.trim()}</li>)}
+               {t(K.meth_haram_items).split(',').map((item:string, i:number) => <li key={i}>{item.trim()}</li>)}
              </ul>
            </div>
            <div className="bg-yellow-50 border border-yellow-100 p-6 rounded-xl">
-             <h4 className="font-bold text-yellow-700 mb-2 flex items-center gap-2"><HelpCircle size={18}/> {t('meth_shubhah_title')}</h4>
+             <h4 className="font-bold text-yellow-700 mb-2 flex items-center gap-2"><HelpCircle size={18}/> {t(K.meth_shubhah_title)}</h4>
              <ul className="text-sm text-yellow-900/80 space-y-2 list-disc list-inside methodology-list">
-               {t('meth_shubhah_items').split(',').map((item:string, i:number) => <li key={i}>{item.trim()}</li>)}
+               {t(K.meth_shubhah_items).split(',').map((item:string, i:number) => <li key={i}>{item.trim()}</li>)}
              </ul>
            </div>
            <div className="bg-emerald-50 border border-emerald-100 p-6 rounded-xl">
-             <h4 className="font-bold text-emerald-700 mb-2 flex items-center gap-2"><CheckCircle size={18}/> {t('meth_halal_title')}</h4>
+             <h4 className="font-bold text-emerald-700 mb-2 flex items-center gap-2"><CheckCircle size={18}/> {t(K.meth_halal_title)}</h4>
              <ul className="text-sm text-emerald-900/80 space-y-2 list-disc list-inside methodology-list">
-               {t('meth_halal_items').split(',').map((item:string, i:number) => <li key={i}>{item.trim()}</li>)}
+               {t(K.meth_halal_items).split(',').map((item:string, i:number) => <li key={i}>{item.trim()}</li>)}
              </ul>
            </div>
          </div>
@@ -1707,55 +1767,55 @@ const MethodologyView = ({ t, userProfile }: any) => {
 
       {/* Deep Dive & Edge Cases */}
       <div className="max-w-4xl mx-auto">
-        <h3 className="text-2xl font-bold text-slate-900 mb-8 text-center">{t('meth_deep_title')}</h3>
+        <h3 className="text-2xl font-bold text-slate-900 mb-8 text-center">{t(K.meth_deep_title)}</h3>
         <div className="space-y-6">
           <div className="bg-white p-6 rounded-xl border border-slate-200 hover:border-blue-300 transition-colors">
-            <h4 className="font-bold text-slate-800 mb-2 flex items-center gap-2"><BookOpen size={18} className="text-blue-500"/> {t('meth_fatwa_section')}</h4>
-            <p className="text-slate-600 text-sm leading-relaxed mb-4">{t('meth_fatwa_text')}</p>
+            <h4 className="font-bold text-slate-800 mb-2 flex items-center gap-2"><BookOpen size={18} className="text-blue-500"/> {t(K.meth_fatwa_section)}</h4>
+            <p className="text-slate-600 text-sm leading-relaxed mb-4">{t(K.meth_fatwa_text)}</p>
             
             {/* Dynamic Note */}
             <div className="bg-blue-50 p-4 rounded-lg border border-blue-100">
-              <span className="text-xs font-bold text-blue-600 uppercase tracking-wide mb-1 block">{t('meth_active_ruling')}</span>
+              <span className="text-xs font-bold text-blue-600 uppercase tracking-wide mb-1 block">{t(K.meth_active_ruling)}</span>
               <p className="text-sm text-blue-800">{getFatwaNote()}</p>
             </div>
             
             {/* Trust Badges */}
             <div className="flex flex-wrap gap-2 mt-4">
               <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800 border border-green-200">
-                <CheckCircle size={12} className="mr-1" /> {t('meth_badge_ecfr')}
+                <CheckCircle size={12} className="mr-1" /> {t(K.meth_badge_ecfr)}
               </span>
               <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-blue-100 text-blue-800 border border-blue-200">
-                <CheckCircle size={12} className="mr-1" /> {t('meth_badge_amja')}
+                <CheckCircle size={12} className="mr-1" /> {t(K.meth_badge_amja)}
               </span>
             </div>
           </div>
           
           <div className="bg-white p-6 rounded-xl border border-slate-200 hover:border-blue-300 transition-colors">
-            <h4 className="font-bold text-slate-800 mb-2 flex items-center gap-2"><PieChart size={18} className="text-blue-500"/> {t('meth_disposal_section')}</h4>
-            <p className="text-slate-600 text-sm leading-relaxed">{t('meth_disposal_text')}</p>
+            <h4 className="font-bold text-slate-800 mb-2 flex items-center gap-2"><PieChart size={18} className="text-blue-500"/> {t(K.meth_disposal_section)}</h4>
+            <p className="text-slate-600 text-sm leading-relaxed">{t(K.meth_disposal_text)}</p>
           </div>
 
           <div className="bg-white p-6 rounded-xl border border-slate-200 hover:border-blue-300 transition-colors">
-             <h4 className="font-bold text-slate-800 mb-4 flex items-center gap-2"><AlertTriangle size={18} className="text-orange-500"/> {t('meth_edge_section')}</h4>
+             <h4 className="font-bold text-slate-800 mb-4 flex items-center gap-2"><AlertTriangle size={18} className="text-orange-500"/> {t(K.meth_edge_section)}</h4>
              <div className="grid md:grid-cols-3 gap-4">
                 <div className="p-4 bg-slate-50 rounded-lg">
-                  <p className="font-bold text-slate-700 text-sm mb-1">{t('meth_edge_title_cashback')}</p>
-                  <p className="text-xs text-slate-500">{t('meth_edge_cashback')}</p>
+                  <p className="font-bold text-slate-700 text-sm mb-1">{t(K.meth_edge_title_cashback)}</p>
+                  <p className="text-xs text-slate-500">{t(K.meth_edge_cashback)}</p>
                 </div>
                 <div className="p-4 bg-slate-50 rounded-lg">
-                  <p className="font-bold text-slate-700 text-sm mb-1">{t('meth_edge_title_rewards')}</p>
-                  <p className="text-xs text-slate-500">{t('meth_edge_rewards')}</p>
+                  <p className="font-bold text-slate-700 text-sm mb-1">{t(K.meth_edge_title_rewards)}</p>
+                  <p className="text-xs text-slate-500">{t(K.meth_edge_rewards)}</p>
                 </div>
                 <div className="p-4 bg-slate-50 rounded-lg">
-                  <p className="font-bold text-slate-700 text-sm mb-1">{t('meth_edge_title_crypto')}</p>
-                  <p className="text-xs text-slate-500">{t('meth_edge_crypto')}</p>
+                  <p className="font-bold text-slate-700 text-sm mb-1">{t(K.meth_edge_title_crypto)}</p>
+                  <p className="text-xs text-slate-500">{t(K.meth_edge_crypto)}</p>
                 </div>
              </div>
           </div>
           
           {/* External Resources */}
           <div className="pt-12 border-t border-slate-100 mt-12">
-             <h4 className="text-xs font-bold text-slate-400 uppercase tracking-widest mb-6 text-center">{t('meth_resources_title')}</h4>
+             <h4 className="text-xs font-bold text-slate-400 uppercase tracking-widest mb-6 text-center">{t(K.meth_resources_title)}</h4>
              <div className="grid grid-cols-1 sm:grid-cols-3 gap-4">
                <a href="https://aaoifi.com" target="_blank" rel="noreferrer" className="flex flex-col items-center justify-center p-6 bg-white rounded-2xl border border-slate-200 shadow-sm hover:shadow-md hover:border-blue-300 hover:-translate-y-1 transition-all group">
                  <div className="w-10 h-10 bg-blue-50 rounded-full flex items-center justify-center mb-3 group-hover:bg-blue-100 transition-colors">
@@ -1806,10 +1866,10 @@ const ManifestoView = ({ t }: any) => (
         <Heart size={12} className="fill-current" /> Our Mission
       </div>
       <h1 className="text-4xl md:text-6xl font-bold text-slate-900 mb-6 tracking-tight leading-tight">
-        {t('man_title')}
+        {t(K.man_title)}
       </h1>
       <p className="text-xl text-slate-600 max-w-2xl mx-auto leading-relaxed">
-        {t('man_subtitle')}
+        {t(K.man_subtitle)}
       </p>
     </div>
 
@@ -1823,8 +1883,8 @@ const ManifestoView = ({ t }: any) => (
           <div className="w-12 h-12 bg-red-100 rounded-xl flex items-center justify-center text-red-600 mb-6">
             <XCircle size={24} />
           </div>
-          <h3 className="text-2xl font-bold text-slate-900 mb-4">{t('man_prob')}</h3>
-          <p className="text-lg text-slate-700 leading-relaxed">{t('man_prob_desc')}</p>
+          <h3 className="text-2xl font-bold text-slate-900 mb-4">{t(K.man_prob)}</h3>
+          <p className="text-lg text-slate-700 leading-relaxed">{t(K.man_prob_desc)}</p>
         </div>
       </div>
 
@@ -1836,20 +1896,20 @@ const ManifestoView = ({ t }: any) => (
           <div className="w-12 h-12 bg-emerald-100 rounded-xl flex items-center justify-center text-emerald-600 mb-6">
             <CheckCircle size={24} />
           </div>
-          <h3 className="text-2xl font-bold text-slate-900 mb-4">{t('man_sol')}</h3>
-          <p className="text-lg text-slate-700 leading-relaxed">{t('man_sol_desc')}</p>
+          <h3 className="text-2xl font-bold text-slate-900 mb-4">{t(K.man_sol)}</h3>
+          <p className="text-lg text-slate-700 leading-relaxed">{t(K.man_sol_desc)}</p>
         </div>
       </div>
     </div>
 
     {/* Core Values Grid */}
     <div className="mb-24">
-      <h2 className="text-3xl font-bold text-slate-900 text-center mb-12">{t('man_values_title')}</h2>
+      <h2 className="text-3xl font-bold text-slate-900 text-center mb-12">{t(K.man_values_title)}</h2>
       <div className="grid md:grid-cols-3 gap-8">
         {[
-          { icon: Shield, title: t('man_val_1'), desc: t('man_val_1_d'), color: 'blue' },
-          { icon: FileText, title: t('man_val_2'), desc: t('man_val_2_d'), color: 'purple' },
-          { icon: Heart, title: t('man_val_3'), desc: t('man_val_3_d'), color: 'pink' },
+          { icon: Shield, title: t(K.man_val_1), desc: t(K.man_val_1_d), color: 'blue' },
+          { icon: FileText, title: t(K.man_val_2), desc: t(K.man_val_2_d), color: 'purple' },
+          { icon: Heart, title: t(K.man_val_3), desc: t(K.man_val_3_d), color: 'pink' },
         ].map((item, i) => (
           <div key={i} className="bg-white p-6 md:p-8 rounded-2xl shadow-sm border border-slate-100 hover-card text-center">
             <div className={`w-14 h-14 mx-auto bg-${item.color}-50 rounded-2xl flex items-center justify-center text-${item.color}-600 mb-6`}>
@@ -1871,9 +1931,9 @@ const ManifestoView = ({ t }: any) => (
       
       <div className="relative z-10 max-w-3xl mx-auto">
         <Shield size={64} className="mx-auto text-blue-400 mb-8" />
-        <h2 className="text-3xl md:text-4xl font-bold mb-6">{t('arch_privacy')}</h2>
+        <h2 className="text-3xl md:text-4xl font-bold mb-6">{t(K.arch_privacy)}</h2>
         <p className="text-xl text-slate-300 leading-relaxed mb-8">
-          {t('arch_privacy_desc')}
+          {t(K.arch_privacy_desc)}
         </p>
         <div className="inline-flex gap-4 items-center justify-center text-sm font-mono text-blue-300 bg-slate-800/50 px-6 py-3 rounded-xl border border-slate-700">
            <span>No Servers</span>
@@ -1888,7 +1948,7 @@ const ManifestoView = ({ t }: any) => (
 );
 
 // 5. Purification View
-const PurificationView = ({ history, onClearHistory, t, language, setActiveView, setHistory, transactions, onUpload }: any) => {
+const PurificationView = ({ history, onClearHistory, t, language, setActiveView, setHistory, transactions, onUpload, onOpenRecord }: any) => {
   const [activeTab, setActiveTab] = useState<'pending' | 'disposed'>('pending');
   const [showClearConfirm, setShowClearConfirm] = useState(false);
 
@@ -1997,7 +2057,7 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
              <tr class="log-row gap-row">
                <td colspan="4" class="gap-cell">
                  <div class="gap-indicator">
-                   <span>⚠️ ${t('puri_cert_gap_detected')} ${new Date(prevDate).toLocaleDateString()} - ${new Date(currDate).toLocaleDateString()}</span>
+                   <span>⚠️ ${t(K.puri_cert_gap_detected)} ${new Date(prevDate).toLocaleDateString()} - ${new Date(currDate).toLocaleDateString()}</span>
                  </div>
                </td>
              </tr>
@@ -2017,7 +2077,7 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
 
     const htmlContent = `
       <!DOCTYPE html>
-      <html dir="${t('dir') || 'ltr'}">
+      <html dir="${document.documentElement.dir || 'ltr'}">
       <head>
         <title>Purification Certificate</title>
         <style>
@@ -2315,7 +2375,7 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             <div class="header">
               <img src="${window.location.origin}/favicon.svg" alt="RibaPurify Logo" class="logo-icon" />
               <div class="brand-name">RibaPurify</div>
-              <h1>${t('puri_cert_header')}</h1>
+              <h1>${t(K.puri_cert_header)}</h1>
             </div>
 
             <div class="ayah-box">
@@ -2326,23 +2386,23 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
 
             <div class="summary-section">
               <div class="currency-list">
-                <div class="summary-label" style="color: #7f1d1d; margin-bottom: 15px;">${t('puri_cert_total_riba')}</div>
+                <div class="summary-label" style="color: #7f1d1d; margin-bottom: 15px;">${t(K.puri_cert_total_riba)}</div>
                 ${currencyRows}
                 
-                <div class="summary-label" style="color: #7f1d1d; margin-bottom: 15px; margin-top: 20px; border-top: 1px dashed #fecaca; padding-top: 15px;">${t('puri_cert_total_amount')}</div>
+                <div class="summary-label" style="color: #7f1d1d; margin-bottom: 15px; margin-top: 20px; border-top: 1px dashed #fecaca; padding-top: 15px;">${t(K.puri_cert_total_amount)}</div>
                 ${currencyRows}
               </div>
             </div>
 
             <div class="logs-section">
-              <div class="summary-label" style="margin-bottom: 10px;">${t('puri_cert_logs')}</div>
+              <div class="summary-label" style="margin-bottom: 10px;">${t(K.puri_cert_logs)}</div>
               <table class="log-table">
                 <thead>
                   <tr>
                     <th class="log-header">#</th>
-                    <th class="log-header">${t('puri_cert_date')}</th>
-                    <th class="log-header">${t('puri_cert_source')}</th>
-                    <th class="log-header text-right">${t('puri_cert_amount')}</th>
+                    <th class="log-header">${t(K.puri_cert_date)}</th>
+                    <th class="log-header">${t(K.puri_cert_source)}</th>
+                    <th class="log-header text-right">${t(K.puri_cert_amount)}</th>
                   </tr>
                 </thead>
                 <tbody>
@@ -2354,31 +2414,31 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             <div class="guidance-box">
               <div class="guidance-title">
                 <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"/><line x1="12" y1="16" x2="12" y2="12"/><line x1="12" y1="8" x2="12.01" y2="8"/></svg>
-                ${t('puri_cert_guidance_title')}
+                ${t(K.puri_cert_guidance_title)}
               </div>
               <div class="guidance-text" style="margin-bottom: 20px;">
-                ${t('puri_cert_guidance_text')}
+                ${t(K.puri_cert_guidance_text)}
               </div>
               <div class="guidance-steps" style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 20px; border-top: 1px dashed #fdba74; padding-top: 15px;">
                 <div class="step">
-                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">1. ${t('puri_step_1_title')}</div>
-                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t('puri_step_1_desc')}</div>
+                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">1. ${t(K.puri_step_1_title)}</div>
+                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t(K.puri_step_1_desc)}</div>
                 </div>
                 <div class="step">
-                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">2. ${t('puri_step_2_title')}</div>
-                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t('puri_step_2_desc')}</div>
+                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">2. ${t(K.puri_step_2_title)}</div>
+                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t(K.puri_step_2_desc)}</div>
                 </div>
                 <div class="step">
-                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">3. ${t('puri_step_3_title')}</div>
-                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t('puri_step_3_desc')}</div>
+                  <div class="step-title" style="font-weight: 700; color: #9a3412; font-size: 11px; margin-bottom: 6px; text-transform: uppercase;">3. ${t(K.puri_step_3_title)}</div>
+                  <div class="step-desc" style="font-size: 10px; color: #7c2d12; line-height: 1.4;">${t(K.puri_step_3_desc)}</div>
                 </div>
               </div>
             </div>
 
             <div class="disclaimer-box">
-              <div class="disclaimer-title">${t('puri_cert_disclaimer_label')}</div>
+              <div class="disclaimer-title">${t(K.puri_cert_disclaimer_label)}</div>
               <div class="disclaimer-text">
-                ${t('puri_cert_disclaimer')}
+                ${t(K.puri_cert_disclaimer)}
               </div>
             </div>
 
@@ -2386,11 +2446,11 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
 
             <div class="footer">
               <div class="footer-text">
-                <strong>${t('puri_cert_confirmation')}</strong><br><br>
-                ${t('puri_cert_privacy')}<br>
-                <strong>${t('puri_cert_id')}:</strong> ${certificateId}
+                <strong>${t(K.puri_cert_confirmation)}</strong><br><br>
+                ${t(K.puri_cert_privacy)}<br>
+                <strong>${t(K.puri_cert_id)}:</strong> ${certificateId}
               </div>
-              <div class="timestamp">${t('puri_cert_generated')}: ${new Date().toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' })}</div>
+              <div class="timestamp">${t(K.puri_cert_generated)}: ${new Date().toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' })}</div>
               <div class="page-number">Page 1</div>
             </div>
           </div>
@@ -2411,8 +2471,8 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
       {/* Header */}
       <div className="flex flex-col md:flex-row justify-between items-start md:items-center gap-4 mb-8">
         <div>
-          <h1 className="text-3xl font-bold text-slate-900">{t('nav_puri')}</h1>
-          <p className="text-slate-500 mt-1">{t('puri_subtitle')}</p>
+          <h1 className="text-3xl font-bold text-slate-900">{t(K.nav_puri)}</h1>
+          <p className="text-slate-500 mt-1">{t(K.puri_subtitle)}</p>
         </div>
         <div className="flex gap-2">
           <button 
@@ -2420,7 +2480,7 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             disabled={disposedItems.length === 0}
             className="flex items-center gap-2 px-4 py-2 bg-slate-900 text-white rounded-lg hover:bg-slate-800 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
           >
-            <Printer size={18} /> {t('puri_btn_export')}
+            <Printer size={18} /> {t(K.puri_btn_export)}
           </button>
         </div>
       </div>
@@ -2431,11 +2491,11 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
           <Heart size={120} className="text-emerald-600" />
         </div>
         <div className="relative z-10 text-center">
-          <h3 className="text-emerald-800 font-bold mb-4">{t('puri_dua_title')}</h3>
+          <h3 className="text-emerald-800 font-bold mb-4">{t(K.puri_dua_title)}</h3>
           <p className="text-2xl md:text-3xl font-arabic leading-loose text-emerald-900 mb-4">
-            {t('puri_dua_arabic')}
+            {t(K.puri_dua_arabic)}
           </p>
-          <p className="text-emerald-700 italic">"{t('puri_dua_trans')}"</p>
+          <p className="text-emerald-700 italic">"{t(K.puri_dua_trans)}"</p>
         </div>
       </div>
 
@@ -2444,28 +2504,28 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
         <div className="bg-orange-50 border border-orange-100 p-4 rounded-xl">
             <div className="flex items-center gap-2 mb-2 text-orange-800 font-bold text-sm uppercase tracking-wide">
                 <span className="w-6 h-6 bg-orange-200 rounded-full flex items-center justify-center text-xs">1</span>
-                {t('puri_step_1_title')}
+                {t(K.puri_step_1_title)}
             </div>
             <p className="text-xs text-orange-900 leading-relaxed">
-                {t('puri_step_1_desc')}
+                {t(K.puri_step_1_desc)}
             </p>
         </div>
         <div className="bg-blue-50 border border-blue-100 p-4 rounded-xl">
             <div className="flex items-center gap-2 mb-2 text-blue-800 font-bold text-sm uppercase tracking-wide">
                 <span className="w-6 h-6 bg-blue-200 rounded-full flex items-center justify-center text-xs">2</span>
-                {t('puri_step_2_title')}
+                {t(K.puri_step_2_title)}
             </div>
             <p className="text-xs text-blue-900 leading-relaxed">
-                {t('puri_step_2_desc')}
+                {t(K.puri_step_2_desc)}
             </p>
         </div>
         <div className="bg-red-50 border border-red-100 p-4 rounded-xl">
             <div className="flex items-center gap-2 mb-2 text-red-800 font-bold text-sm uppercase tracking-wide">
                 <span className="w-6 h-6 bg-red-200 rounded-full flex items-center justify-center text-xs">3</span>
-                {t('puri_step_3_title')}
+                {t(K.puri_step_3_title)}
             </div>
             <p className="text-xs text-red-900 leading-relaxed">
-                {t('puri_step_3_desc')}
+                {t(K.puri_step_3_desc)}
             </p>
         </div>
       </div>
@@ -2478,7 +2538,7 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             activeTab === 'pending' ? 'text-blue-600' : 'text-slate-500 hover:text-slate-700'
           }`}
         >
-          {t('puri_tab_pending')}
+          {t(K.puri_tab_pending)}
           {pendingItems.length > 0 && (
             <span className="ml-2 bg-blue-100 text-blue-600 px-2 py-0.5 rounded-full text-xs">
               {pendingItems.length}
@@ -2492,7 +2552,7 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             activeTab === 'disposed' ? 'text-emerald-600' : 'text-slate-500 hover:text-slate-700'
           }`}
         >
-          {t('puri_tab_disposed')}
+          {t(K.puri_tab_disposed)}
           {activeTab === 'disposed' && <div className="absolute bottom-0 left-0 right-0 h-0.5 bg-emerald-600" />}
         </button>
       </div>
@@ -2514,22 +2574,22 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             <div className="w-12 h-12 bg-slate-100 rounded-full flex items-center justify-center mb-3 group-hover:bg-blue-100 transition-colors">
                 <UploadCloud size={24} className="text-slate-400 group-hover:text-blue-600" />
             </div>
-            <h3 className="font-bold text-slate-700 group-hover:text-blue-700">{t('puri_analyze_new')}</h3>
-            <p className="text-xs text-slate-500 mt-1">{t('puri_analyze_desc')}</p>
+            <h3 className="font-bold text-slate-700 group-hover:text-blue-700">{t(K.puri_analyze_new)}</h3>
+            <p className="text-xs text-slate-500 mt-1">{t(K.puri_analyze_desc)}</p>
           </div>
 
           {/* Pending List */}
           <div className="bg-white rounded-2xl shadow-sm border border-slate-100 overflow-hidden">
             <div className="p-6 border-b border-slate-100 flex justify-between items-center">
-              <h3 className="font-bold text-slate-800">{t('puri_pending_items')}</h3>
+              <h3 className="font-bold text-slate-800">{t(K.puri_pending_items)}</h3>
               <span className="font-mono font-bold text-red-600 text-lg">
-                {t('puri_total_interest')}: {totalPending.toLocaleString()} USD
+                {t(K.puri_total_interest)}: {totalPending.toLocaleString()} USD
               </span>
             </div>
             {pendingItems.length === 0 ? (
               <div className="p-12 text-center text-slate-400">
                 <CheckCircle size={48} className="mx-auto mb-4 text-emerald-500 opacity-50" />
-                <p>{t('puri_all_caught_up')}</p>
+                <p>{t(K.puri_all_caught_up)}</p>
               </div>
             ) : (
               <div className="divide-y divide-slate-50">
@@ -2546,11 +2606,17 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
                       <span className="font-mono font-bold text-red-600 text-lg">
                         {record.amount.toFixed(2)} {record.currency}
                       </span>
+                      <button
+                        onClick={() => onOpenRecord(record.id)}
+                        className="px-4 py-2 text-slate-600 text-sm font-bold rounded-lg hover:bg-slate-100 transition-colors"
+                      >
+                        {t(K.puri_btn_view)}
+                      </button>
                       <button
                         onClick={() => handleMarkDisposed(record.id)}
                         className="px-4 py-2 bg-emerald-600 text-white text-sm font-bold rounded-lg hover:bg-emerald-700 transition-colors shadow-sm"
                       >
-                        {t('puri_btn_dispose')}
+                        {t(K.puri_btn_dispose)}
                       </button>
                     </div>
                   </div>
@@ -2575,18 +2641,18 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
             <div className="w-12 h-12 bg-slate-100 rounded-full flex items-center justify-center mb-3 group-hover:bg-blue-100 transition-colors">
                 <UploadCloud size={24} className="text-slate-400 group-hover:text-blue-600" />
             </div>
-            <h3 className="font-bold text-slate-700 group-hover:text-blue-700">{t('puri_analyze_new')}</h3>
-            <p className="text-xs text-slate-500 mt-1">{t('puri_analyze_desc')}</p>
+            <h3 className="font-bold text-slate-700 group-hover:text-blue-700">{t(K.puri_analyze_new)}</h3>
+            <p className="text-xs text-slate-500 mt-1">{t(K.puri_analyze_desc)}</p>
           </div>
 
           {/* Disposed Stats */}
           <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
             <div className="bg-white p-6 rounded-2xl shadow-sm border border-slate-100">
-              <p className="text-slate-500 text-xs font-bold uppercase tracking-wider">{t('puri_total_purified')}</p>
+              <p className="text-slate-500 text-xs font-bold uppercase tracking-wider">{t(K.puri_total_purified)}</p>
               <p className="text-2xl font-mono font-bold text-emerald-600 mt-1">{totalDisposed.toLocaleString()} USD</p>
             </div>
             <div className="bg-white p-6 rounded-2xl shadow-sm border border-slate-100">
-              <p className="text-slate-500 text-xs font-bold uppercase tracking-wider">{t('puri_transactions')}</p>
+              <p className="text-slate-500 text-xs font-bold uppercase tracking-wider">{t(K.puri_transactions)}</p>
               <p className="text-2xl font-mono font-bold text-slate-800 mt-1">{disposedItems.length}</p>
             </div>
           </div>
@@ -2594,19 +2660,19 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
           {/* Disposed List */}
           <div className="bg-white rounded-2xl shadow-sm border border-slate-100 overflow-hidden">
             <div className="p-6 border-b border-slate-100 flex justify-between items-center">
-              <h3 className="font-bold text-slate-800">{t('puri_tab_disposed')}</h3>
+              <h3 className="font-bold text-slate-800">{t(K.puri_tab_disposed)}</h3>
               {disposedItems.length > 0 && (
                 <button
                   onClick={() => setShowClearConfirm(true)}
                   className="text-red-500 hover:text-red-600 text-sm font-medium flex items-center gap-1"
                 >
-                  <Trash2 size={14} /> {t('puri_clear')}
+                  <Trash2 size={14} /> {t(K.puri_clear)}
                 </button>
               )}
             </div>
             {disposedItems.length === 0 ? (
               <div className="p-12 text-center text-slate-400">
-                <p>{t('puri_no_disposed')}</p>
+                <p>{t(K.puri_no_disposed)}</p>
               </div>
             ) : (
               <div className="divide-y divide-slate-50">
@@ -2616,10 +2682,18 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
                       <p className="font-medium text-slate-800 line-through decoration-slate-400">{record.statementName}</p>
                       <p className="text-sm text-slate-500 font-mono">{record.date}</p>
                     </div>
-                    <span className="font-mono font-bold text-emerald-600 flex items-center gap-2">
-                      <CheckCircle size={14} />
-                      {record.amount.toFixed(2)} {record.currency}
-                    </span>
+                    <div className="flex items-center gap-4">
+                      <span className="font-mono font-bold text-emerald-600 flex items-center gap-2">
+                        <CheckCircle size={14} />
+                        {record.amount.toFixed(2)} {record.currency}
+                      </span>
+                      <button
+                        onClick={() => onOpenRecord(record.id)}
+                        className="px-4 py-2 text-slate-600 text-sm font-bold rounded-lg hover:bg-slate-100 transition-colors"
+                      >
+                        {t(K.puri_btn_view)}
+                      </button>
+                    </div>
                   </div>
                 ))}
               </div>
@@ -2636,22 +2710,22 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
               <div className="w-12 h-12 bg-red-100 text-red-600 rounded-full flex items-center justify-center mb-4">
                 <AlertTriangle size={24} />
               </div>
-              <h3 className="text-xl font-bold text-slate-900 mb-2">{t('puri_clear')}?</h3>
+              <h3 className="text-xl font-bold text-slate-900 mb-2">{t(K.puri_clear)}?</h3>
               <p className="text-slate-500 mb-6">
-                {t('puri_clear_confirm')}
+                {t(K.puri_clear_confirm)}
               </p>
               <div className="flex gap-3 w-full">
                 <button 
                   onClick={() => setShowClearConfirm(false)}
                   className="flex-1 py-2.5 bg-white border border-slate-300 text-slate-700 rounded-lg font-semibold hover:bg-slate-50 transition-colors"
                 >
-                  {t('puri_cancel_btn')}
+                  {t(K.puri_cancel_btn)}
                 </button>
                 <button 
                   onClick={() => { onClearHistory(); setShowClearConfirm(false); }}
                   className="flex-1 py-2.5 bg-red-600 text-white rounded-lg font-semibold hover:bg-red-700 transition-colors shadow-lg shadow-red-200"
                 >
-                  {t('puri_clear_btn')}
+                  {t(K.puri_clear_btn)}
                 </button>
               </div>
             </div>
@@ -2662,20 +2736,20 @@ const PurificationView = ({ history, onClearHistory, t, language, setActiveView,
       {/* Donate Section */}
       <div className="mt-12 bg-gradient-to-br from-orange-50 via-amber-50 to-yellow-50 rounded-3xl shadow-lg border border-orange-200 p-8 md:p-10">
         <div className="text-center mb-8">
-          <h2 className="text-3xl font-bold text-slate-900 mb-3">{t('donate_here')}</h2>
+          <h2 className="text-3xl font-bold text-slate-900 mb-3">{t(K.donate_here)}</h2>
           <p className="text-slate-600 max-w-2xl mx-auto leading-relaxed">
-            <strong>{t('donate_remove_immediately')}</strong> {t('donate_here_desc')}
+            <strong>{t(K.donate_remove_immediately)}</strong> {t(K.donate_here_desc)}
           </p>
         </div>
 
         <div className="grid md:grid-cols-2 gap-4 max-w-4xl mx-auto">
           {[
-            { name: 'Islamic Relief Worldwide', url: 'https://www.islamic-relief.org', region: t('donate_region_global') },
-            { name: 'Penny Appeal', url: 'https://www.pennyappeal.org', region: t('donate_region_uk_global') },
-            { name: 'Human Appeal', url: 'https://humanappeal.org', region: t('donate_region_uk_global') },
-            { name: 'Zakat Foundation', url: 'https://www.zakat.org', region: t('donate_region_usa_global') },
-            { name: 'UNHCR', url: 'https://www.unhcr.org', region: t('donate_region_global') },
-            { name: 'Local Masjid / Community', url: '#', region: t('donate_region_your_area') }
+            { name: 'Islamic Relief Worldwide', url: 'https://www.islamic-relief.org', region: t(K.donate_region_global) },
+            { name: 'Penny Appeal', url: 'https://www.pennyappeal.org', region: t(K.donate_region_uk_global) },
+            { name: 'Human Appeal', url: 'https://humanappeal.org', region: t(K.donate_region_uk_global) },
+            { name: 'Zakat Foundation', url: 'https://www.zakat.org', region: t(K.donate_region_usa_global) },
+            { name: 'UNHCR', url: 'https://www.unhcr.org', region: t(K.donate_region_global) },
+            { name: 'Local Masjid / Community', url: '#', region: t(K.donate_region_your_area) }
           ].map((org, i) => (
             <a
               key={i}
@@ -2762,10 +2836,10 @@ const DonateView = ({ t, totalRiba, currency }: any) => {
           <Heart className="text-white fill-white" size={40} />
         </div>
         <h1 className="text-4xl md:text-5xl font-bold text-slate-900 mb-4">
-          {t('donate_title')}
+          {t(K.donate_title)}
         </h1>
         <p className="text-lg text-slate-600 max-w-2xl mx-auto leading-relaxed">
-          {t('donate_subtitle')}
+          {t(K.donate_subtitle)}
         </p>
       </div>
 
@@ -2773,20 +2847,20 @@ const DonateView = ({ t, totalRiba, currency }: any) => {
       <div className="bg-amber-50 border-l-4 border-amber-500 rounded-xl p-6 mb-12">
         <h2 className="text-xl font-bold text-amber-900 mb-4 flex items-center gap-2">
           <Info size={24} />
-          {t('donate_guidelines_title')}
+          {t(K.donate_guidelines_title)}
         </h2>
         <div className="space-y-3 text-amber-900">
           <div className="flex items-start gap-3">
             <span className="font-bold text-lg">1.</span>
-            <p><strong>{t('donate_guideline_1_title')}</strong> {t('donate_guideline_1_desc')}</p>
+            <p><strong>{t(K.donate_guideline_1_title)}</strong> {t(K.donate_guideline_1_desc)}</p>
           </div>
           <div className="flex items-start gap-3">
             <span className="font-bold text-lg">2.</span>
-            <p><strong>{t('donate_guideline_2_title')}</strong> {t('donate_guideline_2_desc')}</p>
+            <p><strong>{t(K.donate_guideline_2_title)}</strong> {t(K.donate_guideline_2_desc)}</p>
           </div>
           <div className="flex items-start gap-3">
             <span className="font-bold text-lg">3.</span>
-            <p><strong>{t('donate_guideline_3_title')}</strong> {t('donate_guideline_3_desc')}</p>
+            <p><strong>{t(K.donate_guideline_3_title)}</strong> {t(K.donate_guideline_3_desc)}</p>
           </div>
         </div>
       </div>
@@ -2794,7 +2868,7 @@ const DonateView = ({ t, totalRiba, currency }: any) => {
       {/* Charity Organizations Grid */}
       <div className="mb-12">
         <h2 className="text-2xl font-bold text-slate-900 mb-6">
-          {t('donate_orgs_title')}
+          {t(K.donate_orgs_title)}
         </h2>
         <div className="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
           {charities.map((charity, i) => (
@@ -2832,49 +2906,49 @@ const DonateView = ({ t, totalRiba, currency }: any) => {
       {/* Additional Resources */}
       <div className="bg-slate-50 rounded-2xl p-8 border border-slate-200">
         <h3 className="text-xl font-bold text-slate-900 mb-4">
-          {t('donate_other_ways_title')}
+          {t(K.donate_other_ways_title)}
         </h3>
         <div className="grid md:grid-cols-3 gap-4 text-slate-700">
           <div className="flex items-start gap-3">
             <span className="text-2xl">🏥</span>
             <div>
-              <p className="font-semibold">{t('donate_public_hospitals')}</p>
-              <p className="text-sm text-slate-600">{t('donate_public_hospitals_desc')}</p>
+              <p className="font-semibold">{t(K.donate_public_hospitals)}</p>
+              <p className="text-sm text-slate-600">{t(K.donate_public_hospitals_desc)}</p>
             </div>
           </div>
           <div className="flex items-start gap-3">
             <span className="text-2xl">🎓</span>
             <div>
-              <p className="font-semibold">{t('donate_education')}</p>
-              <p className="text-sm text-slate-600">{t('donate_education_desc')}</p>
+              <p className="font-semibold">{t(K.donate_education)}</p>
+              <p className="text-sm text-slate-600">{t(K.donate_education_desc)}</p>
             </div>
           </div>
           <div className="flex items-start gap-3">
             <span className="text-2xl">🚰</span>
             <div>
-              <p className="font-semibold">{t('donate_water')}</p>
-              <p className="text-sm text-slate-600">{t('donate_water_desc')}</p>
+              <p className="font-semibold">{t(K.donate_water)}</p>
+              <p className="text-sm text-slate-600">{t(K.donate_water_desc)}</p>
             </div>
           </div>
           <div className="flex items-start gap-3">
             <span className="text-2xl">🛤️</span>
             <div>
-              <p className="font-semibold">{t('donate_infrastructure')}</p>
-              <p className="text-sm text-slate-600">{t('donate_infrastructure_desc')}</p>
+              <p className="font-semibold">{t(K.donate_infrastructure)}</p>
+              <p className="text-sm text-slate-600">{t(K.donate_infrastructure_desc)}</p>
             </div>
           </div>
           <div className="flex items-start gap-3">
             <span className="text-2xl">👶</span>
             <div>
-              <p className="font-semibold">{t('donate_orphans')}</p>
-              <p className="text-sm text-slate-600">{t('donate_orphans_desc')}</p>
+              <p className="font-semibold">{t(K.donate_orphans)}</p>
+              <p className="text-sm text-slate-600">{t(K.donate_orphans_desc)}</p>
             </div>
           </div>
           <div className="flex items-start gap-3">
             <span className="text-2xl">🍲</span>
             <div>
-              <p className="font-semibold">{t('donate_food')}</p>
-              <p className="text-sm text-slate-600">{t('donate_food_desc')}</p>
+              <p className="font-semibold">{t(K.donate_food)}</p>
+              <p className="text-sm text-slate-600">{t(K.donate_food_desc)}</p>
             </div>
           </div>
         </div>
@@ -2884,14 +2958,81 @@ const DonateView = ({ t, totalRiba, currency }: any) => {
 };
 
 // 7. Settings View
+// Hidden diagnostics (tap the version line five times in Settings): stage
+// timings and counters of this session's scans (diagnostics.ts), exportable
+// as JSON for bug reports. Profiles carry no file names or statement text.
+const DIAGNOSTICS_TAPS = 5;
+
+const DiagnosticsPanel = () => {
+  const [profiles, setProfiles] = useState<readonly ScanProfile[]>(() => [...getScanProfiles()]);
+  useEffect(() => onScanProfile(() => setProfiles([...getScanProfiles()])), []);
+
+  const exportProfiles = () => downloadBlob(
+    new Blob([exportScanProfiles()], { type: 'application/json' }),
+    `ribapurify-diagnostics-${new Date().toISOString().split('T')[0]}.json`
+  );
+
+  const latest = profiles[0];
+  const ms = (value: number) => `${value.toFixed(1)} ms`;
+  return (
+    <div className="mt-6 bg-slate-900 text-slate-100 rounded-xl p-4 font-mono text-xs">
+      <div className="flex items-center justify-between mb-3">
+        <span className="font-semibold text-sm">Diagnostics</span>
+        <button
+          onClick={exportProfiles}
+          disabled={profiles.length === 0}
+          className="flex items-center gap-1 px-3 py-1 bg-slate-700 hover:bg-slate-600 disabled:opacity-50 rounded-md"
+        >
+          <FileJson size={14} /> Export JSON ({profiles.length})
+        </button>
+      </div>
+      {!latest ? (
+        <p className="text-slate-400">No scan in this session yet.</p>
+      ) : (
+        <>
+          <p className="text-slate-400 mb-2">
+            Last scan {new Date(latest.startedAt).toLocaleTimeString()}: {ms(latest.durationMs)}, {latest.files.length} file(s)
+          </p>
+          <table className="w-full mb-3">
+            <thead>
+              <tr className="text-slate-400 text-left">
+                <th className="font-normal">Stage</th>
+                <th className="font-normal text-right">Calls</th>
+                <th className="font-normal text-right">Total</th>
+                <th className="font-normal text-right">Max</th>
+              </tr>
+            </thead>
+            <tbody>
+              {STAGES.filter(({ stage }) => latest.stages[stage]).map(({ stage, label }) => (
+                <tr key={stage}>
+                  <td>{label}</td>
+                  <td className="text-right">{latest.stages[stage]!.calls}</td>
+                  <td className="text-right">{ms(latest.stages[stage]!.ms)}</td>
+                  <td className="text-right">{ms(latest.stages[stage]!.maxMs)}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+          <p>
+            {latest.counters.pages} pages · {latest.counters.lines} lines · {latest.counters.transactions} transactions · {latest.counters.ocrWords} OCR words
+            {latest.peakHeapBytes !== null && ` · peak heap ${(latest.peakHeapBytes / 1024 / 1024).toFixed(1)} MB`}
+          </p>
+          <p className="text-slate-500 mt-2">Worker stages are summed over all workers, so they can exceed the scan time.</p>
+        </>
+      )}
+    </div>
+  );
+};
+
 const SettingsView = ({ userProfile, setUserProfile, t }: any) => {
   const [localProfile, setLocalProfile] = useState(userProfile);
   const [notifications, setNotifications] = useState(true);
   const [biometric, setBiometric] = useState(false);
+  const [versionTaps, setVersionTaps] = useState(0);
 
   const handleSave = () => {
     setUserProfile(localProfile);
-    localStorage.setItem('user_profile', JSON.stringify(localProfile));
+    saveProfile(localProfile).catch(err => console.warn('Could not save profile:', err));
     alert('Settings Saved!');
   };
 
@@ -2906,7 +3047,7 @@ const SettingsView = ({ userProfile, setUserProfile, t }: any) => {
 
   return (
     <div className="max-w-2xl mx-auto py-8 px-4 pb-24 md:pb-12">
-      <h1 className="text-3xl font-bold text-slate-900 mb-6 px-2">{t('settings_title')}</h1>
+      <h1 className="text-3xl font-bold text-slate-900 mb-6 px-2">{t(K.settings_title)}</h1>
       
       <Section title="Account">
         <div className="p-4 flex items-center gap-4">
@@ -2934,16 +3075,16 @@ const SettingsView = ({ userProfile, setUserProfile, t }: any) => {
 
       <Section title="Preferences">
         <div className="p-4 flex items-center justify-between hover:bg-slate-50 transition-colors cursor-pointer">
-             <span className="text-slate-900 font-medium">{t('fatwa_source')}</span>
+             <span className="text-slate-900 font-medium">{t(K.fatwa_source)}</span>
              <div className="flex items-center gap-2">
                <select 
                  value={localProfile.fatwaSource}
                  onChange={(e) => setLocalProfile({...localProfile, fatwaSource: e.target.value})}
                  className="bg-transparent border-none p-0 text-slate-500 focus:ring-0 cursor-pointer text-right appearance-none pr-4"
                >
-                 <option value="global">{t('fatwa_global')}</option>
-                 <option value="ecfr">{t('fatwa_ecfr')}</option>
-                 <option value="amja">{t('fatwa_amja')}</option>
+                 <option value="global">{t(K.fatwa_global)}</option>
+                 <option value="ecfr">{t(K.fatwa_ecfr)}</option>
+                 <option value="amja">{t(K.fatwa_amja)}</option>
                </select>
                <ChevronRight size={18} className="text-slate-300" />
              </div>
@@ -2966,11 +3107,12 @@ const SettingsView = ({ userProfile, setUserProfile, t }: any) => {
           onClick={handleSave}
           className="w-full py-4 bg-blue-600 text-white rounded-xl font-bold text-lg hover:bg-blue-700 transition-colors shadow-lg shadow-blue-200 active:scale-95 transform duration-100"
         >
-          {t('save')}
+          {t(K.save)}
         </button>
-        <p className="text-center text-xs text-slate-400 mt-4">
+        <p onClick={() => setVersionTaps(n => n + 1)} className="text-center text-xs text-slate-400 mt-4 select-none">
           Version 1.0.2 (Build 405)
         </p>
+        {versionTaps >= DIAGNOSTICS_TAPS && <DiagnosticsPanel />}
       </div>
     </div>
   );
@@ -3021,7 +3163,8 @@ const BlogPage = ({ t, language }: any) => {
   "All"
 );
 
-  const [selectedPost, setSelectedPost] = useState<any>(null);
+  const [selectedPost, setSelectedPost] = useState<BlogPost | null>(null);
+  const [article, setArticle] = useState<{ post: BlogPost; paragraphs: RichParagraph[] } | null>(null);
 
   // FAQ Data - Multi-language
   const getFaqData = () => {
@@ -3367,7 +3510,7 @@ if (isHindi) return [
              isTurkish ? "Peygamber Muhammed ﷺ Riba'yı tüketen kişiye, onu verene, kaydedene ve iki şahidine lanet etti ve dedi ki: Hepsi aynı" :
              isBosnian ? "Poslanik Muhammed ﷺ je prokleo onoga ko konzumira Ribu, onoga ko je daje, onoga ko je bilježi i dva svjedoka, rekavši: Svi su isti" :
              isAlbanian ? "Profeti Muhamed ﷺ mallkoi atë që konsumon Riba, atë që e jep, atë që e regjistron dhe dy dëshmitarët, duke thënë: Ata janë të gjithë të njëjtë" :
-             "The Prophet Muhammad ﷺ cursed the one who consumes Riba, the one who gives it, the one who records it, and the two witnesses to it, saying: <span class=\"font-semibold\">\"They are all the same.\"</span>",
+             ["The Prophet Muhammad ﷺ cursed the one who consumes Riba, the one who gives it, the one who records it, and the two witnesses to it, saying: ", ['"They are all the same."']] as RichParagraph,
     hadith2: isArabic ? "للربا سبعون جزءاً، أدناها مثل إتيان الرجل أمه" :
              isUrdu ? "ربا کے ستر درجے ہیں، ان میں سب سے کم درجہ ایسا ہے جیسے کوئی شخص اپنی ماں سے زنا کرے" :
              isHindi ? "रिबा के सत्तर दरजे हैं, और सबसे हल्का दरजा भी ऐसा है जैसे आदमी अपनी मां के साथ ज़िना करे (बहुत बड़ा गुनाह)।" :
@@ -3383,7 +3526,7 @@ if (isHindi) return [
              isTurkish ? "Riba'nın yetmiş bölümü vardır, en az ciddi olanı bir erkeğin annesiyle ensest yapmasına eşdeğerdir" :
              isBosnian ? "Riba ima sedamdeset segmenata, najmanji ozbiljan je jednak čovjeku koji čini incest sa svojom majkom" :
              isAlbanian ? "Riba ka shtatëdhjetë segmente, më pak seriozja është e barabartë me një burrë që kryen incest me nënën e tij" :
-             "<span class=\"font-semibold\">\"Riba has seventy segments, the least serious being equivalent to a man committing incest with his mother.\"</span>"
+             [['"Riba has seventy segments, the least serious being equivalent to a man committing incest with his mother."']] as RichParagraph
   });
 
   const getPurificationGuide = () => ({
@@ -3531,7 +3674,7 @@ if (isHindi) return [
   ];
 
   // Select appropriate blog posts based on language
-  const [currentPosts, setCurrentPosts] = useState<any[]>([]);
+  const [currentPosts, setCurrentPosts] = useState<BlogPost[]>([]);
 
   /* PRIORITY 3 FIXED: Debounced search */
   useEffect(() => {
@@ -3545,62 +3688,23 @@ if (isHindi) return [
     // Reset selected post when language changes
     setSelectedPost(null);
     
-    const loadPosts = async () => {
-      let posts;
-      if (isArabic) {
-        const module = await import('./data/blog_posts_ar');
-        posts = module.BLOG_POSTS_AR;
-      } else if (isUrdu) {
-        const module = await import('./data/blog_posts_ur');
-        posts = module.BLOG_POSTS_UR;
-      } else if (isHindi) {
-        const module = await import('./data/blog_posts_hi');
-        posts = module.BLOG_POSTS_HI;
-      } else if (isBengali) {
-        const module = await import('./data/blog_posts_bn');
-        posts = module.BLOG_POSTS_BN;
-      } else if (isIndonesian) {
-        const module = await import('./data/blog_posts_id');
-        posts = module.BLOG_POSTS_ID;
-      } else if (isMalay) {
-        const module = await import('./data/blog_posts_ms');
-        posts = module.BLOG_POSTS_MS;
-      } else if (isChinese) {
-        const module = await import('./data/blog_posts_zh');
-        posts = module.BLOG_POSTS_ZH;
-      } else if (isFrench) {
-        const module = await import('./data/blog_posts_fr');
-        posts = module.BLOG_POSTS_FR;
-      } else if (isGerman) {
-        const module = await import('./data/blog_posts_de');
-        posts = module.BLOG_POSTS_DE;
-      } else if (isRussian) {
-        const module = await import('./data/blog_posts_ru');
-        posts = module.BLOG_POSTS_RU;
-      } else if (isDutch) {
-        const module = await import('./data/blog_posts_nl');
-        posts = module.BLOG_POSTS_NL;
-      } else if (isHebrew) {
-        const module = await import('./data/blog_posts_he');
-        posts = module.BLOG_POSTS_HE;
-      } else if (isTurkish) {
-        const module = await import('./data/blog_posts_tr');
-        posts = module.BLOG_POSTS_TR;
-      } else if (isBosnian) {
-        const module = await import('./data/blog_posts_bs');
-        posts = module.BLOG_POSTS_BS;
-      } else if (isAlbanian) {
-        const module = await import('./data/blog_posts_sq');
-        posts = module.BLOG_POSTS_SQ;
-      } else {
-        const module = await import('./data/blog_posts_en');
-        posts = module.BLOG_POSTS_EN;
-      }
-      setCurrentPosts(posts);
-    };
-    loadPosts();
+    let cancelled = false;
+    loadBlogPosts(language)
+      .then(posts => { if (!cancelled) setCurrentPosts(posts); })
+      .catch(e => console.error('Failed to load blog posts', e));
+    return () => { cancelled = true; };
   }, [language]);
 
+  // The list only has each post's metadata; its text arrives when it is opened
+  useEffect(() => {
+    if (!selectedPost) return;
+    let cancelled = false;
+    loadBlogArticle(selectedPost)
+      .then(paragraphs => { if (!cancelled) setArticle({ post: selectedPost, paragraphs }); })
+      .catch(e => console.error('Failed to load article', e));
+    return () => { cancelled = true; };
+  }, [selectedPost]);
+
   
 // Set categories based on language
 const categories = isArabic 
@@ -3660,7 +3764,7 @@ useEffect(() => {
 
   // Inject Scheherazade New for Urdu content and a helper class
   const urduFontStyle = isUrdu ? (
-    <style dangerouslySetInnerHTML={{__html: DOMPurify.sanitize("@import url('https://fonts.googleapis.com/css2?family=Scheherazade+New:wght@400;700&display=swap'); .font-urdu{font-family: 'Scheherazade New', serif;}")}} /> /* PRIORITY 1 FIXED */
+    <style>{"@import url('https://fonts.googleapis.com/css2?family=Scheherazade+New:wght@400;700&display=swap'); .font-urdu{font-family: 'Scheherazade New', serif;}"}</style>
   ) : null;
 
   const filteredPosts = currentPosts.filter(post => {
@@ -3732,14 +3836,14 @@ const allCategoryKey = isArabic ? "الكل" :
              </div>
 
              <div className="prose prose-slate max-w-none text-slate-700 leading-relaxed text-lg">
-               {selectedPost.content.split('\n').map((paragraph: string, idx: number) => {
-                 if (!paragraph.trim()) return null;
-                 // Convert **text** to <strong>text</strong> with proper styling
-                 const formattedParagraph = paragraph.replace(/\*\*(.*?)\*\*/g, '<strong class="font-bold text-slate-900">$1</strong>');
-                 return (
-                   <p key={idx} className="mb-6" dangerouslySetInnerHTML={{ __html: DOMPurify.sanitize(formattedParagraph) }} /> /* PRIORITY 1 FIXED */
-                 );
-               })}
+               {article?.post !== selectedPost ? (
+                 <div className="space-y-4 animate-pulse" aria-busy="true">
+                   {[0, 1, 2, 3].map(i => <div key={i} className="h-4 bg-slate-100 rounded w-full" />)}
+                   <div className="h-4 bg-slate-100 rounded w-2/3" />
+                 </div>
+               ) : article.paragraphs.map((paragraph, idx) => (
+                 <p key={idx} className="mb-6"><RichText text={paragraph} strongClassName="font-bold text-slate-900" /></p>
+               ))}
              </div>
           </div>
         </div>
@@ -3753,8 +3857,8 @@ const allCategoryKey = isArabic ? "الكل" :
       {urduFontStyle}
       {/* Header */}
       <div className="text-center mb-12">
-         <h1 className="text-4xl md:text-5xl font-bold text-slate-900 mb-4 tracking-tight">{t('nav_know')}</h1>
-         <p className="text-lg text-slate-600 max-w-2xl mx-auto">{t('blog_subtitle')}</p>
+         <h1 className="text-4xl md:text-5xl font-bold text-slate-900 mb-4 tracking-tight">{t(K.nav_know)}</h1>
+         <p className="text-lg text-slate-600 max-w-2xl mx-auto">{t(K.blog_subtitle)}</p>
       </div>
 
       {/* Tab Navigation */}
@@ -3893,11 +3997,11 @@ const allCategoryKey = isArabic ? "الكل" :
                 <h4 className="font-bold text-slate-900 mb-3 text-lg">{getWhyRibaContent().propheticTitle}</h4>
                 <div className="space-y-4">
                   <div className="bg-white rounded-lg p-4 border border-orange-100">
-                    <p className="text-slate-700 leading-relaxed mb-2" dangerouslySetInnerHTML={{ __html: DOMPurify.sanitize(getWhyRibaContent().hadith1) }} />
+                    <p className="text-slate-700 leading-relaxed mb-2"><RichText text={getWhyRibaContent().hadith1} strongClassName="font-semibold" /></p>
                     <p className="text-sm text-slate-500 font-semibold">— Sahih Muslim 1598</p>
                   </div>
                   <div className="bg-white rounded-lg p-4 border border-orange-100">
-                    <p className="text-slate-700 leading-relaxed mb-2" dangerouslySetInnerHTML={{ __html: DOMPurify.sanitize(getWhyRibaContent().hadith2) }} />
+                    <p className="text-slate-700 leading-relaxed mb-2"><RichText text={getWhyRibaContent().hadith2} strongClassName="font-semibold" /></p>
                     <p className="text-sm text-slate-500 font-semibold">— Ibn Majah 2274, authenticated by Al-Albani</p>
                   </div>
                 </div>
@@ -3980,6 +4084,7 @@ const allCategoryKey = isArabic ? "الكل" :
              <div 
                 key={i} 
                 onClick={() => setSelectedPost(post)}
+                onPointerEnter={() => { loadBlogArticle(post).catch(() => {}); }}
                 className="group bg-white rounded-2xl shadow-sm border border-slate-100 overflow-hidden hover-card flex flex-col h-full cursor-pointer"
              >
                 {/* Decorative Header */}
@@ -4130,10 +4235,17 @@ const BottomNav = ({ activeView, navigateToView, t, onScanClick }: any) => {
 
 // --- MAIN APP COMPONENT ---
 
+const toggleRiba = (txn: Transaction): Transaction =>
+  ({ ...txn, isRiba: !txn.isRiba, category: !txn.isRiba ? 'riba' : 'uncategorized' });
+
 const App = () => {
   const [activeView, setActiveView] = useState<ViewState>('dashboard');
   const [processingState, setProcessingState] = useState<ProcessingState>('idle');
-  const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [processingProgress, setProcessingProgress] = useState<{ done: number; total: number; ocr?: number } | null>(null);
+  // Transactions on screen, indexed for O(1) toggles and running totals (ledger.ts)
+  const [ledger, setLedger] = useState<Ledger>(() => createLedger([]));
+  const transactions = ledger.transactions;
+  const setTransactions = useCallback((next: Transaction[]) => setLedger(createLedger(next)), []);
   const [files, setFiles] = useState<File[]>([]); // Lifted state
   const fileInputRef = useRef<HTMLInputElement>(null); // Global file input ref
   
@@ -4210,17 +4322,17 @@ const App = () => {
     };
   }, []);
 
-  const [userProfile, setUserProfile] = useState<UserProfile>(() => {
-    const saved = localStorage.getItem('user_profile');
-    return saved ? JSON.parse(saved) : { name: 'User', email: '', joinedDate: new Date().toISOString().split('T')[0], fatwaSource: 'global' };
-  });
-  const [history, setHistory] = useState<PurificationRecord[]>(() => {
-    const saved = localStorage.getItem('puri_history');
-    return saved ? JSON.parse(saved) : [];
-  });
+  const [userProfile, setUserProfile] = useState<UserProfile>(() => (
+    { name: 'User', email: '', joinedDate: new Date().toISOString().split('T')[0], fatwaSource: 'global' }
+  ));
+  const [history, setHistory] = useState<PurificationRecord[]>([]);
+  // History as last written to the store (null until it has loaded)
+  const persistedHistory = useRef<PurificationRecord[] | null>(null);
+  // History record whose saved transactions are on screen, if any
+  const savedRecordId = useRef<string | null>(null);
 
   // i18n
-  const { language, setLanguage, t } = useLanguage();
+  const { language, setLanguage, t, rich } = useLanguage();
 
   // Scroll Reset - smooth with delay to feel natural
   useEffect(() => {
@@ -4231,9 +4343,25 @@ const App = () => {
     return () => clearTimeout(timer);
   }, [activeView]);
 
-  // Save History
+  // Load saved history and profile (moving them out of localStorage on first run)
   useEffect(() => {
-    localStorage.setItem('puri_history', JSON.stringify(history));
+    let active = true;
+    loadStore().then(saved => {
+      if (!active) return;
+      persistedHistory.current = saved.history;
+      // Keep any scan finished before the store answered
+      setHistory(prev => prev.length > 0 ? [...prev, ...saved.history] : saved.history);
+      if (saved.profile) setUserProfile(saved.profile);
+    });
+    return () => { active = false; };
+  }, []);
+
+  // Save History: only records added, changed or removed since the last write
+  useEffect(() => {
+    const before = persistedHistory.current;
+    if (!before || before === history) return;
+    persistedHistory.current = history;
+    syncHistory(before, history).catch(err => console.warn('Could not save history:', err));
   }, [history]);
 
   // Clear History
@@ -4241,17 +4369,43 @@ const App = () => {
     setHistory([]);
   };
 
-  // Toggle Riba Status Handler
-  const toggleTransactionStatus = (id: string) => {
-    setTransactions(prevTransactions => 
-      prevTransactions.map(txn => 
-        txn.id === id 
-          ? { ...txn, isRiba: !txn.isRiba, category: !txn.isRiba ? 'riba' : 'uncategorized' }
-          : txn
-      )
-    );
+  // Put a past scan's saved transactions back on the dashboard
+  const openRecord = async (recordId: string) => {
+    try {
+      const saved = await loadTransactions(recordId);
+      if (saved.length === 0) {
+        alert(t(K.puri_no_saved_transactions));
+        return;
+      }
+      savedRecordId.current = recordId;
+      setFiles([]);
+      setTransactions(saved);
+      setProcessingState('complete');
+      navigateToView('dashboard');
+    } catch (err) {
+      console.warn('Could not load transactions:', err);
+      alert(t(K.puri_no_saved_transactions));
+    }
   };
 
+  // Toggle Riba Status Handler
+  // Stable, so memoized rows don't re-render when another row is toggled
+  const toggleTransactionStatus = useCallback((id: string) => {
+    setLedger(prev => updateLedger(prev, id, toggleRiba));
+    // Only the toggled transaction is rewritten in the store
+    if (savedRecordId.current) {
+      updateTransaction(savedRecordId.current, id, toggleRiba).catch(err => console.warn('Could not save transaction:', err));
+    }
+  }, []);
+
+  // Start an OCR worker while images wait to be processed, and follow its progress
+  useEffect(() => {
+    if (files.some(f => f.type.startsWith('image/'))) prewarmOcr(language);
+  }, [files, language]);
+  useEffect(() => onOcrProgress(({ pending, fraction }) => {
+    setProcessingProgress(p => p && { ...p, ocr: pending > 0 ? fraction : undefined });
+  }), []);
+
   // Global File Handler
   const handleGlobalFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
     if (e.target.files && e.target.files.length > 0) {
@@ -4260,9 +4414,10 @@ const App = () => {
     }
   };
 
-  // Direct file processing with async/await (no worker needed)
+  // File processing: extraction runs in the worker pool (workerPool.ts)
   const processFiles = async (files: File[]) => {
     setProcessingState('analyzing');
+    savedRecordId.current = null;
 
     try {
       /* PRIORITY 1 FIXED: Magic byte validation */
@@ -4294,6 +4449,8 @@ const App = () => {
       const MAX_FILE_SIZE = 50 * 1024 * 1024; // 50MB
       const ALLOWED_TYPES = ['application/pdf', 'text/csv', 'image/jpeg', 'image/jpg', 'image/png', 'image/webp'];
       const PROCESSING_TIMEOUT = 120000; // 2 minutes
+      const PARTIAL_RESULTS_INTERVAL = 250; // minimum ms between dashboard updates while processing
+      const PARTIAL_RESULTS_BUDGET = 0.1; // share of the main thread those updates may take
       
       // Pre-validate files and filter out invalid ones
       const invalidFiles: {name: string, reason: string}[] = [];
@@ -4337,150 +4494,98 @@ const App = () => {
         setTimeout(() => reject(new Error('Processing timeout')), PROCESSING_TIMEOUT)
       );
       
+      let cancelled = false;
+      const profiler = createScanProfiler();
       const processingPromise = (async () => {
-        const allLines: { text: string; page: number; fileName: string }[] = [];
-        const fileResults: {fileName: string, success: boolean, reason?: string}[] = [];
+        // CSV and PDF files go to the worker pool, images to Tesseract. Each
+        // page is classified as soon as it arrives and only its transactions
+        // are kept (statement.ts); partial results are published to the
+        // dashboard a few times a second. Files uploaded before come from
+        // the result cache instead.
+        const pool = getWorkerPool();
+        const stream = createStatementStream();
+        // Partial snapshots and the final one are timed as separate stages (diagnostics.ts)
+        const snapshot = (stage: 'snapshot' | 'dedupe') => {
+          const start = performance.now();
+          const txns = stream.snapshot();
+          measureStage(profiler.stages, stage, start);
+          profiler.sampleHeap();
+          return txns;
+        };
+        // Each partial snapshot re-reads every transaction so far, so the next
+        // one waits in proportion to what this one cost: the updates keep to
+        // PARTIAL_RESULTS_BUDGET of the time instead of growing with N²
+        let publishTimer: ReturnType<typeof setTimeout> | undefined;
+        let publishDelay = PARTIAL_RESULTS_INTERVAL;
+        const schedulePublish = () => {
+          publishTimer ??= setTimeout(() => {
+            publishTimer = undefined;
+            if (cancelled) return;
+            const start = performance.now();
+            setTransactions(snapshot('snapshot'));
+            publishDelay = Math.max(PARTIAL_RESULTS_INTERVAL, (performance.now() - start) / PARTIAL_RESULTS_BUDGET);
+          }, publishDelay);
+        };
         
-        for (const file of validFiles) {
-          // CSV Processing
-          if (file.name.endsWith('.csv')) {
-            const Papa = await import('papaparse');
-            const text = await file.text();
-            const parsed = Papa.default.parse(text, { header: true, skipEmptyLines: true });
-            
-            parsed.data.forEach((row: any) => {
-              const rowText = Object.values(row).join(' ');
-              if (rowText.trim().length > 5) {
-                allLines.push({ text: rowText.trim(), page: 1, fileName: file.name });
-              }
-            });
-            fileResults.push({fileName: file.name, success: true});
-            continue;
+        setTransactions([]);
+        setProcessingProgress({ done: 0, total: validFiles.length });
+        const outcomes = await Promise.all(validFiles.map(async (file, fileIndex): Promise<FileOutcome | null> => {
+          // A file seen before (same bytes, and for images the same OCR languages)
+          // skips extraction entirely (resultCache.ts)
+          const ocrLanguages = file.type.startsWith('image/') ? ocrLanguagesFor(language) : undefined;
+          const hash = await fileDigest(file, ocrLanguages).catch(() => null);
+          const cached = hash ? await getCachedResult(hash) : null;
+          if (cached) {
+            profiler.file('cached', file.size);
+            restoreCachedResult(stream, fileIndex, cached);
+            schedulePublish();
+            setProcessingProgress(p => p && { ...p, done: p.done + 1 });
+            return { fileName: file.name, success: true };
           }
-          
-          // PDF Processing
-          if (file.type === 'application/pdf' || file.name.endsWith('.pdf')) {
-            try {
-              const pdfjs = await getPdfJs();
-              if (!pdfjs) throw new Error("Could not load PDF.js");
-              
-              const arrayBuffer = await file.arrayBuffer();
-              const loadingTask = pdfjs.getDocument({ data: arrayBuffer });
-              const pdf = await loadingTask.promise;
-              
-              // Check if it looks like a bank statement
-              let hasFinancialKeywords = false;
-              let textSampleSize = 0;
-              
-              for (let i = 1; i <= Math.min(3, pdf.numPages); i++) {
-                const page = await pdf.getPage(i);
-                const textContent = await page.getTextContent();
-                const pageText = textContent.items.map((item: any) => item.str).join(' ').toLowerCase();
-                textSampleSize += pageText.length;
-                
-                // Look for financial keywords (more comprehensive list)
-                const financialKeywords = [
-                  'balance', 'transaction', 'debit', 'credit', 'account', 'statement', 
-                  'deposit', 'withdrawal', 'payment', 'interest', 'fee', 'bank',
-                  'amount', 'total', 'date', 'description', 'reference', 'transfer',
-                  'cheque', 'check', 'atm', 'pos', 'swift', 'iban', 'sort code',
-                  'opening', 'closing', 'summary', 'charges', 'currency', '$', '£', '€'
-                ];
-                if (financialKeywords.some(kw => pageText.includes(kw))) {
-                  hasFinancialKeywords = true;
-                  break;
-                }
-              }
-              
-              // More lenient check - only reject if PDF has substantial content but zero financial keywords
-              if (!hasFinancialKeywords && textSampleSize > 500) {
-                await pdf.destroy();
-                fileResults.push({fileName: file.name, success: false, reason: 'PDF does not appear to be a bank statement (no financial keywords found)'});
-                console.warn(`Skipping ${file.name}: No financial keywords found`);
-                continue; // Skip this file, continue with others
-              }
-              
-              for (let i = 1; i <= pdf.numPages; i++) {
-                const page = await pdf.getPage(i);
-                const textContent = await page.getTextContent();
-              
-              // Line bucketing algorithm
-              const rows: Record<string, any[]> = {};
-              const Y_TOLERANCE = 4;
-              
-              textContent.items.forEach((item: any) => {
-                const y = item.transform[5];
-                const x = item.transform[4];
-                const str = item.str;
-                
-                const existingY = Object.keys(rows).find(yKey => 
-                  Math.abs(parseFloat(yKey) - y) < Y_TOLERANCE
-                );
-                
-                if (existingY) {
-                  rows[existingY].push({ str, x });
-                } else {
-                  rows[y.toString()] = [{ str, x }];
-                }
-              });
-              
-              // Sort rows top-to-bottom, items left-to-right
-              const sortedY = Object.keys(rows).sort((a, b) => parseFloat(b) - parseFloat(a));
-              const lines = sortedY.map(y => {
-                const rowItems = rows[y].sort((a, b) => a.x - b.x);
-                return rowItems.map(i => i.str).join(" ");
-              });
-              
-              lines.forEach(lineText => {
-                if (lineText.trim().length > 5) {
-                  allLines.push({ text: lineText.trim(), page: i, fileName: file.name });
-                }
-              });
-            }
-            
-            await pdf.destroy();
-            fileResults.push({fileName: file.name, success: true});
-            continue;
-          } catch (pdfError) {
-            console.error('PDF processing error:', pdfError);
-            // Fall through to OCR
+
+          const extraction = recordExtraction();
+          const onPage: PageHandler = (page, lines) => {
+            extraction.lines(page, lines);
+            const start = performance.now();
+            stream.addPage(fileIndex, page, lines);
+            measureStage(profiler.stages, 'classify', start);
+            profiler.counters.pages++;
+            profiler.counters.lines += lines.length;
+            schedulePublish();
+          };
+          const onRows: RowsHandler = (page, rows) => {
+            extraction.rows(page, rows);
+            const start = performance.now();
+            stream.addRows(fileIndex, page, rows);
+            measureStage(profiler.stages, 'classify', start);
+            profiler.counters.lines += rows.length;
+            schedulePublish();
+          };
+          profiler.file(file.name.endsWith('.csv') ? 'csv' : file.type.startsWith('image/') ? 'image' : 'pdf', file.size);
+          const outcome = isPoolFile(file) ? await pool.extractFile(file, onPage, onRows, timings => mergeTimings(profiler.stages, timings))
+            : file.type.startsWith('image/') ? await recognizeStatementImage(file, language, onPage, profiler)
+            : null;
+          if (outcome && !outcome.success) stream.dropFile(fileIndex);
+          if (outcome?.success && hash && extraction.pages && !cancelled) {
+            putCachedResult(hash, extraction.pages, extraction.size, stream.exportFile(fileIndex))
+              .catch(err => console.warn('Could not cache result:', err));
           }
-        }
+          setProcessingProgress(p => p && { ...p, done: p.done + 1 });
+          return outcome;
+        }));
+        clearTimeout(publishTimer);
+        if (cancelled) return;
         
-        // Image OCR
-        if (file.type.startsWith('image/')) {
-          try {
-            const Tesseract = await import('tesseract.js');
-            const worker = await Tesseract.createWorker('eng');
-            const ret = await worker.recognize(file);
-            const ocrText = ret.data.text.toLowerCase();
-            
-            // Check if image contains financial text
-            const financialKeywords = ['balance', 'transaction', 'debit', 'credit', 'account', 'statement', 'payment', 'interest'];
-            const hasFinancialContent = financialKeywords.some(kw => ocrText.includes(kw)) || 
-                                       /\d+[.,]\d{2}/.test(ocrText); // Has decimal numbers
-            
-            if (!hasFinancialContent && ocrText.length > 50) {
-              await worker.terminate();
-              fileResults.push({fileName: file.name, success: false, reason: 'No financial content in image'});
-              console.warn(`Skipping ${file.name}: No financial content`);
-              continue; // Skip this file
-            }
-            
-            const lines = ret.data.text.split('\n');
-            lines.forEach(l => {
-              if (l.trim().length > 5) allLines.push({ text: l.trim(), page: 1, fileName: file.name });
-            });
-            
-            await worker.terminate();
-            fileResults.push({fileName: file.name, success: true});
-          } catch (ocrError) {
-            console.error('OCR error:', ocrError);
-            fileResults.push({fileName: file.name, success: false, reason: 'OCR processing failed'});
-            continue; // Skip this file
+        const fileResults: {fileName: string, success: boolean, reason?: string}[] = [];
+        for (const outcome of outcomes) {
+          if (!outcome) continue;
+          if (outcome.success) {
+            fileResults.push({ fileName: outcome.fileName, success: true });
+          } else {
+            console.warn(`Skipping ${outcome.fileName}: ${outcome.reason}`);
+            fileResults.push({ fileName: outcome.fileName, success: false, reason: outcome.reason });
           }
         }
-      }
       
       // Show processing summary
       const successCount = fileResults.filter(f => f.success).length;
@@ -4491,7 +4596,9 @@ const App = () => {
         const failedFiles = fileResults.filter(f => !f.success);
         if (successCount === 0) {
           // All files failed
+          profiler.finish(0);
           setProcessingState('idle');
+          setTransactions([]);
           setFiles([]);
           if (fileInputRef.current) fileInputRef.current.value = '';
           alert(`❌ All ${failCount} file(s) failed:\n\n${failedFiles.map(f => `• ${f.fileName}: ${f.reason}`).join('\n')}`);
@@ -4503,67 +4610,21 @@ const App = () => {
       }
       
       // Check if we got any meaningful data
-      if (allLines.length === 0) {
+      if (stream.lineCount === 0) {
+        profiler.finish(0);
         setProcessingState('idle');
+        setTransactions([]);
         setFiles([]);
         if (fileInputRef.current) fileInputRef.current.value = '';
-        alert(t('error_no_data_found') || 'No readable data found in the uploaded files. Please ensure your files contain text.');
+        alert(t(K.error_no_data_found) || 'No readable data found in the uploaded files. Please ensure your files contain text.');
         return;
       }
       
-      // Detect dominant currency
-      const fullText = allLines.map(l => l.text).join(' ');
-      const dominantCurrency = detectDominantCurrency(fullText);
-      
-      // Parse transactions
-      const newTransactions: Transaction[] = [];
-      const dateRegex = /(?:\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b)|(?:\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})|(?:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})/i;
-      
-      allLines.forEach(({ text: line, page }) => {
-        if (line.length < 5) return;
-        
-        const { category, isRiba, confidence, reason } = detectCategory(line);
-        const dateMatch = line.match(dateRegex);
-        const dateStr = dateMatch ? dateMatch[0] : null;
-        const amount = parseTransactionAmount(line, dateStr);
-        
-        if (amount > 0) {
-          let currency: Currency = dominantCurrency;
-          if (line.includes('SAR')) currency = 'SAR';
-          else if (line.includes('AED')) currency = 'AED';
-          else if (line.includes('INR') || line.includes('₹')) currency = 'INR';
-          else if (line.includes('MYR') || line.includes('RM')) currency = 'MYR';
-          else if (line.includes('IDR')) currency = 'IDR';
-          else if (line.includes('GBP') || line.includes('£')) currency = 'GBP';
-          else if (line.includes('EUR') || line.includes('€')) currency = 'EUR';
-          else if (line.includes('$') || line.includes('USD')) currency = 'USD';
-          
-          if (isRiba || (dateMatch && line.length > 15)) {
-            newTransactions.push({
-              id: Math.random().toString(36).substr(2, 9),
-              date: dateMatch ? dateMatch[0] : new Date().toISOString().split('T')[0],
-              description: line.substring(0, 80).trim() || "Transaction",
-              amount: amount,
-              originalText: line,
-              isRiba: isRiba,
-              currency: currency,
-              category: category,
-              confidence: confidence,
-              reason: reason,
-              page: page
-            });
-          }
-        }
-      });
-      
-      // Filter duplicates
-      const cleanTxns = newTransactions.filter((t, index, self) => 
-        !isNaN(t.amount) && 
-        t.amount > 0 &&
-        index === self.findIndex((x) => (
-          x.description === t.description && x.amount === t.amount && x.date === t.date
-        ))
-      );
+      // Final pass: every page is in, so unmarked transactions take the final
+      // currency vote; upload order means rows repeated by an overlapping
+      // later statement are the ones dropped
+      const cleanTxns = snapshot('dedupe');
+      profiler.finish(cleanTxns.length);
       
       setTransactions(cleanTxns);
       setProcessingState('complete');
@@ -4571,8 +4632,11 @@ const App = () => {
       // Add to history
       const total = cleanTxns.filter(t => t.isRiba).reduce((acc, t) => acc + t.amount, 0);
       if (total > 0 || cleanTxns.length > 0) {
+        const recordId = Date.now().toString();
+        savedRecordId.current = recordId;
+        saveTransactions(recordId, cleanTxns).catch(err => console.warn('Could not save transactions:', err));
         setHistory(prev => [{
-          id: Date.now().toString(),
+          id: recordId,
           date: new Date().toLocaleDateString(),
           amount: total,
           currency: cleanTxns[0]?.currency || 'USD',
@@ -4588,11 +4652,17 @@ const App = () => {
     // Race between processing and timeout
     await Promise.race([processingPromise, timeoutPromise])
       .catch(err => {
+        // Timed-out and failed scans are profiled too, with what they got through
+        profiler.finish(0);
         if (err.message === 'Processing timeout') {
+          cancelled = true;
+          terminateWorkerPool();
+          terminateOcr();
           setProcessingState('idle');
+          setTransactions([]);
           setFiles([]);
           if (fileInputRef.current) fileInputRef.current.value = '';
-          alert(t('error_processing_timeout') || 'Processing is taking too long. Please try with a smaller file or contact support.');
+          alert(t(K.error_processing_timeout) || 'Processing is taking too long. Please try with a smaller file or contact support.');
         } else {
           throw err;
         }
@@ -4603,12 +4673,13 @@ const App = () => {
       setProcessingState('idle');
       setFiles([]);
       if (fileInputRef.current) fileInputRef.current.value = '';
-      alert(t('error_processing_failed') || 'An error occurred while processing your files. Please try again.');
+      alert(t(K.error_processing_failed) || 'An error occurred while processing your files. Please try again.');
     }
   };
 
   const handleReset = () => {
     setProcessingState('idle');
+    savedRecordId.current = null;
     setTransactions([]);
     setFiles([]);
     if (fileInputRef.current) fileInputRef.current.value = '';
@@ -4674,12 +4745,12 @@ const App = () => {
 
           <div className="hidden md:flex items-center gap-1 overflow-x-auto no-scrollbar px-4">
             {[
-              { id: 'dashboard', label: t('nav_dash'), icon: Home },
-              { id: 'knowledge', label: t('nav_know'), icon: BookOpen },
-              { id: 'methodology', label: t('nav_meth'), icon: FileText },
-              { id: 'purification', label: t('nav_puri'), icon: RefreshCw },
-              { id: 'donate', label: t('donate_title'), icon: Heart },
-              { id: 'manifesto', label: t('nav_mani'), icon: Info },
+              { id: 'dashboard', label: t(K.nav_dash), icon: Home },
+              { id: 'knowledge', label: t(K.nav_know), icon: BookOpen },
+              { id: 'methodology', label: t(K.nav_meth), icon: FileText },
+              { id: 'purification', label: t(K.nav_puri), icon: RefreshCw },
+              { id: 'donate', label: t(K.donate_title), icon: Heart },
+              { id: 'manifesto', label: t(K.nav_mani), icon: Info },
             ].map(item => (
               <Tooltip key={item.id} text={item.label} position="bottom">
                 <button
@@ -4734,7 +4805,9 @@ const App = () => {
               userProfile={userProfile} 
               onProcess={processFiles}
               processingState={processingState}
+              processingProgress={processingProgress}
               transactions={transactions}
+              ledger={ledger}
               history={history}
               onReset={handleReset}
               onToggleStatus={toggleTransactionStatus} 
@@ -4748,10 +4821,10 @@ const App = () => {
             />
           )}
           {activeView === 'knowledge' && <BlogPage t={t} language={language} />}
-          {activeView === 'methodology' && <MethodologyView t={t} userProfile={userProfile} />}
+          {activeView === 'methodology' && <MethodologyView t={t} rich={rich} userProfile={userProfile} />}
           {activeView === 'manifesto' && <ManifestoView t={t} />}
-          {activeView === 'purification' && <PurificationView history={history} setHistory={setHistory} onClearHistory={handleClearHistory} t={t} language={language} setActiveView={navigateToView} transactions={transactions} onUpload={processFiles} />}
-          {activeView === 'donate' && <DonateView t={t} totalRiba={transactions.filter((t: Transaction) => t.isRiba).reduce((acc: number, t: Transaction) => acc + t.amount, 0)} currency={transactions[0]?.currency || 'USD'} />}
+          {activeView === 'purification' && <PurificationView history={history} setHistory={setHistory} onClearHistory={handleClearHistory} t={t} language={language} setActiveView={navigateToView} transactions={transactions} onUpload={processFiles} onOpenRecord={openRecord} />}
+          {activeView === 'donate' && <DonateView t={t} totalRiba={ledger.totals.riba.amount} currency={transactions[0]?.currency || 'USD'} />}
           {activeView === 'settings' && <SettingsView userProfile={userProfile} setUserProfile={setUserProfile} t={t} />}
           </div>
         </div>
@@ -4763,42 +4836,42 @@ const App = () => {
               <div className="grid md:grid-cols-4 gap-8 mb-6">
                 <div>
                   <h3 className="font-bold text-slate-900 mb-3">RibaPurify</h3>
-                  <p className="text-sm text-slate-600">{t('footer_tagline')}</p>
+                  <p className="text-sm text-slate-600">{t(K.footer_tagline)}</p>
                 </div>
                 <div>
-                  <h3 className="font-bold text-slate-900 mb-3">{t('footer_quick_links')}</h3>
+                  <h3 className="font-bold text-slate-900 mb-3">{t(K.footer_quick_links)}</h3>
                   <div className="grid grid-cols-2 gap-2">
-                    <button onClick={() => navigateToView('dashboard')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t('nav_dash')}</button>
-                    <button onClick={() => navigateToView('knowledge')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t('nav_know')}</button>
-                    <button onClick={() => navigateToView('methodology')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t('nav_meth')}</button>
-                    <button onClick={() => navigateToView('purification')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t('nav_puri')}</button>
-                    <button onClick={() => navigateToView('donate')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t('donate_title')}</button>
-                    <button onClick={() => navigateToView('manifesto')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t('nav_mani')}</button>
+                    <button onClick={() => navigateToView('dashboard')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t(K.nav_dash)}</button>
+                    <button onClick={() => navigateToView('knowledge')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t(K.nav_know)}</button>
+                    <button onClick={() => navigateToView('methodology')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t(K.nav_meth)}</button>
+                    <button onClick={() => navigateToView('purification')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t(K.nav_puri)}</button>
+                    <button onClick={() => navigateToView('donate')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t(K.donate_title)}</button>
+                    <button onClick={() => navigateToView('manifesto')} className="text-left text-sm text-slate-600 hover:text-blue-600 flex items-center gap-1 before:content-['•'] before:text-slate-400 transition-colors active:scale-95 transform">{t(K.nav_mani)}</button>
                   </div>
                 </div>
                 <div>
-                  <h3 className="font-bold text-slate-900 mb-3">{t('footer_features')}</h3>
+                  <h3 className="font-bold text-slate-900 mb-3">{t(K.footer_features)}</h3>
                   <div className="grid grid-cols-2 gap-3">
                     <div>
-                      <p className="text-sm font-medium text-slate-900">{t('footer_feature_privacy')}</p>
-                      <p className="text-xs text-slate-600">{t('footer_feature_privacy_desc')}</p>
+                      <p className="text-sm font-medium text-slate-900">{t(K.footer_feature_privacy)}</p>
+                      <p className="text-xs text-slate-600">{t(K.footer_feature_privacy_desc)}</p>
                     </div>
                     <div>
-                      <p className="text-sm font-medium text-slate-900">{t('footer_feature_local')}</p>
-                      <p className="text-xs text-slate-600">{t('footer_feature_local_desc')}</p>
+                      <p className="text-sm font-medium text-slate-900">{t(K.footer_feature_local)}</p>
+                      <p className="text-xs text-slate-600">{t(K.footer_feature_local_desc)}</p>
                     </div>
                     <div>
-                      <p className="text-sm font-medium text-slate-900">{t('footer_feature_shariah')}</p>
-                      <p className="text-xs text-slate-600">{t('footer_feature_shariah_desc')}</p>
+                      <p className="text-sm font-medium text-slate-900">{t(K.footer_feature_shariah)}</p>
+                      <p className="text-xs text-slate-600">{t(K.footer_feature_shariah_desc)}</p>
                     </div>
                     <div>
-                      <p className="text-sm font-medium text-slate-900">{t('footer_feature_knowledge')}</p>
-                      <p className="text-xs text-slate-600">{t('footer_feature_knowledge_desc')}</p>
+                      <p className="text-sm font-medium text-slate-900">{t(K.footer_feature_knowledge)}</p>
+                      <p className="text-xs text-slate-600">{t(K.footer_feature_knowledge_desc)}</p>
                     </div>
                   </div>
                 </div>
                 <div>
-                  <h3 className="font-bold text-slate-900 mb-3">{t('footer_contact')}</h3>
+                  <h3 className="font-bold text-slate-900 mb-3">{t(K.footer_contact)}</h3>
                   <a href="mailto:contact.codeforummah@gmail.com" className="text-sm text-slate-600 hover:text-blue-600 flex items-center gap-2">
                     <Mail size={16} />
                     contact.codeforummah@gmail.com
@@ -4815,7 +4888,7 @@ const App = () => {
                   </p>
                 </div>
                 <div className="flex flex-col md:flex-row justify-between items-center gap-4 pt-4 border-t border-slate-100">
-                  <p className="text-xs text-slate-500">© 2025 RibaPurify. {t('footer_copyright')}</p>
+                  <p className="text-xs text-slate-500">© 2025 RibaPurify. {t(K.footer_copyright)}</p>
                   <div className="flex items-center gap-4">
                     <a href="https://github.com/Code-for-Ummah" target="_blank" rel="noopener noreferrer" className="text-slate-600 hover:text-slate-900 transition-colors" aria-label="GitHub">
                       <svg className="w-5 h-5" fill="currentColor" viewBox="0 0 24 24" aria-hidden="true">
@@ -4858,9 +4931,15 @@ const App = () => {
 const container = document.getElementById('root');
 if (container) {
   const root = createRoot(container);
-  root.render(
-    <ErrorBoundary>
-      <App />
-    </ErrorBoundary>
-  );
+  // Fetch the active locale and the English fallback before the first render so t() never shows raw keys
+  const initialLanguage = detectInitialLanguage();
+  Promise.all([loadLocale(initialLanguage), loadLocale('en')])
+    .catch(e => console.error('Failed to preload locales', e))
+    .finally(() => {
+      root.render(
+        <ErrorBoundary>
+          <App />
+        </ErrorBoundary>
+      );
+    });
 }// Force refresh
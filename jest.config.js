@@ -3,7 +3,14 @@ export default {
   roots: ['<rootDir>/__tests__'],
   testMatch: ['**/__tests__/**/*.test.{ts,tsx}'],
   moduleFileExtensions: ['ts', 'tsx', 'js', 'jsx'],
-  transform: {},
+  // Type annotations are stripped and ES modules turned into CommonJS, which
+  // is what Jest runs without --experimental-vm-modules. No type checking.
+  transform: {
+    '^.+\\.[jt]sx?$': ['babel-jest', {
+      presets: ['@babel/preset-typescript'],
+      plugins: ['@babel/plugin-transform-modules-commonjs'],
+    }],
+  },
   moduleNameMapper: {
     '\\.(css|less|scss|sass)$': 'identity-obj-proxy',
   },
@@ -0,0 +1,205 @@
+// ledger.ts
+// Transactions on screen with an id -> index map and running totals
+//
+// The dashboard used to filter and reduce the whole transaction array on every
+// render, and a riba toggle mapped over all of it. A ledger is built once per
+// result set; a toggle then finds its row by id, adjusts the totals by that
+// one row and keeps the list of riba rows sorted with a binary search.
+//
+// Alongside the objects the ledger keeps the transactions as columns: amounts
+// in a Float64Array, category/currency/confidence/riba as byte codes and
+// descriptions interned into a string table. Aggregations that the running
+// totals do not cover (top sources, certificate totals) loop over these arrays
+// instead of walking the objects.
+
+import { CURRENCY_CODES } from './rules/compiled';
+import type { Currency, Transaction } from './statement';
+
+type Category = Transaction['category'];
+type Confidence = Transaction['confidence'];
+
+// Code n of a column is entry n of these tables
+export const CATEGORY_CODES: readonly Category[] = ['income', 'shopping', 'utilities', 'transfer', 'riba', 'uncategorized'];
+export const CONFIDENCE_CODES: readonly Confidence[] = ['high', 'medium', 'low'];
+export { CURRENCY_CODES };
+
+const codes = <T extends string>(table: readonly T[]) => new Map<T, number>(table.map((value, i) => [value, i]));
+const categoryCode = codes(CATEGORY_CODES);
+const currencyCode = codes(CURRENCY_CODES as readonly Currency[]);
+const confidenceCode = codes(CONFIDENCE_CODES);
+
+// Row i describes transactions[i]
+export interface LedgerColumns {
+  amount: Float64Array;
+  category: Uint8Array; // CATEGORY_CODES
+  currency: Uint8Array; // CURRENCY_CODES
+  confidence: Uint8Array; // CONFIDENCE_CODES
+  riba: Uint8Array; // 1 for riba
+  description: Uint32Array; // index into descriptions
+  descriptions: string[]; // each distinct description once
+}
+
+export interface Tally {
+  count: number;
+  amount: number;
+}
+
+export interface LedgerTotals {
+  volume: number; // every transaction
+  riba: Tally;
+  ribaByCurrency: Partial<Record<Currency, Tally>>; // only currencies with riba
+  byCategory: Partial<Record<Category, Tally>>;
+}
+
+export interface Ledger {
+  transactions: Transaction[];
+  indexById: Map<string, number>;
+  ribaIndexes: number[]; // ascending, i.e. in transaction order
+  totals: LedgerTotals;
+  columns: LedgerColumns;
+}
+
+const add = <K extends string>(tallies: Partial<Record<K, Tally>>, key: K, amount: number, sign: 1 | -1) => {
+  const tally = tallies[key] ?? { count: 0, amount: 0 };
+  const count = tally.count + sign;
+  // Drop emptied tallies so a currency toggled away stops being listed
+  if (count === 0) delete tallies[key];
+  else tallies[key] = { count, amount: tally.amount + sign * amount };
+};
+
+const tallyRiba = (totals: LedgerTotals, txn: Transaction, sign: 1 | -1) => {
+  const count = totals.riba.count + sign;
+  totals.riba = { count, amount: count === 0 ? 0 : totals.riba.amount + sign * txn.amount };
+  add(totals.ribaByCurrency, txn.currency, txn.amount, sign);
+};
+
+export const createLedger = (transactions: Transaction[]): Ledger => {
+  const indexById = new Map<string, number>();
+  const ribaIndexes: number[] = [];
+  const totals: LedgerTotals = { volume: 0, riba: { count: 0, amount: 0 }, ribaByCurrency: {}, byCategory: {} };
+  const n = transactions.length;
+  const columns: LedgerColumns = {
+    amount: new Float64Array(n),
+    category: new Uint8Array(n),
+    currency: new Uint8Array(n),
+    confidence: new Uint8Array(n),
+    riba: new Uint8Array(n),
+    description: new Uint32Array(n),
+    descriptions: [],
+  };
+  const interned = new Map<string, number>();
+  transactions.forEach((txn, i) => {
+    indexById.set(txn.id, i);
+    totals.volume += txn.amount;
+    add(totals.byCategory, txn.category, txn.amount, 1);
+    if (txn.isRiba) {
+      ribaIndexes.push(i);
+      tallyRiba(totals, txn, 1);
+    }
+    columns.amount[i] = txn.amount;
+    columns.category[i] = categoryCode.get(txn.category)!;
+    columns.currency[i] = currencyCode.get(txn.currency)!;
+    columns.confidence[i] = confidenceCode.get(txn.confidence)!;
+    columns.riba[i] = txn.isRiba ? 1 : 0;
+    let d = interned.get(txn.description);
+    if (d === undefined) {
+      d = columns.descriptions.push(txn.description) - 1;
+      interned.set(txn.description, d);
+    }
+    columns.description[i] = d;
+  });
+  return { transactions, indexById, ribaIndexes, totals, columns };
+};
+
+// First position in `sorted` whose value is >= index
+const lowerBound = (sorted: number[], index: number) => {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (sorted[mid] < index) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+// Replace one transaction; the ledger is copied, never mutated, so it can live
+// in React state. Amount, currency, confidence and description are assumed
+// unchanged (toggles change status and category).
+export const updateLedger = (ledger: Ledger, id: string, update: (txn: Transaction) => Transaction): Ledger => {
+  const index = ledger.indexById.get(id);
+  if (index === undefined) return ledger;
+  const before = ledger.transactions[index];
+  const after = update(before);
+
+  const transactions = ledger.transactions.slice();
+  transactions[index] = after;
+
+  const totals: LedgerTotals = {
+    ...ledger.totals,
+    ribaByCurrency: { ...ledger.totals.ribaByCurrency },
+    byCategory: { ...ledger.totals.byCategory },
+  };
+  add(totals.byCategory, before.category, before.amount, -1);
+  add(totals.byCategory, after.category, after.amount, 1);
+
+  let ribaIndexes = ledger.ribaIndexes;
+  if (before.isRiba !== after.isRiba) {
+    const at = lowerBound(ribaIndexes, index);
+    ribaIndexes = ribaIndexes.slice();
+    if (after.isRiba) ribaIndexes.splice(at, 0, index);
+    else ribaIndexes.splice(at, 1);
+  }
+  if (before.isRiba) tallyRiba(totals, before, -1);
+  if (after.isRiba) tallyRiba(totals, after, 1);
+
+  // Only the two changed byte columns are copied
+  let columns = ledger.columns;
+  if (before.category !== after.category || before.isRiba !== after.isRiba) {
+    columns = { ...columns, category: columns.category.slice(), riba: columns.riba.slice() };
+    columns.category[index] = categoryCode.get(after.category)!;
+    columns.riba[index] = after.isRiba ? 1 : 0;
+  }
+
+  return { transactions, indexById: ledger.indexById, ribaIndexes, totals, columns };
+};
+
+// Riba total per currency, summed afresh in transaction order (the running
+// tallies can drift by float rounding after many toggles); keys in order of
+// first appearance
+export const ribaTotalsByCurrency = ({ columns }: Ledger): Partial<Record<Currency, number>> => {
+  const { amount, currency, riba } = columns;
+  const sums = new Float64Array(CURRENCY_CODES.length);
+  const order: number[] = [];
+  for (let i = 0; i < amount.length; i++) {
+    if (!riba[i]) continue;
+    const c = currency[i];
+    if (sums[c] === 0 && !order.includes(c)) order.push(c);
+    sums[c] += amount[i];
+  }
+  const totals: Partial<Record<Currency, number>> = {};
+  for (const c of order) totals[CURRENCY_CODES[c] as Currency] = sums[c];
+  return totals;
+};
+
+// Largest riba totals by source, the first word of the description. Amounts
+// are summed per interned description, so each distinct description is split once.
+export const topRibaSources = ({ columns }: Ledger, limit: number): [string, number][] => {
+  const { amount, riba, description, descriptions } = columns;
+  const sums = new Float64Array(descriptions.length);
+  const seen = new Uint8Array(descriptions.length);
+  for (let i = 0; i < amount.length; i++) {
+    if (!riba[i]) continue;
+    sums[description[i]] += amount[i];
+    seen[description[i]] = 1;
+  }
+  const bySource = new Map<string, number>();
+  for (let d = 0; d < descriptions.length; d++) {
+    if (!seen[d]) continue;
+    const source = descriptions[d].split(' ')[0] || 'Bank';
+    bySource.set(source, (bySource.get(source) || 0) + sums[d]);
+  }
+  return Array.from(bySource.entries())
+    .sort((a, b) => b[1] - a[1])
+    .slice(0, limit);
+};
@@ -0,0 +1,257 @@
+// Generated by scripts/build_locales.py from translations.ts. Do not edit by hand.
+
+export type Language = 'en' | 'ar' | 'ur' | 'hi' | 'bn' | 'id' | 'ms' | 'zh' | 'fr' | 'de' | 'ru' | 'nl' | 'he' | 'tr' | 'bs' | 'sq';
+export const LANGUAGES: { code: Language; name: string; flag: string; dir: 'ltr' | 'rtl'; fontClass: string }[] = [
+  { code: 'en', name: 'English', flag: '🇺🇸', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'ar', name: 'العربية', flag: '🇸🇦', dir: 'rtl', fontClass: 'font-arabic' },
+  { code: 'ur', name: 'اردو', flag: '🇵🇰', dir: 'rtl', fontClass: 'font-urdu' },
+  { code: 'hi', name: 'हिंदी', flag: '🇮🇳', dir: 'ltr', fontClass: 'font-hindi' },
+  { code: 'bn', name: 'বাংলা', flag: '🇧🇩', dir: 'ltr', fontClass: 'font-bengali' },
+  { code: 'id', name: 'Bahasa Indonesia', flag: '🇮🇩', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'ms', name: 'Bahasa Melayu', flag: '🇲🇾', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'zh', name: '简体中文', flag: '🇨🇳', dir: 'ltr', fontClass: 'font-chinese' },
+  { code: 'fr', name: 'Français', flag: '🇫🇷', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'de', name: 'Deutsch', flag: '🇩🇪', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'ru', name: 'Русский', flag: '🇷🇺', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'nl', name: 'Nederlands', flag: '🇳🇱', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'he', name: 'עברית', flag: '🇵🇸', dir: 'rtl', fontClass: 'font-hebrew' },
+  { code: 'tr', name: 'Türkçe', flag: '🇹🇷', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'bs', name: 'Bosanski', flag: '🇧🇦', dir: 'ltr', fontClass: 'font-sans' },
+  { code: 'sq', name: 'Shqip', flag: '🇦🇱', dir: 'ltr', fontClass: 'font-sans' },
+];
+
+// Translation key ids; each locale asset is an array indexed by these
+export enum K {
+  hero_title = 0,
+  hero_subtitle = 1,
+  hero_desc = 2,
+  upload_btn = 3,
+  drop_text = 4,
+  nav_dash = 5,
+  nav_know = 6,
+  nav_meth = 7,
+  nav_puri = 8,
+  nav_mani = 9,
+  total_riba = 10,
+  riba_sources = 11,
+  confidence = 12,
+  action_halal = 13,
+  action_riba = 14,
+  status_processing = 15,
+  status_error = 16,
+  login = 17,
+  logout = 18,
+  save = 19,
+  settings_title = 20,
+  fatwa_source = 21,
+  fatwa_global = 22,
+  fatwa_ecfr = 23,
+  fatwa_amja = 24,
+  impact_meals = 25,
+  impact_desc = 26,
+  disposal_guide = 27,
+  faq_title = 28,
+  faq_1_q = 29,
+  faq_1_ans = 30,
+  faq_2_q = 31,
+  faq_2_ans = 32,
+  faq_3_q = 33,
+  faq_3_ans = 34,
+  faq_future_q = 35,
+  faq_future_ans = 36,
+  meth_title = 37,
+  meth_intro = 38,
+  meth_landing_teaser = 39,
+  meth_step_1 = 40,
+  meth_step_1_desc = 41,
+  meth_step_2 = 42,
+  meth_step_2_desc = 43,
+  meth_spectrum_title = 44,
+  meth_haram_title = 45,
+  meth_haram_items = 46,
+  meth_shubhah_title = 47,
+  meth_shubhah_items = 48,
+  meth_halal_title = 49,
+  meth_halal_items = 50,
+  meth_deep_title = 51,
+  meth_fatwa_section = 52,
+  meth_fatwa_text = 53,
+  meth_active_ruling = 54,
+  meth_note_global = 55,
+  meth_note_ecfr = 56,
+  meth_note_amja = 57,
+  meth_badge_ecfr = 58,
+  meth_badge_amja = 59,
+  meth_disposal_section = 60,
+  meth_disposal_text = 61,
+  meth_edge_section = 62,
+  meth_edge_cashback = 63,
+  meth_edge_rewards = 64,
+  meth_edge_crypto = 65,
+  meth_resources_title = 66,
+  man_title = 67,
+  man_subtitle = 68,
+  man_prob = 69,
+  man_prob_desc = 70,
+  man_sol = 71,
+  man_sol_desc = 72,
+  arch_privacy = 73,
+  arch_privacy_desc = 74,
+  puri_history = 75,
+  puri_empty = 76,
+  puri_streak = 77,
+  puri_total = 78,
+  puri_clear = 79,
+  puri_clear_confirm = 80,
+  puri_clear_btn = 81,
+  puri_cancel_btn = 82,
+  login_title = 83,
+  login_subtitle = 84,
+  login_email_ph = 85,
+  login_pass_ph = 86,
+  login_btn = 87,
+  dash_selected = 88,
+  dash_process_btn = 89,
+  dash_processing_sub = 90,
+  dash_privacy_text = 91,
+  dash_none_detected = 92,
+  meth_edge_title_cashback = 93,
+  meth_edge_title_rewards = 94,
+  meth_edge_title_crypto = 95,
+  set_name = 96,
+  set_email = 97,
+  set_helper = 98,
+  puri_modal_title = 99,
+  puri_modal_simple_title = 100,
+  puri_modal_simple_desc = 101,
+  puri_modal_link = 102,
+  puri_step_1_title = 103,
+  puri_step_1_desc = 104,
+  puri_step_2_title = 105,
+  puri_step_2_desc = 106,
+  puri_step_3_title = 107,
+  puri_step_3_desc = 108,
+  puri_modal_btn = 109,
+  blog_subtitle = 110,
+  man_values_title = 111,
+  man_val_1 = 112,
+  man_val_1_d = 113,
+  man_val_2 = 114,
+  man_val_2_d = 115,
+  man_val_3 = 116,
+  man_val_3_d = 117,
+  dash_reset_btn = 118,
+  verif_log = 119,
+  verif_log_desc = 120,
+  page_col = 121,
+  puri_cert_header = 122,
+  puri_cert_ayah = 123,
+  puri_cert_ayah_ref = 124,
+  puri_cert_ayah_trans = 125,
+  puri_cert_total_riba = 126,
+  puri_cert_guidance_title = 127,
+  puri_cert_guidance_text = 128,
+  puri_cert_disclaimer = 129,
+  puri_print_btn = 130,
+  puri_dua_title = 131,
+  puri_dua_arabic = 132,
+  puri_dua_trans = 133,
+  puri_tab_pending = 134,
+  puri_tab_disposed = 135,
+  puri_btn_dispose = 136,
+  puri_btn_export = 137,
+  puri_analyze_new = 138,
+  puri_analyze_desc = 139,
+  puri_pending_items = 140,
+  puri_all_caught_up = 141,
+  puri_total_purified = 142,
+  puri_transactions = 143,
+  puri_no_disposed = 144,
+  puri_subtitle = 145,
+  puri_total_interest = 146,
+  puri_cert_total_amount = 147,
+  puri_cert_logs = 148,
+  puri_cert_date = 149,
+  puri_cert_source = 150,
+  puri_cert_amount = 151,
+  puri_cert_disclaimer_label = 152,
+  puri_cert_certified = 153,
+  puri_cert_generated = 154,
+  puri_cert_gap_detected = 155,
+  puri_cert_confirmation = 156,
+  puri_cert_privacy = 157,
+  puri_cert_id = 158,
+  puri_identified_across = 159,
+  puri_currencies = 160,
+  error_file_too_large = 161,
+  error_invalid_file_type = 162,
+  error_not_bank_statement = 163,
+  error_not_financial_image = 164,
+  error_image_processing = 165,
+  error_no_data_found = 166,
+  error_processing_timeout = 167,
+  error_processing_failed = 168,
+  financial_purity_score = 169,
+  export_certificate_pdf = 170,
+  cert_footer_confirmation = 171,
+  cert_footer_privacy = 172,
+  cert_footer_id = 173,
+  cert_footer_generated = 174,
+  donate_title = 175,
+  donate_subtitle = 176,
+  donate_guidelines_title = 177,
+  donate_guideline_1_title = 178,
+  donate_guideline_1_desc = 179,
+  donate_guideline_2_title = 180,
+  donate_guideline_2_desc = 181,
+  donate_guideline_3_title = 182,
+  donate_guideline_3_desc = 183,
+  donate_orgs_title = 184,
+  donate_other_ways_title = 185,
+  donate_public_hospitals = 186,
+  donate_public_hospitals_desc = 187,
+  donate_education = 188,
+  donate_education_desc = 189,
+  donate_water = 190,
+  donate_water_desc = 191,
+  donate_infrastructure = 192,
+  donate_infrastructure_desc = 193,
+  donate_orphans = 194,
+  donate_orphans_desc = 195,
+  donate_food = 196,
+  donate_food_desc = 197,
+  donate_here = 198,
+  donate_here_desc = 199,
+  donate_remove_immediately = 200,
+  donate_region_global = 201,
+  donate_region_uk_global = 202,
+  donate_region_usa_global = 203,
+  donate_region_your_area = 204,
+  footer_tagline = 205,
+  footer_quick_links = 206,
+  footer_features = 207,
+  footer_feature_privacy = 208,
+  footer_feature_privacy_desc = 209,
+  footer_feature_local = 210,
+  footer_feature_local_desc = 211,
+  footer_feature_shariah = 212,
+  footer_feature_shariah_desc = 213,
+  footer_feature_knowledge = 214,
+  footer_feature_knowledge_desc = 215,
+  footer_contact = 216,
+  footer_copyright = 217,
+  export_report = 218,
+  export_riba_only = 219,
+  export_date_from = 220,
+  export_date_to = 221,
+  export_start = 222,
+  export_done = 223,
+  export_failed = 224,
+  puri_btn_view = 225,
+  puri_no_saved_transactions = 226,
+}
+export type TranslationKey = K;
+// Rich text: paragraphs of runs, each plain text or [bold text]
+export type RichRun = string | [string];
+export type RichParagraph = RichRun[];
+export type LocaleStrings = (string | RichParagraph | null)[];
@@ -0,0 +1,152 @@
+// ocr.ts
+// Long-lived Tesseract.js scheduler for statement images
+//
+// Starting a Tesseract worker (WASM core + ~10 MB traineddata) costs far more
+// than recognizing one screenshot, so workers are started once, shared by every
+// upload and terminated only after IDLE_TIMEOUT without jobs.
+
+import type { Language } from './locales';
+
+// Tesseract traineddata for each UI locale
+export const OCR_LANGUAGES: Record<Language, string> = {
+  en: 'eng', ar: 'ara', ur: 'urd', hi: 'hin', bn: 'ben', id: 'ind', ms: 'msa', zh: 'chi_sim',
+  fr: 'fra', de: 'deu', ru: 'rus', nl: 'nld', he: 'heb', tr: 'tur', bs: 'bos', sq: 'sqi',
+};
+
+// Statements mix English headings with the local script, so eng is always loaded
+export const ocrLanguagesFor = (language: Language) => {
+  const code = OCR_LANGUAGES[language] || 'eng';
+  return code === 'eng' ? 'eng' : `eng+${code}`;
+};
+
+export const OCR_WORKERS = Math.max(1, Math.min(4, Math.floor((navigator.hardwareConcurrency || 2) / 2)));
+const IDLE_TIMEOUT = 60000; // terminate workers after 1 minute without jobs
+
+export interface OcrProgress {
+  pending: number; // images queued or being recognized
+  fraction: number; // 0-1 over every image since the scheduler was last idle
+}
+
+interface OcrPool {
+  langs: string;
+  ready: Promise<any>; // the scheduler, once its first worker is up
+  workers: number; // started or starting
+  pending: number;
+  submitted: number;
+  completed: number;
+  active: Map<string, number>; // recognize progress by Tesseract job id
+  closed: boolean;
+  idleTimer?: ReturnType<typeof setTimeout>;
+}
+
+let pool: OcrPool | null = null;
+const listeners = new Set<(progress: OcrProgress) => void>();
+
+export const onOcrProgress = (listener: (progress: OcrProgress) => void) => {
+  listeners.add(listener);
+  return () => { listeners.delete(listener); };
+};
+
+const report = (p: OcrPool) => {
+  if (p !== pool) return;
+  let running = 0;
+  p.active.forEach(progress => { running += progress; });
+  const progress = { pending: p.pending, fraction: p.submitted ? (p.completed + running) / p.submitted : 0 };
+  listeners.forEach(listener => listener(progress));
+};
+
+const close = (p: OcrPool) => {
+  if (p.closed) return;
+  p.closed = true;
+  clearTimeout(p.idleTimer);
+  if (pool === p) pool = null;
+  p.ready.then(scheduler => scheduler.terminate(), () => {});
+};
+
+const addWorker = async (p: OcrPool, scheduler: any) => {
+  p.workers++;
+  try {
+    const Tesseract = await import('tesseract.js');
+    const worker = await Tesseract.createWorker(p.langs, undefined, {
+      logger: (m: any) => {
+        if (m.status !== 'recognizing text' || !m.jobId) return;
+        p.active.set(m.jobId, m.progress);
+        report(p);
+      },
+    });
+    // Closed while this worker was loading
+    if (p.closed) {
+      await worker.terminate();
+      return;
+    }
+    scheduler.addWorker(worker);
+  } catch (err) {
+    p.workers--;
+    throw err;
+  }
+};
+
+const getPool = (langs: string) => {
+  if (pool && pool.langs === langs) return pool;
+  // A pool for another language finishes its jobs, then closes (see recognizeImage)
+  if (pool && pool.pending === 0) close(pool);
+
+  const p: OcrPool = {
+    langs, ready: Promise.resolve(), workers: 0, pending: 0,
+    submitted: 0, completed: 0, active: new Map(), closed: false,
+  };
+  p.ready = import('tesseract.js').then(async (Tesseract) => {
+    const scheduler = Tesseract.createScheduler();
+    await addWorker(p, scheduler);
+    return scheduler;
+  });
+  // e.g. traineddata could not be fetched: let the next call start over
+  p.ready.catch(() => close(p));
+  pool = p;
+  return p;
+};
+
+const scheduleIdleClose = (p: OcrPool) => {
+  clearTimeout(p.idleTimer);
+  p.idleTimer = setTimeout(() => close(p), IDLE_TIMEOUT);
+};
+
+// Start loading a worker for `language` before any image is submitted
+export const prewarmOcr = (language: Language) => {
+  const p = getPool(ocrLanguagesFor(language));
+  if (p.pending === 0) scheduleIdleClose(p);
+};
+
+// Recognize one image with the UI locale's traineddata (plus English)
+export const recognizeImage = async (image: File | Blob, language: Language): Promise<string> => {
+  const p = getPool(ocrLanguagesFor(language));
+  clearTimeout(p.idleTimer);
+  p.pending++;
+  p.submitted++;
+  report(p);
+  try {
+    const scheduler = await p.ready;
+    // One more worker per waiting image, up to OCR_WORKERS
+    if (p.workers < Math.min(OCR_WORKERS, p.pending)) {
+      addWorker(p, scheduler).catch(err => console.warn('OCR worker failed to start:', err));
+    }
+    const { jobId, data } = await scheduler.addJob('recognize', image);
+    p.active.delete(jobId);
+    return data.text;
+  } finally {
+    p.pending--;
+    p.completed++;
+    report(p);
+    if (p.pending === 0) {
+      p.submitted = p.completed = 0;
+      p.active.clear();
+      if (pool === p) scheduleIdleClose(p);
+      else close(p);
+    }
+  }
+};
+
+// Stop all OCR now (e.g. on processing timeout); jobs in flight are rejected
+export const terminateOcr = () => {
+  if (pool) close(pool);
+};
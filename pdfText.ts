@@ -0,0 +1,75 @@
+// pdfText.ts
+// Group pdf.js text items into visual lines (used by processWorker.ts)
+
+export interface PageTextItem {
+  str: string;
+  x: number;
+  y: number;
+}
+
+export const Y_TOLERANCE = 4; // pixels
+
+// Object.keys() lists integer-like keys first (ascending), then the rest in
+// insertion order. The original string-keyed version picked rows in that
+// order, so ties between two candidate rows are broken the same way here.
+const isIndexKey = (y: number) => Number.isInteger(y) && y >= 0 && y < 4294967295;
+
+// Optimized Line Bucketing Algorithm
+//
+// An item joins the existing row whose anchor (the y of the row's first item)
+// is within Y_TOLERANCE, otherwise it starts a new row. A new anchor is only
+// created at least Y_TOLERANCE away from every other one, so at most two
+// anchors can be in range of an item and a binary search over the sorted
+// anchors finds them: O(n log n) instead of scanning every row per item.
+// The output is identical to the previous Object.keys(rows).find() version.
+export const processPageText = (items: PageTextItem[]): string[] => {
+  const anchors: number[] = []; // ascending
+  const rowIds: number[] = []; // rowIds[k] is the row anchored at anchors[k]
+  const rows: number[][] = []; // item indices per row, in creation order
+
+  for (let i = 0; i < items.length; i++) {
+    const y = items[i].y;
+
+    // First anchor above y - Y_TOLERANCE; check one slot either side for rounding
+    let lo = 0;
+    let hi = anchors.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (anchors[mid] <= y - Y_TOLERANCE) lo = mid + 1;
+      else hi = mid;
+    }
+
+    let best = -1;
+    for (let k = Math.max(0, lo - 1); k < Math.min(anchors.length, lo + 3); k++) {
+      if (!(Math.abs(anchors[k] - y) < Y_TOLERANCE)) continue;
+      if (best === -1) {
+        best = k;
+        continue;
+      }
+      const bestIsIndex = isIndexKey(anchors[best]);
+      const kIsIndex = isIndexKey(anchors[k]);
+      // Scanning ascending: a lower index key already wins, a later-created row never does
+      if ((kIsIndex && !bestIsIndex) || (kIsIndex === bestIsIndex && !bestIsIndex && rowIds[k] < rowIds[best])) {
+        best = k;
+      }
+    }
+
+    if (best !== -1) {
+      rows[rowIds[best]].push(i);
+    } else {
+      let at = lo;
+      while (at < anchors.length && anchors[at] < y) at++;
+      anchors.splice(at, 0, y);
+      rowIds.splice(at, 0, rows.length);
+      rows.push([i]);
+    }
+  }
+
+  // Rows top-to-bottom (PDF y grows upwards), items left-to-right
+  const lines: string[] = [];
+  for (let k = anchors.length - 1; k >= 0; k--) {
+    const row = rows[rowIds[k]].sort((a, b) => items[a].x - items[b].x);
+    lines.push(row.map(i => items[i].str).join(' '));
+  }
+  return lines;
+};
@@ -1,287 +1,230 @@
 // processWorker.ts
-// Web Worker for heavy file processing (PDF, OCR, CSV)
+// Web Worker for heavy file processing (PDF, CSV), run as a pool by workerPool.ts
+//
+// Each task turns one file, or a page range of one PDF, into text lines and
+// posts them one page at a time, so only a few pages of text items are held
+// here and the main thread can classify pages as they arrive (statement.ts).
+// CSVs are streamed from the File in chunks and posted one chunk at a time,
+// as typed rows when their columns are recognized (csvColumns.ts). Stage
+// timings (diagnostics.ts) go back with the task's 'done' message.
+// A parsed PDF stays open after its range, so the pool can send this worker
+// the file's next range without the bytes; the pool closes it once the file
+// is done.
 
-// Types
-type Currency = 'USD' | 'GBP' | 'EUR' | 'INR' | 'SAR' | 'AED' | 'MYR' | 'IDR';
-type Category = 'income' | 'shopping' | 'utilities' | 'transfer' | 'riba' | 'uncategorized';
-type Confidence = 'high' | 'medium' | 'low';
+import Papa from 'papaparse';
+import { processPageText } from './pdfText';
+import { detectCsvColumns, readCsvRow } from './csvColumns';
+import type { CsvColumns, CsvRow } from './csvColumns';
+import { measureStage } from './diagnostics';
+import type { StageTimings } from './diagnostics';
 
-interface Transaction {
-  id: string;
-  date: string;
-  description: string;
-  amount: number;
-  originalText: string;
-  isRiba: boolean;
-  currency: Currency;
-  category: Category;
-  confidence: Confidence;
-  page: number;
-  reason?: string;
-}
+export type ExtractTask =
+  | { kind: 'csv' }
+  // probe: check the first pages for bank statement keywords and report numPages
+  // before extracting, so the pool can hand the remaining pages to other workers
+  | { kind: 'pdf'; from: number; to: number; probe: boolean };
+
+// A CSV arrives as the File itself (Papa reads it in chunks); a PDF's bytes
+// as a transferred ArrayBuffer, left out when this worker already has that
+// document (`doc`, numbered by the pool) open. 'close' drops the open document.
+export type ExtractRequest =
+  | { id: number; kind: 'csv'; file: File }
+  | (Extract<ExtractTask, { kind: 'pdf' }> & { id: number; doc: number; buffer?: ArrayBuffer })
+  | { kind: 'close' };
+
+export type ExtractResponse =
+  | { id: number; type: 'pages'; numPages: number }
+  | { id: number; type: 'page'; page: number; lines: string[] }
+  | { id: number; type: 'rows'; page: number; rows: CsvRow[] }
+  | { id: number; type: 'done'; timings: StageTimings }
+  | { id: number; type: 'rejected'; reason: string }
+  | { id: number; type: 'error'; error: string };
+
+const FINANCIAL_KEYWORDS = [
+  'balance', 'transaction', 'debit', 'credit', 'account', 'statement',
+  'deposit', 'withdrawal', 'payment', 'interest', 'fee', 'bank',
+  'amount', 'total', 'date', 'description', 'reference', 'transfer',
+  'cheque', 'check', 'atm', 'pos', 'swift', 'iban', 'sort code',
+  'opening', 'closing', 'summary', 'charges', 'currency', '$', '£', '€'
+];
 
-// PDF.js Dynamic Import
+// PDF.js Dynamic Import (same bundled build as the main thread)
 let pdfjsLib: any = null;
 const getPdfJs = async () => {
   if (pdfjsLib) return pdfjsLib;
-  const version = '4.8.69';
-  const pdfjs = await import(`https://cdn.jsdelivr.net/npm/pdfjs-dist@${version}/+esm`);
-  pdfjs.GlobalWorkerOptions.workerSrc = `https://cdn.jsdelivr.net/npm/pdfjs-dist@${version}/build/pdf.worker.min.mjs`;
+  const pdfjs = await import('pdfjs-dist');
+  // @ts-ignore
+  const pdfWorker = (await import('pdfjs-dist/build/pdf.worker.min.mjs?url')).default;
+  pdfjs.GlobalWorkerOptions.workerSrc = pdfWorker;
   pdfjsLib = pdfjs;
   return pdfjs;
 };
 
-// Tesseract Dynamic Import (Lazy Load)
-let tesseractModule: any = null;
-const getTesseract = async () => {
-  if (tesseractModule) return tesseractModule;
-  tesseractModule = await import('tesseract.js');
-  return tesseractModule;
-};
-
-// PapaParse Import
-import Papa from 'papaparse';
+// The document parsed for the last PDF range, kept for the file's next range
+let open: { doc: number; pdf: any } | null = null;
 
-// Optimized Line Bucketing Algorithm
-const processPageText = (items: any[]) => {
-  const rows: Record<string, any[]> = {};
-  const Y_TOLERANCE = 4; // pixels
+const closePdf = async () => {
+  if (!open) return;
+  const { pdf } = open;
+  open = null;
+  await pdf.destroy().catch(() => {});
+};
 
-  items.forEach(item => {
-    const existingY = Object.keys(rows).find(y => Math.abs(parseFloat(y) - item.y) < Y_TOLERANCE);
-    
-    if (existingY) {
-      rows[existingY].push(item);
-    } else {
-      rows[item.y.toString()] = [item];
-    }
-  });
+const openPdf = async (request: Extract<ExtractRequest, { kind: 'pdf' }>, timings: StageTimings) => {
+  if (!request.buffer) {
+    if (open?.doc !== request.doc) throw new Error('PDF is not open in this worker');
+    return open.pdf;
+  }
+  await closePdf();
+  const loadStart = performance.now();
+  const pdfjs = await getPdfJs();
+  const pdf = await pdfjs.getDocument({ data: request.buffer }).promise;
+  measureStage(timings, 'pdfLoad', loadStart);
+  open = { doc: request.doc, pdf };
+  return pdf;
+};
 
-  // Sort rows top-to-bottom
-  const sortedY = Object.keys(rows).sort((a, b) => parseFloat(b) - parseFloat(a));
+const PREFETCH_PAGES = 2; // PDF pages requested ahead of the one being grouped
 
-  // Process each row
-  return sortedY.map(y => {
-    const rowItems = rows[y].sort((a, b) => a.x - b.x);
-    return rowItems.map(i => i.str).join(" ");
-  });
-};
+interface PdfPageText {
+  page: any;
+  items: any[];
+}
 
-// Detect dominant currency
-const detectDominantCurrency = (text: string): Currency => {
-  const currencies = {
-    SAR: (text.match(/SAR/gi) || []).length,
-    AED: (text.match(/AED/gi) || []).length,
-    INR: (text.match(/INR|₹/gi) || []).length,
-    MYR: (text.match(/MYR|RM/gi) || []).length,
-    IDR: (text.match(/IDR/gi) || []).length,
-    GBP: (text.match(/GBP|£/gi) || []).length,
-    EUR: (text.match(/EUR|€/gi) || []).length,
-    USD: (text.match(/USD|\$/gi) || []).length,
+// Every page's text is read once, through a bounded window: get(i) also
+// requests the next PREFETCH_PAGES pages up to `last`, so pdf.js extracts
+// them while page i is being grouped and posted. A page stays available until
+// release(i), which lets the bank statement probe and the extraction share it.
+const readPages = (pdf: any, last: number, timings: StageTimings) => {
+  const pending = new Map<number, Promise<PdfPageText>>();
+  const request = (i: number) => {
+    if (pending.has(i)) return;
+    const start = performance.now();
+    const read: Promise<PdfPageText> = pdf.getPage(i)
+      .then(async (page: any) => {
+        const { items } = await page.getTextContent();
+        measureStage(timings, 'textContent', start);
+        return { page, items };
+      });
+    // Errors surface through get(); a prefetch nobody waits for must not be unhandled
+    read.catch(() => {});
+    pending.set(i, read);
+  };
+  return {
+    get(i: number) {
+      request(i);
+      for (let j = i + 1; j <= Math.min(i + PREFETCH_PAGES, last); j++) request(j);
+      return pending.get(i)!;
+    },
+    release(i: number) {
+      pending.delete(i);
+    },
   };
-  return (Object.keys(currencies) as Currency[]).reduce((a, b) => currencies[a] > currencies[b] ? a : b, 'USD');
 };
 
-// Detect category
-const detectCategory = (line: string): { category: Category; isRiba: boolean; confidence: Confidence; reason?: string } => {
-  const lowerLine = line.toLowerCase();
-  
-  // High confidence RIBA indicators
-  if (lowerLine.match(/interest|late fee|finance charge|overdraft|cash advance fee|apr|annual percentage rate/i)) {
-    return { category: 'riba', isRiba: true, confidence: 'high', reason: 'Interest-bearing transaction' };
-  }
-  
-  // Medium confidence
-  if (lowerLine.match(/penalty|charge|fee/i) && lowerLine.match(/late|overdue|past due/i)) {
-    return { category: 'riba', isRiba: true, confidence: 'medium', reason: 'Late payment fee' };
-  }
-  
-  // Halal indicators
-  if (lowerLine.match(/salary|cashback|refund|reward/i)) {
-    return { category: 'income', isRiba: false, confidence: 'high' };
-  }
-  
-  return { category: 'uncategorized', isRiba: false, confidence: 'low' };
+const keepLine = (lines: string[], text: string) => {
+  if (text.trim().length > 5) lines.push(text.trim());
 };
 
-// Parse transaction amount
-const parseTransactionAmount = (line: string, dateStr: string | null): number => {
-  let cleanLine = line;
-  if (dateStr) {
-    cleanLine = cleanLine.replace(dateStr, '');
-  }
-  
-  const amountMatches = cleanLine.match(/[\d,]+\.?\d{0,2}/g);
-  if (!amountMatches) return 0;
-  
-  const amounts = amountMatches.map(m => parseFloat(m.replace(/,/g, ''))).filter(a => a > 0);
-  return amounts.length > 0 ? Math.max(...amounts) : 0;
-};
+const CSV_CHUNK_SIZE = 1024 * 1024; // bytes per Papa chunk
 
-// Main processing function
-const processFiles = async (files: any[]) => {
-  try {
-    const allLines: { text: string; page: number }[] = [];
-    
-    for (const fileData of files) {
-      // Reconstruct File from transferred ArrayBuffer
-      const blob = new Blob([fileData.buffer], { type: fileData.type });
-      const file = new File([blob], fileData.name, { type: fileData.type });
-      
-      console.log('Processing file:', file.name, file.type, 'Size:', file.size);
-      
-      // CSV Processing (Fast & Accurate)
-      if (file.name.endsWith('.csv')) {
-        const text = await file.text();
-        const parsed = Papa.parse(text, { header: true, skipEmptyLines: true });
-        
-        parsed.data.forEach((row: any, idx: number) => {
-          const rowText = Object.values(row).join(' ');
-          if (rowText.trim().length > 5) {
-            allLines.push({ text: rowText.trim(), page: 1 });
-          }
-        });
-        console.log('CSV parsed:', parsed.data.length, 'rows');
-        continue;
-      }
-      
-      // PDF Processing
-      if (file.type === 'application/pdf' || file.name.endsWith('.pdf')) {
-        try {
-          console.log('Loading PDF engine...');
-          const pdfjs = await getPdfJs();
-          if (!pdfjs) throw new Error("Could not load PDF engine");
-          
-          console.log('Parsing PDF...');
-          const arrayBuffer = await file.arrayBuffer();
-          const loadingTask = pdfjs.getDocument({ data: arrayBuffer });
-          const pdf = await loadingTask.promise;
-          console.log('PDF loaded:', pdf.numPages, 'pages');
-        
-          for (let i = 1; i <= pdf.numPages; i++) {
-            const page = await pdf.getPage(i);
-            const textContent = await page.getTextContent();
-            
-            // Map items with coordinates
-            const items = textContent.items.map((item: any) => ({
-              str: item.str,
-              x: item.transform[4],
-              y: item.transform[5]
-            }));
-            
-            // Use optimized line bucketing
-            const lines = processPageText(items);
-            lines.forEach(lineText => {
-              if (lineText.trim().length > 5) {
-                allLines.push({ text: lineText.trim(), page: i });
-              }
-            });
-            
-            // Memory cleanup
-            textContent.items = [];
-          }
-          
-          // Cleanup PDF document
-          await pdf.destroy();
-          continue;
-        } catch (pdfError) {
-          console.error('PDF processing error:', pdfError);
-          // Continue to try OCR fallback
+// Columns are mapped once, from the header and the first chunk; every chunk is
+// then posted (all as page 1) and dropped, so memory stays at one chunk
+// Timed as a whole (csvParse): reading, parsing and mapping the chunks
+const extractCsv = (request: Extract<ExtractRequest, { kind: 'csv' }>, timings: StageTimings) => new Promise<void>((resolve, reject) => {
+  const start = performance.now();
+  let columns: CsvColumns | null | undefined;
+  Papa.parse<Record<string, unknown>>(request.file, {
+    header: true,
+    skipEmptyLines: true,
+    chunkSize: CSV_CHUNK_SIZE,
+    chunk: (results) => {
+      if (columns === undefined) columns = detectCsvColumns(results.meta.fields ?? [], results.data);
+      if (columns) {
+        const rows: CsvRow[] = [];
+        for (const row of results.data) {
+          const csvRow = readCsvRow(row, columns);
+          if (csvRow.text.length > 5) rows.push(csvRow);
         }
+        post({ id: request.id, type: 'rows', page: 1, rows });
+      } else {
+        // Unrecognized columns: the whole row is one statement line
+        const lines: string[] = [];
+        results.data.forEach(row => keepLine(lines, Object.values(row).join(' ')));
+        post({ id: request.id, type: 'page', page: 1, lines });
       }
-      
-      // Image OCR (Lazy loaded)
-      if (file.type.startsWith('image/')) {
-        const Tesseract = await getTesseract();
-        const tesseractFn = Tesseract.createWorker || Tesseract.default?.createWorker;
-        if (!tesseractFn) throw new Error("Tesseract not loaded");
-        
-        const worker = await tesseractFn('eng');
-        const ret = await worker.recognize(file);
-        const lines = ret.data.text.split('\n');
-        
-        lines.forEach((l: string) => {
-          if (l.trim().length > 5) allLines.push({ text: l.trim(), page: 1 });
-        });
-        
-        await worker.terminate();
+    },
+    complete: () => {
+      measureStage(timings, 'csvParse', start);
+      post({ id: request.id, type: 'done', timings });
+      resolve();
+    },
+    error: reject,
+  });
+});
+
+const extractPdf = async (request: Extract<ExtractRequest, { kind: 'pdf' }>, timings: StageTimings) => {
+  const pdf = await openPdf(request, timings);
+  const last = Math.min(request.to, pdf.numPages);
+  const pages = readPages(pdf, last, timings);
+  if (request.probe) {
+    let hasFinancialKeywords = false;
+    let textSampleSize = 0;
+    for (let i = 1; i <= Math.min(3, pdf.numPages); i++) {
+      const { items } = await pages.get(i);
+      const pageText = items.map((item: any) => item.str).join(' ').toLowerCase();
+      textSampleSize += pageText.length;
+      if (FINANCIAL_KEYWORDS.some(kw => pageText.includes(kw))) {
+        hasFinancialKeywords = true;
+        break;
       }
     }
-    
-    // Pre-Scan for Dominant Currency
-    const fullText = allLines.map(l => l.text).join(' ');
-    const dominantCurrency = detectDominantCurrency(fullText);
-    
-    // Parse Text
-    const newTransactions: Transaction[] = [];
-    const dateRegex = /(?:\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b)|(?:\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})|(?:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})/i;
-    
-    allLines.forEach(({ text: line, page }) => {
-      if (line.length < 5) return;
-      
-      const { category, isRiba, confidence, reason } = detectCategory(line);
-      const dateMatch = line.match(dateRegex);
-      const dateStr = dateMatch ? dateMatch[0] : null;
-      const amount = parseTransactionAmount(line, dateStr);
-      
-      if (amount > 0) {
-        let currency: Currency = dominantCurrency;
-        if (line.includes('SAR')) currency = 'SAR';
-        else if (line.includes('AED')) currency = 'AED';
-        else if (line.includes('INR') || line.includes('₹')) currency = 'INR';
-        else if (line.includes('MYR') || line.includes('RM')) currency = 'MYR';
-        else if (line.includes('IDR')) currency = 'IDR';
-        else if (line.includes('GBP') || line.includes('£')) currency = 'GBP';
-        else if (line.includes('EUR') || line.includes('€')) currency = 'EUR';
-        else if (line.includes('$') || line.includes('USD')) currency = 'USD';
-        
-        if (isRiba || (dateMatch && line.length > 15)) {
-          newTransactions.push({
-            id: Math.random().toString(36).substr(2, 9),
-            date: dateMatch ? dateMatch[0] : new Date().toISOString().split('T')[0],
-            description: line.substring(0, 80).trim() || "Transaction",
-            amount: amount,
-            originalText: line,
-            isRiba: isRiba,
-            currency: currency,
-            category: category,
-            confidence: confidence,
-            reason: reason,
-            page: page
-          });
-        }
-      }
-    });
-    
-    // Filter duplicates & invalid amounts
-    const cleanTxns = newTransactions.filter((t, index, self) => 
-      !isNaN(t.amount) && 
-      t.amount > 0 &&
-      index === self.findIndex((x) => (
-        x.description === t.description && x.amount === t.amount && x.date === t.date
-      ))
-    );
-    
-    return cleanTxns;
-  } catch (err) {
-    throw err;
+    // Lenient check: only reject if the PDF has substantial content but zero financial keywords
+    if (!hasFinancialKeywords && textSampleSize > 500) {
+      post({ id: request.id, type: 'rejected', reason: 'PDF does not appear to be a bank statement (no financial keywords found)' });
+      return;
+    }
+    post({ id: request.id, type: 'pages', numPages: pdf.numPages });
+  }
+
+  for (let i = request.from; i <= last; i++) {
+    const { page, items } = await pages.get(i);
+    pages.release(i);
+    const lines: string[] = [];
+    const start = performance.now();
+    processPageText(items.map((item: any) => ({
+      str: item.str,
+      x: item.transform[4],
+      y: item.transform[5]
+    }))).forEach(lineText => keepLine(lines, lineText));
+    measureStage(timings, 'lineGrouping', start);
+    post({ id: request.id, type: 'page', page: i, lines });
+    // Release the page's fonts and operator lists before the next one
+    page.cleanup();
   }
+  post({ id: request.id, type: 'done', timings });
 };
 
+const post = (response: ExtractResponse) => self.postMessage(response);
+
 // Worker message handler
-self.onmessage = async (event) => {
-  const { files, action } = event.data;
-  
-  console.log('Worker received:', action, 'with', files?.length, 'files');
-  
+self.onmessage = async (event: MessageEvent<ExtractRequest>) => {
+  const request = event.data;
+  if (request.kind === 'close') {
+    await closePdf();
+    return;
+  }
+  const timings: StageTimings = {};
   try {
-    if (action === 'process') {
-      const result = await processFiles(files);
-      console.log('Worker processed:', result.length, 'transactions');
-      self.postMessage({ success: true, result });
+    if (request.kind === 'csv') {
+      await extractCsv(request, timings);
+    } else {
+      await extractPdf(request, timings);
     }
   } catch (error: any) {
     console.error('Worker error:', error);
-    self.postMessage({ success: false, error: error.message });
+    // The pool forgets this worker's document on an error
+    if (request.kind === 'pdf') await closePdf();
+    post({ id: request.id, type: 'error', error: error?.message || String(error) });
   }
 };
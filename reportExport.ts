@@ -0,0 +1,125 @@
+// reportExport.ts
+// Export the transactions on screen as CSV, JSON Lines or OFX, written by exportWorker.ts
+//
+// Where the File System Access API is available the report is streamed into
+// the file the user picks; elsewhere the worker returns a Blob to download.
+// The worker pulls the ledger's rows a slice at a time, and a Riba-only
+// export pulls only the riba rows (ledger.ribaIndexes).
+
+import { REPORT_FORMATS } from './reportFormats';
+import type { ExportFilter, ExportFormat } from './reportFormats';
+import type { ExportRequest, ExportResponse } from './exportWorker';
+import type { Ledger } from './ledger';
+
+// The parts of FileSystemWritableFileStream used here
+interface ReportWritable {
+  write: (chunk: string | Blob) => Promise<void>;
+  close: () => Promise<void>;
+  abort: () => Promise<void>;
+}
+
+export interface ExportOptions {
+  format: ExportFormat;
+  filter: ExportFilter;
+  onProgress?: (fraction: number) => void; // share of rows read, 0..1
+  signal?: AbortSignal;
+}
+
+export const downloadBlob = (blob: Blob, fileName: string) => {
+  const url = URL.createObjectURL(blob);
+  const link = document.createElement('a');
+  link.setAttribute('href', url);
+  link.setAttribute('download', fileName);
+  document.body.appendChild(link);
+  link.click();
+  document.body.removeChild(link);
+  setTimeout(() => URL.revokeObjectURL(url), 0);
+};
+
+// Ask for the output file; null when there is no save dialog to ask with
+const pickFile = async (fileName: string, format: ExportFormat): Promise<ReportWritable | null | 'cancelled'> => {
+  const picker = (window as any).showSaveFilePicker;
+  if (!picker) return null;
+  const { mimeType, extension } = REPORT_FORMATS[format];
+  try {
+    const handle = await picker({
+      suggestedName: fileName,
+      types: [{ description: extension.toUpperCase(), accept: { [mimeType.split(';')[0]]: [`.${extension}`] } }],
+    });
+    return await handle.createWritable();
+  } catch (error: any) {
+    if (error?.name === 'AbortError') return 'cancelled';
+    // e.g. not allowed in this frame: download instead
+    console.warn('Save dialog unavailable, downloading instead:', error);
+    return null;
+  }
+};
+
+// Number of rows exported, or null if the user dismissed the save dialog.
+// Call it straight from a click handler: the save dialog needs the user's
+// activation, which an earlier await would use up. Rejects with an
+// AbortError when `signal` aborts.
+export const exportReport = async (ledger: Ledger, options: ExportOptions): Promise<number | null> => {
+  const { format, filter, onProgress, signal } = options;
+  const today = new Date().toISOString().split('T')[0];
+  const fileName = `Purification_Report_${today}.${REPORT_FORMATS[format].extension}`;
+  const writable = await pickFile(fileName, format);
+  if (writable === 'cancelled') return null;
+
+  const { transactions, ribaIndexes } = ledger;
+  const total = filter.ribaOnly ? ribaIndexes.length : transactions.length;
+  const rows = (from: number, count: number) => filter.ribaOnly
+    ? ribaIndexes.slice(from, from + count).map(i => transactions[i])
+    : transactions.slice(from, from + count);
+
+  const worker = new Worker(new URL('./exportWorker.ts', import.meta.url), { type: 'module' });
+  const send = (request: ExportRequest) => worker.postMessage(request);
+  // Chunks are written one after another, in the order they were made
+  let writing = Promise.resolve();
+  try {
+    const result = await new Promise<Extract<ExportResponse, { type: 'done' }>>((resolve, reject) => {
+      const abort = () => reject(new DOMException('Export cancelled', 'AbortError'));
+      if (signal?.aborted) return abort();
+      signal?.addEventListener('abort', abort, { once: true });
+      worker.onmessage = (event: MessageEvent<ExportResponse>) => {
+        const response = event.data;
+        switch (response.type) {
+          case 'read':
+            send({ type: 'rows', from: response.from, rows: rows(response.from, response.count) });
+            break;
+          case 'chunk':
+            writing = writing.then(() => writable!.write(response.chunk));
+            writing.catch(reject);
+            break;
+          case 'progress':
+            onProgress?.(response.fraction);
+            break;
+          case 'done':
+            resolve(response);
+            break;
+          case 'error':
+            reject(new Error(response.error));
+            break;
+        }
+      };
+      worker.onerror = (event) => {
+        event.preventDefault();
+        reject(new Error(event.message || 'Export worker failed'));
+      };
+      send({ type: 'start', format, filter, total, today, toFile: Boolean(writable) });
+    });
+    if (writable) {
+      await writing;
+      await writable.close();
+    } else {
+      downloadBlob(result.blob!, fileName);
+    }
+    return result.count;
+  } catch (error) {
+    // An unclosed file is discarded, leaving whatever was there before
+    await writable?.abort().catch(() => {});
+    throw error;
+  } finally {
+    worker.terminate();
+  }
+};
@@ -0,0 +1,145 @@
+// reportFormats.ts
+// Row formatting for report exports (CSV, JSON Lines, OFX), run by exportWorker.ts
+//
+// Each format is written as header, rows and footer strings, so an export of
+// any size is produced a slice of rows at a time and never held as one string.
+
+import type { Currency, Transaction } from './statement';
+
+export type ExportFormat = 'csv' | 'jsonl' | 'ofx';
+
+// Dates are ISO yyyy-mm-dd, as from <input type="date">; either end may be open
+export interface ExportFilter {
+  ribaOnly: boolean;
+  from?: string;
+  to?: string;
+}
+
+const MONTHS = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'];
+const pad = (n: number) => String(n).padStart(2, '0');
+
+const iso = (year: number, month: number, day: number) => {
+  if (month < 1 || month > 12 || day < 1 || day > 31) return null;
+  return `${year < 100 ? 2000 + year : year}-${pad(month)}-${pad(day)}`;
+};
+
+// Transaction dates are kept as printed on the statement (DATE_RE in
+// statement.ts, or a CSV column). Numeric dates are read day first unless
+// that cannot be a date, or the statement is in dollars.
+export const isoDate = (date: string, currency: Currency): string | null => {
+  const text = date.trim();
+  let m = text.match(/^(\d{4})-(\d{1,2})-(\d{1,2})/);
+  if (m) return iso(+m[1], +m[2], +m[3]);
+  m = text.match(/^(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})$/);
+  if (m) {
+    const [a, b, year] = [+m[1], +m[2], +m[3]];
+    const monthFirst = a <= 12 && (b > 12 || currency === 'USD');
+    return monthFirst ? iso(year, a, b) : iso(year, b, a);
+  }
+  m = text.match(/^(\d{1,2})\s+([a-z]{3})[a-z]*\.?\s+(\d{2,4})$/i);
+  if (m) return iso(+m[3], MONTHS.indexOf(m[2].toLowerCase()) + 1, +m[1]);
+  m = text.match(/^([a-z]{3})[a-z]*\.?\s+(\d{1,2}),?\s+(\d{4})$/i);
+  if (m) return iso(+m[3], MONTHS.indexOf(m[1].toLowerCase()) + 1, +m[2]);
+  return null;
+};
+
+// Rows outside a date range are dropped, and so are rows whose date cannot be read
+export const matchesFilter = (txn: Transaction, date: string | null, filter: ExportFilter) => {
+  if (filter.ribaOnly && !txn.isRiba) return false;
+  if (!filter.from && !filter.to) return true;
+  if (!date) return false;
+  return (!filter.from || date >= filter.from) && (!filter.to || date <= filter.to);
+};
+
+export interface ReportFormat {
+  mimeType: string;
+  extension: string;
+  header: (today: string) => string;
+  // OFX lists each currency as a statement of its own: the rows are written
+  // once per currency between these, with that currency's date range
+  statement?: {
+    start: (currency: Currency, from: string, to: string) => string;
+    end: (currency: Currency, to: string) => string;
+  };
+  row: (txn: Transaction, date: string | null, today: string) => string;
+  footer: () => string;
+}
+
+const csvField = (value: string) => /[",\r\n]/.test(value) ? `"${value.replace(/"/g, '""')}"` : value;
+
+const csv: ReportFormat = {
+  mimeType: 'text/csv;charset=utf-8',
+  extension: 'csv',
+  header: () => 'Date,Description,Amount,Currency,Category,Status,Confidence\n',
+  row: t => [
+    csvField(t.date),
+    `"${t.description.replace(/"/g, '""')}"`,
+    t.amount,
+    t.currency,
+    t.category,
+    t.isRiba ? 'Riba' : 'Halal',
+    t.confidence,
+  ].join(',') + '\n',
+  footer: () => '',
+};
+
+// Every transaction field; `recordId` and the like from storage are left out
+const jsonl: ReportFormat = {
+  mimeType: 'application/x-ndjson',
+  extension: 'jsonl',
+  header: () => '',
+  row: t => JSON.stringify({
+    id: t.id,
+    date: t.date,
+    description: t.description,
+    amount: t.amount,
+    currency: t.currency,
+    category: t.category,
+    isRiba: t.isRiba,
+    confidence: t.confidence,
+    page: t.page,
+    reason: t.reason,
+    originalText: t.originalText,
+  }) + '\n',
+  footer: () => '',
+};
+
+const xml = (value: string) => value.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+const ofxDate = (date: string) => date.replace(/-/g, '');
+const STATUS_OK = '<STATUS><CODE>0</CODE><SEVERITY>INFO</SEVERITY></STATUS>';
+
+// OFX 2.2 (XML). Amounts are unsigned on statements here, so income is a
+// credit and everything else a debit; no balance is known, so LEDGERBAL is 0.
+const ofx: ReportFormat = {
+  mimeType: 'application/x-ofx',
+  extension: 'ofx',
+  header: today => [
+    '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
+    '<?OFX OFXHEADER="200" VERSION="220" SECURITY="NONE" OLDFILEUID="NONE" NEWFILEUID="NONE"?>',
+    '<OFX>',
+    `<SIGNONMSGSRSV1><SONRS>${STATUS_OK}<DTSERVER>${ofxDate(today)}</DTSERVER><LANGUAGE>ENG</LANGUAGE></SONRS></SIGNONMSGSRSV1>`,
+    '<BANKMSGSRSV1>',
+    '',
+  ].join('\n'),
+  statement: {
+    start: (currency, from, to) => [
+      `<STMTTRNRS><TRNUID>${currency}</TRNUID>${STATUS_OK}<STMTRS><CURDEF>${currency}</CURDEF>`,
+      `<BANKACCTFROM><BANKID>RIBAPURIFY</BANKID><ACCTID>${currency}</ACCTID><ACCTTYPE>CHECKING</ACCTTYPE></BANKACCTFROM>`,
+      `<BANKTRANLIST><DTSTART>${ofxDate(from)}</DTSTART><DTEND>${ofxDate(to)}</DTEND>`,
+      '',
+    ].join('\n'),
+    end: (_currency, to) =>
+      `</BANKTRANLIST><LEDGERBAL><BALAMT>0.00</BALAMT><DTASOF>${ofxDate(to)}</DTASOF></LEDGERBAL></STMTRS></STMTTRNRS>\n`,
+  },
+  row: (t, date, today) => {
+    const credit = t.category === 'income';
+    return `<STMTTRN><TRNTYPE>${credit ? 'CREDIT' : 'DEBIT'}</TRNTYPE>` +
+      `<DTPOSTED>${ofxDate(date || today)}</DTPOSTED>` +
+      `<TRNAMT>${credit ? '' : '-'}${t.amount.toFixed(2)}</TRNAMT>` +
+      `<FITID>${xml(t.id)}</FITID><NAME>${xml(t.description.slice(0, 32))}</NAME>` +
+      `<MEMO>${t.isRiba ? 'Riba' : 'Halal'}: ${xml(t.category)}</MEMO></STMTTRN>\n`;
+  },
+  footer: () => '</BANKMSGSRSV1>\n</OFX>\n',
+};
+
+export const REPORT_FORMATS: Record<ExportFormat, ReportFormat> = { csv, jsonl, ofx };
@@ -0,0 +1,153 @@
+// resultCache.ts
+// Content-addressed cache of statement results, so re-uploading a file skips extraction
+//
+// Entries are keyed by the SHA-256 of the file's bytes (and, for images, the
+// OCR languages) and hold what the workers extracted (lines per page, or mapped CSV rows) plus the file as
+// statement.ts classified it. Classification is tagged with the rule set and
+// classifier version: when either changes, the cached lines are classified
+// again and no PDF parsing or OCR is repeated. Entries are evicted least
+// recently used first once their estimated size passes CACHE_BUDGET.
+
+import { RULESET_VERSION } from './rules/compiled';
+import { CLASSIFIER_VERSION } from './statement';
+import type { ClassifiedFile, StatementStream } from './statement';
+import type { CsvRow } from './csvColumns';
+import { RESULTS, RESULT_USAGE, complete, openStore, request } from './store';
+
+// Bump when processWorker.ts or OCR would extract the same bytes differently
+const EXTRACT_VERSION = 1;
+const CACHE_BUDGET = 64 * 1024 * 1024; // estimated bytes over all entries
+const MAX_ENTRY_SIZE = 16 * 1024 * 1024; // larger files are not cached
+
+const CLASSIFICATION = `${RULESET_VERSION}/${CLASSIFIER_VERSION}`;
+
+export type ExtractedPage =
+  | { page: number; lines: string[] }
+  | { page: number; rows: CsvRow[] };
+
+export interface CachedResult {
+  hash: string;
+  pages: ExtractedPage[];
+  classification: string; // rule set / classifier the file was classified with
+  classified: ClassifiedFile;
+}
+
+interface ResultUsage {
+  hash: string;
+  size: number;
+  lastUsed: number;
+}
+
+// Cache key for a file, or null where Web Crypto is unavailable (insecure
+// origins). What OCR reads from an image depends on the traineddata it ran
+// with, so an image's key also names its OCR languages (ocrLanguagesFor).
+export const fileDigest = async (file: File, ocrLanguages?: string): Promise<string | null> => {
+  if (!globalThis.crypto?.subtle) return null;
+  const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', await file.arrayBuffer()));
+  let hex = '';
+  for (const byte of digest) hex += byte.toString(16).padStart(2, '0');
+  return ocrLanguages ? `${EXTRACT_VERSION}:${hex}:${ocrLanguages}` : `${EXTRACT_VERSION}:${hex}`;
+};
+
+// Approximate bytes held by strings (UTF-16) plus a fixed cost per object
+const textSize = (text: string) => 2 * text.length + 32;
+const rowSize = (row: CsvRow) => textSize(row.text) + textSize(row.description) + textSize(row.date);
+
+const classifiedSize = (classified: ClassifiedFile) => {
+  let size = 0;
+  for (const { transactions } of classified.pages) {
+    for (const t of transactions) size += textSize(t.originalText) + textSize(t.description) + 160;
+  }
+  return size;
+};
+
+// Collects one file's extracted pages as they arrive, giving up (and letting
+// go of them) once they pass MAX_ENTRY_SIZE
+export const recordExtraction = () => {
+  let pages: ExtractedPage[] | null = [];
+  let size = 0;
+  const add = (page: ExtractedPage, bytes: number) => {
+    if (!pages) return;
+    size += bytes;
+    if (size > MAX_ENTRY_SIZE) pages = null;
+    else pages.push(page);
+  };
+  return {
+    lines(page: number, lines: string[]) {
+      add({ page, lines }, lines.reduce((n, line) => n + textSize(line), 0));
+    },
+    rows(page: number, rows: CsvRow[]) {
+      add({ page, rows }, rows.reduce((n, row) => n + rowSize(row), 0));
+    },
+    get pages() { return pages; },
+    get size() { return size; },
+  };
+};
+
+// Cached result for a file digest (marking it as just used); null on a miss
+// or when IndexedDB is unavailable
+export const getCachedResult = async (hash: string): Promise<CachedResult | null> => {
+  try {
+    const db = await openStore();
+    const tx = db.transaction([RESULTS, RESULT_USAGE], 'readwrite');
+    const usage = tx.objectStore(RESULT_USAGE);
+    const [entry, used] = await Promise.all([
+      request(tx.objectStore(RESULTS).get(hash) as IDBRequest<CachedResult | undefined>),
+      request(usage.get(hash) as IDBRequest<ResultUsage | undefined>),
+    ]);
+    if (entry && used) usage.put({ ...used, lastUsed: Date.now() });
+    await complete(tx);
+    return entry ?? null;
+  } catch (e) {
+    console.warn('Result cache unavailable:', e);
+    return null;
+  }
+};
+
+// Store a file's result, then evict the least recently used entries over budget
+export const putCachedResult = async (hash: string, pages: ExtractedPage[], pagesSize: number, classified: ClassifiedFile) => {
+  const size = pagesSize + classifiedSize(classified);
+  if (size > MAX_ENTRY_SIZE) return;
+  const db = await openStore();
+  const tx = db.transaction([RESULTS, RESULT_USAGE], 'readwrite');
+  const results = tx.objectStore(RESULTS);
+  const usage = tx.objectStore(RESULT_USAGE);
+  const entry: CachedResult = { hash, pages, classification: CLASSIFICATION, classified };
+  const used: ResultUsage = { hash, size, lastUsed: Date.now() };
+  results.put(entry);
+  usage.put(used);
+
+  // Oldest first; only the small usage records are read
+  const all = await request(usage.index('lastUsed').getAll() as IDBRequest<ResultUsage[]>);
+  let total = all.reduce((n, u) => n + u.size, 0);
+  for (const old of all) {
+    if (total <= CACHE_BUDGET) break;
+    if (old.hash === hash) continue;
+    results.delete(old.hash);
+    usage.delete(old.hash);
+    total -= old.size;
+  }
+  await complete(tx);
+};
+
+// Add a cached file to `stream`. With the current rules the classified pages
+// are restored as they are; otherwise the cached lines and rows are classified
+// again and the refreshed result is written back.
+export const restoreCachedResult = (stream: StatementStream, fileIndex: number, cached: CachedResult) => {
+  if (cached.classification === CLASSIFICATION) {
+    stream.restoreFile(fileIndex, cached.classified);
+    return;
+  }
+  let pagesSize = 0;
+  for (const page of cached.pages) {
+    if ('rows' in page) {
+      stream.addRows(fileIndex, page.page, page.rows);
+      pagesSize += page.rows.reduce((n, row) => n + rowSize(row), 0);
+    } else {
+      stream.addPage(fileIndex, page.page, page.lines);
+      pagesSize += page.lines.reduce((n, line) => n + textSize(line), 0);
+    }
+  }
+  putCachedResult(cached.hash, cached.pages, pagesSize, stream.exportFile(fileIndex))
+    .catch(err => console.warn('Could not update cached result:', err));
+};
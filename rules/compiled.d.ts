@@ -0,0 +1,20 @@
+// Generated by scripts/build_rules.py from rules/riba_rules.toml. Do not edit by hand.
+
+export type RuleCategory = "riba" | "utilities" | "income" | "uncategorized" | "shopping";
+export type RuleConfidence = "high" | "medium" | "low";
+export type CurrencyCode = "GBP" | "USD" | "EUR" | "INR" | "SAR" | "AED" | "MYR" | "IDR";
+
+export interface CategoryMatch {
+  readonly category: RuleCategory;
+  readonly isRiba: boolean;
+  readonly confidence: RuleConfidence;
+  readonly reason?: string;
+}
+
+export declare const RULESET_VERSION: string;
+export declare const CATEGORY_RULES: readonly CategoryMatch[];
+export declare const CURRENCY_CODES: readonly CurrencyCode[];
+export declare const detectCategory: (text: string) => CategoryMatch;
+export declare const countCurrencies: (text: string) => Record<CurrencyCode, number>;
+export declare const pickDominantCurrency: (counts: Record<CurrencyCode, number>) => CurrencyCode | null;
+export declare const dominantCurrency: (text: string) => CurrencyCode | null;
@@ -0,0 +1,73 @@
+// Generated by scripts/build_rules.py from rules/riba_rules.toml. Do not edit by hand.
+
+export const RULESET_VERSION = "1-b19081c12f9d";
+
+// Category rules in priority order; rule n is capture group n + 1 of CATEGORY_RE
+export const CATEGORY_RULES = [
+  Object.freeze({ category: "riba", isRiba: true, confidence: "high", reason: "Explicit Interest/Finance Charge" }), // riba_explicit
+  Object.freeze({ category: "riba", isRiba: true, confidence: "medium", reason: "Penalty/Late Fee" }), // riba_penalty
+  Object.freeze({ category: "riba", isRiba: true, confidence: "medium", reason: "Contains word 'interest'" }), // riba_interest
+  Object.freeze({ category: "utilities", isRiba: false, confidence: "low", reason: "Bank Service Fee" }), // service_fee
+  Object.freeze({ category: "income", isRiba: false, confidence: "high" }), // income
+  Object.freeze({ category: "uncategorized", isRiba: false, confidence: "medium", reason: "Ambiguous Reward/Profit" }), // shubhah
+];
+const DEFAULT_CATEGORY = Object.freeze({ category: "shopping", isRiba: false, confidence: "low" });
+const CATEGORY_RE = /((?:credit|gross|net|paid)\s*interest|int\.?\s*pd|fawaid|overdraft\s*interest|finance\s*charge|nsf\s*fee|non-sufficient\s*funds)|(late\s*fee|penalty|arrears|deficiency|past\s*due)|(interest)|(service\s*fee|maintenance\s*fee|annual\s*fee|monthly\s*fee)|(cashback|refund|return|deposit|transfer|salary|payroll)|(dividend|profit|bonus|reward)/gi;
+
+// Currency n is capture group n + 1 of CURRENCY_RE; on a tie the later one wins
+export const CURRENCY_CODES = Object.freeze(["GBP", "USD", "EUR", "INR", "SAR", "AED", "MYR", "IDR"]);
+const CURRENCY_RE = /(£|GBP)|(\$|USD)|(€|EUR)|(₹|[Ii][Nn][Rr]|[Rr][Ss]\.?|[Rr][Uu][Pp][Ee][Ee][Ss])|(SAR|ر.س)|(AED)|(MYR|RM)|(IDR|Rp)/g;
+
+// At every match position the first alternative wins. Restarting one character
+// later (instead of after the match) still finds rules that overlap it, so the
+// result is the same as testing each rule's own regex in order.
+export const detectCategory = (text) => {
+  let best = CATEGORY_RULES.length;
+  CATEGORY_RE.lastIndex = 0;
+  let m;
+  while (best > 0 && (m = CATEGORY_RE.exec(text)) !== null) {
+    for (let g = 1; g <= best; g++) {
+      if (m[g] !== undefined) {
+        best = g - 1;
+        break;
+      }
+    }
+    CATEGORY_RE.lastIndex = m.index + 1;
+  }
+  return best < CATEGORY_RULES.length ? CATEGORY_RULES[best] : DEFAULT_CATEGORY;
+};
+
+export const countCurrencies = (text) => {
+  const counts = {};
+  const lastEnd = [];
+  for (const code of CURRENCY_CODES) {
+    counts[code] = 0;
+    lastEnd.push(0);
+  }
+  CURRENCY_RE.lastIndex = 0;
+  let m;
+  while ((m = CURRENCY_RE.exec(text)) !== null) {
+    for (let g = 1; g <= CURRENCY_CODES.length; g++) {
+      const hit = m[g];
+      if (hit === undefined) continue;
+      // Matches of one currency never overlap, as with a per-currency /g scan
+      if (m.index >= lastEnd[g - 1]) {
+        counts[CURRENCY_CODES[g - 1]]++;
+        lastEnd[g - 1] = m.index + hit.length;
+      }
+      break;
+    }
+    CURRENCY_RE.lastIndex = m.index + 1;
+  }
+  return counts;
+};
+
+// Most frequent currency in counts (ties go to the later code), or null if all are zero.
+// Counts from countCurrencies() can be summed over chunks of text and passed in.
+export const pickDominantCurrency = (counts) => {
+  const best = CURRENCY_CODES.reduce((a, b) => (counts[a] > counts[b] ? a : b));
+  return counts[best] > 0 ? best : null;
+};
+
+// Most frequent currency marker, or null when the text has none
+export const dominantCurrency = (text) => pickDominantCurrency(countCurrencies(text));
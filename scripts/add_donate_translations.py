@@ -1,259 +0,0 @@
-#!/usr/bin/env python3
-# Quick script to add donate translations to remaining languages
-
-translations = {
-    "id": {
-        "search": '    cert_footer_generated: "Dibuat",\n  },',
-        "replace": '''    cert_footer_generated: "Dibuat",
-    donate_title: "Donasi & Memurnikan",
-    donate_subtitle: "Lengkapi pemurnian Anda dengan menyumbangkan jumlah Riba yang terdeteksi ke amal. Ini adalah tindakan pembersihan (Tathir), bukan untuk mendapat pahala.",
-    donate_guidelines_title: "Pedoman Penting",
-    donate_guideline_1_title: "Tanpa Niat Pahala:",
-    donate_guideline_1_desc: "Anda menghilangkan ketidakmurnian, bukan mendapat pahala. Jangan harapkan pahala.",
-    donate_guideline_2_title: "Manfaat Umum:",
-    donate_guideline_2_desc: "Berikan untuk pekerjaan umum (jalan, rumah sakit, sekolah) atau yang membutuhkan.",
-    donate_guideline_3_title: "Bertindak Segera:",
-    donate_guideline_3_desc: "Jangan simpan uang ini. Buang secepat mungkin.",
-    donate_orgs_title: "Organisasi Terverifikasi",
-    donate_other_ways_title: "Cara Memberi Lainnya",
-    donate_public_hospitals: "Rumah Sakit Umum",
-    donate_public_hospitals_desc: "Dukung perawatan medis bagi yang membutuhkan",
-    donate_education: "Lembaga Pendidikan",
-    donate_education_desc: "Danai sekolah dan program Islam",
-    donate_water: "Proyek Air Bersih",
-    donate_water_desc: "Sediakan akses air bersih",
-    donate_infrastructure: "Infrastruktur Umum",
-    donate_infrastructure_desc: "Jalan, jembatan, fasilitas komunitas",
-  },'''
-    },
-    "ms": {
-        "search": '    cert_footer_generated: "Dijana",\n  },',
-        "replace": '''    cert_footer_generated: "Dijana",
-    donate_title: "Derma & Sucikan",
-    donate_subtitle: "Lengkapkan penyucian anda dengan menderma jumlah Riba yang dikesan kepada kebajikan. Ini adalah tindakan pembersihan (Tathir), bukan untuk mendapat pahala.",
-    donate_guidelines_title: "Garis Panduan Penting",
-    donate_guideline_1_title: "Tiada Niat Pahala:",
-    donate_guideline_1_desc: "Anda menghilangkan kekotoran, bukan mendapat pahala. Jangan harap pahala.",
-    donate_guideline_2_title: "Faedah Awam:",
-    donate_guideline_2_desc: "Beri kepada kerja awam (jalan, hospital, sekolah) atau yang memerlukan.",
-    donate_guideline_3_title: "Bertindak Segera:",
-    donate_guideline_3_desc: "Jangan simpan wang ini. Buang secepat mungkin.",
-    donate_orgs_title: "Organisasi Disahkan",
-    donate_other_ways_title: "Cara Memberi Lain",
-    donate_public_hospitals: "Hospital Awam",
-    donate_public_hospitals_desc: "Sokong penjagaan perubatan untuk yang memerlukan",
-    donate_education: "Institusi Pendidikan",
-    donate_education_desc: "Dana sekolah dan program Islam",
-    donate_water: "Projek Air Bersih",
-    donate_water_desc: "Sediakan akses air bersih",
-    donate_infrastructure: "Infrastruktur Awam",
-    donate_infrastructure_desc: "Jalan, jambatan, kemudahan komuniti",
-  },'''
-    },
-    "zh": {
-        "search": '    cert_footer_generated: "生成时间",\n  },',
-        "replace": '''    cert_footer_generated: "生成时间",
-    donate_title: "捐赠并净化",
-    donate_subtitle: "通过捐赠检测到的利瓦金额来完成您的净化。这是一种净化行为（Tathir），而不是为了获得回报。",
-    donate_guidelines_title: "重要指南",
-    donate_guideline_1_title: "不求回报：",
-    donate_guideline_1_desc: "您是在去除不洁，而不是赚取回报。不要期待回报。",
-    donate_guideline_2_title: "公益事业：",
-    donate_guideline_2_desc: "捐给公共工程（道路、医院、学校）或有需要的人。",
-    donate_guideline_3_title: "立即行动：",
-    donate_guideline_3_desc: "不要持有这笔钱。尽快处理掉。",
-    donate_orgs_title: "经过验证的组织",
-    donate_other_ways_title: "其他捐赠方式",
-    donate_public_hospitals: "公立医院",
-    donate_public_hospitals_desc: "支持为有需要者提供医疗服务",
-    donate_education: "教育机构",
-    donate_education_desc: "资助伊斯兰学校和项目",
-    donate_water: "清洁水项目",
-    donate_water_desc: "提供清洁水资源",
-    donate_infrastructure: "公共基础设施",
-    donate_infrastructure_desc: "道路、桥梁、社区设施",
-  },'''
-    },
-    "de": {
-        "search": '    cert_footer_generated: "Erstellt",\n  },',
-        "replace": '''    cert_footer_generated: "Erstellt",
-    donate_title: "Spenden & Reinigen",
-    donate_subtitle: "Vervollständigen Sie Ihre Reinigung, indem Sie den erkannten Riba-Betrag für wohltätige Zwecke spenden. Dies ist eine Reinigungshandlung (Tathir), nicht um Belohnung zu erhalten.",
-    donate_guidelines_title: "Wichtige Richtlinien",
-    donate_guideline_1_title: "Keine Sawab-Absicht:",
-    donate_guideline_1_desc: "Sie entfernen Unreinheit, verdienen keine Belohnung. Erwarten Sie keine Sawab.",
-    donate_guideline_2_title: "Öffentlicher Nutzen:",
-    donate_guideline_2_desc: "Geben Sie für öffentliche Arbeiten (Straßen, Krankenhäuser, Schulen) oder Bedürftige.",
-    donate_guideline_3_title: "Sofort handeln:",
-    donate_guideline_3_desc: "Behalten Sie dieses Geld nicht. Entsorgen Sie es so schnell wie möglich.",
-    donate_orgs_title: "Verifizierte Organisationen",
-    donate_other_ways_title: "Andere Wege zu geben",
-    donate_public_hospitals: "Öffentliche Krankenhäuser",
-    donate_public_hospitals_desc: "Unterstützen Sie medizinische Versorgung für Bedürftige",
-    donate_education: "Bildungseinrichtungen",
-    donate_education_desc: "Finanzieren Sie islamische Schulen und Programme",
-    donate_water: "Trinkwasserprojekte",
-    donate_water_desc: "Zugang zu sauberem Wasser bereitstellen",
-    donate_infrastructure: "Öffentliche Infrastruktur",
-    donate_infrastructure_desc: "Straßen, Brücken, Gemeinschaftseinrichtungen",
-  },'''
-    },
-    "ru": {
-        "search": '    cert_footer_generated: "Создан",\n  },',
-        "replace": '''    cert_footer_generated: "Создан",
-    donate_title: "Пожертвовать и очистить",
-    donate_subtitle: "Завершите очищение, пожертвовав обнаруженную сумму риба на благотворительность. Это акт очищения (Tathir), а не для получения вознаграждения.",
-    donate_guidelines_title: "Важные рекомендации",
-    donate_guideline_1_title: "Без намерения Савab:",
-    donate_guideline_1_desc: "Вы удаляете нечистоту, а не зарабатываете награду. Не ожидайте Sawab.",
-    donate_guideline_2_title: "Общественная польза:",
-    donate_guideline_2_desc: "Давайте на общественные работы (дороги, больницы, школы) или нуждающимся.",
-    donate_guideline_3_title: "Действуйте немедленно:",
-    donate_guideline_3_desc: "Не держите эти деньги. Избавьтесь как можно скорее.",
-    donate_orgs_title: "Проверенные организации",
-    donate_other_ways_title: "Другие способы помочь",
-    donate_public_hospitals: "Государственные больницы",
-    donate_public_hospitals_desc: "Поддержите медицинскую помощь нуждающимся",
-    donate_education: "Образовательные учреждения",
-    donate_education_desc: "Финансируйте исламские школы и программы",
-    donate_water: "Проекты чистой воды",
-    donate_water_desc: "Обеспечьте доступ к чистой воде",
-    donate_infrastructure: "Общественная инфраструктура",
-    donate_infrastructure_desc: "Дороги, мосты, общественные объекты",
-  },'''
-    },
-    "nl": {
-        "search": '    cert_footer_generated: "Gegenereerd",\n  },',
-        "replace": '''    cert_footer_generated: "Gegenereerd",
-    donate_title: "Doneren & Zuiveren",
-    donate_subtitle: "Voltooi je zuivering door het gedetecteerde Riba-bedrag aan liefdadigheid te doneren. Dit is een zuiveringshandeling (Tathir), niet voor beloning.",
-    donate_guidelines_title: "Belangrijke richtlijnen",
-    donate_guideline_1_title: "Geen Sawab-intentie:",
-    donate_guideline_1_desc: "Je verwijdert onzuiverheid, verdient geen beloning. Verwacht geen Sawab.",
-    donate_guideline_2_title: "Publiek voordeel:",
-    donate_guideline_2_desc: "Geef aan openbare werken (wegen, ziekenhuizen, scholen) of behoeftigen.",
-    donate_guideline_3_title: "Handel onmiddellijk:",
-    donate_guideline_3_desc: "Bewaar dit geld niet. Verwijder het zo snel mogelijk.",
-    donate_orgs_title: "Geverifieerde organisaties",
-    donate_other_ways_title: "Andere manieren om te geven",
-    donate_public_hospitals: "Openbare ziekenhuizen",
-    donate_public_hospitals_desc: "Ondersteun medische zorg voor behoeftigen",
-    donate_education: "Onderwijsinstellingen",
-    donate_education_desc: "Financier islamitische scholen en programma's",
-    donate_water: "Schoon water projecten",
-    donate_water_desc: "Bied toegang tot schoon water",
-    donate_infrastructure: "Openbare infrastructuur",
-    donate_infrastructure_desc: "Wegen, bruggen, gemeenschapsvoorzieningen",
-  },'''
-    },
-    "he": {
-        "search": '    cert_footer_generated: "נוצר",\n  },',
-        "replace": '''    cert_footer_generated: "נוצר",
-    donate_title: "לתרום ולטהר",
-    donate_subtitle: "השלם את הטיהור שלך על ידי תרומת סכום הריבא שזוהה לצדקה. זהו מעשה ניקוי (Tathir), לא כדי לזכות בשכר.",
-    donate_guidelines_title: "הנחיות חשובות",
-    donate_guideline_1_title: "ללא כוונת שכר:",
-    donate_guideline_1_desc: "אתה מסיר טומאה, לא זוכה בשכר. אל תצפה לשכר.",
-    donate_guideline_2_title: "תועלת ציבורית:",
-    donate_guideline_2_desc: "תן לעבודות ציבוריות (כבישים, בתי חולים, בתי ספר) או לנזקקים.",
-    donate_guideline_3_title: "פעל מיד:",
-    donate_guideline_3_desc: "אל תשמור כסף זה. סלק אותו בהקדם האפשרי.",
-    donate_orgs_title: "ארגונים מאומתים",
-    donate_other_ways_title: "דרכים אחרות לתת",
-    donate_public_hospitals: "בתי חולים ציבוריים",
-    donate_public_hospitals_desc: "תמוך בטיפול רפואי לנזקקים",
-    donate_education: "מוסדות חינוך",
-    donate_education_desc: "מימון בתי ספר ותוכניות אסלאמיות",
-    donate_water: "פרויקטי מים נקיים",
-    donate_water_desc: "ספק גישה למים נקיים",
-    donate_infrastructure: "תשתית ציבורית",
-    donate_infrastructure_desc: "כבישים, גשרים, מתקני קהילה",
-  },'''
-    },
-    "tr": {
-        "search": '    cert_footer_generated: "Oluşturuldu",\n  },',
-        "replace": '''    cert_footer_generated: "Oluşturuldu",
-    donate_title: "Bağışla ve Arındır",
-    donate_subtitle: "Tespit edilen Riba miktarını hayır kurumlarına bağışlayarak arınmanızı tamamlayın. Bu bir temizleme eylemidir (Tathir), ödül kazanmak için değil.",
-    donate_guidelines_title: "Önemli Yönergeler",
-    donate_guideline_1_title: "Sevap Niyeti Yok:",
-    donate_guideline_1_desc: "Kirliği gideriyorsunuz, ödül kazanmıyorsunuz. Sevap beklemeyin.",
-    donate_guideline_2_title: "Kamu Yararı:",
-    donate_guideline_2_desc: "Kamu işlerine (yollar, hastaneler, okullar) veya ihtiyaç sahiplerine verin.",
-    donate_guideline_3_title: "Hemen Harekete Geçin:",
-    donate_guideline_3_desc: "Bu parayı tutmayın. En kısa sürede bertaraf edin.",
-    donate_orgs_title: "Doğrulanmış Kuruluşlar",
-    donate_other_ways_title: "Vermenin Diğer Yolları",
-    donate_public_hospitals: "Kamu Hastaneleri",
-    donate_public_hospitals_desc: "İhtiyaç sahipleri için tıbbi bakımı destekleyin",
-    donate_education: "Eğitim Kurumları",
-    donate_education_desc: "İslami okulları ve programları fonlayın",
-    donate_water: "Temiz Su Projeleri",
-    donate_water_desc: "Temiz su erişimi sağlayın",
-    donate_infrastructure: "Kamu Altyapısı",
-    donate_infrastructure_desc: "Yollar, köprüler, topluluk tesisleri",
-  },'''
-    },
-    "bs": {
-        "search": '    cert_footer_generated: "Generisan",\n  },',
-        "replace": '''    cert_footer_generated: "Generisan",
-    donate_title: "Doniraj i očisti",
-    donate_subtitle: "Dovršite svoje prečišćavanje doniranjem otkrivenog iznosa Riba dobrotvornim organizacijama. Ovo je čin čišćenja (Tathir), ne za zarađivanje nagrade.",
-    donate_guidelines_title: "Važne smjernice",
-    donate_guideline_1_title: "Bez namjere Sawab:",
-    donate_guideline_1_desc: "Uklanjate nečistoću, ne zarađujete nagradu. Ne očekujte Sawab.",
-    donate_guideline_2_title: "Javna korist:",
-    donate_guideline_2_desc: "Donirajte za javne radove (puteve, bolnice, škole) ili potrebite.",
-    donate_guideline_3_title: "Djelujte odmah:",
-    donate_guideline_3_desc: "Ne držite ovaj novac. Odložite ga što prije.",
-    donate_orgs_title: "Provjerene organizacije",
-    donate_other_ways_title: "Drugi načini davanja",
-    donate_public_hospitals: "Javne bolnice",
-    donate_public_hospitals_desc: "Podržite medicinsku njegu za potrebite",
-    donate_education: "Obrazovne institucije",
-    donate_education_desc: "Finansirajte islamske škole i programe",
-    donate_water: "Projekti čiste vode",
-    donate_water_desc: "Pružite pristup čistoj vodi",
-    donate_infrastructure: "Javna infrastruktura",
-    donate_infrastructure_desc: "Putevi, mostovi, objekti zajednice",
-  },'''
-    },
-    "sq": {
-        "search": '    cert_footer_generated: "Gjeneruar",\n  },',
-        "replace": '''    cert_footer_generated: "Gjeneruar",
-    donate_title: "Dhuro & Pastro",
-    donate_subtitle: "Plotëso pastrimin tënd duke dhuruar shumën e Riba-s së zbuluar në bamirësi. Ky është një akt pastrimi (Tathir), jo për të fituar shpërblim.",
-    donate_guidelines_title: "Udhëzime të Rëndësishme",
-    donate_guideline_1_title: "Pa Qëllim Savab:",
-    donate_guideline_1_desc: "Po largon papastërtinë, jo duke fituar shpërblim. Mos prit Savab.",
-    donate_guideline_2_title: "Përfitim Publik:",
-    donate_guideline_2_desc: "Jep për punë publike (rrugë, spitale, shkolla) ose për ata në nevojë.",
-    donate_guideline_3_title: "Vepro Menjëherë:",
-    donate_guideline_3_desc: "Mos e mbaj këtë para. Hidhja sa më shpejt që të jetë e mundur.",
-    donate_orgs_title: "Organizata të Verifikuara",
-    donate_other_ways_title: "Mënyra të Tjera për të Dhuruar",
-    donate_public_hospitals: "Spitale Publike",
-    donate_public_hospitals_desc: "Mbështet kujdesin mjekësor për ata në nevojë",
-    donate_education: "Institucione Arsimore",
-    donate_education_desc: "Financo shkollat dhe programet islame",
-    donate_water: "Projekte Uji të Pastër",
-    donate_water_desc: "Sigurojë akses në ujë të pastër",
-    donate_infrastructure: "Infrastrukturë Publike",
-    donate_infrastructure_desc: "Rrugë, ura, objekteve komunitare",
-  },'''
-    }
-}
-
-# Read the file
-with open('translations.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Apply all replacements
-for lang, trans in translations.items():
-    content = content.replace(trans['search'], trans['replace'])
-
-# Write back
-with open('translations.ts', 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("Added donate translations to all remaining languages!")
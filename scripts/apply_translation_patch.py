@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# Apply declarative translation patches to translations.ts in one pass.
+#
+# A patch file (JSON, TOML, or YAML if PyYAML is installed) looks like:
+#
+#   {
+#     "description": "Add donate_here to all languages",
+#     "after": "donate_food_desc",
+#     "overwrite": false,
+#     "languages": {
+#       "fr": { "donate_here": "Faire un don ici" },
+#       "ar": { "donate_here": "تبرع هنا" }
+#     }
+#   }
+#
+# "after" is the key new entries are inserted after; it can also be a
+# { lang: key } map when the anchor differs per language. Keys that already
+# exist are replaced in place unless "overwrite" is false, in which case only
+# missing keys are added.
+#
+# Usage:
+#   python3 scripts/apply_translation_patch.py scripts/patches/*.json
+#   python3 scripts/apply_translation_patch.py --check patch.json   # CI: exit 1 if it would change anything
+
+import argparse
+import json
+import sys
+import time
+import tomllib
+from pathlib import Path
+
+from translations_index import TRANSLATIONS_PATH, TranslationsFile
+
+
+def load_patch(path: Path) -> dict:
+    suffix = path.suffix.lower()
+    if suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            patch = json.load(f)
+    elif suffix == '.toml':
+        with open(path, 'rb') as f:
+            patch = tomllib.load(f)
+    elif suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            sys.exit(f"❌ {path.name}: YAML patches need PyYAML (pip install pyyaml)")
+        with open(path, 'r', encoding='utf-8') as f:
+            patch = yaml.safe_load(f)
+    else:
+        sys.exit(f"❌ {path.name}: unsupported patch format (use .json, .toml or .yaml)")
+
+    if not isinstance(patch, dict) or not isinstance(patch.get('languages'), dict):
+        sys.exit(f"❌ {path.name}: patch must have a 'languages' mapping of language -> key -> text")
+    return patch
+
+
+def apply_patch(tf: TranslationsFile, patch: dict, stats: dict[str, dict]):
+    """Queue every key of one patch on the index, accumulating per-language counts.
+
+    Nothing is written here: the queued edits are applied to the text in one
+    pass by tf.render(), so the time spent is reported once, in main().
+    """
+    after = patch.get('after')
+    overwrite = patch.get('overwrite', True)
+
+    for lang, keys in patch['languages'].items():
+        anchor = after.get(lang) if isinstance(after, dict) else after
+        changed = tf.upsert_many(lang, list(keys.items()), after=anchor, overwrite=overwrite)
+        lang_stats = stats.setdefault(lang, {'keys': 0, 'changed': 0})
+        lang_stats['keys'] += len(keys)
+        lang_stats['changed'] += changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply translation patch files to translations.ts')
+    parser.add_argument('patches', nargs='+', type=Path, help='.json / .toml / .yaml patch files')
+    parser.add_argument('--file', type=Path, default=TRANSLATIONS_PATH, help='translations.ts to patch')
+    parser.add_argument('--check', action='store_true', help='do not write; exit 1 if anything would change')
+    parser.add_argument('--dry-run', action='store_true', help='do not write; just report')
+    args = parser.parse_args()
+
+    total_start = time.perf_counter()
+    start = time.perf_counter()
+    tf = TranslationsFile.load(args.file)
+    parse_seconds = time.perf_counter() - start
+
+    stats: dict[str, dict] = {}
+    for path in args.patches:
+        try:
+            apply_patch(tf, load_patch(path), stats)
+        except KeyError as e:
+            sys.exit(f"❌ {path.name}: {e.args[0]}")
+
+    start = time.perf_counter()
+    text = tf.render()
+    render_seconds = time.perf_counter() - start
+
+    print(f"{'lang':<6}{'keys':>6}{'changed':>9}")
+    for lang, s in stats.items():
+        print(f"{lang:<6}{s['keys']:>6}{s['changed']:>9}")
+    total_changed = sum(s['changed'] for s in stats.values())
+    print(f"\nparse {parse_seconds * 1000:.1f} ms, apply (render) {render_seconds * 1000:.1f} ms")
+
+    if args.check:
+        if total_changed:
+            sys.exit(f"❌ {total_changed} key(s) out of date in {args.file.name}")
+        print("✅ translations.ts is up to date")
+        return
+    if args.dry_run or not total_changed:
+        print(f"{total_changed} key(s) would change" if args.dry_run else "✅ Nothing to change")
+        return
+
+    start = time.perf_counter()
+    with open(args.file, 'w', encoding='utf-8') as f:
+        f.write(text)
+    write_seconds = time.perf_counter() - start
+    print(f"write {write_seconds * 1000:.1f} ms")
+    print(f"✅ {total_changed} key(s) changed in {(time.perf_counter() - total_start) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+// Benchmark the compiled rule matcher against the per-regex rules it replaced.
+//
+// Builds a seeded 100k-line synthetic statement, checks that both versions
+// agree on every line, then reports lines/s for category detection and MB/s
+// for the currency vote. Run `npm run rules` first if the table changed.
+//
+// Usage:
+//   node scripts/bench_rules.mjs [lines]
+
+import { detectCategory, countCurrencies } from '../rules/compiled.js';
+
+const LINES = Number(process.argv[2]) || 100_000;
+const ROUNDS = 5;
+
+// --- Previous implementation (index.tsx before the rule table) ---
+
+const legacyDetectCategory = (text) => {
+  const lower = text.toLowerCase();
+  if (/(?:credit|gross|net|paid)\s*interest|int\.?\s*pd|fawaid|overdraft\s*interest|finance\s*charge|nsf\s*fee|non-sufficient\s*funds/i.test(lower)) {
+    return { category: 'riba', isRiba: true, confidence: 'high', reason: "Explicit Interest/Finance Charge" };
+  }
+  if (/late\s*fee|penalty|arrears|deficiency|past\s*due/i.test(lower)) {
+    return { category: 'riba', isRiba: true, confidence: 'medium', reason: "Penalty/Late Fee" };
+  }
+  if (/interest/i.test(lower)) {
+    return { category: 'riba', isRiba: true, confidence: 'medium', reason: "Contains word 'interest'" };
+  }
+  if (/service\s*fee|maintenance\s*fee|annual\s*fee|monthly\s*fee/i.test(lower)) {
+    return { category: 'utilities', isRiba: false, confidence: 'low', reason: "Bank Service Fee" };
+  }
+  if (/cashback|refund|return|deposit|transfer|salary|payroll/i.test(lower)) {
+    return { category: 'income', isRiba: false, confidence: 'high' };
+  }
+  if (/dividend|profit|bonus|reward/i.test(lower)) {
+    return { category: 'uncategorized', isRiba: false, confidence: 'medium', reason: "Ambiguous Reward/Profit" };
+  }
+  return { category: 'shopping', isRiba: false, confidence: 'low' };
+};
+
+const legacyCountCurrencies = (fullText) => ({
+  'GBP': (fullText.match(/£|GBP/g) || []).length,
+  'USD': (fullText.match(/\$|USD/g) || []).length,
+  'EUR': (fullText.match(/€|EUR/g) || []).length,
+  'INR': (fullText.match(/₹|INR|Rs\.?|Rupees/gi) || []).length,
+  'SAR': (fullText.match(/SAR|ر.س/g) || []).length,
+  'AED': (fullText.match(/AED/g) || []).length,
+  'MYR': (fullText.match(/MYR|RM/g) || []).length,
+  'IDR': (fullText.match(/IDR|Rp/g) || []).length,
+});
+
+// --- Synthetic statement ---
+
+// mulberry32: small seeded PRNG so every run scans the same text
+const rng = (seed) => () => {
+  seed = (seed + 0x6D2B79F5) | 0;
+  let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+  t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+};
+
+const DESCRIPTIONS = [
+  'POS PURCHASE TESCO STORES 2231', 'AMAZON MKTPLACE PMTS', 'DIRECT DEBIT BRITISH GAS', 'UBER *TRIP HELP.UBER.COM',
+  'SALARY ACME LTD', 'TRANSFER TO SAVINGS', 'CREDIT INTEREST', 'Overdraft Interest Charged', 'LATE FEE',
+  'MONTHLY FEE', 'Refund - Order 88213', 'Cashback Reward', 'DIVIDEND VANGUARD', 'Finance charge on purchases',
+  'CARD PAYMENT STARBUCKS', 'ATM WITHDRAWAL', 'NSF FEE', 'Int. Pd', 'Past due amount', 'Deposit',
+  'Netflix.com', 'Spotify P0A1B2', 'Annual fee', 'Payroll ABC Corp', 'Grocery Outlet', 'Fawaid Bank Credit',
+];
+const CURRENCIES = ['£', 'GBP', '$', 'USD', '€', 'EUR', 'Rs.', '₹', 'SAR', 'AED', 'RM', 'Rp', ''];
+
+const buildStatement = (count) => {
+  const rand = rng(42);
+  const pick = (list) => list[Math.floor(rand() * list.length)];
+  const lines = [];
+  for (let i = 0; i < count; i++) {
+    const day = String(1 + Math.floor(rand() * 28)).padStart(2, '0');
+    const month = String(1 + Math.floor(rand() * 12)).padStart(2, '0');
+    const amount = (rand() * 5000).toFixed(2);
+    lines.push(`${day}/${month}/2024 ${pick(DESCRIPTIONS)} ${pick(CURRENCIES)}${amount} ${(rand() * 90000).toFixed(2)}`);
+  }
+  return lines;
+};
+
+// --- Run ---
+
+const time = (fn) => {
+  let best = Infinity;
+  for (let r = 0; r < ROUNDS; r++) {
+    const start = performance.now();
+    fn();
+    best = Math.min(best, performance.now() - start);
+  }
+  return best;
+};
+
+const lines = buildStatement(LINES);
+const fullText = lines.join(' ');
+
+let mismatches = 0;
+for (const line of lines) {
+  const a = legacyDetectCategory(line);
+  const b = detectCategory(line);
+  if (a.category !== b.category || a.confidence !== b.confidence || a.reason !== b.reason) {
+    if (mismatches++ < 5) console.error('Category mismatch:', line, a, b);
+  }
+}
+const legacyCounts = legacyCountCurrencies(fullText);
+const counts = countCurrencies(fullText);
+for (const code of Object.keys(legacyCounts)) {
+  if (legacyCounts[code] !== counts[code]) {
+    mismatches++;
+    console.error(`Currency mismatch for ${code}: ${legacyCounts[code]} vs ${counts[code]}`);
+  }
+}
+if (mismatches) {
+  console.error(`❌ ${mismatches} mismatch(es); the compiled rules do not match the previous behaviour`);
+  process.exit(1);
+}
+
+let sink = 0;
+const categoryBefore = time(() => { for (const line of lines) sink += legacyDetectCategory(line).isRiba ? 1 : 0; });
+const categoryAfter = time(() => { for (const line of lines) sink += detectCategory(line).isRiba ? 1 : 0; });
+const currencyBefore = time(() => { sink += legacyCountCurrencies(fullText).USD; });
+const currencyAfter = time(() => { sink += countCurrencies(fullText).USD; });
+
+const mb = Buffer.byteLength(fullText) / 1e6;
+const row = (name, before, after, unit, size) =>
+  console.log(`${name.padEnd(10)} ${(size / before * 1000).toFixed(0).padStart(12)} ${(size / after * 1000).toFixed(0).padStart(12)} ${unit}   ${(before / after).toFixed(2)}x`);
+
+console.log(`✅ ${LINES} lines (${mb.toFixed(1)} MB), results identical; best of ${ROUNDS} rounds\n`);
+console.log(`${'stage'.padEnd(10)} ${'before'.padStart(12)} ${'after'.padStart(12)}`);
+row('category', categoryBefore, categoryAfter, 'lines/s', LINES);
+row('currency', currencyBefore, currencyAfter, 'MB/s   ', mb);
+if (sink === -1) console.log(sink);
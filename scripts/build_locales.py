@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# Compile translations.ts and data/blog_posts_*.ts into content-hashed JSON.
+#
+# translations.ts and data/blog_posts_*.ts stay the sources of truth (the
+# patch/validate scripts edit them). This writes:
+#   public/i18n/assets/<lang>.<hash>.json       UI strings per locale, as an array indexed by key id
+#   public/i18n/assets/blog-<lang>.<hash>.json  blog index per locale: every post without its body
+#   public/i18n/assets/blog-<lang>-<n>.<hash>.json  one post's body as rich text, fetched when it is opened
+#   public/i18n/manifest.json                   locale -> asset URLs, read by i18n.ts and sw.js
+#   locales/index.ts                            LANGUAGES, Language and the `K` key enum
+#   locales/keys.json                           key id registry (index = id)
+#
+# The hash is taken from each asset's bytes, so fixing one French string only
+# changes fr.<hash>.json; every other locale keeps its URL and stays cached.
+# The Knowledge Hub list only needs the blog index; each index entry carries
+# the URL of its body under `body`, so editing one article changes that body
+# file and the small index, and no other article.
+#
+# Article bodies and the RICH_KEYS strings use **bold** markup. They are
+# compiled to rich text: paragraphs (one per non-blank line) of runs, each a
+# plain string or a one-element list for bold text. React renders the runs as
+# text nodes, so the app never builds or sanitizes HTML for them.
+#
+# Key ids are append-only: a new key gets the next free id and a key removed
+# from `en` leaves a null hole, so an id never changes meaning. Adding a key
+# therefore does not touch locales that have not translated it yet (trailing
+# nulls are trimmed), and a cached array stays valid for newer app builds.
+#
+# Usage:
+#   python3 scripts/build_locales.py           # regenerate
+#   python3 scripts/build_locales.py --check   # CI: exit 1 if anything is stale
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from translations_index import ROOT, Arr, Obj, Str, TranslationsFile, find_export, tokenize
+
+TYPES_DIR = ROOT / 'locales'
+PUBLIC_DIR = ROOT / 'public' / 'i18n'
+ASSETS_DIR = PUBLIC_DIR / 'assets'
+BLOG_DIR = ROOT / 'data'
+KEYS_PATH = TYPES_DIR / 'keys.json'
+URL_PREFIX = '/i18n/assets/'
+HASH_LENGTH = 10
+HEADER = '// Generated by scripts/build_locales.py from translations.ts. Do not edit by hand.\n'
+# Keys whose translations use **bold**; stored as one rich paragraph (see rich())
+RICH_KEYS = {'meth_intro'}
+# Same match as the /\*\*(.*?)\*\*/g the app used to run (JS `.` stops at any line terminator)
+BOLD_RE = re.compile(r'\*\*([^\n\r\u2028\u2029]*?)\*\*')
+
+
+def ts_quote(value: str) -> str:
+    """Single-quoted TS string, matching the LANGUAGES table style."""
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def minify(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def read_languages(text: str) -> list[dict]:
+    languages = find_export(text, 'LANGUAGES', tokenize(text))
+    if not isinstance(languages, Arr):
+        raise SystemExit('❌ LANGUAGES is not an array literal')
+    rows = []
+    for item in languages.items:
+        if not isinstance(item, Obj):
+            raise SystemExit('❌ LANGUAGES entries must be object literals')
+        rows.append({p.key: p.value.value for p in item.props if isinstance(p.value, Str)})
+    return rows
+
+
+def read_blog_posts(lang: str) -> list[dict] | None:
+    path = BLOG_DIR / f'blog_posts_{lang}.ts'
+    if not path.exists():
+        return None
+    text = path.read_text(encoding='utf-8')
+    posts = find_export(text, f'BLOG_POSTS_{lang.upper()}', tokenize(text))
+    if not isinstance(posts, Arr):
+        raise SystemExit(f'❌ {path.name}: BLOG_POSTS_{lang.upper()} is not an array literal')
+    return [{p.key: p.value.value for p in post.props if isinstance(p.value, Str)}
+            for post in posts.items if isinstance(post, Obj)]
+
+
+def rich(text: str) -> list:
+    """One paragraph of **bold** markup -> runs: 'plain' or ['bold']."""
+    runs = []
+    pos = 0
+    for m in BOLD_RE.finditer(text):
+        if m.start() > pos:
+            runs.append(text[pos:m.start()])
+        if m.group(1):
+            runs.append([m.group(1)])
+        pos = m.end()
+    if pos < len(text):
+        runs.append(text[pos:])
+    return runs
+
+
+def rich_paragraphs(text: str) -> list[list]:
+    return [rich(line) for line in text.split('\n') if line.strip()]
+
+
+def assign_ids(en_keys: list[str]) -> list[str | None]:
+    """Extend the committed id registry with new `en` keys; retire removed ones."""
+    registry = json.loads(KEYS_PATH.read_text(encoding='utf-8')) if KEYS_PATH.exists() else []
+    live = set(en_keys)
+    registry = [k if k in live else None for k in registry]
+    known = set(registry)
+    registry += [k for k in en_keys if k not in known]
+    return registry
+
+
+def table_value(strings: dict[str, str], key: str | None):
+    value = strings.get(key) if key else None
+    return rich(value) if value and key in RICH_KEYS else value
+
+
+def dense_table(strings: dict[str, str], registry: list[str | None]) -> list:
+    table = [table_value(strings, k) for k in registry]
+    while table and table[-1] is None:
+        table.pop()
+    return table
+
+
+def hashed_asset(name: str, data) -> tuple[str, bytes]:
+    body = minify(data)
+    digest = hashlib.sha256(body).hexdigest()[:HASH_LENGTH]
+    return f'{name}.{digest}.json', body
+
+
+def render_types(languages: list[dict], registry: list[str | None]) -> str:
+    codes = [row['code'] for row in languages]
+    out = [HEADER, '\n']
+    out.append('export type Language = ' + ' | '.join(ts_quote(c) for c in codes) + ';\n')
+    out.append("export const LANGUAGES: { code: Language; name: string; flag: string; dir: 'ltr' | 'rtl'; fontClass: string }[] = [\n")
+    for row in languages:
+        fields = ', '.join(f'{k}: {ts_quote(v)}' for k, v in row.items())
+        out.append(f'  {{ {fields} }},\n')
+    out.append('];\n\n')
+    out.append('// Translation key ids; each locale asset is an array indexed by these\n')
+    out.append('export enum K {\n')
+    out.append(''.join(f'  {k} = {i},\n' for i, k in enumerate(registry) if k))
+    out.append('}\n')
+    out.append('export type TranslationKey = K;\n')
+    out.append('// Rich text: paragraphs of runs, each plain text or [bold text]\n')
+    out.append('export type RichRun = string | [string];\n')
+    out.append('export type RichParagraph = RichRun[];\n')
+    out.append('export type LocaleStrings = (string | RichParagraph | null)[];\n')
+    return ''.join(out)
+
+
+def build() -> dict[Path, bytes]:
+    tf = TranslationsFile.load()
+    outputs: dict[Path, bytes] = {}
+    manifest = {'version': 2, 'locales': {}}
+    registry = assign_ids(list(dict.fromkeys(e.key for e in tf.locale('en').entries)))
+
+    for lang in tf.languages:
+        # Last occurrence wins, matching what the JS object literal did at runtime
+        strings = {e.key: e.value for e in tf.locale(lang).entries}
+        name, body = hashed_asset(lang, dense_table(strings, registry))
+        outputs[ASSETS_DIR / name] = body
+        entry = {'strings': URL_PREFIX + name}
+
+        posts = read_blog_posts(lang)
+        if posts is not None:
+            index = []
+            for n, post in enumerate(posts):
+                name, body = hashed_asset(f'blog-{lang}-{n}', rich_paragraphs(post.get('content', '')))
+                outputs[ASSETS_DIR / name] = body
+                index.append({**{k: v for k, v in post.items() if k != 'content'}, 'body': URL_PREFIX + name})
+            name, body = hashed_asset(f'blog-{lang}', index)
+            outputs[ASSETS_DIR / name] = body
+            entry['blog'] = URL_PREFIX + name
+        manifest['locales'][lang] = entry
+
+    outputs[PUBLIC_DIR / 'manifest.json'] = (json.dumps(manifest, indent=2) + '\n').encode('utf-8')
+    outputs[KEYS_PATH] = (json.dumps(registry, indent=1) + '\n').encode('utf-8')
+    outputs[TYPES_DIR / 'index.ts'] = render_types(read_languages(tf.text), registry).encode('utf-8')
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile locale JSON assets from translations.ts and data/')
+    parser.add_argument('--check', action='store_true', help='exit 1 if the generated files are out of date')
+    args = parser.parse_args()
+
+    outputs = build()
+    stale = [p for p, body in outputs.items() if not p.exists() or p.read_bytes() != body]
+    existing = list(ASSETS_DIR.glob('*.json')) + list(TYPES_DIR.glob('*.ts'))
+    orphans = [p for p in existing if p not in outputs]
+
+    if args.check:
+        for p in stale + orphans:
+            print(f"❌ {p.relative_to(ROOT)} is out of date")
+        if stale or orphans:
+            sys.exit('Run python3 scripts/build_locales.py')
+        print("✅ Locale assets are up to date")
+        return
+
+    for p in stale:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(outputs[p])
+    for p in orphans:
+        p.unlink()
+    total = sum(len(b) for p, b in outputs.items() if p.parent == ASSETS_DIR)
+    print(f"✅ Wrote {len(stale)} file(s), removed {len(orphans)} ({total / 1024:.0f} KB of locale assets)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# Compile rules/riba_rules.toml into rules/compiled.js (+ compiled.d.ts).
+#
+# The category rules become one case-insensitive alternation with a capturing
+# group per rule, and the currency markers another, so detectCategory() and
+# countCurrencies() scan their input once instead of once per regex. The
+# output is plain JavaScript so Node benchmarks can import it without a
+# TypeScript toolchain; the .d.ts next to it types it for the app.
+#
+# Usage:
+#   python3 scripts/build_rules.py           # regenerate
+#   python3 scripts/build_rules.py --check   # CI: exit 1 if rules/ is stale
+
+import argparse
+import json
+import sys
+
+from ribascan.rules import CONFIDENCES, RULES_PATH, RuleError, load_rules
+from translations_index import ROOT
+
+OUT_DIR = ROOT / 'rules'
+HEADER = '// Generated by scripts/build_rules.py from rules/riba_rules.toml. Do not edit by hand.\n'
+
+
+def js(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def js_regex(source: str, flags: str) -> str:
+    # Escape '/' for the literal form; it cannot appear unescaped in a class here
+    return '/' + source.replace('\\/', '/').replace('/', '\\/') + '/' + flags
+
+
+def js_object(result: dict) -> str:
+    return 'Object.freeze({ ' + ', '.join(f'{k}: {js(v)}' for k, v in result.items()) + ' })'
+
+
+def render_js(rules) -> str:
+    out = [HEADER, '\n']
+    out.append(f'export const RULESET_VERSION = {js(rules.version)};\n\n')
+
+    out.append('// Category rules in priority order; rule n is capture group n + 1 of CATEGORY_RE\n')
+    out.append('export const CATEGORY_RULES = [\n')
+    for rule in rules.categories:
+        out.append(f'  {js_object(rule.result())}, // {rule.id}\n')
+    out.append('];\n')
+    out.append(f'const DEFAULT_CATEGORY = {js_object(rules.default.result())};\n')
+    out.append(f'const CATEGORY_RE = {js_regex(rules.category_source(), "gi")};\n\n')
+
+    out.append('// Currency n is capture group n + 1 of CURRENCY_RE; on a tie the later one wins\n')
+    out.append('export const CURRENCY_CODES = Object.freeze([' + ', '.join(js(c.code) for c in rules.currencies) + ']);\n')
+    out.append(f'const CURRENCY_RE = {js_regex(rules.currency_source(), "g")};\n\n')
+
+    out.append('''\
+// At every match position the first alternative wins. Restarting one character
+// later (instead of after the match) still finds rules that overlap it, so the
+// result is the same as testing each rule's own regex in order.
+export const detectCategory = (text) => {
+  let best = CATEGORY_RULES.length;
+  CATEGORY_RE.lastIndex = 0;
+  let m;
+  while (best > 0 && (m = CATEGORY_RE.exec(text)) !== null) {
+    for (let g = 1; g <= best; g++) {
+      if (m[g] !== undefined) {
+        best = g - 1;
+        break;
+      }
+    }
+    CATEGORY_RE.lastIndex = m.index + 1;
+  }
+  return best < CATEGORY_RULES.length ? CATEGORY_RULES[best] : DEFAULT_CATEGORY;
+};
+
+export const countCurrencies = (text) => {
+  const counts = {};
+  const lastEnd = [];
+  for (const code of CURRENCY_CODES) {
+    counts[code] = 0;
+    lastEnd.push(0);
+  }
+  CURRENCY_RE.lastIndex = 0;
+  let m;
+  while ((m = CURRENCY_RE.exec(text)) !== null) {
+    for (let g = 1; g <= CURRENCY_CODES.length; g++) {
+      const hit = m[g];
+      if (hit === undefined) continue;
+      // Matches of one currency never overlap, as with a per-currency /g scan
+      if (m.index >= lastEnd[g - 1]) {
+        counts[CURRENCY_CODES[g - 1]]++;
+        lastEnd[g - 1] = m.index + hit.length;
+      }
+      break;
+    }
+    CURRENCY_RE.lastIndex = m.index + 1;
+  }
+  return counts;
+};
+
+// Most frequent currency in counts (ties go to the later code), or null if all are zero.
+// Counts from countCurrencies() can be summed over chunks of text and passed in.
+export const pickDominantCurrency = (counts) => {
+  const best = CURRENCY_CODES.reduce((a, b) => (counts[a] > counts[b] ? a : b));
+  return counts[best] > 0 ? best : null;
+};
+
+// Most frequent currency marker, or null when the text has none
+export const dominantCurrency = (text) => pickDominantCurrency(countCurrencies(text));
+''')
+    return ''.join(out)
+
+
+def render_dts(rules) -> str:
+    union = lambda values: ' | '.join(js(v) for v in dict.fromkeys(values))
+    categories = [r.category for r in rules.categories] + [rules.default.category]
+    return HEADER + f'''
+export type RuleCategory = {union(categories)};
+export type RuleConfidence = {union(CONFIDENCES)};
+export type CurrencyCode = {union(c.code for c in rules.currencies)};
+
+export interface CategoryMatch {{
+  readonly category: RuleCategory;
+  readonly isRiba: boolean;
+  readonly confidence: RuleConfidence;
+  readonly reason?: string;
+}}
+
+export declare const RULESET_VERSION: string;
+export declare const CATEGORY_RULES: readonly CategoryMatch[];
+export declare const CURRENCY_CODES: readonly CurrencyCode[];
+export declare const detectCategory: (text: string) => CategoryMatch;
+export declare const countCurrencies: (text: string) => Record<CurrencyCode, number>;
+export declare const pickDominantCurrency: (counts: Record<CurrencyCode, number>) => CurrencyCode | null;
+export declare const dominantCurrency: (text: string) => CurrencyCode | null;
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile rules/riba_rules.toml into rules/compiled.js')
+    parser.add_argument('--check', action='store_true', help='exit 1 if the generated files are out of date')
+    args = parser.parse_args()
+
+    try:
+        rules = load_rules(RULES_PATH)
+    except RuleError as e:
+        sys.exit(f'❌ {RULES_PATH.relative_to(ROOT)}: {e}')
+
+    outputs = {OUT_DIR / 'compiled.js': render_js(rules), OUT_DIR / 'compiled.d.ts': render_dts(rules)}
+    stale = [p for p, text in outputs.items() if not p.exists() or p.read_text(encoding='utf-8') != text]
+
+    if args.check:
+        for p in stale:
+            print(f"❌ {p.relative_to(ROOT)} is out of date")
+        if stale:
+            sys.exit('Run python3 scripts/build_rules.py')
+        print("✅ Compiled rules are up to date")
+        return
+
+    for p in stale:
+        p.write_text(outputs[p], encoding='utf-8')
+    print(f"✅ {len(rules.categories)} category rule(s), {len(rules.currencies)} currencies "
+          f"(version {rules.version}); wrote {len(stale)} file(s)")
+
+
+if __name__ == '__main__':
+    main()
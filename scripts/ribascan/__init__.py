@@ -0,0 +1,21 @@
+# Server-side port of the app's statement scanner (processWorker.ts + statement.ts).
+#
+# Same input, same transactions: see pipeline.py for the detection rules,
+# readers.py for the supported dumps and batch.py for the process pool.
+# Entry point: python3 scripts/scan_statements.py
+
+from .batch import ScanResult, find_statements, scan_file, scan_many
+from .pipeline import (
+    detect_category,
+    detect_dominant_currency,
+    parse_transaction_amount,
+    process_lines,
+    process_page_text,
+)
+from .readers import read_lines
+
+__all__ = [
+    'ScanResult', 'find_statements', 'scan_file', 'scan_many',
+    'detect_category', 'detect_dominant_currency', 'parse_transaction_amount',
+    'process_lines', 'process_page_text', 'read_lines',
+]
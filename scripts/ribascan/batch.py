@@ -0,0 +1,74 @@
+# Scan many statements in parallel.
+#
+# One file is one statement, i.e. one processFiles([file]) call in the worker:
+# the dominant currency and the dedupe are per file. Files are spread over a
+# process pool (the regexes are CPU-bound, so threads would not scale) and
+# results are yielded as they finish.
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .jscompat import js_json_number
+from .pipeline import process_lines
+from .readers import SUPPORTED_SUFFIXES, read_lines
+
+
+@dataclass
+class ScanResult:
+    path: str
+    transactions: list[dict] = field(default_factory=list)
+    lines: int = 0
+    error: str | None = None
+    ms: float = 0.0
+
+    @property
+    def riba_count(self) -> int:
+        return sum(1 for t in self.transactions if t['isRiba'])
+
+    def to_json(self) -> str:
+        """One JSONL record; transactions serialise exactly like JSON.stringify() in the app."""
+        record = {'file': self.path}
+        if self.error:
+            record['error'] = self.error
+        else:
+            record['transactions'] = [{**t, 'amount': js_json_number(t['amount'])} for t in self.transactions]
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+
+def scan_file(path: str, today: str | None = None) -> ScanResult:
+    start = time.perf_counter()
+    try:
+        lines = read_lines(Path(path))
+        result = ScanResult(path, process_lines(lines, today), len(lines))
+    except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+        result = ScanResult(path, error=f'{type(e).__name__}: {e}')
+    result.ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+def find_statements(paths: list[str]) -> list[str]:
+    """Expand directories (recursively) into supported statement files, sorted."""
+    found = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            found += sorted(str(f) for f in p.rglob('*') if f.is_file() and f.suffix.lower() in SUPPORTED_SUFFIXES)
+        else:
+            found.append(str(p))
+    return found
+
+
+def scan_many(files: list[str], workers: int | None = None, today: str | None = None):
+    """Yield a ScanResult per file, in input order. workers=1 scans in-process."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(files) < 2:
+        for f in files:
+            yield scan_file(f, today)
+        return
+    # Small chunks keep the pool busy when file sizes are uneven
+    chunksize = max(1, min(32, len(files) // (workers * 8)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(scan_file, files, [today] * len(files), chunksize=chunksize)
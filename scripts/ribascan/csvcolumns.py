@@ -0,0 +1,156 @@
+# Port of csvColumns.ts: find the date, description and amount columns of a
+# CSV bank export and read rows through them.
+#
+# Mapped rows are dicts shaped like CsvRow ({date, description, amount, text});
+# pipeline.process_lines() classifies them like statement.ts addRows().
+
+import re
+import unicodedata
+
+from .jscompat import JS_S, js_trim
+from .pipeline import DATE_RE
+
+# Header keywords per role, best first (compared lowercased and without accents)
+HEADER_KEYWORDS = {
+    'date': [
+        'date', 'datum', 'fecha', 'tanggal', 'tarikh', 'tarih', 'buchungstag', 'posted',
+        'تاريخ', 'दिनांक', 'तारीख', 'তারিখ', 'дата', '日期', 'תאריך',
+    ],
+    'debit': [
+        'debit', 'withdrawal', 'paid out', 'money out', 'debet', 'soll', 'borc', 'afschrijving',
+        'مدين', 'नामे', 'डेबिट', 'дебет', 'списание', '支出', 'חובה',
+    ],
+    'credit': [
+        'credit', 'deposit', 'paid in', 'money in', 'kredit', 'haben', 'alacak', 'bijschrijving',
+        'دائن', 'जमा', 'क्रेडिट', 'кредит', 'зачисление', '收入', 'זכות',
+    ],
+    'amount': [
+        'amount', 'montant', 'betrag', 'bedrag', 'importe', 'jumlah', 'amaun', 'tutar', 'iznos', 'shuma',
+        'المبلغ', 'مبلغ', 'राशि', 'টাকা', 'сумма', '金额', 'סכום', 'value',
+    ],
+    'description': [
+        'description', 'details', 'narrative', 'memo', 'payee', 'merchant', 'particulars',
+        'libelle', 'omschrijving', 'verwendungszweck', 'beschreibung', 'keterangan', 'butiran',
+        'aciklama', 'acıklama', 'opis', 'pershkrim', 'البيان', 'الوصف', 'विवरण', 'বিবরণ',
+        'описание', 'назначение', '摘要', '描述', 'תיאור', 'reference', 'transaction', 'name',
+    ],
+}
+
+BALANCE_KEYWORDS = ['balance', 'saldo', 'solde', 'baki', 'bakiye', 'الرصيد', 'शेष', 'остаток', '余额', 'יתרה']
+
+ROLE_ORDER = ['date', 'debit', 'credit', 'amount', 'description']
+
+SAMPLE_ROWS = 50
+_ISO_DATE_RE = re.compile(r'\d{4}[./-]\d{1,2}[./-]\d{1,2}', re.ASCII)
+_CURRENCY_TEXT_RE = re.compile(r'[A-Za-z]{2,3}\.?|[$£€₹﷼]')
+_AMOUNT_CHARS_RE = re.compile(rf"(?:[0-9.,'()+-]|{JS_S})*\Z")
+_COMBINING_RE = re.compile('[\u0300-\u036f]')
+
+
+def _normalize_header(header: str) -> str:
+    return js_trim(_COMBINING_RE.sub('', unicodedata.normalize('NFD', header.lower())))
+
+
+def _cell(row: dict, field: str | None) -> str:
+    if field is None:
+        return ''
+    value = row.get(field)
+    if value is None:
+        return ''
+    return js_trim(','.join(value) if isinstance(value, list) else value)
+
+
+def _looks_like_date(value: str) -> bool:
+    return bool(_ISO_DATE_RE.match(value) or DATE_RE.search(value))
+
+
+def _looks_like_amount(value: str) -> bool:
+    return (bool(re.search('[0-9]', value)) and not _looks_like_date(value)
+            and bool(_AMOUNT_CHARS_RE.match(_CURRENCY_TEXT_RE.sub('', value))))
+
+
+def _js_number(s: str) -> float:
+    try:
+        return float(s)
+    except ValueError:
+        return float('nan')
+
+
+def parse_csv_amount(raw: str) -> float:
+    """Amount cell -> absolute value; see parseCsvAmount() for the separator rules."""
+    clean = re.sub(r'[^0-9.,]', '', raw)
+    if not re.search('[0-9]', clean):
+        return float('nan')
+    comma, dot = clean.rfind(','), clean.rfind('.')
+    if comma != -1 and dot != -1:
+        decimal = ',' if comma > dot else '.'
+        clean = clean.replace('.' if decimal == ',' else ',', '').replace(',', '.', 1)
+    elif comma != -1:
+        single = clean.find(',') == comma
+        clean = clean.replace(',', '.', 1) if single and len(clean) - comma - 1 != 3 else clean.replace(',', '')
+    elif dot != -1 and clean.find('.') != dot:
+        clean = clean.replace('.', '')
+    return _js_number(clean)
+
+
+def _match_rate(sample: list[dict], field: str, test) -> float:
+    filled = matched = 0
+    for row in sample:
+        value = _cell(row, field)
+        if not value:
+            continue
+        filled += 1
+        if test(value):
+            matched += 1
+    return matched / filled if filled else 0
+
+
+_ROLE_TEST = {
+    'date': _looks_like_date,
+    'debit': _looks_like_amount,
+    'credit': _looks_like_amount,
+    'amount': _looks_like_amount,
+    'description': None,
+}
+
+
+def detect_csv_columns(fields: list[str], rows: list[dict]) -> dict | None:
+    """Map header fields to roles, or None without a date column and an amount/debit/credit column."""
+    sample = rows[:SAMPLE_ROWS]
+    headers = [_normalize_header(f) for f in fields]
+    used: set[int] = set()
+    found: dict[str, str] = {}
+
+    for role in ROLE_ORDER:
+        test = _ROLE_TEST[role]
+        for keyword in HEADER_KEYWORDS[role]:
+            index = next((i for i, header in enumerate(headers)
+                          if i not in used and keyword in header
+                          and (role in ('date', 'description') or not any(kw in header for kw in BALANCE_KEYWORDS))
+                          and (not test or _match_rate(sample, fields[i], test) >= 0.5)), -1)
+            if index == -1:
+                continue
+            used.add(index)
+            found[role] = fields[index]
+            break
+
+    if 'date' not in found or not (found.get('amount') or found.get('debit') or found.get('credit')):
+        return None
+    return {role: found.get(role) for role in ('date', 'description', 'amount', 'debit', 'credit')}
+
+
+def read_csv_row(row: dict, columns: dict, text: str) -> dict:
+    """One row through its mapping; `text` is the row's flattened, trimmed cells."""
+    amount = float('nan')
+    for field in (columns['amount'], columns['debit'], columns['credit']):
+        if field is None:
+            continue
+        amount = parse_csv_amount(_cell(row, field))
+        if amount > 0:
+            break
+    return {
+        'date': _cell(row, columns['date']),
+        'description': _cell(row, columns['description']),
+        'amount': amount,
+        'text': text,
+    }
@@ -0,0 +1,88 @@
+# JavaScript string/number semantics needed to match the app's pipeline exactly.
+#
+# The app measures and slices strings in UTF-16 code units, trims with the
+# ECMAScript whitespace set and relies on object key order when bucketing PDF
+# rows and flattening CSV rows. Python differs on all of these for non-ASCII
+# input, so the pipeline goes through these helpers instead of len()/strip().
+
+import re
+
+# ECMAScript WhiteSpace + LineTerminator (String.prototype.trim, regex \s)
+JS_WHITESPACE = '\t\n\v\f\r \u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff'
+JS_S = '[' + re.escape(JS_WHITESPACE) + ']'
+
+_ARRAY_INDEX_RE = re.compile(r'0|[1-9][0-9]*')
+
+
+def js_len(s: str) -> int:
+    """String.prototype.length: UTF-16 code units, not code points."""
+    return len(s) + sum(1 for ch in s if ord(ch) > 0xFFFF)
+
+
+def js_trim(s: str) -> str:
+    return s.strip(JS_WHITESPACE)
+
+
+def js_substring(s: str, start: int, end: int) -> str:
+    """String.prototype.substring in UTF-16 units; a split pair keeps its lone surrogate."""
+    if js_len(s) == len(s):
+        return s[start:end]
+    units = s.encode('utf-16-le', 'surrogatepass')
+    return units[start * 2:end * 2].decode('utf-16-le', 'surrogatepass')
+
+
+def js_number_str(x: float) -> str:
+    """Number.prototype.toString() for finite numbers (e.g. 700 -> '700', 1e-7 -> '1e-7')."""
+    if x != x:
+        return 'NaN'
+    if x in (float('inf'), float('-inf')):
+        return 'Infinity' if x > 0 else '-Infinity'
+    if x == 0:
+        return '0'
+    if x < 0:
+        return '-' + js_number_str(-x)
+    # repr() gives the same shortest round-trip digits; only the layout differs
+    mantissa, _, exp = repr(float(x)).partition('e')
+    int_part, _, frac = mantissa.partition('.')
+    digits = int_part + frac
+    n = len(int_part) + int(exp or 0)
+    stripped = digits.lstrip('0')
+    n -= len(digits) - len(stripped)
+    digits = stripped.rstrip('0')
+    k = len(digits)
+    if k <= n <= 21:
+        return digits + '0' * (n - k)
+    if 0 < n <= 21:
+        return digits[:n] + '.' + digits[n:]
+    if -6 < n <= 0:
+        return '0.' + '0' * -n + digits
+    e = n - 1
+    sign = '+' if e >= 0 else '-'
+    head = digits if k == 1 else digits[0] + '.' + digits[1:]
+    return f'{head}e{sign}{abs(e)}'
+
+
+def js_parse_float(s: str) -> float:
+    """parseFloat() for the digit/dot strings the amount regex produces."""
+    try:
+        return float(s)
+    except ValueError:
+        return float('nan')
+
+
+def js_json_number(x: float):
+    """Value whose json.dumps() output equals JSON.stringify(x)."""
+    if x == int(x) and abs(x) < 1e21:
+        return int(x)
+    return x
+
+
+def is_array_index(key: str) -> bool:
+    return bool(_ARRAY_INDEX_RE.fullmatch(key)) and int(key) < 2 ** 32 - 1
+
+
+def js_key_order(keys):
+    """Object.keys() order: array-index keys ascending, then the rest in insertion order."""
+    keys = list(keys)
+    indices = sorted((k for k in keys if is_array_index(k)), key=int)
+    return indices + [k for k in keys if not is_array_index(k)]
@@ -0,0 +1,181 @@
+# Port of the statement pipeline: line extraction in processWorker.ts and
+# transaction parsing in statement.ts (CSV column mapping is in csvcolumns.py).
+#
+# Every function mirrors its TypeScript namesake, including its quirks (first
+# matching row bucket, ties in the currency vote, 80-unit descriptions), so a
+# statement scanned here yields the same transactions as in the browser. Keep
+# them in sync: a change to either file must be made here too. Category and
+# currency rules come from rules/riba_rules.toml, shared with the app. With no
+# currency marker at all the app guesses from the browser's timezone; here the
+# fallback is always USD.
+
+import bisect
+import random
+import re
+from datetime import datetime, timezone
+
+from .jscompat import JS_S, is_array_index, js_len, js_number_str, js_parse_float, js_substring, js_trim
+from .rules import compiled
+
+# JS regexes are ASCII-only for \d and \b and case-fold ASCII only; re.ASCII
+# matches that. \s is spelled out as the ECMAScript whitespace class.
+_FLAGS = re.IGNORECASE | re.ASCII
+
+Y_TOLERANCE = 4  # pixels
+
+# Per-line currency override, checked in this order (case-sensitive includes())
+LINE_CURRENCY_MARKERS = [
+    ('SAR', ('SAR',)),
+    ('AED', ('AED',)),
+    ('INR', ('INR', '₹')),
+    ('MYR', ('MYR', 'RM')),
+    ('IDR', ('IDR',)),
+    ('GBP', ('GBP', '£')),
+    ('EUR', ('EUR', '€')),
+    ('USD', ('$', 'USD')),
+]
+
+# Amounts need exactly two decimals: 1,234.56 or 1.234,56
+DECIMAL_AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})*\.\d{2})\b|(\d{1,3}(?:\.\d{3})*,\d{2})\b', re.ASCII)
+_LONG_NUMBER_RE = re.compile(r'\b\d{5,}\b', re.ASCII)
+
+_MONTHS = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+DATE_RE = re.compile(
+    rf'(?:\b\d{{1,2}}[./-]\d{{1,2}}[./-]\d{{2,4}}\b)'
+    rf'|(?:\b\d{{1,2}}{JS_S}+{_MONTHS}[a-z]*{JS_S}+\d{{2,4}})'
+    rf'|(?:\b{_MONTHS}[a-z]*{JS_S}+\d{{1,2}},?{JS_S}+\d{{4}})',
+    _FLAGS)
+
+_ID_ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def process_page_text(items: list[dict]) -> list[str]:
+    """Group pdf.js text items ({str, x, y}) into lines, top to bottom (see pdfText.ts)."""
+    anchors: list[float] = []  # ascending
+    row_ids: list[int] = []  # row_ids[k] is the row anchored at anchors[k]
+    rows: list[list[dict]] = []  # in creation order
+
+    for item in items:
+        y = item['y']
+        lo = bisect.bisect_right(anchors, y - Y_TOLERANCE)
+        best = -1
+        for k in range(max(0, lo - 1), min(len(anchors), lo + 3)):
+            if not abs(anchors[k] - y) < Y_TOLERANCE:
+                continue
+            if best == -1:
+                best = k
+                continue
+            # Object.keys() order: index-like keys first (ascending), then creation order
+            k_index, best_index = is_array_index(js_number_str(anchors[k])), is_array_index(js_number_str(anchors[best]))
+            if (k_index and not best_index) or (not k_index and not best_index and row_ids[k] < row_ids[best]):
+                best = k
+
+        if best != -1:
+            rows[row_ids[best]].append(item)
+        else:
+            at = bisect.bisect_left(anchors, y, lo)
+            anchors.insert(at, y)
+            row_ids.insert(at, len(rows))
+            rows.append([item])
+
+    return [' '.join(i['str'] for i in sorted(rows[row_ids[k]], key=lambda i: i['x']))
+            for k in range(len(anchors) - 1, -1, -1)]
+
+
+def detect_dominant_currency(text: str) -> str:
+    return compiled().dominant_currency(text) or 'USD'
+
+
+def detect_category(line: str) -> dict:
+    return compiled().detect_category(line)
+
+
+def parse_transaction_amount(line: str, date_str: str | None) -> float:
+    clean = line.replace(date_str, '', 1) if date_str else line
+    # Account numbers and bare years are never amounts
+    clean = _LONG_NUMBER_RE.sub('', clean)
+    match = DECIMAL_AMOUNT_RE.search(clean)
+    if not match:
+        return 0
+    raw = match.group(0)
+    if re.search(r',\d{2}\Z', raw):
+        return js_parse_float(raw.replace('.', '').replace(',', '.', 1))
+    return js_parse_float(raw.replace(',', ''))
+
+
+def line_currency(line: str, dominant: str) -> str:
+    for cur, markers in LINE_CURRENCY_MARKERS:
+        if any(m in line for m in markers):
+            return cur
+    return dominant
+
+
+def random_id() -> str:
+    return ''.join(random.choices(_ID_ALPHABET, k=9))
+
+
+def keep_line(text: str) -> bool:
+    return js_len(js_trim(text)) > 5
+
+
+def _transaction(date: str, description: str, amount: float, text: str, detected: dict, currency: str, page: int) -> dict:
+    txn = {
+        'id': random_id(),
+        'date': date,
+        'description': js_trim(js_substring(description, 0, 80)) or 'Transaction',
+        'amount': amount,
+        'originalText': text,
+        'isRiba': detected['isRiba'],
+        'currency': currency,
+        'category': detected['category'],
+        'confidence': detected['confidence'],
+    }
+    if 'reason' in detected:
+        txn['reason'] = detected['reason']
+    txn['page'] = page
+    return txn
+
+
+def process_lines(all_lines: list[tuple[str | dict, int]], today: str | None = None) -> list[dict]:
+    """Turn (text, page) lines into deduplicated transactions, as processFiles() does.
+
+    An entry may also be a mapped CSV row (see csvcolumns.py), classified like
+    statement.ts addRows(): date, amount and description from their columns.
+    """
+    dominant = detect_dominant_currency(' '.join(
+        entry['text'] if isinstance(entry, dict) else entry for entry, _ in all_lines))
+    today = today or datetime.now(timezone.utc).date().isoformat()
+
+    transactions = []
+    seen = set()
+    for entry, page in all_lines:
+        if isinstance(entry, dict):
+            line = entry['text']
+            if not entry['amount'] > 0:
+                continue
+            detected = detect_category(line)
+            if not (detected['isRiba'] or entry['date']):
+                continue
+            txn = _transaction(entry['date'] or today, entry['description'] or line, entry['amount'],
+                               line, detected, line_currency(line, dominant), page)
+        else:
+            line = entry
+            if js_len(line) < 5:
+                continue
+
+            detected = detect_category(line)
+            date_match = DATE_RE.search(line)
+            date_str = date_match.group(0) if date_match else None
+            amount = parse_transaction_amount(line, date_str)
+            if not amount > 0:
+                continue
+            if not (detected['isRiba'] or (date_match and js_len(line) > 15)):
+                continue
+            txn = _transaction(date_str or today, line, amount, line, detected, line_currency(line, dominant), page)
+
+        # Same key as dedupe.ts: first occurrence wins
+        key = (txn['description'], txn['amount'], txn['date'])
+        if key not in seen:
+            seen.add(key)
+            transactions.append(txn)
+    return transactions
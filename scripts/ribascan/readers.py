@@ -0,0 +1,159 @@
+# Turn statement files into the (text, page) lines processFiles() collects.
+#
+#   *.csv   parsed like Papa.parse(file, { header: true, skipEmptyLines: true });
+#           when csvcolumns maps the columns, entries are (row dict, page) instead
+#   *.json  pdf.js text dump: {"pages": [[{"str", "x", "y"}, ...], ...]}; items may
+#           also carry the raw getTextContent() "transform" instead of x/y
+#   *.txt   OCR text (Tesseract's data.text), all on page 1 like the worker
+
+import csv
+import io
+import itertools
+import json
+import sys
+from pathlib import Path
+
+from .csvcolumns import detect_csv_columns, read_csv_row
+from .jscompat import js_key_order, js_len, js_trim
+from .pipeline import keep_line, process_page_text
+
+SUPPORTED_SUFFIXES = ('.csv', '.json', '.txt')
+
+# Papa.parse's delimiter candidates, in its order
+PAPA_DELIMITERS = [',', '\t', '|', ';', '\x1e', '\x1f']
+PAPA_PREVIEW_ROWS = 10
+
+csv.field_size_limit(sys.maxsize)
+
+
+def read_text(path: Path) -> str:
+    # File.text(): UTF-8, BOM dropped, invalid bytes replaced
+    return path.read_bytes().decode('utf-8-sig', errors='replace')
+
+
+def _rows(text: str, delimiter: str):
+    # csv yields [] for a blank line where Papa yields ['']
+    for row in csv.reader(io.StringIO(text, newline=''), delimiter=delimiter, strict=False):
+        yield row or ['']
+
+
+def _is_empty(row: list[str]) -> bool:
+    return len(row) == 1 and row[0] == ''
+
+
+def guess_delimiter(text: str) -> str:
+    """Papa's guessDelimiter(): the most consistent candidate over the first 10 rows."""
+    best_delim, best_delta, max_fields = None, None, None
+    for delim in PAPA_DELIMITERS:
+        delta, total, empty, prev = 0, 0, 0, None
+        preview = list(itertools.islice(_rows(text, delim), PAPA_PREVIEW_ROWS))
+        for row in preview:
+            if _is_empty(row):
+                empty += 1
+                continue
+            total += len(row)
+            if prev is None:
+                prev = len(row)
+            elif len(row) > 0:
+                delta += abs(len(row) - prev)
+                prev = len(row)
+        rows = len(preview) - empty
+        avg = total / rows if rows else float('nan')
+        if ((best_delta is None or delta <= best_delta)
+                and (max_fields is None or avg > max_fields) and avg > 1.99):
+            best_delim, best_delta, max_fields = delim, delta, avg
+    return best_delim or ','
+
+
+def _dedupe_headers(headers: list[str]) -> list[str]:
+    """Papa 5.4+ renames repeated header names to name_1, name_2, ..."""
+    counts: dict[str, int] = {}
+    used = set(headers)
+    result = []
+    for header in headers:
+        if header not in counts:
+            counts[header] = 1
+            result.append(header)
+            continue
+        suffix = counts[header]
+        while f'{header}_{suffix}' in used:
+            suffix += 1
+        renamed = f'{header}_{suffix}'
+        used.add(renamed)
+        counts[header] += 1
+        result.append(renamed)
+    return result
+
+
+def _row_object(fields: list[str], row: list[str]) -> dict[str, object]:
+    # Build the row object the way Papa does
+    obj: dict[str, object] = {}
+    for j, value in enumerate(row):
+        field = fields[j] if j < len(fields) else '__parsed_extra'
+        if field == '__parsed_extra':
+            obj.setdefault(field, []).append(value)
+        elif field != '__proto__':
+            obj[field] = value
+    return obj
+
+
+def _row_text(obj: dict[str, object]) -> str:
+    # Object.values(row).join(' ')
+    values = [obj[k] for k in js_key_order(obj)]
+    return ' '.join(','.join(v) if isinstance(v, list) else v for v in values)
+
+
+def csv_lines(text: str) -> list[tuple[str | dict, int]]:
+    raw = list(_rows(text, guess_delimiter(text)))
+    if raw and not _is_empty(raw[0]):
+        raw[0] = _dedupe_headers(raw[0])
+    data = [row for row in raw if not _is_empty(row)]
+    if not data:
+        return []
+    fields, data = data[0], data[1:]
+    objects = [_row_object(fields, row) for row in data]
+
+    # The worker maps columns from its first chunk, which holds at least the sample
+    columns = detect_csv_columns(fields, objects)
+    lines = []
+    for obj in objects:
+        row_text = js_trim(_row_text(obj))
+        if columns:
+            if js_len(row_text) > 5:
+                lines.append((read_csv_row(obj, columns, row_text), 1))
+        elif keep_line(row_text):
+            lines.append((row_text, 1))
+    return lines
+
+
+def _item_xy(item: dict) -> dict:
+    if 'transform' in item:
+        return {'str': item['str'], 'x': item['transform'][4], 'y': item['transform'][5]}
+    return item
+
+
+def pdf_dump_lines(text: str) -> list[tuple[str, int]]:
+    dump = json.loads(text)
+    pages = dump['pages'] if isinstance(dump, dict) else dump
+    lines = []
+    for page_no, items in enumerate(pages, 1):
+        for line in process_page_text([_item_xy(i) for i in items]):
+            if keep_line(line):
+                lines.append((js_trim(line), page_no))
+    return lines
+
+
+def ocr_lines(text: str) -> list[tuple[str, int]]:
+    return [(js_trim(line), 1) for line in text.split('\n') if keep_line(line)]
+
+
+def read_lines(path: Path) -> list[tuple[str | dict, int]]:
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_SUFFIXES:
+        raise ValueError(f'unsupported file type: {path.name}')
+    text = read_text(path)
+    if suffix == '.csv':
+        return csv_lines(text)
+    if suffix == '.json':
+        return pdf_dump_lines(text)
+    return ocr_lines(text)
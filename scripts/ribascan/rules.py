@@ -0,0 +1,222 @@
+# Load and compile rules/riba_rules.toml.
+#
+# Each rule is a list of JavaScript regex fragments. Both targets get one
+# combined alternation per table, with one capturing group per rule:
+#   - scripts/build_rules.py emits it as JS (rules/compiled.js) for the app
+#   - CompiledRules turns it into a Python matcher for ribascan
+# A line is scanned once; at every match position the first alternative wins,
+# and the scan restarts one character later so an overlapping higher-priority
+# rule is still seen. The result equals testing each rule's regex in order.
+
+import hashlib
+import json
+import re
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+
+from .jscompat import JS_WHITESPACE
+
+RULES_PATH = Path(__file__).resolve().parent.parent.parent / 'rules' / 'riba_rules.toml'
+
+CATEGORIES = ('income', 'shopping', 'utilities', 'transfer', 'riba', 'uncategorized')
+CONFIDENCES = ('high', 'medium', 'low')
+
+# One regex token: escape (\uXXXX, \xHH or \<char>), character class, or any char
+_FRAGMENT_TOKEN_RE = re.compile(r'\\u[0-9a-fA-F]{4}|\\x[0-9a-fA-F]{2}|\\.|\[(?:\\.|[^\]\\])*\]|.', re.DOTALL)
+_JS_DOT = '[^\\n\\r\\u2028\\u2029]'
+
+
+class RuleError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    id: str
+    category: str
+    is_riba: bool
+    confidence: str
+    reason: str | None
+    patterns: tuple[str, ...]
+
+    def result(self) -> dict:
+        """The object detectCategory() returns, with the same keys as in the app."""
+        out = {'category': self.category, 'isRiba': self.is_riba, 'confidence': self.confidence}
+        if self.reason:
+            out['reason'] = self.reason
+        return out
+
+
+@dataclass(frozen=True)
+class CurrencyRule:
+    code: str
+    patterns: tuple[str, ...]
+    ignore_case: bool = False
+
+
+@dataclass(frozen=True)
+class Ruleset:
+    version: str
+    default: CategoryRule
+    categories: tuple[CategoryRule, ...]
+    currencies: tuple[CurrencyRule, ...]
+
+    def category_source(self) -> str:
+        """Combined alternation for the category rules (flags: case-insensitive)."""
+        return '|'.join('(' + '|'.join(r.patterns) + ')' for r in self.categories)
+
+    def currency_source(self) -> str:
+        """Combined alternation for the currency markers (no flags; case is expanded)."""
+        return '|'.join('(' + '|'.join(expand_case(p) if c.ignore_case else p for p in c.patterns) + ')'
+                        for c in self.currencies)
+
+
+def _tokens(fragment: str) -> list[str]:
+    return _FRAGMENT_TOKEN_RE.findall(fragment)
+
+
+def check_fragment(fragment: str, where: str):
+    tokens = _tokens(fragment)
+    padded = tokens + ['', '', '']
+    for i, tok in enumerate(tokens):
+        # '(' and '(?<name>' capture; '(?:', '(?=', '(?!', '(?<=' and '(?<!' do not
+        named = padded[i + 1] == '?' and padded[i + 2] == '<' and padded[i + 3] not in ('=', '!')
+        if tok == '(' and (padded[i + 1] != '?' or named):
+            raise RuleError(f"{where}: capturing group in {fragment!r}; use (?:...)")
+    try:
+        re.compile(to_python(fragment))
+    except re.error as e:
+        raise RuleError(f"{where}: invalid pattern {fragment!r}: {e}") from None
+
+
+def expand_case(fragment: str) -> str:
+    """Make a fragment case-insensitive without the /i flag: 'Rs' -> '[Rr][Ss]'."""
+    out = []
+    for tok in _tokens(fragment):
+        if len(tok) == 1 and tok.isascii() and tok.isalpha():
+            out.append(f'[{tok.upper()}{tok.lower()}]')
+        elif tok.startswith('[') and len(tok) > 2:
+            body = tok[1:-1]
+            if re.search(r'[A-Za-z]-|-[A-Za-z]', body.replace('\\-', '')):
+                raise RuleError(f"letter ranges are not supported with ignore_case: {fragment!r}")
+            extra = ''.join(ch.swapcase() for ch in re.sub(r'\\.', '', body)
+                            if ch.isascii() and ch.isalpha() and ch.swapcase() not in body)
+            out.append(tok[:-1] + extra + ']')
+        else:
+            out.append(tok)
+    return ''.join(out)
+
+
+def to_python(fragment: str) -> str:
+    """Translate a JS regex fragment to Python `re` (used with re.ASCII)."""
+    out = []
+    for tok in _tokens(fragment):
+        if tok == r'\s':
+            out.append('[' + re.escape(JS_WHITESPACE) + ']')
+        elif tok == '.':
+            out.append(_JS_DOT)
+        elif tok == '$':
+            out.append(r'\Z')
+        elif tok == r'\/':
+            out.append('/')
+        elif tok.startswith('['):
+            out.append(tok.replace(r'\s', re.escape(JS_WHITESPACE)))
+        else:
+            out.append(tok)
+    return ''.join(out)
+
+
+def _category_rule(raw: dict, where: str) -> CategoryRule:
+    if raw.get('category') not in CATEGORIES:
+        raise RuleError(f"{where}: category must be one of {', '.join(CATEGORIES)}")
+    if raw.get('confidence') not in CONFIDENCES:
+        raise RuleError(f"{where}: confidence must be one of {', '.join(CONFIDENCES)}")
+    patterns = tuple(raw.get('patterns', ()))
+    for p in patterns:
+        check_fragment(p, where)
+    return CategoryRule(raw.get('id', 'default'), raw['category'], bool(raw.get('is_riba', False)),
+                        raw['confidence'], raw.get('reason'), patterns)
+
+
+def load_rules(path: Path = RULES_PATH) -> Ruleset:
+    data = tomllib.loads(path.read_text(encoding='utf-8'))
+
+    categories = []
+    for n, raw in enumerate(data.get('category', []), 1):
+        rule = _category_rule(raw, f"category #{n} ({raw.get('id', '?')})")
+        if not rule.patterns:
+            raise RuleError(f"category #{n} ({rule.id}) has no patterns")
+        categories.append(rule)
+
+    currencies = []
+    for n, raw in enumerate(data.get('currency', []), 1):
+        where = f"currency #{n} ({raw.get('code', '?')})"
+        patterns = tuple(raw.get('patterns', ()))
+        if not patterns:
+            raise RuleError(f"{where} has no patterns")
+        for p in patterns:
+            check_fragment(p, where)
+        currencies.append(CurrencyRule(raw['code'], patterns, bool(raw.get('ignore_case', False))))
+
+    # The version changes whenever anything that affects results changes
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:12]
+    return Ruleset(f"{data.get('version', 1)}-{digest}", _category_rule(data['default'], 'default'),
+                   tuple(categories), tuple(currencies))
+
+
+class CompiledRules:
+    """Python counterpart of rules/compiled.js."""
+
+    def __init__(self, ruleset: Ruleset):
+        self.ruleset = ruleset
+        self._results = [r.result() for r in ruleset.categories]
+        self._default = ruleset.default.result()
+        self._codes = [c.code for c in ruleset.currencies]
+        self._category_re = re.compile(to_python(ruleset.category_source()), re.IGNORECASE | re.ASCII)
+        self._currency_re = re.compile(to_python(ruleset.currency_source()), re.ASCII)
+
+    def detect_category(self, text: str) -> dict:
+        best = len(self._results)
+        pos = 0
+        while best > 0:
+            m = self._category_re.search(text, pos)
+            if m is None:
+                break
+            best = min(best, m.lastindex - 1)
+            pos = m.start() + 1
+        return dict(self._results[best] if best < len(self._results) else self._default)
+
+    def count_currencies(self, text: str) -> dict[str, int]:
+        counts = dict.fromkeys(self._codes, 0)
+        last_end = [0] * len(self._codes)
+        pos = 0
+        while True:
+            m = self._currency_re.search(text, pos)
+            if m is None:
+                break
+            g = m.lastindex - 1
+            # Matches of one currency never overlap, as with a per-currency /g scan
+            if m.start() >= last_end[g]:
+                counts[self._codes[g]] += 1
+                last_end[g] = m.end()
+            pos = m.start() + 1
+        return counts
+
+    def dominant_currency(self, text: str) -> str | None:
+        counts = self.count_currencies(text)
+        best = self._codes[0]
+        for code in self._codes[1:]:
+            best = best if counts[best] > counts[code] else code
+        return best if counts[best] > 0 else None
+
+
+_compiled: CompiledRules | None = None
+
+
+def compiled() -> CompiledRules:
+    global _compiled
+    if _compiled is None:
+        _compiled = CompiledRules(load_rules())
+    return _compiled
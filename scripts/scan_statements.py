@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Bulk-scan statement dumps with the same pipeline as the app.
+#
+# For members who opted in to an audit: point it at directories of CSV
+# exports, pdf.js text dumps (.json) or OCR text (.txt). Each file is one
+# statement; results are written as JSONL (one record per file, transactions
+# in the app's JSON shape) and a throughput summary is printed at the end.
+#
+# Usage:
+#   python3 scripts/scan_statements.py statements/ -o results.jsonl
+#   python3 scripts/scan_statements.py a.csv b.json --workers 1 --date 2024-01-31
+
+import argparse
+import sys
+import time
+
+from ribascan import find_statements, scan_many
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan statement dumps for Riba across a process pool')
+    parser.add_argument('paths', nargs='+', help='statement files or directories (searched recursively)')
+    parser.add_argument('-o', '--output', help='write JSONL results here (default: stdout)')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--date', help='fallback date for undated riba lines (default: today, UTC)')
+    parser.add_argument('--quiet', action='store_true', help='only print the summary')
+    args = parser.parse_args()
+
+    files = find_statements(args.paths)
+    if not files:
+        sys.exit('❌ No .csv, .json or .txt statements found')
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    log = sys.stderr
+    start = time.perf_counter()
+    statements = transactions = riba = failed = 0
+
+    try:
+        for result in scan_many(files, args.workers, args.date):
+            out.write(result.to_json() + '\n')
+            statements += 1
+            if result.error:
+                failed += 1
+                print(f"❌ {result.path}: {result.error}", file=log)
+                continue
+            transactions += len(result.transactions)
+            riba += result.riba_count
+            if not args.quiet:
+                print(f"   {result.path}: {len(result.transactions)} txn, {result.riba_count} riba "
+                      f"({result.ms:.0f} ms)", file=log)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ {statements} statement(s), {transactions} transaction(s), {riba} riba, {failed} failed "
+          f"in {elapsed:.2f} s — {statements / elapsed:.1f} statements/s", file=log)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
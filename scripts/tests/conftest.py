@@ -0,0 +1,6 @@
+# The scripts are run as `python3 scripts/<name>.py`, not installed, so the
+# tests import them from the scripts directory
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
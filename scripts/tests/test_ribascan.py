@@ -0,0 +1,123 @@
+# The Python scanner must find what the app finds. Expectations come from the
+# TS pipeline itself (bench/fixtures/pipeline-expected.json, regenerated with
+# bench/fixtures/generate-pipeline-expected.ts) and from the accuracy the
+# pipeline benchmark records (bench/fixtures/golden-baseline.json).
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from ribascan import (
+    detect_category,
+    detect_dominant_currency,
+    parse_transaction_amount,
+    process_lines,
+    process_page_text,
+    scan_file,
+    scan_many,
+)
+
+FIXTURES = Path(__file__).resolve().parents[2] / 'bench' / 'fixtures'
+CORPUS = json.loads((FIXTURES / 'golden-corpus.json').read_text(encoding='utf-8'))['statements']
+EXPECTED = json.loads((FIXTURES / 'pipeline-expected.json').read_text(encoding='utf-8'))['statements']
+BASELINE = json.loads((FIXTURES / 'golden-baseline.json').read_text(encoding='utf-8'))
+
+
+def without_ids(transactions):
+    return [{k: v for k, v in t.items() if k != 'id'} for t in transactions]
+
+
+@pytest.mark.parametrize('statement,expected', list(zip(CORPUS, EXPECTED)), ids=[s['name'] for s in CORPUS])
+def test_first_page_matches_ts_pipeline(statement, expected):
+    assert statement['name'] == expected['name']
+    lines = [(line['text'], 1) for line in statement['pages'][0]]
+    assert without_ids(process_lines(lines)) == expected['transactions']
+
+
+def test_golden_corpus_accuracy_matches_baseline():
+    # Same counting as score() in bench/pipeline.bench.ts
+    n = dict.fromkeys(['tp', 'fp', 'fn', 'riba_tp', 'riba_fp', 'riba_fn', 'amount', 'currency'], 0)
+    for statement in CORPUS:
+        pages = statement['pages']
+        found = process_lines([(line['text'], p + 1) for p, page in enumerate(pages) for line in page])
+        by_text = {t['originalText']: t for t in found}
+        for page in pages:
+            for line in page:
+                t, label = by_text.get(line['text']), line['txn']
+                if t and label:
+                    n['tp'] += 1
+                elif t:
+                    n['fp'] += 1
+                elif label:
+                    n['fn'] += 1
+                riba = bool(t and t['isRiba'])
+                if riba and label and label['riba']:
+                    n['riba_tp'] += 1
+                elif riba:
+                    n['riba_fp'] += 1
+                elif label and label['riba']:
+                    n['riba_fn'] += 1
+                if t and label:
+                    n['amount'] += abs(t['amount'] - label['amount']) < 0.005
+                    n['currency'] += t['currency'] == label['currency']
+
+    def rate(tp, fp, fn):
+        return {'precision': tp / (tp + fp) if tp + fp else 1, 'recall': tp / (tp + fn) if tp + fn else 1}
+
+    assert {
+        'transactions': rate(n['tp'], n['fp'], n['fn']),
+        'riba': rate(n['riba_tp'], n['riba_fp'], n['riba_fn']),
+        'amount': n['amount'] / n['tp'],
+        'currency': n['currency'] / n['tp'],
+    } == BASELINE
+
+
+def test_page_text_rebuilds_corpus_lines():
+    # Laid out like bench/pipeline.bench.ts: a word per item, rows with baseline jitter
+    rng = random.Random(3)
+    for statement in CORPUS:
+        for page in statement['pages']:
+            items = []
+            for row, line in enumerate(page):
+                x = 36
+                for word in line['text'].split(' '):
+                    items.append({'str': word, 'x': x, 'y': 760 - row * 12 + rng.uniform(-1, 1)})
+                    x += len(word) * 5 + 3
+            rng.shuffle(items)
+            assert process_page_text(items) == [line['text'] for line in page]
+
+
+def test_single_lines():
+    line = '13/06/2024 Overdraft Interest Charged 100000 63.66 4,029.04'
+    assert parse_transaction_amount(line, '13/06/2024') == 63.66
+    assert detect_category(line)['isRiba'] is True
+    assert detect_category('05/04/2024 CARD PAYMENT STARBUCKS 100001 GBP 1,703.82')['isRiba'] is False
+    assert detect_dominant_currency('Statement in € EUR, balance EUR 1.234,00') == 'EUR'
+    assert detect_dominant_currency('no currency here') == 'USD'
+
+
+def test_undated_rows_take_today():
+    [txn] = process_lines([('Overdraft Interest Charged 12.50 GBP', 1)], today='2024-01-31')
+    assert txn['date'] == '2024-01-31'
+    assert txn['currency'] == 'GBP'
+
+
+def test_scan_files(tmp_path):
+    statement = CORPUS[0]
+    dump = tmp_path / 'statement.json'
+    dump.write_text(json.dumps({'pages': [[
+        {'str': line['text'], 'x': 36, 'y': 760 - row * 12} for row, line in enumerate(statement['pages'][0])
+    ]]}), encoding='utf-8')
+    ocr = tmp_path / 'scan.txt'
+    ocr.write_text('\n'.join(line['text'] for line in statement['pages'][0]), encoding='utf-8')
+    broken = tmp_path / 'broken.json'
+    broken.write_text('{"pages": ', encoding='utf-8')
+
+    results = list(scan_many([str(dump), str(ocr), str(broken)], workers=1))
+    assert [r.path for r in results] == [str(dump), str(ocr), str(broken)]
+    assert without_ids(results[0].transactions) == EXPECTED[0]['transactions']
+    assert without_ids(results[1].transactions) == EXPECTED[0]['transactions']
+    assert results[2].error and not results[2].transactions
+    assert scan_file(str(dump)).riba_count == sum(t['isRiba'] for t in EXPECTED[0]['transactions'])
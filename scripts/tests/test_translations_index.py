@@ -0,0 +1,137 @@
+import pytest
+
+from translations_index import ParseError, TranslationsFile, decode_string, encode_string, tokenize
+
+SOURCE = '''// header
+export const TRANSLATIONS = {
+  en: {
+    hello: "Hello",
+    url: "https://example.com", // not a comment start
+    quote: 'It\\'s "fine"',
+    hello: "Hello again",
+    last: `multi
+line`
+  },
+  fr: {
+    hello: "Bonjour",
+  },
+};
+'''
+
+
+def load(text=SOURCE):
+    return TranslationsFile(text)
+
+
+def test_decode_string_escapes():
+    assert decode_string(r'"a\nb\t\"c\""') == 'a\nb\t"c"'
+    assert decode_string(r"'é\x41\u{1F600}'") == 'éA\U0001F600'
+    assert decode_string('"line\\\ncontinued"') == 'linecontinued'
+
+
+def test_encode_string_round_trips():
+    for value in ['plain', 'quote " and \\ backslash', 'new\nline', 'العربية']:
+        assert decode_string(encode_string(value)) == value
+
+
+def test_tokenize_keeps_urls_inside_strings():
+    tokens = tokenize('a: "https://x.y", // c\n/* d */ b')
+    assert [t.kind for t in tokens] == ['ident', 'punct', 'str', 'punct', 'ident']
+    assert decode_string(tokens[2].text) == 'https://x.y'
+
+
+def test_last_occurrence_wins_and_duplicates_are_reported():
+    tf = load()
+    assert tf.languages == ['en', 'fr']
+    assert tf.get('en', 'hello') == 'Hello again'
+    assert tf.get('en', 'url') == 'https://example.com'
+    assert tf.get('en', 'quote') == 'It\'s "fine"'
+    assert tf.get('en', 'last') == 'multi\nline'
+    assert [(d.key, d.value) for d in tf.locale('en').duplicates()] == [('hello', 'Hello')]
+    assert tf.locale('fr').duplicates() == []
+
+
+def test_replace_edits_the_copy_js_uses():
+    tf = load('export const TRANSLATIONS = {\n  en: {\n    a: "one",\n    a: "two",\n    a: "three",\n  },\n};\n')
+    assert tf.get('en', 'a') == 'three'
+    assert tf.keys('en') == ['a']
+    assert [d.value for d in tf.locale('en').duplicates()] == ['one', 'two']
+    tf.replace('en', 'a', 'NEW')
+    assert tf.render().splitlines()[2:5] == ['    a: "one",', '    a: "two",', '    a: "NEW",']
+
+
+def test_edits_are_applied_in_one_pass():
+    tf = load()
+    assert tf.replace('fr', 'hello', 'Salut')
+    assert not tf.replace('fr', 'hello', 'Salut')
+    tf.insert('fr', 'bye', 'Au revoir', after='hello')
+    tf.upsert('en', 'bye', 'Bye', after='url')
+    tf.delete('en', 'hello', entry=tf.locale('en').duplicates()[0])
+    text = tf.render()
+
+    again = load(text)
+    assert again.keys('en') == ['url', 'bye', 'quote', 'hello', 'last']
+    assert again.locale('en').duplicates() == []
+    assert again.get('en', 'hello') == 'Hello again'
+    assert again.get('en', 'bye') == 'Bye'
+    assert again.keys('fr') == ['hello', 'bye']
+    assert again.get('fr', 'hello') == 'Salut'
+    assert tf.changed_keys() == {'fr': {'hello', 'bye'}, 'en': {'bye', 'hello'}}
+
+
+def test_last_queued_replace_wins():
+    tf = load()
+    tf.replace('fr', 'hello', 'Salut')
+    tf.replace('fr', 'hello', 'Coucou')
+    assert load(tf.render()).get('fr', 'hello') == 'Coucou'
+
+
+def test_upsert_many_keeps_order_and_can_skip_existing():
+    tf = load()
+    changed = tf.upsert_many('fr', [('hello', 'Salut'), ('a', 'A'), ('b', 'B')], overwrite=False)
+    assert changed == 2
+    again = load(tf.render())
+    assert again.keys('fr') == ['hello', 'a', 'b']
+    assert again.get('fr', 'hello') == 'Bonjour'
+
+
+def test_insert_after_a_line_without_trailing_comma():
+    tf = load()
+    tf.insert('en', 'after_last', 'x')
+    again = load(tf.render())
+    assert again.keys('en')[-1] == 'after_last'
+    assert again.get('en', 'last') == 'multi\nline'
+
+
+def test_bad_edits_raise():
+    tf = load()
+    with pytest.raises(KeyError):
+        tf.insert('fr', 'hello', 'x')
+    with pytest.raises(KeyError):
+        tf.replace('fr', 'missing', 'x')
+    with pytest.raises(KeyError):
+        tf.locale('de')
+
+
+def test_parse_errors():
+    with pytest.raises(ParseError):
+        TranslationsFile('export const OTHER = {};')
+    with pytest.raises(ParseError):
+        TranslationsFile('export const TRANSLATIONS = { en: { count: 3 } };')
+
+
+def test_save_reindexes(tmp_path):
+    path = tmp_path / 'translations.ts'
+    path.write_text(SOURCE, encoding='utf-8')
+    tf = TranslationsFile.load(path)
+    assert not tf.save()
+    tf.replace('fr', 'hello', 'Salut')
+    assert tf.save()
+    assert tf.get('fr', 'hello') == 'Salut'
+    assert TranslationsFile.load(path).get('fr', 'hello') == 'Salut'
+
+
+def test_repository_file_parses():
+    tf = TranslationsFile.load()
+    assert 'en' in tf.languages
+    assert tf.load(tf.path).render() == tf.text
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# Shared parser + in-memory index for translations.ts
+#
+# translations.ts is tokenized once into (language -> key -> entry) with the
+# character span of every key/value, so scripts can queue any number of
+# inserts, replacements and deletes and write the file back in one pass.
+#
+# Usage:
+#   from translations_index import TranslationsFile
+#   tf = TranslationsFile.load()
+#   tf.upsert('fr', 'donate_here', 'Faire un don ici', after='donate_food_desc')
+#   tf.save()
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TRANSLATIONS_PATH = ROOT / 'translations.ts'
+
+# --- Lexer ---
+
+# One alternation, tried left to right at each position. Strings come before
+# comments so URLs like "https://..." are never mistaken for a comment.
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<str>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<num>-?\d+(?:\.\d+)?)
+  | (?P<punct>.)
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)', re.DOTALL)
+
+
+@dataclass
+class Token:
+    kind: str   # 'str' | 'ident' | 'num' | 'punct'
+    text: str
+    start: int
+    end: int
+
+
+def tokenize(text: str) -> list[Token]:
+    """Split JS/TS source into tokens, dropping whitespace and comments."""
+    tokens = []
+    for m in _TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind in ('ws', 'comment'):
+            continue
+        tokens.append(Token(kind, m.group(), m.start(), m.end()))
+    return tokens
+
+
+def _unescape(match: re.Match) -> str:
+    esc = match.group(1)
+    if esc[0] == 'u':
+        return chr(int(esc[2:-1] if esc[1] == '{' else esc[1:], 16))
+    if esc[0] == 'x':
+        return chr(int(esc[1:], 16))
+    if esc == '\n':
+        return ''  # line continuation
+    return _ESCAPES.get(esc, esc)
+
+
+def decode_string(literal: str) -> str:
+    """Turn a JS string literal (any quote style) into its Python value."""
+    return _ESCAPE_RE.sub(_unescape, literal[1:-1])
+
+
+def encode_string(value: str) -> str:
+    """Render a value as a double-quoted JS string literal."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+# --- Literal parser ---
+
+@dataclass
+class Str:
+    value: str
+    start: int
+    end: int
+
+
+@dataclass
+class Raw:
+    text: str   # numbers, identifiers (true/false/null), anything non-string
+    start: int
+    end: int
+
+
+@dataclass
+class Prop:
+    key: str
+    value: 'Node'
+    start: int          # start of the key token
+    end: int            # end of the value, or of the trailing comma if any
+    has_comma: bool
+
+
+@dataclass
+class Obj:
+    props: list[Prop]
+    start: int
+    end: int
+
+
+@dataclass
+class Arr:
+    items: list['Node']
+    start: int
+    end: int
+
+
+Node = Str | Raw | Obj | Arr
+
+
+class ParseError(ValueError):
+    pass
+
+
+def parse_literal(tokens: list[Token], i: int = 0) -> tuple[Node, int]:
+    """Parse one object/array/string/scalar literal starting at tokens[i].
+
+    Returns the node and the index of the first token after it.
+    """
+    tok = tokens[i]
+    if tok.kind == 'str':
+        return Str(decode_string(tok.text), tok.start, tok.end), i + 1
+    if tok.text == '{':
+        return _parse_object(tokens, i)
+    if tok.text == '[':
+        return _parse_array(tokens, i)
+    if tok.kind in ('ident', 'num'):
+        return Raw(tok.text, tok.start, tok.end), i + 1
+    raise ParseError(f'Unexpected {tok.text!r} at offset {tok.start}')
+
+
+def _parse_object(tokens: list[Token], i: int) -> tuple[Obj, int]:
+    start = tokens[i].start
+    props = []
+    i += 1
+    while tokens[i].text != '}':
+        key_tok = tokens[i]
+        if key_tok.kind == 'str':
+            key = decode_string(key_tok.text)
+        elif key_tok.kind in ('ident', 'num'):
+            key = key_tok.text
+        else:
+            raise ParseError(f'Expected a key at offset {key_tok.start}, got {key_tok.text!r}')
+        if tokens[i + 1].text != ':':
+            raise ParseError(f'Expected ":" after key {key!r} at offset {tokens[i + 1].start}')
+        value, i = parse_literal(tokens, i + 2)
+        has_comma = tokens[i].text == ','
+        end = tokens[i].end if has_comma else value.end
+        props.append(Prop(key, value, key_tok.start, end, has_comma))
+        if has_comma:
+            i += 1
+        elif tokens[i].text != '}':
+            raise ParseError(f'Expected "," or "}}" at offset {tokens[i].start}')
+    return Obj(props, start, tokens[i].end), i + 1
+
+
+def _parse_array(tokens: list[Token], i: int) -> tuple[Arr, int]:
+    start = tokens[i].start
+    items = []
+    i += 1
+    while tokens[i].text != ']':
+        item, i = parse_literal(tokens, i)
+        items.append(item)
+        if tokens[i].text == ',':
+            i += 1
+        elif tokens[i].text != ']':
+            raise ParseError(f'Expected "," or "]" at offset {tokens[i].start}')
+    return Arr(items, start, tokens[i].end), i + 1
+
+
+def find_export(text: str, name: str, tokens: list[Token] | None = None) -> Node:
+    """Locate `const <name>[: Type] = <literal>` in a source file and parse the literal."""
+    tokens = tokens if tokens is not None else tokenize(text)
+    for i, tok in enumerate(tokens):
+        if tok.kind != 'ident' or tok.text != name or i == 0 or tokens[i - 1].text != 'const':
+            continue
+        j = i + 1
+        if tokens[j].text == ':':
+            # Skip the type annotation up to the top-level "="
+            depth = 0
+            while depth or tokens[j].text != '=':
+                if tokens[j].text in '{[(<':
+                    depth += 1
+                elif tokens[j].text in '}])>':
+                    depth -= 1
+                j += 1
+        if tokens[j].text == '=':
+            return parse_literal(tokens, j + 1)[0]
+    raise ParseError(f'Could not find `const {name} = ...`')
+
+
+def parse_entries(snippet: str) -> list[tuple[str, str]]:
+    """Read loose `key: "value",` lines (as found in the old add_*.py scripts)."""
+    tokens = tokenize('{' + snippet.strip().rstrip('}').rstrip().rstrip(',') + '}')
+    obj, _ = _parse_object(tokens, 0)
+    return [(p.key, p.value.value) for p in obj.props if isinstance(p.value, Str)]
+
+
+# --- Index ---
+
+@dataclass
+class Entry:
+    key: str
+    value: str
+    start: int        # first char of the line holding the entry
+    end: int          # one past the newline (or comma) that ends it
+    value_start: int
+    value_end: int
+    has_comma: bool
+    indent: str
+
+
+@dataclass
+class Locale:
+    lang: str
+    start: int        # the "{" of the locale block
+    end: int          # one past its "}"
+    entries: list[Entry] = field(default_factory=list)
+    index: dict[str, Entry] = field(default_factory=dict)   # last occurrence wins, as in JS
+
+    def duplicates(self) -> list[Entry]:
+        """Earlier copies of a key that appears again later in this block."""
+        return [e for e in self.entries if self.index[e.key] is not e]
+
+
+def _line_span(text: str, prop: Prop) -> tuple[int, int, str]:
+    """Widen a property to whole lines when it sits alone on its line."""
+    line_start = text.rfind('\n', 0, prop.start) + 1
+    indent = text[line_start:prop.start]
+    if indent.strip():
+        return prop.start, prop.end, ''
+    line_end = text.find('\n', prop.end)
+    if line_end == -1 or text[prop.end:line_end].strip():
+        return prop.start, prop.end, indent
+    return line_start, line_end + 1, indent
+
+
+@dataclass
+class _Edit:
+    start: int
+    end: int
+    prefix: str
+    value: str | None   # None for deletions
+    suffix: str
+    seq: int
+
+    @property
+    def text(self) -> str:
+        if self.value is None:
+            return ''
+        return self.prefix + encode_string(self.value) + self.suffix
+
+
+class TranslationsFile:
+    """translations.ts tokenized once, with edits queued and applied on save()."""
+
+    def __init__(self, text: str, path: Path = TRANSLATIONS_PATH):
+        self.path = Path(path)
+        self.text = text
+        self.locales: dict[str, Locale] = {}
+        self._edits: list[_Edit] = []
+        self._changed: dict[str, set[str]] = {}
+        self._pending: dict[tuple[str, str], _Edit] = {}   # queued replace/insert per key
+
+        root = find_export(text, 'TRANSLATIONS')
+        if not isinstance(root, Obj):
+            raise ParseError('TRANSLATIONS is not an object literal')
+        for lang_prop in root.props:
+            block = lang_prop.value
+            if not isinstance(block, Obj):
+                raise ParseError(f'TRANSLATIONS.{lang_prop.key} is not an object literal')
+            locale = Locale(lang_prop.key, block.start, block.end)
+            for prop in block.props:
+                if not isinstance(prop.value, Str):
+                    raise ParseError(f'{lang_prop.key}.{prop.key} is not a string')
+                start, end, indent = _line_span(text, prop)
+                entry = Entry(prop.key, prop.value.value, start, end,
+                              prop.value.start, prop.value.end, prop.has_comma, indent)
+                locale.entries.append(entry)
+                locale.index[prop.key] = entry
+            self.locales[lang_prop.key] = locale
+
+    @classmethod
+    def load(cls, path: Path | str = TRANSLATIONS_PATH) -> 'TranslationsFile':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), Path(path))
+
+    # --- Reads ---
+
+    @property
+    def languages(self) -> list[str]:
+        return list(self.locales)
+
+    def locale(self, lang: str) -> Locale:
+        try:
+            return self.locales[lang]
+        except KeyError:
+            raise KeyError(f'Unknown language {lang!r} in {self.path.name}') from None
+
+    def get(self, lang: str, key: str, default: str | None = None) -> str | None:
+        entry = self.locale(lang).index.get(key)
+        return entry.value if entry else default
+
+    def keys(self, lang: str) -> list[str]:
+        return list(self.locale(lang).index)
+
+    def has(self, lang: str, key: str) -> bool:
+        """True if the key exists in the file or is already queued for insertion."""
+        return key in self.locale(lang).index or (lang, key) in self._pending
+
+    # --- Queued edits ---
+
+    def _queue(self, lang: str, key: str, start: int, end: int,
+               value: str | None = None, prefix: str = '', suffix: str = '') -> _Edit:
+        edit = _Edit(start, end, prefix, value, suffix, len(self._edits))
+        self._edits.append(edit)
+        self._changed.setdefault(lang, set()).add(key)
+        return edit
+
+    def replace(self, lang: str, key: str, value: str) -> bool:
+        """Change an existing key's value. Returns False if it was already equal.
+
+        Replacing a key that is already queued just updates the queued value,
+        so the last write wins when several patches touch the same key.
+        """
+        pending = self._pending.get((lang, key))
+        if pending is not None:
+            if pending.value == value:
+                return False
+            pending.value = value
+            return True
+        entry = self.locale(lang).index.get(key)
+        if entry is None:
+            raise KeyError(f'{lang}.{key} does not exist')
+        if entry.value == value:
+            return False
+        self._pending[lang, key] = self._queue(lang, key, entry.value_start, entry.value_end, value)
+        return True
+
+    def insert(self, lang: str, key: str, value: str, after: str | None = None):
+        """Add a new key after `after` (or at the end of the block)."""
+        locale = self.locale(lang)
+        if self.has(lang, key):
+            raise KeyError(f'{lang}.{key} already exists')
+        if after is not None:
+            anchor = locale.index.get(after)
+            if anchor is None:
+                raise KeyError(f'Anchor {lang}.{after} does not exist')
+        elif locale.entries:
+            anchor = locale.entries[-1]
+        else:
+            raise KeyError(f'{lang} block is empty; nothing to anchor on')
+
+        prefix = f'{anchor.indent}{key}: '
+        if anchor.has_comma:
+            edit = self._queue(lang, key, anchor.end, anchor.end, value, prefix, ',\n')
+        else:
+            edit = self._queue(lang, key, anchor.value_end, anchor.value_end, value, ',\n' + prefix)
+        self._pending[lang, key] = edit
+
+    def upsert(self, lang: str, key: str, value: str, after: str | None = None) -> bool:
+        """Replace the key if present, otherwise insert it. Returns True if anything changed."""
+        if self.has(lang, key):
+            return self.replace(lang, key, value)
+        self.insert(lang, key, value, after=after)
+        return True
+
+    def upsert_many(self, lang: str, entries: list[tuple[str, str]], after: str | None = None,
+                    overwrite: bool = True) -> int:
+        """Upsert keys in order, each new key landing after the previous one.
+
+        With overwrite=False existing keys are left alone and only missing ones are added.
+        """
+        changed = 0
+        for key, value in entries:
+            if overwrite or not self.has(lang, key):
+                changed += self.upsert(lang, key, value, after=after)
+            after = key if key in self.locale(lang).index else after
+        return changed
+
+    def delete(self, lang: str, key: str, entry: Entry | None = None):
+        """Remove a key (or one specific occurrence of a duplicated key)."""
+        entry = entry or self.locale(lang).index.get(key)
+        if entry is None:
+            raise KeyError(f'{lang}.{key} does not exist')
+        self._queue(lang, key, entry.start, entry.end)
+
+    def changed_keys(self) -> dict[str, set[str]]:
+        return {lang: set(keys) for lang, keys in self._changed.items()}
+
+    # --- Write back ---
+
+    def render(self) -> str:
+        """Apply every queued edit in a single left-to-right pass."""
+        edits = sorted(self._edits, key=lambda e: (e.start, e.end, e.seq))
+        out = []
+        pos = 0
+        for edit in edits:
+            if edit.start < pos:
+                raise ValueError(f'Overlapping edits at offset {edit.start}')
+            out.append(self.text[pos:edit.start])
+            out.append(edit.text)
+            pos = edit.end
+        out.append(self.text[pos:])
+        return ''.join(out)
+
+    def save(self, path: Path | str | None = None) -> bool:
+        """Write the file once if anything changed. Returns True if it was written."""
+        if not self._edits:
+            return False
+        text = self.render()
+        with open(path or self.path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # Re-index so the object stays usable after saving
+        self.__init__(text, Path(path or self.path))
+        return True
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# Validate translations.ts and data/blog_posts_*.ts
+#
+# Reports, for every locale:
+#   - duplicate keys, with both values (JS uses the last, and so does fix_duplicates.py)
+#   - keys missing relative to `en` (warning: t() falls back to English)
+#   - extra keys that `en` does not have
+#   - placeholder mismatches ({name} variables; **bold** markers as warnings)
+# and for every blog file: duplicate/missing post fields and post-count drift.
+#
+# Each file is hashed before it is parsed; results are cached under
+# .cache/validate_translations.json so unchanged files are skipped on the next
+# run. Exit code is 1 when there are errors (or warnings with --strict).
+#
+# Files are not parsed as a stream: the checks compare every locale with `en`
+# and report line numbers, so they need the whole index anyway, and the
+# shared tokenizer (translations_index.py) handles multi-line and escaped
+# strings that a line-by-line reader would get wrong. translations.ts is a
+# few hundred KB and parses in about 0.1 s. The hash cache is what keeps
+# repeat runs cheap: an unchanged file is hashed in 64 KB chunks and never parsed.
+#
+# Usage:
+#   python3 scripts/validate_translations.py            # pre-commit / CI
+#   python3 scripts/validate_translations.py --no-cache --strict
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from translations_index import ROOT, TRANSLATIONS_PATH, Arr, Obj, ParseError, TranslationsFile, find_export, tokenize
+
+BLOG_DIR = ROOT / 'data'
+CACHE_PATH = ROOT / '.cache' / 'validate_translations.json'
+# Bump when the checks change so stale cached results are discarded
+CACHE_VERSION = 3
+
+PLACEHOLDER_RE = re.compile(r'\{\{?\s*([A-Za-z_][\w.]*)\s*\}\}?')
+
+
+def file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def line_of(text: str, offset: int) -> int:
+    return text.count('\n', 0, offset) + 1
+
+
+def finding(level: str, file: Path, line: int, lang: str, message: str) -> dict:
+    return {'level': level, 'file': file.relative_to(ROOT).as_posix(), 'line': line, 'lang': lang, 'message': message}
+
+
+def placeholders(value: str) -> tuple[list[str], int]:
+    return sorted(PLACEHOLDER_RE.findall(value)), value.count('**')
+
+
+# --- translations.ts ---
+
+def check_translations(path: Path) -> list[dict]:
+    tf = TranslationsFile.load(path)
+    text = tf.text
+    results = []
+    en = tf.locale('en')
+
+    for lang in tf.languages:
+        locale = tf.locale(lang)
+
+        for dup in locale.duplicates():
+            kept = locale.index[dup.key]
+            results.append(finding(
+                'error', path, line_of(text, dup.start), lang,
+                f"duplicate key '{dup.key}' (used copy at line {line_of(text, kept.start)}): "
+                f"this one {dup.value!r} is overridden by {kept.value!r} — fix_duplicates.py removes it"))
+
+        if lang == 'en':
+            continue
+
+        missing = [k for k in en.index if k not in locale.index]
+        if missing:
+            results.append(finding(
+                'warning', path, line_of(text, locale.start), lang,
+                f"{len(missing)} key(s) missing vs en: {', '.join(missing)}"))
+
+        for key, entry in locale.index.items():
+            if key not in en.index:
+                results.append(finding('error', path, line_of(text, entry.start), lang,
+                                       f"extra key '{key}' not present in en"))
+                continue
+            expected = placeholders(en.index[key].value)
+            actual = placeholders(entry.value)
+            if expected[0] != actual[0]:
+                results.append(finding(
+                    'error', path, line_of(text, entry.start), lang,
+                    f"'{key}' placeholders {actual[0]} do not match en {expected[0]}"))
+            elif expected[1] != actual[1]:
+                # Missing emphasis only changes formatting, so it is not fatal
+                results.append(finding(
+                    'warning', path, line_of(text, entry.start), lang,
+                    f"'{key}' has {actual[1]} '**' marker(s), en has {expected[1]}"))
+    return results
+
+
+# --- data/blog_posts_*.ts ---
+
+def load_posts(path: Path) -> tuple[str, Arr]:
+    text = path.read_text(encoding='utf-8')
+    name = 'BLOG_POSTS_' + path.stem.rsplit('_', 1)[1].upper()
+    posts = find_export(text, name, tokenize(text))
+    if not isinstance(posts, Arr):
+        raise ParseError(f'{name} is not an array literal')
+    return text, posts
+
+
+def check_blog(path: Path, en_fields: list[str], en_count: int) -> list[dict]:
+    lang = path.stem.rsplit('_', 1)[1]
+    text, posts = load_posts(path)
+    results = []
+
+    if len(posts.items) != en_count:
+        results.append(finding('warning', path, line_of(text, posts.start), lang,
+                               f"{len(posts.items)} post(s), en has {en_count}"))
+
+    for n, post in enumerate(posts.items, 1):
+        if not isinstance(post, Obj):
+            results.append(finding('error', path, line_of(text, post.start), lang, f"post #{n} is not an object"))
+            continue
+        seen = set()
+        for prop in post.props:
+            if prop.key in seen:
+                results.append(finding('error', path, line_of(text, prop.start), lang,
+                                       f"post #{n} has duplicate field '{prop.key}'"))
+            seen.add(prop.key)
+        missing = [f for f in en_fields if f not in seen]
+        if missing:
+            results.append(finding('error', path, line_of(text, post.start), lang,
+                                   f"post #{n} is missing field(s): {', '.join(missing)}"))
+    return results
+
+
+# --- Cache ---
+
+def load_cache(enabled: bool) -> dict:
+    if not enabled or not CACHE_PATH.exists():
+        return {}
+    try:
+        cache = json.loads(CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('version') == CACHE_VERSION else {}
+
+
+def save_cache(files: dict):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps({'version': CACHE_VERSION, 'files': files}, ensure_ascii=False),
+                          encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate translations.ts and blog post translations')
+    parser.add_argument('--no-cache', action='store_true', help='ignore and do not write the result cache')
+    parser.add_argument('--strict', action='store_true', help='treat warnings as errors')
+    parser.add_argument('--quiet', action='store_true', help='only print errors and the summary')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cache = load_cache(not args.no_cache)
+    new_cache = {}
+    results = []
+    skipped = 0
+
+    blog_files = sorted(BLOG_DIR.glob('blog_posts_*.ts'))
+    en_blog = BLOG_DIR / 'blog_posts_en.ts'
+    en_blog_hash = file_hash(en_blog)
+    en_blog_info = None
+
+    jobs = [(TRANSLATIONS_PATH, file_hash(TRANSLATIONS_PATH))]
+    # A blog file's result also depends on the English file it is compared with
+    jobs += [(p, file_hash(p) + ':' + en_blog_hash) for p in blog_files]
+
+    for path, digest in jobs:
+        rel = path.relative_to(ROOT).as_posix()
+        cached = cache.get(rel)
+        if cached and cached['hash'] == digest:
+            file_results = cached['results']
+            skipped += 1
+        else:
+            try:
+                if path == TRANSLATIONS_PATH:
+                    file_results = check_translations(path)
+                else:
+                    if en_blog_info is None:
+                        _, en_posts = load_posts(en_blog)
+                        fields = [p.key for p in en_posts.items[0].props] if en_posts.items else []
+                        en_blog_info = (fields, len(en_posts.items))
+                    file_results = check_blog(path, *en_blog_info)
+            except (ParseError, KeyError, IndexError) as e:
+                file_results = [finding('error', path, 0, '', f'could not parse: {e}')]
+        new_cache[rel] = {'hash': digest, 'results': file_results}
+        results += file_results
+
+    if not args.no_cache:
+        save_cache(new_cache)
+
+    errors = [r for r in results if r['level'] == 'error']
+    warnings = [r for r in results if r['level'] == 'warning']
+    for r in results:
+        if r['level'] == 'error' or not args.quiet:
+            icon = '❌' if r['level'] == 'error' else '⚠️ '
+            print(f"{icon} {r['file']}:{r['line']} [{r['lang']}] {r['message']}")
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n{len(errors)} error(s), {len(warnings)} warning(s) in {len(jobs)} file(s) "
+          f"({skipped} unchanged, cached) — {elapsed:.0f} ms")
+
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
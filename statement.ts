@@ -0,0 +1,270 @@
+// statement.ts
+// Statement lines (and mapped CSV rows) -> transactions, page by page (used by processFiles in index.tsx)
+
+import { detectCategory, countCurrencies, pickDominantCurrency, CURRENCY_CODES } from './rules/compiled';
+import type { CurrencyCode } from './rules/compiled';
+import { dedupeTransactions } from './dedupe';
+import type { CsvRow } from './csvColumns';
+
+// Bump when addPage()/addRows() would classify the same input differently,
+// so cached classifications (resultCache.ts) are redone
+export const CLASSIFIER_VERSION = 1;
+
+export type Currency = 'USD' | 'GBP' | 'EUR' | 'INR' | 'SAR' | 'AED' | 'MYR' | 'IDR';
+
+export interface Transaction {
+  id: string;
+  date: string;
+  description: string;
+  amount: number;
+  originalText: string;
+  isRiba: boolean;
+  currency: Currency;
+  category: 'income' | 'shopping' | 'utilities' | 'transfer' | 'riba' | 'uncategorized';
+  confidence: 'high' | 'medium' | 'low';
+  page: number; // Added page number
+  reason?: string;
+}
+
+export const DATE_RE = /(?:\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b)|(?:\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})|(?:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})/i;
+
+// With no currency marker anywhere in the upload, guess from the timezone
+const guessCurrencyFromTimezone = (): Currency => {
+  try {
+    const tz = Intl.DateTimeFormat().resolvedOptions().timeZone;
+    if (tz.includes('Calcutta') || tz.includes('Kolkata') || tz.includes('India')) return 'INR';
+    if (tz.includes('Riyadh') || tz.includes('Saudi')) return 'SAR';
+    if (tz.includes('Dubai') || tz.includes('Abu_Dhabi')) return 'AED';
+    if (tz.includes('Jakarta')) return 'IDR';
+    if (tz.includes('Kuala_Lumpur')) return 'MYR';
+    if (tz.includes('London')) return 'GBP';
+    if (tz.includes('Berlin') || tz.includes('Paris') || tz.includes('Madrid')) return 'EUR';
+  } catch (e) {}
+  return 'USD'; // Ultimate fallback
+};
+
+// Robust Amount Parser Helper
+// Solves issue where page number "1" is detected instead of "189.00"
+// Strategy: Enforce 2 decimal places strict check, filter out account numbers/dates
+const parseTransactionAmount = (line: string, dateMatch: string | null): number => {
+  let clean = line;
+  if (dateMatch) clean = clean.replace(dateMatch, ''); // Remove date
+
+  // Remove noise: account numbers (long sequences of digits), specific 'page' numbers if at end
+  // Remove sequences of digits > 4 that don't have separators, to avoid years like 2023 if missed by date regex or account nums
+  clean = clean.replace(/\b\d{5,}\b/g, '');
+
+  // Strict regex: requires decimal point or comma followed by 2 digits.
+  // Supports 1,234.56 (US/UK) or 1.234,56 (EU)
+  // This actively ignores single integers like "1" or "2"
+  const decimalMatches = clean.match(/(\d{1,3}(?:,\d{3})*\.\d{2})\b|(\d{1,3}(?:\.\d{3})*,\d{2})\b/g);
+
+  if (!decimalMatches || decimalMatches.length === 0) return 0;
+
+  // If multiple matches, we take the first one found that fits the format.
+  // Usually, checking the line context helps, but simply taking the first one is safer than last (balance).
+
+  const raw = decimalMatches[0];
+
+  // Normalize to float
+  // If it has ',' as decimal separator (at the end e.g. ,00)
+  if (raw.match(/,\d{2}$/)) {
+     return parseFloat(raw.replace(/\./g, '').replace(',', '.'));
+  }
+  // Else assume '.' is decimal
+  return parseFloat(raw.replace(/,/g, ''));
+};
+
+const transactionId = () => Math.random().toString(36).substr(2, 9);
+
+// A file's classified pages and currency votes, to cache and restore later
+// without classifying again; `defaulted` lists the transactions per page
+// whose currency came from the vote
+export interface ClassifiedFile {
+  pages: { page: number; transactions: Transaction[]; defaulted: number[] }[];
+  counts: Record<CurrencyCode, number>;
+  lineCount: number;
+}
+
+// Currency named on the line itself, if any
+const lineCurrency = (line: string): Currency | null => {
+  if (line.includes('SAR')) return 'SAR';
+  if (line.includes('AED')) return 'AED';
+  if (line.includes('INR') || line.includes('₹')) return 'INR';
+  if (line.includes('MYR') || line.includes('RM')) return 'MYR';
+  if (line.includes('IDR')) return 'IDR';
+  if (line.includes('GBP') || line.includes('£')) return 'GBP';
+  if (line.includes('EUR') || line.includes('€')) return 'EUR';
+  if (line.includes('$') || line.includes('USD')) return 'USD';
+  return null;
+};
+
+// Incremental statement pipeline: pages are added as they are extracted, in
+// any order, and only their transactions are kept. The dominant currency is an
+// online vote over every line seen so far; transactions with no currency of
+// their own follow it, so a snapshot taken mid-upload may still change
+// currency once the last page is in. Results are always in upload order
+// (file, then page) and deduplicated, the same as parsing all lines at once.
+export const createStatementStream = () => {
+  const zero = () => {
+    const counts = {} as Record<CurrencyCode, number>;
+    for (const code of CURRENCY_CODES) counts[code] = 0;
+    return counts;
+  };
+  const counts = zero();
+  const files: Transaction[][][] = []; // [file][page] -> transactions
+  const fileCounts: Record<CurrencyCode, number>[] = [];
+  const fileLines: number[] = [];
+  const defaulted = new Set<Transaction>(); // currency taken from the vote
+  let lineCount = 0;
+
+  const currentCurrency = (): Currency => pickDominantCurrency(counts) ?? guessCurrencyFromTimezone();
+
+  // Re-point defaulted transactions at the current vote (new objects, never mutated)
+  const snapshot = (): Transaction[] => {
+    const currency = currentCurrency();
+    const all: Transaction[] = [];
+    for (const pages of files) {
+      if (!pages) continue;
+      for (const txns of pages) {
+        if (!txns) continue;
+        for (let i = 0; i < txns.length; i++) {
+          const t = txns[i];
+          if (defaulted.has(t) && t.currency !== currency) {
+            defaulted.delete(t);
+            txns[i] = { ...t, currency };
+            defaulted.add(txns[i]);
+          }
+          all.push(txns[i]);
+        }
+      }
+    }
+    return dedupeTransactions(all);
+  };
+
+  // Add a batch of lines to the currency vote; returns the vote's currency after it
+  const vote = (fileIndex: number, lines: string[]): Currency => {
+    const ownCounts = fileCounts[fileIndex] ??= zero();
+    for (const line of lines) {
+      const lineCounts = countCurrencies(line);
+      for (const code of CURRENCY_CODES) {
+        counts[code] += lineCounts[code];
+        ownCounts[code] += lineCounts[code];
+      }
+    }
+    lineCount += lines.length;
+    fileLines[fileIndex] = (fileLines[fileIndex] || 0) + lines.length;
+    return currentCurrency();
+  };
+
+  const store = (fileIndex: number, page: number, txns: Transaction[]) => {
+    const pages = files[fileIndex] ??= [];
+    pages[page] = pages[page] ? pages[page].concat(txns) : txns;
+  };
+
+  return {
+    addPage(fileIndex: number, page: number, lines: string[]) {
+      const currency = vote(fileIndex, lines);
+      const txns: Transaction[] = [];
+      for (const line of lines) {
+        if (line.length < 5) continue;
+
+        const { category, isRiba, confidence, reason } = detectCategory(line);
+        const dateMatch = line.match(DATE_RE);
+        const dateStr = dateMatch ? dateMatch[0] : null;
+        const amount = parseTransactionAmount(line, dateStr);
+
+        if (amount > 0 && (isRiba || (dateMatch && line.length > 15))) {
+          const own = lineCurrency(line);
+          const txn: Transaction = {
+            id: transactionId(),
+            date: dateMatch ? dateMatch[0] : new Date().toISOString().split('T')[0],
+            description: line.substring(0, 80).trim() || "Transaction",
+            amount: amount,
+            originalText: line,
+            isRiba: isRiba,
+            currency: own ?? currency,
+            category: category,
+            confidence: confidence,
+            reason: reason,
+            page: page
+          };
+          if (!own) defaulted.add(txn);
+          txns.push(txn);
+        }
+      }
+      store(fileIndex, page, txns);
+    },
+    // CSV rows whose columns were mapped (csvColumns.ts): the date, amount and
+    // description come from their own columns, the category and currency from
+    // the whole row as on the line path
+    addRows(fileIndex: number, page: number, rows: CsvRow[]) {
+      const currency = vote(fileIndex, rows.map(row => row.text));
+      const txns: Transaction[] = [];
+      for (const row of rows) {
+        if (!(row.amount > 0)) continue;
+
+        const { category, isRiba, confidence, reason } = detectCategory(row.text);
+        if (!isRiba && !row.date) continue;
+
+        const own = lineCurrency(row.text);
+        const txn: Transaction = {
+          id: transactionId(),
+          date: row.date || new Date().toISOString().split('T')[0],
+          description: (row.description || row.text).substring(0, 80).trim() || "Transaction",
+          amount: row.amount,
+          originalText: row.text,
+          isRiba: isRiba,
+          currency: own ?? currency,
+          category: category,
+          confidence: confidence,
+          reason: reason,
+          page: page
+        };
+        if (!own) defaulted.add(txn);
+        txns.push(txn);
+      }
+      store(fileIndex, page, txns);
+    },
+    // The file's classified pages, once all of them are in
+    exportFile(fileIndex: number): ClassifiedFile {
+      const pages: ClassifiedFile['pages'] = [];
+      files[fileIndex]?.forEach((transactions, page) => {
+        const marks: number[] = [];
+        transactions.forEach((t, i) => { if (defaulted.has(t)) marks.push(i); });
+        pages.push({ page, transactions, defaulted: marks });
+      });
+      return { pages, counts: { ...(fileCounts[fileIndex] ?? zero()) }, lineCount: fileLines[fileIndex] || 0 };
+    },
+    // Add a file classified earlier (see exportFile) as if its pages had just
+    // been classified; transactions get new ids
+    restoreFile(fileIndex: number, saved: ClassifiedFile) {
+      const ownCounts = fileCounts[fileIndex] ??= zero();
+      for (const code of CURRENCY_CODES) {
+        counts[code] += saved.counts[code] || 0;
+        ownCounts[code] += saved.counts[code] || 0;
+      }
+      lineCount += saved.lineCount;
+      fileLines[fileIndex] = (fileLines[fileIndex] || 0) + saved.lineCount;
+      for (const { page, transactions, defaulted: marks } of saved.pages) {
+        const txns = transactions.map(t => ({ ...t, id: transactionId() }));
+        for (const i of marks) defaulted.add(txns[i]);
+        store(fileIndex, page, txns);
+      }
+    },
+    // Forget a file that failed part-way, including its currency votes
+    dropFile(fileIndex: number) {
+      files[fileIndex]?.forEach(txns => txns?.forEach(t => defaulted.delete(t)));
+      delete files[fileIndex];
+      const ownCounts = fileCounts[fileIndex];
+      if (ownCounts) for (const code of CURRENCY_CODES) counts[code] -= ownCounts[code];
+      delete fileCounts[fileIndex];
+      lineCount -= fileLines[fileIndex] || 0;
+      fileLines[fileIndex] = 0;
+    },
+    get lineCount() { return lineCount; },
+    snapshot,
+  };
+};
+
+export type StatementStream = ReturnType<typeof createStatementStream>;
@@ -0,0 +1,280 @@
+// store.ts
+// IndexedDB persistence for purification history, scanned transactions and the user profile
+// (the same database also holds resultCache.ts)
+//
+// History used to be one JSON string in localStorage, re-serialized on every
+// change. Here each record is its own row: a change writes only the records
+// that differ, transactions are read back a page at a time with cursors, and
+// the old localStorage keys are moved over once, the first time the store opens.
+// A history record's transactions can be opened again from the Purification view.
+
+import type { Currency, Transaction } from './statement';
+
+export type FatwaSource = 'global' | 'ecfr' | 'amja' | 'local';
+
+export interface UserProfile {
+  name: string;
+  email: string;
+  joinedDate: string;
+  fatwaSource: FatwaSource;
+}
+
+export interface PurificationRecord {
+  id: string;
+  date: string;
+  amount: number;
+  currency: Currency;
+  statementName: string;
+  itemsCount: number;
+  status: 'pending' | 'disposed';
+  notes?: string;
+}
+
+// A transaction saved with the scan (history record) it came from, and its
+// place in that scan's list (ids are random, so key order is not scan order)
+export interface StoredTransaction extends Transaction {
+  recordId: string;
+  position?: number; // missing on transactions saved before it was added
+}
+
+const DB_NAME = 'ribapurify';
+const DB_VERSION = 2;
+const HISTORY = 'history';
+const TRANSACTIONS = 'transactions';
+const SETTINGS = 'settings';
+export const RESULTS = 'results'; // resultCache.ts entries
+export const RESULT_USAGE = 'resultUsage'; // their size and last use, read for LRU eviction
+const PROFILE_KEY = 'profile';
+const LEGACY_HISTORY_KEY = 'puri_history';
+const LEGACY_PROFILE_KEY = 'user_profile';
+const PAGE_SIZE = 100;
+
+export const request = <T>(req: IDBRequest<T>) => new Promise<T>((resolve, reject) => {
+  req.onsuccess = () => resolve(req.result);
+  req.onerror = () => reject(req.error);
+});
+
+export const complete = (tx: IDBTransaction) => new Promise<void>((resolve, reject) => {
+  tx.oncomplete = () => resolve();
+  tx.onerror = tx.onabort = () => reject(tx.error);
+});
+
+const readLegacy = <T>(key: string): T | null => {
+  try {
+    const saved = localStorage.getItem(key);
+    return saved ? JSON.parse(saved) : null;
+  } catch (e) {
+    console.warn(`Ignoring unreadable ${key}:`, e);
+    return null;
+  }
+};
+
+// One-time move of the localStorage blobs; the keys are removed only once the
+// records are committed, so an interrupted migration runs again next time
+const migrate = async (db: IDBDatabase) => {
+  const history = readLegacy<PurificationRecord[]>(LEGACY_HISTORY_KEY);
+  const profile = readLegacy<UserProfile>(LEGACY_PROFILE_KEY);
+  if (!history && !profile) return;
+
+  const tx = db.transaction([HISTORY, SETTINGS], 'readwrite');
+  const records = tx.objectStore(HISTORY);
+  if (Array.isArray(history)) history.forEach(record => records.put(record));
+  if (profile) tx.objectStore(SETTINGS).put(profile, PROFILE_KEY);
+  await complete(tx);
+  localStorage.removeItem(LEGACY_HISTORY_KEY);
+  localStorage.removeItem(LEGACY_PROFILE_KEY);
+};
+
+let opening: Promise<IDBDatabase> | null = null;
+
+export const openStore = () => opening ??= new Promise<IDBDatabase>((resolve, reject) => {
+  const req = indexedDB.open(DB_NAME, DB_VERSION);
+  req.onupgradeneeded = (event) => {
+    const db = req.result;
+    if (event.oldVersion < 1) {
+      // History ids are Date.now() strings, so key order is scan order
+      const history = db.createObjectStore(HISTORY, { keyPath: 'id' });
+      history.createIndex('date', 'date');
+      history.createIndex('currency', 'currency');
+      history.createIndex('status', 'status');
+      // Keyed by [recordId, id]: one scan's transactions are a single key range
+      const transactions = db.createObjectStore(TRANSACTIONS, { keyPath: ['recordId', 'id'] });
+      transactions.createIndex('date', 'date');
+      transactions.createIndex('currency', 'currency');
+      transactions.createIndex('category', 'category');
+      db.createObjectStore(SETTINGS);
+    }
+    if (event.oldVersion < 2) {
+      db.createObjectStore(RESULTS, { keyPath: 'hash' });
+      db.createObjectStore(RESULT_USAGE, { keyPath: 'hash' }).createIndex('lastUsed', 'lastUsed');
+    }
+  };
+  req.onsuccess = () => resolve(req.result);
+  req.onerror = () => reject(req.error);
+}).then(async db => {
+  await migrate(db);
+  return db;
+}).catch(err => {
+  opening = null;
+  throw err;
+});
+
+// Without IndexedDB (e.g. some private browsing modes) history and profile stay
+// in localStorage as before, and transactions are not kept
+let fallback = false;
+
+const recordTransactions = (recordId: string) => IDBKeyRange.bound([recordId], [recordId, []]);
+
+// Saved history (newest first) and profile; also runs the localStorage migration
+export const loadStore = async (): Promise<{ history: PurificationRecord[]; profile: UserProfile | null }> => {
+  try {
+    const db = await openStore();
+    const tx = db.transaction([HISTORY, SETTINGS]);
+    const [history, profile] = await Promise.all([
+      request(tx.objectStore(HISTORY).getAll() as IDBRequest<PurificationRecord[]>),
+      request(tx.objectStore(SETTINGS).get(PROFILE_KEY) as IDBRequest<UserProfile | undefined>),
+    ]);
+    return { history: history.reverse(), profile: profile ?? null };
+  } catch (e) {
+    console.warn('IndexedDB unavailable, keeping history in localStorage:', e);
+    fallback = true;
+    const history = readLegacy<PurificationRecord[]>(LEGACY_HISTORY_KEY);
+    return { history: Array.isArray(history) ? history : [], profile: readLegacy<UserProfile>(LEGACY_PROFILE_KEY) };
+  }
+};
+
+// Persist the difference between two history states: records are immutable
+// in React state, so only new or replaced objects are written, and removed
+// records are deleted together with their transactions
+export const syncHistory = async (prev: PurificationRecord[], next: PurificationRecord[]) => {
+  if (fallback) {
+    localStorage.setItem(LEGACY_HISTORY_KEY, JSON.stringify(next));
+    return;
+  }
+  const before = new Map(prev.map(record => [record.id, record]));
+  const changed = next.filter(record => before.get(record.id) !== record);
+  const kept = new Set(next.map(record => record.id));
+  const removed = prev.filter(record => !kept.has(record.id));
+  if (changed.length === 0 && removed.length === 0) return;
+
+  const db = await openStore();
+  const tx = db.transaction([HISTORY, TRANSACTIONS], 'readwrite');
+  const records = tx.objectStore(HISTORY);
+  const transactions = tx.objectStore(TRANSACTIONS);
+  changed.forEach(record => records.put(record));
+  removed.forEach(record => {
+    records.delete(record.id);
+    transactions.delete(recordTransactions(record.id));
+  });
+  await complete(tx);
+};
+
+export const saveProfile = async (profile: UserProfile) => {
+  if (fallback) {
+    localStorage.setItem(LEGACY_PROFILE_KEY, JSON.stringify(profile));
+    return;
+  }
+  const db = await openStore();
+  const tx = db.transaction(SETTINGS, 'readwrite');
+  tx.objectStore(SETTINGS).put(profile, PROFILE_KEY);
+  await complete(tx);
+};
+
+// Keep a scan's transactions with its history record
+export const saveTransactions = async (recordId: string, transactions: Transaction[]) => {
+  if (fallback) return;
+  const db = await openStore();
+  const tx = db.transaction(TRANSACTIONS, 'readwrite');
+  const store = tx.objectStore(TRANSACTIONS);
+  transactions.forEach((txn, position) => store.put({ ...txn, recordId, position }));
+  await complete(tx);
+};
+
+// Rewrite one saved transaction (e.g. its riba status was toggled); no-op if it is gone
+export const updateTransaction = async (recordId: string, id: string, update: (txn: Transaction) => Transaction) => {
+  if (fallback) return;
+  const db = await openStore();
+  const tx = db.transaction(TRANSACTIONS, 'readwrite');
+  const store = tx.objectStore(TRANSACTIONS);
+  const saved = await request(store.get([recordId, id]) as IDBRequest<StoredTransaction | undefined>);
+  if (saved) store.put({ ...update(saved), recordId });
+  await complete(tx);
+};
+
+// Position of the last transaction of a page, to resume from
+export interface TransactionCursor {
+  key: IDBValidKey;
+  primaryKey: IDBValidKey;
+}
+
+export interface TransactionQuery {
+  index?: 'date' | 'currency' | 'category';
+  range?: IDBKeyRange | IDBValidKey; // keys of `index`, or [recordId, id] keys without one
+  after?: TransactionCursor | null;
+  limit?: number;
+}
+
+export interface TransactionPage {
+  transactions: StoredTransaction[];
+  next: TransactionCursor | null; // null on the last page
+}
+
+// One page of saved transactions in index order, e.g.
+//   pageTransactions({ index: 'category', range: 'riba' })
+//   pageTransactions({ range: IDBKeyRange.bound([recordId], [recordId, []]) })
+// Pass the returned `next` as `after` for the following page.
+export const pageTransactions = async (query: TransactionQuery = {}): Promise<TransactionPage> => {
+  if (fallback) return { transactions: [], next: null };
+  const { index, range = null, after = null, limit = PAGE_SIZE } = query;
+  const db = await openStore();
+  const store = db.transaction(TRANSACTIONS).objectStore(TRANSACTIONS);
+  const source = index ? store.index(index) : store;
+
+  const transactions: StoredTransaction[] = [];
+  let last: TransactionCursor | null = null;
+  let next: TransactionCursor | null = null;
+  await new Promise<void>((resolve, reject) => {
+    const req = source.openCursor(range);
+    req.onerror = () => reject(req.error);
+    req.onsuccess = () => {
+      const cursor = req.result;
+      if (!cursor) return resolve();
+      if (after) {
+        const byKey = indexedDB.cmp(cursor.key, after.key);
+        const byPrimaryKey = indexedDB.cmp(cursor.primaryKey, after.primaryKey);
+        if (byKey < 0 || (byKey === 0 && byPrimaryKey < 0)) {
+          // Jump straight to where the previous page ended
+          if (index) cursor.continuePrimaryKey(after.key, after.primaryKey);
+          else cursor.continue(after.key);
+          return;
+        }
+        if (byKey === 0 && byPrimaryKey === 0) {
+          cursor.continue();
+          return;
+        }
+      }
+      if (transactions.length === limit) {
+        next = last;
+        return resolve();
+      }
+      transactions.push(cursor.value);
+      last = { key: cursor.key, primaryKey: cursor.primaryKey };
+      cursor.continue();
+    };
+  });
+  return { transactions, next };
+};
+
+// A scan's saved transactions in their original order, read a page at a time;
+// empty if none were kept (IndexedDB unavailable, or a scan from before they were)
+export const loadTransactions = async (recordId: string): Promise<Transaction[]> => {
+  const saved: StoredTransaction[] = [];
+  let after: TransactionCursor | null = null;
+  do {
+    const page = await pageTransactions({ range: recordTransactions(recordId), after });
+    saved.push(...page.transactions);
+    after = page.next;
+  } while (after);
+  saved.sort((a, b) => (a.position ?? 0) - (b.position ?? 0));
+  return saved.map(({ recordId, position, ...txn }) => txn);
+};
@@ -1,48 +1,216 @@
 // Service Worker for RibaPurify PWA
-const CACHE_NAME = 'ribapurify-v1';
-const urlsToCache = [
-  '/',
-  '/index.html',
-  '/favicon.svg',
-  '/apple-touch-icon.png',
-  '/web-app-manifest-192x192.png',
-  '/web-app-manifest-512x512.png'
-];
-
-// Install event - cache essential files
+//
+// `vite build` prepends `self.__PRECACHE` (see precacheManifest() in
+// vite.config.ts): every emitted file and top-level public file with a hash of
+// its content, plus a version hashed from that list. Under `vite dev` there is
+// no manifest and nothing is precached.
+const PRECACHE = self.__PRECACHE || { version: 'dev', entries: [] };
+const PRECACHE_CACHE = `ribapurify-precache-${PRECACHE.version}`;
+
+// Locale assets from scripts/build_locales.py. Files under /i18n/assets/ carry
+// a content hash in their name and never change, so they live in their own
+// cache that survives new builds; the manifest comes from the network whenever
+// it can, and the previous build's files are kept for pages still using them.
+const I18N_CACHE = 'ribapurify-i18n';
+const I18N_MANIFEST = '/i18n/manifest.json';
+const I18N_ASSETS = '/i18n/assets/';
+
+// Tesseract's worker script, WASM core and traineddata (from cdn.jsdelivr.net
+// by default) and any other .wasm: large and versioned by URL, so cache first.
+// The cache holds at most MODEL_BUDGET bytes, least recently used go first.
+const MODEL_CACHE = 'ribapurify-models';
+const MODEL_INDEX = '/__model-index'; // { [url]: { size, lastUsed } }
+const MODEL_BUDGET = 150 * 1024 * 1024;
+// importScripts() responses are opaque and hide their size; browsers also pad
+// them when counting quota, so assume a few megabytes each
+const OPAQUE_SIZE = 8 * 1024 * 1024;
+
+const CURRENT_CACHES = [PRECACHE_CACHE, I18N_CACHE, MODEL_CACHE];
+
+// Revision in the key, so an unchanged file can be copied between precache versions
+const precacheKey = (entry) => `${entry.url}?__rev=${entry.revision}`;
+const precacheKeys = new Map(PRECACHE.entries.map((entry) => [entry.url, precacheKey(entry)]));
+const APP_SHELL = precacheKeys.get('/index.html');
+
+// Drop hashed locale files neither manifest references: the new one, and the
+// one it replaces, which pages opened before the deploy are still reading
+// from. Blog post bodies are listed in their locale's blog index rather than
+// the manifest, so they are kept while a cached index points at them.
+const pruneLocaleAssets = (manifests) => {
+  const live = new Set();
+  const blogIndexes = [];
+  manifests.forEach((manifest) => Object.values(manifest.locales || {}).forEach((entry) => {
+    live.add(new URL(entry.strings, self.location.origin).href);
+    if (entry.blog) blogIndexes.push(new URL(entry.blog, self.location.origin).href);
+  }));
+  blogIndexes.forEach((url) => live.add(url));
+  return caches.open(I18N_CACHE).then((cache) =>
+    Promise.all(blogIndexes.map((url) => cache.match(url)
+      .then((cached) => (cached ? cached.json() : []))
+      .then((posts) => posts.forEach((post) => live.add(new URL(post.body, self.location.origin).href)))
+      .catch(() => {})
+    ))
+      .then(() => cache.keys())
+      .then((requests) => Promise.all(
+        requests
+          .filter((request) => request.url.includes(I18N_ASSETS) && !live.has(request.url))
+          .map((request) => cache.delete(request))
+      ))
+  );
+};
+
+// Network first, so a page never gets a manifest naming files the server has
+// already replaced; the cached copy is only for when the network fails
+// (offline). A changed manifest replaces the cached one and prunes the files
+// of the build before that.
+const fetchLocaleManifest = (event) =>
+  caches.open(I18N_CACHE).then((cache) => fetch(event.request).then((response) => {
+    if (!response.ok) return response;
+    const fresh = response.clone();
+    event.waitUntil(
+      Promise.all([fresh.text(), cache.match(I18N_MANIFEST).then((cached) => (cached ? cached.text() : null))])
+        .then(([text, previous]) => {
+          if (text === previous) return undefined;
+          const manifests = [JSON.parse(text)];
+          if (previous) manifests.push(JSON.parse(previous));
+          return cache.put(I18N_MANIFEST, new Response(text, { headers: fresh.headers }))
+            .then(() => pruneLocaleAssets(manifests));
+        })
+        .catch(() => {})
+    );
+    return response;
+  }, (error) => cache.match(I18N_MANIFEST).then((cached) => {
+    if (cached) return cached;
+    throw error;
+  })));
+
+// Hashed assets are immutable: cache first, network only on a miss
+const fetchLocaleAsset = (request) =>
+  caches.open(I18N_CACHE).then((cache) =>
+    cache.match(request).then((cached) => cached || fetch(request).then((response) => {
+      if (response.ok) cache.put(request, response.clone());
+      return response;
+    }))
+  );
+
+const isModelAsset = (url) =>
+  /\.wasm(\.js)?$|\.traineddata(\.gz)?$/.test(url.pathname) ||
+  (url.hostname === 'cdn.jsdelivr.net' && /^\/npm\/(@tesseract\.js-data\/|tesseract\.js(-core)?@)/.test(url.pathname));
+
+// Read-modify-write of the model index, one at a time
+let modelIndexQueue = Promise.resolve();
+const updateModelIndex = (change) => {
+  modelIndexQueue = modelIndexQueue.then(async () => {
+    const cache = await caches.open(MODEL_CACHE);
+    const saved = await cache.match(MODEL_INDEX);
+    const index = saved ? await saved.json() : {};
+    await change(cache, index);
+    await cache.put(MODEL_INDEX, new Response(JSON.stringify(index), {
+      headers: { 'Content-Type': 'application/json' },
+    }));
+  }).catch(() => {});
+  return modelIndexQueue;
+};
+
+// Add a model file, then evict least recently used ones over budget
+const storeModelAsset = (request, response) => updateModelIndex(async (cache, index) => {
+  const size = Number(response.headers.get('Content-Length')) ||
+    (response.type === 'opaque' ? OPAQUE_SIZE : (await response.clone().blob()).size);
+  if (size > MODEL_BUDGET) return;
+  await cache.put(request, response);
+  index[request.url] = { size, lastUsed: Date.now() };
+
+  const urls = Object.keys(index).sort((a, b) => index[a].lastUsed - index[b].lastUsed);
+  let total = urls.reduce((n, url) => n + index[url].size, 0);
+  for (const url of urls) {
+    if (total <= MODEL_BUDGET) break;
+    if (url === request.url) continue;
+    await cache.delete(url);
+    total -= index[url].size;
+    delete index[url];
+  }
+});
+
+const fetchModelAsset = (event) =>
+  caches.open(MODEL_CACHE).then((cache) => cache.match(event.request).then((cached) => {
+    if (cached) {
+      event.waitUntil(updateModelIndex((_, index) => {
+        if (index[event.request.url]) index[event.request.url].lastUsed = Date.now();
+      }));
+      return cached;
+    }
+    return fetch(event.request).then((response) => {
+      // Opaque responses (importScripts from the CDN) cannot be checked for errors,
+      // but their URLs are pinned to a package version
+      if (response.ok || response.type === 'opaque') {
+        event.waitUntil(storeModelAsset(event.request, response.clone()));
+      }
+      return response;
+    });
+  }));
+
+// Precached files, and the app shell for navigations to extension-less paths
+const precachedKey = (request, url) => {
+  const key = precacheKeys.get(url.pathname);
+  if (key) return key;
+  if (request.mode === 'navigate' && !/\.[^/]*$/.test(url.pathname)) return APP_SHELL;
+  return undefined;
+};
+
+// Install event - fill this build's precache, copying files whose revision
+// is already cached by the previous build instead of downloading them again.
+// No skipWaiting(): open tabs of the previous build lazily import its hashed
+// chunks, so the new worker waits until none of them is left before it
+// activates and deletes the old precache.
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => cache.addAll(urlsToCache))
-      .then(() => self.skipWaiting())
+    caches.open(PRECACHE_CACHE).then((cache) => Promise.all(PRECACHE.entries.map((entry) => {
+      const key = precacheKey(entry);
+      return caches.match(key)
+        .then((cached) => cached || fetch(entry.url, { cache: 'reload' }).then((response) => {
+          if (!response.ok) throw new Error(`Precaching ${entry.url} failed: ${response.status}`);
+          return response;
+        }))
+        .then((response) => cache.put(key, response));
+    })))
   );
 });
 
-// Activate event - clean up old caches
+// Activate event - delete caches of earlier builds (and the old ribapurify-v1),
+// which no page uses by now; claim() only takes pages opened before the first install
 self.addEventListener('activate', (event) => {
   event.waitUntil(
-    caches.keys().then((cacheNames) => {
-      return Promise.all(
-        cacheNames.map((cacheName) => {
-          if (cacheName !== CACHE_NAME) {
-            return caches.delete(cacheName);
-          }
-        })
-      );
-    }).then(() => self.clients.claim())
+    caches.keys().then((cacheNames) => Promise.all(
+      cacheNames
+        .filter((cacheName) => !CURRENT_CACHES.includes(cacheName))
+        .map((cacheName) => caches.delete(cacheName))
+    )).then(() => self.clients.claim())
   );
 });
 
-// Fetch event - serve from cache, fallback to network
+// Fetch event - precache, then the runtime caches; anything else goes to the network
 self.addEventListener('fetch', (event) => {
-  event.respondWith(
-    caches.match(event.request)
-      .then((response) => {
-        // Cache hit - return response
-        if (response) {
-          return response;
-        }
-        return fetch(event.request);
-      })
-  );
+  const { request } = event;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+
+  if (url.origin === self.location.origin) {
+    if (url.pathname === I18N_MANIFEST) {
+      event.respondWith(fetchLocaleManifest(event));
+      return;
+    }
+    if (url.pathname.startsWith(I18N_ASSETS)) {
+      event.respondWith(fetchLocaleAsset(request));
+      return;
+    }
+    const key = precachedKey(request, url);
+    if (key) {
+      event.respondWith(
+        caches.match(key, { cacheName: PRECACHE_CACHE }).then((cached) => cached || fetch(request))
+      );
+      return;
+    }
+  }
+
+  if (isModelAsset(url)) event.respondWith(fetchModelAsset(event));
 });
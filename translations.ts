@@ -100,6 +100,8 @@ export const TRANSLATIONS = {
     puri_streak: "Current Streak",
     puri_total: "Lifetime Purified",
     puri_clear: "Clear History",
+    puri_btn_view: "View transactions",
+    puri_no_saved_transactions: "No transactions were saved with this scan.",
     puri_clear_confirm: "Are you sure you want to clear your entire purification history? This action cannot be undone.",
     puri_clear_btn: "Yes, Clear All",
     puri_cancel_btn: "Cancel",
@@ -191,6 +193,13 @@ export const TRANSLATIONS = {
     error_processing_failed: "An error occurred while processing your files. Please try again.",
     financial_purity_score: "Financial Purity Score",
     export_certificate_pdf: "Export Certificate (PDF)",
+    export_report: "Export Report",
+    export_riba_only: "Riba transactions only",
+    export_date_from: "From",
+    export_date_to: "To",
+    export_start: "Export",
+    export_done: "transactions exported",
+    export_failed: "The export failed. Please try again.",
     cert_footer_confirmation: "This certificate confirms the detection and calculation of prohibited interest (Riba).",
     cert_footer_privacy: "All processing was performed locally on your device. No data was transmitted to external servers.",
     cert_footer_id: "Certificate ID",
@@ -320,6 +329,8 @@ hi: {
     puri_streak: "मौजूदा स्ट्रीक",
     puri_total: "कुल पाक किया गया",
     puri_clear: "हिस्ट्री साफ़ करें",
+    puri_btn_view: "लेनदेन देखें",
+    puri_no_saved_transactions: "इस स्कैन के साथ कोई लेनदेन सहेजा नहीं गया था।",
     puri_clear_confirm: "क्या आप पूरा तत्हीर इतिहास साफ़ करना चाहते हैं? यह वापस नहीं होगा।",
     puri_clear_btn: "हाँ, साफ़ करें",
     puri_cancel_btn: "रद्द करें",
@@ -386,6 +397,13 @@ hi: {
     puri_no_disposed: "अभी तक कोई आइटम निपटाया नहीं गया।",
     financial_purity_score: "माली पाकीज़गी स्कोर",
     export_certificate_pdf: "सर्टिफ़िकेट (PDF) एक्सपोर्ट करें",
+    export_report: "रिपोर्ट एक्सपोर्ट करें",
+    export_riba_only: "केवल रिबा लेनदेन",
+    export_date_from: "से",
+    export_date_to: "तक",
+    export_start: "एक्सपोर्ट करें",
+    export_done: "लेनदेन एक्सपोर्ट किए गए",
+    export_failed: "एक्सपोर्ट विफल रहा। कृपया फिर से प्रयास करें।",
     cert_footer_confirmation: "यह सर्टिफ़िकेट रिबा की पहचान और हिसाब की तस्दीक़ करता है।",
     donate_title: "दान करें और पाकी हासिल करें",
     donate_subtitle: "पकड़ी गई रिबा की रकम को दान करके अपनी पाकी (तथीर) पूरी करें। यह सफाई का अमल है, सवाब कमाने के लिए नहीं।",
@@ -534,6 +552,8 @@ hi: {
     puri_streak: "Série actuelle",
     puri_total: "Total Purifié",
     puri_clear: "Effacer l'historique",
+    puri_btn_view: "Voir les transactions",
+    puri_no_saved_transactions: "Aucune transaction n'a été enregistrée avec cette analyse.",
     puri_clear_confirm: "Êtes-vous sûr de vouloir effacer tout votre historique de purification ? Cette action est irréversible.",
     puri_clear_btn: "Oui, tout effacer",
     puri_cancel_btn: "Annuler",
@@ -624,6 +644,13 @@ hi: {
     error_processing_failed: "Une erreur s'est produite lors du traitement de vos fichiers. Veuillez réessayer.",
     financial_purity_score: "Score de pureté financière",
     export_certificate_pdf: "Exporter le certificat (PDF)",
+    export_report: "Exporter le rapport",
+    export_riba_only: "Transactions riba uniquement",
+    export_date_from: "Du",
+    export_date_to: "Au",
+    export_start: "Exporter",
+    export_done: "transactions exportées",
+    export_failed: "L'exportation a échoué. Veuillez réessayer.",
     cert_footer_confirmation: "Ce certificat confirme la détection et le calcul des intérêts interdits (Riba).",
     cert_footer_privacy: "Tout le traitement a été effectué localement sur votre appareil. Aucune donnée n'a été transmise à des serveurs externes.",
     cert_footer_id: "ID du certificat",
@@ -755,6 +782,8 @@ hi: {
     puri_streak: "التتابع الحالي",
     puri_total: "إجمالي ما تم تطهيره",
     puri_clear: "مسح السجل",
+    puri_btn_view: "عرض المعاملات",
+    puri_no_saved_transactions: "لم تُحفظ أي معاملات مع هذا الفحص.",
     puri_clear_confirm: "هل أنت متأكد أنك تريد مسح سجل التطهير بالكامل؟ لا يمكن التراجع عن هذا الإجراء.",
     puri_clear_btn: "نعم، امسح الكل",
     puri_cancel_btn: "إلغاء",
@@ -846,6 +875,13 @@ hi: {
     error_processing_failed: "حدث خطأ أثناء معالجة الملفات. يرجى المحاولة مرة أخرى.",
     financial_purity_score: "درجة النقاء المالي",
     export_certificate_pdf: "تصدير الشهادة (PDF)",
+    export_report: "تصدير التقرير",
+    export_riba_only: "معاملات الربا فقط",
+    export_date_from: "من",
+    export_date_to: "إلى",
+    export_start: "تصدير",
+    export_done: "معاملة تم تصديرها",
+    export_failed: "فشل التصدير. يرجى المحاولة مرة أخرى.",
     cert_footer_confirmation: "تؤكد هذه الشهادة اكتشاف وحساب الفوائد المحرمة (الربا).",
     cert_footer_privacy: "تمت جميع المعالجات محليًا على جهازك. لم يتم نقل أي بيانات إلى خوادم خارجية.",
     cert_footer_id: "رقم الشهادة",
@@ -977,6 +1013,8 @@ hi: {
     puri_streak: "مسلسل",
     puri_total: "کل پاک کیا گیا",
     puri_clear: "تاریخ صاف کریں",
+    puri_btn_view: "لین دین دیکھیں",
+    puri_no_saved_transactions: "اس اسکین کے ساتھ کوئی لین دین محفوظ نہیں کی گئی۔",
     puri_clear_confirm: "کیا آپ واقعی اپنی تمام تطہیر کی تاریخ کو صاف کرنا چاہتے ہیں؟ اس عمل کو واپس نہیں کیا جا سکتا۔",
     puri_clear_btn: "ہاں، سب صاف کریں",
     puri_cancel_btn: "منسوخ کریں",
@@ -1068,6 +1106,13 @@ hi: {
     error_processing_failed: "آپ کی فائلوں کو پروسیس کرتے وقت خرابی پیش آئی۔ براہ کرم دوبارہ کوشش کریں۔",
     financial_purity_score: "مالی پاکیزگی اسکور",
     export_certificate_pdf: "سرٹیفکیٹ برآمد کریں (PDF)",
+    export_report: "رپورٹ برآمد کریں",
+    export_riba_only: "صرف سود والی لین دین",
+    export_date_from: "سے",
+    export_date_to: "تک",
+    export_start: "برآمد کریں",
+    export_done: "لین دین برآمد کی گئیں",
+    export_failed: "برآمد ناکام ہو گئی۔ براہ کرم دوبارہ کوشش کریں۔",
     cert_footer_confirmation: "یہ سرٹیفکیٹ حرام سود (ربا) کی شناخت اور حساب کی تصدیق کرتا ہے۔",
     cert_footer_privacy: "تمام پروسیسنگ آپ کے ڈیوائس پر مقامی طور پر کی گئی۔ کوئی ڈیٹا بیرونی سرورز پر منتقل نہیں کیا گیا۔",
     cert_footer_id: "سرٹیفکیٹ نمبر",
@@ -1199,6 +1244,8 @@ hi: {
     puri_streak: "বর্তমান স্ট্রিক",
     puri_total: "মোট পবিত্র করা হয়েছে",
     puri_clear: "ইতিহাস মুছুন",
+    puri_btn_view: "লেনদেন দেখুন",
+    puri_no_saved_transactions: "এই স্ক্যানের সাথে কোনো লেনদেন সংরক্ষিত হয়নি।",
     puri_clear_confirm: "আপনি কি নিশ্চিত যে আপনি আপনার সমস্ত পবিত্রকরণের ইতিহাস মুছে ফেলতে চান? এই ক্রিয়াটি পূর্বাবস্থায় ফেরানো যাবে না।",
     puri_clear_btn: "হ্যাঁ, সব মুছুন",
     puri_cancel_btn: "বাতিল করুন",
@@ -1279,6 +1326,13 @@ hi: {
     error_processing_failed: "আপনার ফাইল প্রক্রিয়াকরণে ত্রুটি ঘটেছে। অনুগ্রহ করে আবার চেষ্টা করুন।",
     financial_purity_score: "আর্থিক পবিত্রতা স্কোর",
     export_certificate_pdf: "সার্টিফিকেট রপ্তানি করুন (PDF)",
+    export_report: "রিপোর্ট রপ্তানি করুন",
+    export_riba_only: "শুধু রিবা লেনদেন",
+    export_date_from: "থেকে",
+    export_date_to: "পর্যন্ত",
+    export_start: "রপ্তানি করুন",
+    export_done: "লেনদেন রপ্তানি হয়েছে",
+    export_failed: "রপ্তানি ব্যর্থ হয়েছে। অনুগ্রহ করে আবার চেষ্টা করুন।",
     cert_footer_confirmation: "এই সার্টিফিকেট নিষিদ্ধ সুদ (রিবা) শনাক্তকরণ এবং গণনা নিশ্চিত করে।",
     cert_footer_privacy: "সমস্ত প্রক্রিয়াকরণ আপনার ডিভাইসে স্থানীয়ভাবে করা হয়েছে। কোনো ডেটা বাহ্যিক সার্ভারে স্থানান্তরিত হয়নি।",
     cert_footer_id: "সার্টিফিকেট আইডি",
@@ -1410,6 +1464,8 @@ hi: {
     puri_streak: "Kemenangan Semasa",
     puri_total: "Total Disucikan",
     puri_clear: "Hapus Riwayat",
+    puri_btn_view: "Lihat transaksi",
+    puri_no_saved_transactions: "Tidak ada transaksi yang disimpan dengan pemindaian ini.",
     puri_clear_confirm: "Apakah Anda yakin ingin menghapus seluruh riwayat penyucian Anda? Tindakan ini tidak dapat dibatalkan.",
     puri_clear_btn: "Ya, Hapus Semua",
     puri_cancel_btn: "Batal",
@@ -1490,6 +1546,13 @@ hi: {
     error_processing_failed: "Terjadi kesalahan saat memproses file Anda. Silakan coba lagi.",
     financial_purity_score: "Skor Kemurnian Keuangan",
     export_certificate_pdf: "Ekspor Sertifikat (PDF)",
+    export_report: "Ekspor Laporan",
+    export_riba_only: "Hanya transaksi riba",
+    export_date_from: "Dari",
+    export_date_to: "Sampai",
+    export_start: "Ekspor",
+    export_done: "transaksi diekspor",
+    export_failed: "Ekspor gagal. Silakan coba lagi.",
     cert_footer_confirmation: "Sertifikat ini mengonfirmasi deteksi dan perhitungan bunga terlarang (Riba).",
     cert_footer_privacy: "Semua pemrosesan dilakukan secara lokal pada perangkat Anda. Tidak ada data yang ditransmisikan ke server eksternal.",
     cert_footer_id: "ID Sertifikat",
@@ -1621,6 +1684,8 @@ hi: {
     puri_streak: "Kemenangan Semasa",
     puri_total: "Jumlah Disucikan",
     puri_clear: "Kosongkan Sejarah",
+    puri_btn_view: "Lihat transaksi",
+    puri_no_saved_transactions: "Tiada transaksi disimpan bersama imbasan ini.",
     puri_clear_confirm: "Adakah anda pasti mahu mengosongkan keseluruhan sejarah penyucian anda? Tindakan ini tidak boleh dibatalkan.",
     puri_clear_btn: "Ya, Kosongkan Semua",
     puri_cancel_btn: "Batal",
@@ -1700,6 +1765,13 @@ hi: {
     error_processing_failed: "Ralat berlaku semasa memproses fail anda. Sila cuba lagi.",
     financial_purity_score: "Skor Kesucian Kewangan",
     export_certificate_pdf: "Eksport Sijil (PDF)",
+    export_report: "Eksport Laporan",
+    export_riba_only: "Transaksi riba sahaja",
+    export_date_from: "Dari",
+    export_date_to: "Hingga",
+    export_start: "Eksport",
+    export_done: "transaksi dieksport",
+    export_failed: "Eksport gagal. Sila cuba lagi.",
     cert_footer_confirmation: "Sijil ini mengesahkan pengesanan dan pengiraan faedah terlarang (Riba).",
     cert_footer_privacy: "Semua pemprosesan dilakukan secara tempatan pada peranti anda. Tiada data dihantar ke pelayan luaran.",
     cert_footer_id: "ID Sijil",
@@ -1831,6 +1903,8 @@ hi: {
     puri_streak: "当前连胜",
     puri_total: "累计净化",
     puri_clear: "清除历史",
+    puri_btn_view: "查看交易",
+    puri_no_saved_transactions: "此次扫描没有保存任何交易。",
     puri_clear_confirm: "您确定要清除所有净化历史记录吗？此操作无法撤消。",
     puri_clear_btn: "是的，全部清除",
     puri_cancel_btn: "取消",
@@ -1910,6 +1984,13 @@ hi: {
     error_processing_failed: "处理您的文件时出错。请重试。",
     financial_purity_score: "财务纯度分数",
     export_certificate_pdf: "导出证书（PDF）",
+    export_report: "导出报告",
+    export_riba_only: "仅利息（Riba）交易",
+    export_date_from: "从",
+    export_date_to: "至",
+    export_start: "导出",
+    export_done: "笔交易已导出",
+    export_failed: "导出失败，请重试。",
     cert_footer_confirmation: "本证书确认禁止利息（里巴）的检测和计算。",
     cert_footer_privacy: "所有处理均在您的设备上本地执行。没有数据传输到外部服务器。",
     cert_footer_id: "证书编号",
@@ -2039,6 +2120,8 @@ hi: {
     puri_streak: "Aktuelle Serie",
     puri_total: "Gesamt gereinigt",
     puri_clear: "Verlauf löschen",
+    puri_btn_view: "Transaktionen ansehen",
+    puri_no_saved_transactions: "Mit diesem Scan wurden keine Transaktionen gespeichert.",
     puri_clear_confirm: "Sind Sie sicher, dass Sie den gesamten Verlauf löschen möchten? Dies kann nicht rückgängig gemacht werden.",
     puri_clear_btn: "Ja, Alles Löschen",
     puri_cancel_btn: "Abbrechen",
@@ -2118,6 +2201,13 @@ hi: {
     error_processing_failed: "Beim Verarbeiten Ihrer Dateien ist ein Fehler aufgetreten. Bitte versuchen Sie es erneut.",
     financial_purity_score: "Finanzreinheitsbewertung",
     export_certificate_pdf: "Zertifikat exportieren (PDF)",
+    export_report: "Bericht exportieren",
+    export_riba_only: "Nur Riba-Transaktionen",
+    export_date_from: "Von",
+    export_date_to: "Bis",
+    export_start: "Exportieren",
+    export_done: "Transaktionen exportiert",
+    export_failed: "Der Export ist fehlgeschlagen. Bitte versuchen Sie es erneut.",
     cert_footer_confirmation: "Dieses Zertifikat bestätigt die Erkennung und Berechnung verbotener Zinsen (Riba).",
     cert_footer_privacy: "Die gesamte Verarbeitung wurde lokal auf Ihrem Gerät durchgeführt. Es wurden keine Daten an externe Server übertragen.",
     cert_footer_id: "Zertifikat-ID",
@@ -2249,6 +2339,8 @@ hi: {
     puri_streak: "Серия",
     puri_total: "Очищено",
     puri_clear: "Очистить историю",
+    puri_btn_view: "Показать операции",
+    puri_no_saved_transactions: "С этим сканированием операции не сохранялись.",
     puri_clear_confirm: "Вы уверены, что хотите очистить всю историю? Это действие нельзя отменить.",
     puri_clear_btn: "Да, очистить все",
     puri_cancel_btn: "Отмена",
@@ -2328,6 +2420,13 @@ hi: {
     error_processing_failed: "Произошла ошибка при обработке ваших файлов. Пожалуйста, попробуйте снова.",
     financial_purity_score: "Оценка финансовой чистоты",
     export_certificate_pdf: "Экспорт сертификата (PDF)",
+    export_report: "Экспорт отчёта",
+    export_riba_only: "Только операции с рибой",
+    export_date_from: "С",
+    export_date_to: "По",
+    export_start: "Экспортировать",
+    export_done: "операций экспортировано",
+    export_failed: "Не удалось выполнить экспорт. Попробуйте ещё раз.",
     cert_footer_confirmation: "Этот сертификат подтверждает обнаружение и расчет запрещенных процентов (Риба).",
     cert_footer_privacy: "Вся обработка выполнялась локально на вашем устройстве. Никакие данные не передавались на внешние серверы.",
     cert_footer_id: "ID сертификата",
@@ -2459,6 +2558,8 @@ hi: {
     puri_streak: "Huidige Reeks",
     puri_total: "Totaal Gezuiverd",
     puri_clear: "Geschiedenis wissen",
+    puri_btn_view: "Transacties bekijken",
+    puri_no_saved_transactions: "Bij deze scan zijn geen transacties opgeslagen.",
     puri_clear_confirm: "Weet u zeker dat u uw volledige zuiveringsgeschiedenis wilt wissen? Dit kan niet ongedaan gemaakt worden.",
     puri_clear_btn: "Ja, Alles Wissen",
     puri_cancel_btn: "Annuleren",
@@ -2538,6 +2639,13 @@ hi: {
     error_processing_failed: "Er is een fout opgetreden bij het verwerken van uw bestanden. Probeer het opnieuw.",
     financial_purity_score: "Financiële zuiverheidsscore",
     export_certificate_pdf: "Certificaat exporteren (PDF)",
+    export_report: "Rapport exporteren",
+    export_riba_only: "Alleen riba-transacties",
+    export_date_from: "Van",
+    export_date_to: "Tot",
+    export_start: "Exporteren",
+    export_done: "transacties geëxporteerd",
+    export_failed: "Het exporteren is mislukt. Probeer het opnieuw.",
     cert_footer_confirmation: "Dit certificaat bevestigt de detectie en berekening van verboden rente (Riba).",
     cert_footer_privacy: "Alle verwerking werd lokaal uitgevoerd op uw apparaat. Er zijn geen gegevens verzonden naar externe servers.",
     cert_footer_id: "Certificaat-ID",
@@ -2669,6 +2777,8 @@ hi: {
     puri_streak: "רצף נוכחי",
     puri_total: "סך הכל טוהר",
     puri_clear: "נקה היסטוריה",
+    puri_btn_view: "הצג עסקאות",
+    puri_no_saved_transactions: "לא נשמרו עסקאות עם סריקה זו.",
     puri_clear_confirm: "האם אתה בטוח שברצונך לנקות את כל היסטוריית הטהרה שלך? פעולה זו אינה הפיכה.",
     puri_clear_btn: "כן, נקה הכל",
     puri_cancel_btn: "ביטול",
@@ -2748,6 +2858,13 @@ hi: {
     error_processing_failed: "אירעה שגיאה בעיבוד הקבצים שלך. אנא נסה שוב.",
     financial_purity_score: "ציון טוהר פיננסי",
     export_certificate_pdf: "ייצא תעודה (PDF)",
+    export_report: "ייצא דוח",
+    export_riba_only: "עסקאות ריבא בלבד",
+    export_date_from: "מתאריך",
+    export_date_to: "עד תאריך",
+    export_start: "ייצא",
+    export_done: "עסקאות יוצאו",
+    export_failed: "הייצוא נכשל. אנא נסה שוב.",
     cert_footer_confirmation: "תעודה זו מאשרת זיהוי וחישוב ריבית אסורה (ריבא).",
     cert_footer_privacy: "כל העיבוד בוצע מקומית במכשיר שלך. לא הועברו נתונים לשרתים חיצוניים.",
     cert_footer_id: "מזהה תעודה",
@@ -2880,6 +2997,8 @@ hi: {
     puri_streak: "Trenutni niz",
     puri_total: "Ukupno očišćeno",
     puri_clear: "Očisti historiju",
+    puri_btn_view: "Prikaži transakcije",
+    puri_no_saved_transactions: "Uz ovo skeniranje nisu sačuvane transakcije.",
     login_title: "Prijava",
     login_subtitle: "Lokalni profil (bez servera)",
     login_email_ph: "Email",
@@ -2956,6 +3075,13 @@ hi: {
     error_processing_failed: "Došlo je do greške pri obradi vaših datoteka. Molimo pokušajte ponovo.",
     financial_purity_score: "Ocjena finansijske čistoće",
     export_certificate_pdf: "Izvezi certifikat (PDF)",
+    export_report: "Izvezi izvještaj",
+    export_riba_only: "Samo riba transakcije",
+    export_date_from: "Od",
+    export_date_to: "Do",
+    export_start: "Izvezi",
+    export_done: "transakcija izvezeno",
+    export_failed: "Izvoz nije uspio. Pokušajte ponovo.",
     cert_footer_confirmation: "Ovaj certifikat potvrđuje detekciju i proračun zabranjene kamate (Riba).",
     cert_footer_privacy: "Sva obrada je izvršena lokalno na vašem uređaju. Nijedan podatak nije prenesen na externe servere.",
     cert_footer_id: "ID certifikata",
@@ -3088,6 +3214,8 @@ hi: {
     puri_streak: "Mevcut seri",
     puri_total: "Toplam temizlendi",
     puri_clear: "Geçmişi Temizle",
+    puri_btn_view: "İşlemleri görüntüle",
+    puri_no_saved_transactions: "Bu taramayla hiçbir işlem kaydedilmedi.",
     puri_clear_confirm: "Adakah anda pasti mahu mengosongkan keseluruhan sejarah penyucian anda? Tindakan ini tidak boleh dibatalkan.",
     puri_clear_btn: "Ya, Kosongkan Semua",
     puri_cancel_btn: "Batal",
@@ -3167,6 +3295,13 @@ hi: {
     error_processing_failed: "Dosyalarınızı işlerken bir hata oluştu. Lütfen tekrar deneyin.",
     financial_purity_score: "Mali Saflık Skoru",
     export_certificate_pdf: "Sertifikayı Dışa Aktar (PDF)",
+    export_report: "Raporu Dışa Aktar",
+    export_riba_only: "Yalnızca riba işlemleri",
+    export_date_from: "Başlangıç",
+    export_date_to: "Bitiş",
+    export_start: "Dışa Aktar",
+    export_done: "işlem dışa aktarıldı",
+    export_failed: "Dışa aktarma başarısız oldu. Lütfen tekrar deneyin.",
     cert_footer_confirmation: "Bu sertifika yasak faizin (Riba) tespitini ve hesaplamasını onaylar.",
     cert_footer_privacy: "Tüm işlemler cihazınızda yerel olarak gerçekleştirildi. Harici sunuculara hiçbir veri aktarılmadı.",
     cert_footer_id: "Sertifika Kimliği",
@@ -3299,6 +3434,8 @@ hi: {
     puri_streak: "Seria Aktuale",
     puri_total: "Totali i Pastruar",
     puri_clear: "Pastro Historinë",
+    puri_btn_view: "Shiko transaksionet",
+    puri_no_saved_transactions: "Asnjë transaksion nuk u ruajt me këtë skanim.",
     puri_clear_confirm: "A jeni i sigurt se doni të pastroni të gjithë historinë tuaj të pastrimit?",
     puri_clear_btn: "Po, Pastro Gjithçka",
     puri_cancel_btn: "Anulo",
@@ -3376,6 +3513,13 @@ hi: {
     error_processing_failed: "Ndodhi një gabim gjatë përpunimit të skedarëve tuaj. Ju lutemi provoni përsëri.",
     financial_purity_score: "Rezultati i Pastërtisë Financiare",
     export_certificate_pdf: "Eksporto Çertifikatën (PDF)",
+    export_report: "Eksporto raportin",
+    export_riba_only: "Vetëm transaksionet me riba",
+    export_date_from: "Nga",
+    export_date_to: "Deri",
+    export_start: "Eksporto",
+    export_done: "transaksione u eksportuan",
+    export_failed: "Eksportimi dështoi. Ju lutemi provoni përsëri.",
     cert_footer_confirmation: "Ky çertifikatë konfirmon zbulimin dhe llogaritjen e interesit të ndaluar (Riba).",
     cert_footer_privacy: "I gjithë përpunimi u krye lokalisht në pajisjen tuaj. Asnjë të dhënë nuk u transmetua në serverë të jashtëm.",
     cert_footer_id: "ID e Çertifikatës",
@@ -1,7 +1,44 @@
+import { createHash } from 'crypto';
+import fs from 'fs';
 import path from 'path';
 import { defineConfig, loadEnv } from 'vite';
+import type { Plugin } from 'vite';
 import react from '@vitejs/plugin-react';
 
+const contentHash = (content: string | Uint8Array) =>
+  createHash('sha256').update(content).digest('hex').slice(0, 10);
+
+// Emits sw.js with this build's precache manifest: every file in the bundle
+// (chunks, CSS, workers, the pdf.js worker, index.html) and the top-level
+// public files, each with a hash of its content. The version hashes the whole
+// list, so a deploy that changes any file installs a new precache.
+const precacheManifest = (): Plugin => ({
+  name: 'ribapurify-precache',
+  apply: 'build',
+  enforce: 'post', // after index.html and the worker bundles are emitted
+  generateBundle(_options, bundle) {
+    const entries = Object.values(bundle)
+      .filter(file => !file.fileName.endsWith('.map'))
+      .map(file => ({
+        url: `/${file.fileName}`,
+        revision: contentHash(file.type === 'chunk' ? file.code : file.source),
+      }));
+    // i18n/ has its own runtime cache in sw.js
+    const publicDir = path.resolve(__dirname, 'public');
+    for (const name of fs.readdirSync(publicDir)) {
+      const file = path.join(publicDir, name);
+      if (fs.statSync(file).isFile()) entries.push({ url: `/${name}`, revision: contentHash(fs.readFileSync(file)) });
+    }
+    entries.sort((a, b) => a.url.localeCompare(b.url));
+    const manifest = { version: contentHash(JSON.stringify(entries)), entries };
+    this.emitFile({
+      type: 'asset',
+      fileName: 'sw.js',
+      source: `self.__PRECACHE = ${JSON.stringify(manifest)};\n${fs.readFileSync(path.resolve(__dirname, 'sw.js'), 'utf8')}`,
+    });
+  },
+});
+
 export default defineConfig(({ mode }) => {
     const env = loadEnv(mode, '.', '');
     return {
@@ -9,7 +46,11 @@ export default defineConfig(({ mode }) => {
         port: 3000,
         host: '0.0.0.0',
       },
-      plugins: [react()],
+      plugins: [react(), precacheManifest()],
+      worker: {
+        // processWorker.ts lazy-loads pdf.js, which needs code splitting
+        format: 'es',
+      },
       define: {
         // Avoid injecting full process.env to prevent security risks and memory issues
         'process.env.NODE_ENV': JSON.stringify(mode),
@@ -44,7 +85,7 @@ export default defineConfig(({ mode }) => {
                 if (id.includes('react') || id.includes('react-dom')) {
                   return 'react-vendor';
                 }
-                if (id.includes('dompurify') || id.includes('lucide-react')) {
+                if (id.includes('lucide-react')) {
                   return 'ui-vendor';
                 }
                 if (id.includes('pdfjs')) {
@@ -52,10 +93,6 @@ export default defineConfig(({ mode }) => {
                 }
                 return 'vendor';
               }
-              // Split blog translations for lazy loading
-              if (id.includes('blog_posts_')) {
-                return 'blog-translations';
-              }
             },
           },
         },
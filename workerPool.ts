@@ -0,0 +1,249 @@
+// workerPool.ts
+// Pool of processWorker.ts workers: one task per CSV, PDFs split into page ranges
+//
+// A worker keeps the last PDF it parsed open, and the file's later ranges go
+// to a worker that has it open when one is free, so a long statement is read
+// and parsed about once per worker rather than once per range. Each worker
+// that takes part still holds its own parsed copy until the file is done.
+
+import type { ExtractTask, ExtractResponse } from './processWorker';
+import type { CsvRow } from './csvColumns';
+import type { StageTimings } from './diagnostics';
+
+// Leave a core for the UI thread (and pdf.js / Tesseract helper workers)
+export const POOL_SIZE = Math.max(1, Math.min(8, (navigator.hardwareConcurrency || 4) - 1));
+const PDF_PAGES_PER_TASK = 16;
+const IDLE_TIMEOUT = 30000; // terminate idle workers after 30s
+
+export type FileOutcome =
+  | { fileName: string; success: true }
+  | { fileName: string; success: false; reason: string };
+
+// Called with each page's lines as soon as a worker has extracted it
+export type PageHandler = (page: number, lines: string[]) => void;
+// Called with each chunk of a CSV whose columns were recognized
+export type RowsHandler = (page: number, rows: CsvRow[]) => void;
+// Called with each task's stage timings (diagnostics.ts) when it finishes
+export type TimingsHandler = (timings: StageTimings) => void;
+
+interface Task {
+  file: File;
+  doc?: number; // PDFs: the file's document number, shared by its ranges
+  task: ExtractTask;
+  onResponse: (response: ExtractResponse) => void;
+}
+
+export const isPoolFile = (file: File) =>
+  file.name.endsWith('.csv') || file.type === 'application/pdf' || file.name.endsWith('.pdf');
+
+const createWorkerPool = (size: number) => {
+  const workers = new Set<Worker>();
+  const idle: Worker[] = [];
+  const running = new Map<number, { worker: Worker; task: Task }>();
+  let queue: Task[] = [];
+  let nextId = 1;
+  let nextDoc = 1;
+  const opened = new Map<Worker, number>(); // the PDF each worker has open
+  const extracting = new Set<number>(); // documents with ranges still to come
+  let idleTimer: ReturnType<typeof setTimeout> | undefined;
+
+  const spawn = () => {
+    const worker = new Worker(new URL('./processWorker.ts', import.meta.url), { type: 'module' });
+    worker.onmessage = (event: MessageEvent<ExtractResponse>) => {
+      const response = event.data;
+      const entry = running.get(response.id);
+      if (!entry) return;
+      entry.task.onResponse(response);
+      // 'pages', 'page' and 'rows' are progress; the task continues on this worker
+      if (response.type !== 'pages' && response.type !== 'page' && response.type !== 'rows') {
+        // The worker closes its document after an error
+        if (response.type === 'error') opened.delete(worker);
+        running.delete(response.id);
+        release(worker);
+      }
+    };
+    // Uncaught failure (e.g. the worker script did not load): fail its task, replace the worker
+    worker.onerror = (event) => {
+      event.preventDefault();
+      workers.delete(worker);
+      opened.delete(worker);
+      worker.terminate();
+      for (const [id, entry] of running) {
+        if (entry.worker !== worker) continue;
+        running.delete(id);
+        entry.task.onResponse({ id, type: 'error', error: event.message || 'Worker failed' });
+      }
+      pump();
+    };
+    workers.add(worker);
+    return worker;
+  };
+
+  const closeDocument = (worker: Worker) => {
+    opened.delete(worker);
+    worker.postMessage({ kind: 'close' });
+  };
+
+  const release = (worker: Worker) => {
+    if (!workers.has(worker)) return;
+    const doc = opened.get(worker);
+    if (doc !== undefined && !extracting.has(doc)) closeDocument(worker);
+    idle.push(worker);
+    pump();
+  };
+
+  // A file is done: close its document in the idle workers; busy ones close it on release
+  const finishDocument = (doc: number) => {
+    extracting.delete(doc);
+    for (const worker of idle) {
+      if (opened.get(worker) === doc) closeDocument(worker);
+    }
+  };
+
+  const run = async (worker: Worker, task: Task) => {
+    const id = nextId++;
+    running.set(id, { worker, task });
+    try {
+      // A CSV is streamed by the worker from the File itself (no bytes are copied)
+      if (task.task.kind === 'csv') {
+        worker.postMessage({ kind: 'csv', id, file: task.file });
+        return;
+      }
+      const doc = task.doc!;
+      if (opened.get(worker) === doc) {
+        worker.postMessage({ ...task.task, id, doc });
+        return;
+      }
+      // Read the file only when a worker is free, so queued tasks hold no bytes
+      const buffer = await task.file.arrayBuffer();
+      opened.set(worker, doc);
+      worker.postMessage({ ...task.task, id, doc, buffer }, [buffer]);
+    } catch (error: any) {
+      running.delete(id);
+      task.onResponse({ id, type: 'error', error: error?.message || String(error) });
+      release(worker);
+    }
+  };
+
+  const pump = () => {
+    clearTimeout(idleTimer);
+    while (queue.length > 0) {
+      const task = queue[0];
+      // Prefer a worker that already has this PDF open
+      const warm = task.doc === undefined ? -1 : idle.findIndex(w => opened.get(w) === task.doc);
+      let worker = warm >= 0 ? idle.splice(warm, 1)[0] : idle.pop();
+      if (!worker) {
+        if (workers.size >= size) return;
+        worker = spawn();
+      }
+      queue.shift();
+      run(worker, task);
+    }
+    if (running.size === 0) idleTimer = setTimeout(terminate, IDLE_TIMEOUT);
+  };
+
+  const submit = (tasks: Task[], first = false) => {
+    if (first) queue.unshift(...tasks);
+    else queue.push(...tasks);
+    pump();
+  };
+
+  const terminate = () => {
+    clearTimeout(idleTimer);
+    for (const worker of workers) worker.terminate();
+    workers.clear();
+    idle.length = 0;
+    opened.clear();
+    extracting.clear();
+    queue = [];
+    for (const [id, { task }] of running) task.onResponse({ id, type: 'error', error: 'Worker pool terminated' });
+    running.clear();
+  };
+
+  // Extract one file's lines. PDFs start with a probe task on pages 1..N that
+  // checks for statement keywords; once it reports the page count, the other
+  // ranges are queued ahead of files not yet started so a long statement is
+  // spread over every free worker. Pages reach onPage in completion order;
+  // once the promise resolves successfully, every page has been delivered.
+  // CSV chunks reach onRows, or onPage when the columns were not recognized.
+  const extractFile = (file: File, onPage: PageHandler, onRows: RowsHandler, onTimings?: TimingsHandler) => new Promise<FileOutcome>(resolve => {
+    const fileName = file.name;
+    let settled = false;
+    let doc: number | undefined; // PDFs only
+    const settle = () => {
+      settled = true;
+      if (doc !== undefined) finishDocument(doc);
+    };
+    const fail = (reason: string) => {
+      if (settled) return;
+      settle();
+      queue = queue.filter(t => t.file !== file);
+      resolve({ fileName, success: false, reason });
+    };
+
+    if (file.name.endsWith('.csv')) {
+      submit([{
+        file,
+        task: { kind: 'csv' },
+        onResponse: response => {
+          if (response.type === 'page') onPage(response.page, response.lines);
+          else if (response.type === 'rows') onRows(response.page, response.rows);
+          else if (response.type === 'done') {
+            onTimings?.(response.timings);
+            resolve({ fileName, success: true });
+          } else if (response.type === 'error') fail('CSV could not be read');
+        },
+      }]);
+      return;
+    }
+
+    doc = nextDoc++;
+    extracting.add(doc);
+    let pending = 1;
+    const onRange = (response: ExtractResponse) => {
+      if (settled) return;
+      switch (response.type) {
+        case 'pages': {
+          const ranges: Task[] = [];
+          for (let from = PDF_PAGES_PER_TASK + 1; from <= response.numPages; from += PDF_PAGES_PER_TASK) {
+            const task = { kind: 'pdf' as const, from, to: from + PDF_PAGES_PER_TASK - 1, probe: false };
+            ranges.push({ file, doc, task, onResponse: onRange });
+          }
+          pending += ranges.length;
+          submit(ranges, true);
+          break;
+        }
+        case 'page':
+          onPage(response.page, response.lines);
+          break;
+        case 'done':
+          onTimings?.(response.timings);
+          if (--pending === 0) {
+            settle();
+            resolve({ fileName, success: true });
+          }
+          break;
+        case 'rejected':
+          fail(response.reason);
+          break;
+        case 'error':
+          console.error('PDF processing error:', response.error);
+          fail('PDF could not be read');
+          break;
+      }
+    };
+    submit([{ file, doc, task: { kind: 'pdf', from: 1, to: PDF_PAGES_PER_TASK, probe: true }, onResponse: onRange }]);
+  });
+
+  return { extractFile, terminate };
+};
+
+let pool: ReturnType<typeof createWorkerPool> | null = null;
+
+export const getWorkerPool = () => pool ??= createWorkerPool(POOL_SIZE);
+
+// Stop all work in progress (e.g. on processing timeout); the next upload starts a fresh pool
+export const terminateWorkerPool = () => {
+  pool?.terminate();
+  pool = null;
+};